@@ -14,6 +14,10 @@ Subcommand dispatcher. Subcommands:
 - ``stack-sync --enabled <comma-list>``
 - ``setup ssh-config`` / ``setup wait-ssh`` / ``setup ensure-jq`` /
   ``setup wetty-ssh-agent``
+
+Module scope imports only the stdlib; each handler imports what it
+needs when it runs (see ``_COMMANDS``), so ``--version`` or
+``config dump-shell`` don't load requests or the deploy modules.
 """
 
 from __future__ import annotations
@@ -22,56 +26,16 @@ import os
 import re
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
-
-import requests
+from typing import TYPE_CHECKING, cast, get_args
 
 from nexus_deploy import __version__, hello
-from nexus_deploy import hetzner_capacity as _hetzner
-from nexus_deploy import pipeline as _pipeline
-from nexus_deploy import s3_persistence as _s3_persistence
-from nexus_deploy import s3_restore as _s3_restore
-from nexus_deploy.compose_runner import run_compose_up
-from nexus_deploy.config import ConfigError, NexusConfig
-from nexus_deploy.gitea import (
-    GiteaError,
-    run_configure_gitea,
-    run_mirror_setup,
-    run_woodpecker_oauth_setup,
-)
-from nexus_deploy.infisical import (
-    BootstrapEnv,
-    InfisicalClient,
-    compute_folders,
-    provision_admin,
-)
-from nexus_deploy.kestra import run_register_system_flows
-from nexus_deploy.orchestrator import Orchestrator
-from nexus_deploy.r2_tokens import (
-    DEFAULT_NEXUS_R2_PREFIX,
-    build_inventory,
-    cleanup_orphan_tokens,
-)
-from nexus_deploy.secret_sync import StackTarget, run_sync_for_stack
-from nexus_deploy.seeder import _is_safe_repo_path, run_seed_for_repo
-from nexus_deploy.service_env import (
-    GiteaWorkspaceConfig,
-    ServiceEnvError,
-    append_gitea_workspace_block,
-    render_all_env_files,
-)
-from nexus_deploy.services import run_admin_setups
-from nexus_deploy.setup import (
-    SetupError,
-    SSHConfigSpec,
-    configure_ssh,
-    ensure_jq,
-    setup_wetty_ssh_agent,
-    wait_for_service_token,
-    wait_for_ssh,
-)
-from nexus_deploy.ssh import SSHClient, SSHError
-from nexus_deploy.stack_sync import run_stack_sync
+
+if TYPE_CHECKING:
+    from nexus_deploy import hetzner_capacity as _hetzner
+    from nexus_deploy.orchestrator import OrchestratorResult
+    from nexus_deploy.stack_sync import SyncMode
 
 
 def _config_dump_shell(args: list[str]) -> int:
@@ -87,6 +51,8 @@ def _config_dump_shell(args: list[str]) -> int:
     Writes shell-eval-able ``VAR=value`` lines to stdout. Consumed via
     ``eval "$(... | python -m nexus_deploy config dump-shell --stdin)"``.
     """
+    from nexus_deploy.config import ConfigError, NexusConfig
+
     tofu_dir = Path("tofu/stack")
     tofu_dir_explicit = False
     use_stdin = False
@@ -154,6 +120,9 @@ def _infisical_bootstrap(args: list[str]) -> int:
     - 2: hard failure — input validation, transport (rsync/ssh),
          unexpected exception. Caller should abort.
     """
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.infisical import BootstrapEnv, InfisicalClient, compute_folders
+
     if args:
         print(f"infisical bootstrap: unexpected arg {args[0]!r}", file=sys.stderr)
         return 2
@@ -260,6 +229,8 @@ def _infisical_provision_admin(args: list[str]) -> int:
       caller warns and continues without pushing secrets.
     - 2: bad args, transport, unexpected error — caller aborts.
     """
+    from nexus_deploy.infisical import provision_admin
+
     if args:
         print(f"infisical provision-admin: unexpected arg {args[0]!r}", file=sys.stderr)
         return 2
@@ -348,6 +319,8 @@ def _secret_sync(args: list[str]) -> int:
          transport (ssh) failure, unexpected exception. Caller
          should abort.
     """
+    from nexus_deploy.secret_sync import StackTarget, run_sync_for_stack
+
     stack: str | None = None
     i = 0
     while i < len(args):
@@ -472,24 +445,28 @@ def _seed(args: list[str]) -> int:
     """`nexus-deploy seed --repo <owner>/<name> [--root PATH] [--prefix STR]`.
 
     Walks the local seed tree (default ``examples/workspace-seeds/``),
-    base64-encodes each file, rsyncs the JSON payloads to the server,
-    and POSTs each one to Gitea's Contents API under the prefix
-    (default ``nexus_seeds/``). Two call-sites use this: non-mirror
-    mode (admin-owned repo) and mirror+user mode (user's fork). Each
-    invokes this CLI with the appropriate ``--repo`` arg.
+    skips files already in the repo tree, streams the rest base64-
+    encoded over ssh stdin, and commits them to Gitea under the prefix
+    (default ``nexus_seeds/``) in batched multi-file Contents API
+    calls, one commit per chunk (see :mod:`nexus_deploy.seeder`). Two
+    call-sites use this: non-mirror mode (admin-owned repo) and
+    mirror+user mode (user's fork). Each invokes this CLI with the
+    appropriate ``--repo`` arg.
 
     Required env: ``GITEA_TOKEN``.
 
     Exit codes:
     - 0: all seeds either created (HTTP 201/200) or correctly skipped
-         (HTTP 422 = file already exists, user edits persist — #501
-         contract).
+         (already in the repo tree, or HTTP 422 = file already exists;
+         user edits persist — #501 contract).
     - 1: partial — some files failed but at least one succeeded.
          Yellow warning, continue.
     - 2: hard failure — bad ``--repo`` format, missing token, transport
          (ssh/rsync) failure, no parseable RESULT line, unexpected
          exception. Caller should abort.
     """
+    from nexus_deploy.seeder import _is_safe_repo_path, run_seed_for_repo
+
     repo: str | None = None
     root_arg: str | None = None
     prefix = "nexus_seeds/"
@@ -584,6 +561,9 @@ def _seed(args: list[str]) -> int:
             root=root,
             token=token,
             prefix=prefix,
+            batch=True,
+            tree_diff=True,
+            stream=True,
         )
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
         # Same defence-in-depth as `secret-sync`: never print exc.cmd /
@@ -612,8 +592,12 @@ def _compose_up(args: list[str]) -> int:
 
     Renders the parallel ``docker compose up -d --build`` loop for
     every enabled service, runs it server-side via ssh, parses the
-    RESULT line. Per-service admin-setup hooks (Wikijs, Dify, etc.)
-    live in :mod:`nexus_deploy.services`.
+    RESULT line. Stack weights come from ``./services.yaml`` and the
+    weight budget from ``NEXUS_COMPOSE_PARALLELISM``. Build contexts
+    are hashed from ``./stacks`` (tags resolved via
+    ``IMAGE_VERSIONS_JSON``) so unchanged local images aren't
+    rebuilt. Per-service admin-setup hooks (Wikijs, Dify, etc.) live
+    in :mod:`nexus_deploy.services`.
 
     The comma-list is the same ``ENABLED_SERVICES`` set the rest of
     the pipeline consumes; callers pass it as-is. Virtual-service
@@ -628,6 +612,9 @@ def _compose_up(args: list[str]) -> int:
     - 2: hard failure — invalid args, transport (ssh) failure, no
          parseable RESULT line. Caller should abort.
     """
+    from nexus_deploy.compose_runner import load_stack_weights, run_compose_up
+    from nexus_deploy.image_prepull import parse_image_versions
+
     if not args or args[0] != "up":
         print("compose: only 'up' subcommand is supported", file=sys.stderr)
         return 2
@@ -659,7 +646,13 @@ def _compose_up(args: list[str]) -> int:
         return 0
 
     try:
-        result = run_compose_up(enabled)
+        result = run_compose_up(
+            enabled,
+            weights=load_stack_weights(Path("services.yaml")),
+            max_weight=_compose_max_weight_from_env(),
+            local_stacks_dir=Path("stacks"),
+            image_versions=parse_image_versions(os.environ.get("IMAGE_VERSIONS_JSON")),
+        )
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
         print(f"compose up: transport failure ({type(exc).__name__})", file=sys.stderr)
         return 2
@@ -678,15 +671,18 @@ def _compose_up(args: list[str]) -> int:
 def _services_configure(args: list[str]) -> int:
     """`nexus-deploy services configure --enabled <comma-list>`.
 
-    Renders + executes the per-service admin-setup hooks for the
-    enabled services that have a renderer in
-    ``nexus_deploy.services._HOOK_REGISTRY``. Reads NexusConfig from
+    Runs the per-service admin-setup hooks for the enabled services
+    that have an entry in one of the ``nexus_deploy.services`` hook
+    registries (REST hooks over SSH tunnels, rendered bash, or
+    python-side). Reads NexusConfig from
     stdin (SECRETS_JSON) and reads BootstrapEnv fields (DOMAIN,
     ADMIN_EMAIL, etc.) from environment variables — same handoff
     pattern as ``infisical bootstrap``.
 
     Currently shipped: Portainer, n8n, Metabase, LakeFS, OpenMetadata,
-    RedPanda, Superset, Filestash (python-side JSON mutation).
+    Wiki.js, Dify, Windmill (REST), RedPanda, Superset, Garage, SFTPGo,
+    pg-ducklake, Uptime Kuma (bash), Filestash (python-side JSON
+    mutation).
     Additional hooks land here as new services need configuration.
 
     Exit codes:
@@ -697,6 +693,10 @@ def _services_configure(args: list[str]) -> int:
     - 2: bad args, transport (ssh) failure, or unexpected exception.
          Caller should abort.
     """
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.infisical import BootstrapEnv
+    from nexus_deploy.services import run_admin_setups
+
     if not args or args[0] != "configure":
         print("services: only 'configure' subcommand is supported", file=sys.stderr)
         return 2
@@ -810,6 +810,10 @@ def _kestra_register_system_flows(args: list[str]) -> int:
     - 2: bad args, ssh tunnel setup failure, or unexpected exception
          (caller should abort).
     """
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.kestra import run_register_system_flows
+    from nexus_deploy.ssh import SSHClient, SSHError
+
     if args:
         print(f"kestra register-system-flows: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -967,6 +971,10 @@ def _gitea_configure(args: list[str]) -> int:
     - 1: partial — at least one step failed but token may be in stdout
     - 2: bad args / ssh / unexpected — NO token in stdout
     """
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.gitea import run_configure_gitea
+    from nexus_deploy.ssh import SSHClient, SSHError
+
     if args:
         print(f"gitea configure: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1140,6 +1148,9 @@ def _gitea_woodpecker_oauth(args: list[str]) -> int:
       possibly applied but create failed; Woodpecker would 401
       until next successful deploy if we continued). Abort.
     """
+    from nexus_deploy.gitea import GiteaError, run_woodpecker_oauth_setup
+    from nexus_deploy.ssh import SSHClient, SSHError
+
     if args:
         print(f"gitea woodpecker-oauth: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1313,6 +1324,9 @@ def _gitea_mirror_setup(args: list[str]) -> int:
     - 2: bad args / missing required env / SSH tunnel / unexpected
       exception. Abort.
     """
+    from nexus_deploy.gitea import GiteaError, run_mirror_setup
+    from nexus_deploy.ssh import SSHClient, SSHError
+
     if args:
         print(f"gitea mirror-setup: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1406,7 +1420,8 @@ def _gitea_mirror_setup(args: list[str]) -> int:
     sys.stderr.write(f"  • admin UID: {result.admin_uid}\n")
     for m in result.mirrors:
         sys.stderr.write(
-            f"  • mirror: {m.name} → {m.status}{(' — ' + m.detail) if m.detail else ''}\n"
+            f"  • mirror: {m.name} → {m.status} ({m.ms / 1000:.1f}s)"
+            f"{(' — ' + m.detail) if m.detail else ''}\n"
         )
     if result.fork is not None:
         sys.stderr.write(
@@ -1432,12 +1447,16 @@ def _gitea_mirror_setup(args: list[str]) -> int:
 
 
 def _stack_sync(args: list[str]) -> int:
-    """`nexus-deploy stack-sync --enabled <comma-list> [--stacks-dir PATH]`.
+    """`nexus-deploy stack-sync --enabled <comma-list> [--stacks-dir PATH] [--mode MODE]`.
 
-    Per-stack rsync of ``stacks/<svc>/`` →
+    Push of every ``stacks/<svc>/`` →
     ``nexus:/opt/docker-server/stacks/<svc>/``, plus disabled-stack
     cleanup (server-side ``docker compose down`` + ``rm -rf`` for any
-    folder NOT in the enabled list).
+    folder NOT in the enabled list). ``--mode`` is ``bulk`` (default:
+    one rsync), ``per-service`` (one rsync per stack) or ``manifest``
+    (opt-in delta tar stream; also deletes files dropped since its
+    last sync) — see :mod:`stack_sync`. ``--per-service`` is kept as
+    an alias for ``--mode per-service``.
 
     Optional ``--stacks-dir`` defaults to ``stacks`` relative to the
     repo root — exposed for tests. Production callers leave it off.
@@ -1453,11 +1472,26 @@ def _stack_sync(args: list[str]) -> int:
     - 2: bad args, transport (ssh/rsync) failure, no parseable RESULT
       line, or unexpected exception. Caller should abort.
     """
+    from nexus_deploy.stack_sync import SyncMode, run_stack_sync
+
     enabled_str: str | None = None
     stacks_dir_arg: str | None = None
+    mode: SyncMode = "bulk"
     i = 0
     while i < len(args):
-        if args[i] == "--enabled":
+        if args[i] == "--per-service":
+            mode = "per-service"
+            i += 1
+        elif args[i] == "--mode":
+            if i + 1 >= len(args) or args[i + 1] not in get_args(SyncMode):
+                print(
+                    "stack-sync: --mode requires one of bulk, per-service, manifest",
+                    file=sys.stderr,
+                )
+                return 2
+            mode = cast("SyncMode", args[i + 1])
+            i += 2
+        elif args[i] == "--enabled":
             if i + 1 >= len(args):
                 print("stack-sync: --enabled requires a value", file=sys.stderr)
                 return 2
@@ -1498,7 +1532,11 @@ def _stack_sync(args: list[str]) -> int:
         return 2
 
     try:
-        result = run_stack_sync(stacks_dir, enabled)
+        result = run_stack_sync(
+            stacks_dir,
+            enabled,
+            sync_mode=mode,
+        )
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
         print(
             f"stack-sync: transport failure ({type(exc).__name__})",
@@ -1523,7 +1561,8 @@ def _stack_sync(args: list[str]) -> int:
     # is what they need to see.
     for r in result.rsync:
         if r.status == "synced":
-            sys.stderr.write(f"  ✓ {r.service} synced\n")
+            detail = f" ({r.detail})" if r.detail else ""
+            sys.stderr.write(f"  ✓ {r.service} synced{detail}\n")
         elif r.status == "missing-local":
             sys.stderr.write(f"  ⚠ {r.service}: local stack folder not found - skipping\n")
         else:
@@ -1573,6 +1612,8 @@ def _setup_ssh_config(args: list[str]) -> int:
     - 0: ssh-config block written
     - 2: missing required env, missing Service Token, or write failure
     """
+    from nexus_deploy.setup import SetupError, SSHConfigSpec, configure_ssh
+
     if args:
         print(f"setup ssh-config: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1627,6 +1668,8 @@ def _setup_wait_ssh(args: list[str]) -> int:
     - 0: SSH connection established
     - 2: max retries exhausted (Token-test OR readiness loop)
     """
+    from nexus_deploy.setup import wait_for_service_token, wait_for_ssh
+
     if args:
         print(f"setup wait-ssh: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1677,6 +1720,9 @@ def _setup_ensure_jq(args: list[str]) -> int:
     - 0: jq present (already-installed or newly-installed)
     - 2: install failed (transport, sudo permission, dpkg lock, etc.)
     """
+    from nexus_deploy.setup import ensure_jq
+    from nexus_deploy.ssh import SSHClient
+
     if args:
         print(f"setup ensure-jq: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1759,6 +1805,9 @@ def _setup_wetty_ssh_agent(args: list[str]) -> int:
          the forwarded stderr.
     - 2: hard transport / unexpected error
     """
+    from nexus_deploy.setup import setup_wetty_ssh_agent
+    from nexus_deploy.ssh import SSHClient
+
     if args:
         print(f"setup wetty-ssh-agent: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -1875,6 +1924,15 @@ def _service_env(args: list[str]) -> int:
     - 2: hard failure (SFTPGo password missing, write error,
          unexpected exception)
     """
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.infisical import BootstrapEnv
+    from nexus_deploy.service_env import (
+        GiteaWorkspaceConfig,
+        ServiceEnvError,
+        append_gitea_workspace_block,
+        render_all_env_files,
+    )
+
     enabled_str: str | None = None
     stacks_dir_arg: str | None = None
     i = 0
@@ -2183,6 +2241,14 @@ def _r2_tokens(args: list[str]) -> int:
          / safety guard hit (e.g. ``--prefix`` doesn't start with
          ``nexus-r2-``).
     """
+    import requests
+
+    from nexus_deploy.r2_tokens import (
+        DEFAULT_NEXUS_R2_PREFIX,
+        build_inventory,
+        cleanup_orphan_tokens,
+    )
+
     if not args:
         print(
             "r2-tokens: subcommand required (list | cleanup --name|--prefix VALUE [--apply])",
@@ -2334,6 +2400,12 @@ def _run_all(args: list[str]) -> int:
     - 1: at least one phase produced status='partial'
     - 2: at least one phase failed (orchestrator aborted)
     """
+    from nexus_deploy import tracing as _tracing
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.infisical import BootstrapEnv
+    from nexus_deploy.orchestrator import Orchestrator
+    from nexus_deploy.ssh import SSHError
+
     if args:
         print(f"run-all: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -2410,6 +2482,9 @@ def _run_all(args: list[str]) -> int:
         gitea_user_email=gitea_user_email,
         gitea_user_password=gitea_user_password,
         ssh_host=ssh_host,
+        ssh_multiplex=True,
+        max_parallel_phases=_phase_workers_from_env(),
+        skip_unchanged=_skip_unchanged_from_env(),
         project_id=project_id,
         infisical_token=infisical_token,
         infisical_env=infisical_env,
@@ -2419,7 +2494,8 @@ def _run_all(args: list[str]) -> int:
     )
 
     try:
-        result = orchestrator.run_all()
+        with _tracing.session(_tracing.path_from_env()):
+            result = orchestrator.run_all()
     except SSHError as exc:
         print(f"run-all: ssh setup failed: {exc}", file=sys.stderr)
         return 2
@@ -2441,6 +2517,7 @@ def _run_all(args: list[str]) -> int:
         marker = {"ok": "✓", "partial": "⚠", "failed": "✗", "skipped": "—"}.get(phase.status, "?")
         detail = f" — {phase.detail}" if phase.detail else ""
         sys.stderr.write(f"  {marker} {phase.name}: {phase.status}{detail}\n")
+    _write_critical_path(result)
 
     # Eval-able stdout: 3 values for the surviving shell glue.
     import shlex as _shlex
@@ -2505,6 +2582,8 @@ def _read_single_pair_from_tfvars(text: str) -> _hetzner.ServerSpec | None:
     SERVER_LOCATION`` set should keep working without having to
     learn the new key.
     """
+    from nexus_deploy import hetzner_capacity as _hetzner
+
     type_match = _TFVARS_TYPE_LINE.search(text)
     loc_match = _TFVARS_LOC_LINE.search(text)
     if type_match is None or loc_match is None:
@@ -2619,6 +2698,8 @@ def _select_capacity(args: list[str]) -> int:
     - 0: a pair was selected (or skipped due to missing token)
     - 2: preference list exhausted, or API failure, or arg error
     """
+    from nexus_deploy import hetzner_capacity as _hetzner
+
     # Crude arg-parse — keeps us out of argparse for one-flag handlers.
     tfvars_path: Path | None = None
     i = 0
@@ -2799,6 +2880,11 @@ def _run_pipeline(args: list[str]) -> int:
     All in-process — no subprocess CLI invocations of nexus_deploy
     sub-commands, no eval-able stdout payloads.
 
+    ``--resume``: skip ``run_all`` phases that finished ``ok`` in the
+    previous (aborted) attempt and whose inputs are unchanged, per the
+    ``$PROJECT_ROOT/.nexus-checkpoint.json`` journal — see
+    :mod:`nexus_deploy.checkpoint`.
+
     Required env: none (everything is read from tofu state +
     config.tfvars).
 
@@ -2809,6 +2895,13 @@ def _run_pipeline(args: list[str]) -> int:
     - ``DOCKERHUB_USER`` + ``DOCKERHUB_TOKEN`` — for higher pull rate
     - ``INFISICAL_ENV`` — defaults to "dev"
     - ``PROJECT_ROOT`` — defaults to ``$PWD``; the repo checkout root
+    - ``NEXUS_PHASE_WORKERS`` — phase-scheduler concurrency (default 1)
+    - ``NEXUS_FORCE_REDEPLOY`` — ``1`` ignores the input-hash stamps
+    - ``NEXUS_COMPOSE_PARALLELISM`` — compose-up weight budget (default 8)
+    - ``NEXUS_STACK_SYNC_MODE`` — ``manifest`` opts stack-sync into the
+      delta sync (default ``bulk``)
+    - ``NEXUS_TRACE_FILE`` — write a Chrome-trace JSON of the run there
+      (see :mod:`nexus_deploy.tracing`)
 
     Exit codes:
     - 0: deploy succeeded — covers both clean runs AND runs where
@@ -2819,8 +2912,14 @@ def _run_pipeline(args: list[str]) -> int:
     - 2: hard failure (PipelineError; tofu state missing, secrets
          empty, ssh wait timeout, orchestrator phase status='failed').
     """
-    if args:
-        print(f"run-pipeline: unknown args {args!r}", file=sys.stderr)
+    from nexus_deploy import pipeline as _pipeline
+    from nexus_deploy import tracing as _tracing
+    from nexus_deploy.setup import SetupError
+
+    resume = "--resume" in args
+    unknown = [a for a in args if a != "--resume"]
+    if unknown:
+        print(f"run-pipeline: unknown args {unknown!r}", file=sys.stderr)
         return 2
 
     project_root_env = os.environ.get("PROJECT_ROOT")
@@ -2833,10 +2932,16 @@ def _run_pipeline(args: list[str]) -> int:
         dockerhub_user=os.environ.get("DOCKERHUB_USER") or None,
         dockerhub_token=os.environ.get("DOCKERHUB_TOKEN") or None,
         infisical_env=os.environ.get("INFISICAL_ENV") or "dev",
+        max_parallel_phases=_phase_workers_from_env(),
+        skip_unchanged=_skip_unchanged_from_env(),
+        compose_max_weight=_compose_max_weight_from_env(),
+        stack_sync_mode=_stack_sync_mode_from_env(),
+        resume=resume,
     )
 
     try:
-        result = _pipeline.run_pipeline(project_root=project_root, options=options)
+        with _tracing.session(_tracing.path_from_env()):
+            result = _pipeline.run_pipeline(project_root=project_root, options=options)
     except _pipeline.PipelineError as exc:
         print(f"run-pipeline: {exc}", file=sys.stderr)
         return 2
@@ -2896,6 +3001,7 @@ def _run_pipeline(args: list[str]) -> int:
             marker = markers.get(phase.status, "?")
             detail = f" — {phase.detail}" if phase.detail else ""
             sys.stderr.write(f"  {marker} {phase.name}: {phase.status}{detail}\n")
+        _write_critical_path(sub_result)
 
     sys.stdout.write(_pipeline.format_done_banner(result))
 
@@ -2956,6 +3062,12 @@ def _s3_snapshot(args: list[str]) -> int:
          CalledProcessError from the rendered bash, or feature flag
          on with credentials missing. Teardown MUST abort.
     """
+    from nexus_deploy import pipeline as _pipeline
+    from nexus_deploy import s3_persistence as _s3_persistence
+    from nexus_deploy import s3_restore as _s3_restore
+    from nexus_deploy.setup import SetupError
+    from nexus_deploy.ssh import SSHError
+
     if args:
         print(f"s3-snapshot: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -3118,6 +3230,11 @@ def _run_pre_bootstrap(args: list[str]) -> int:
     - 2: at least one phase failed (orchestrator aborted; subsequent
          steps that depend on Infisical/etc must abort too).
     """
+    from nexus_deploy import tracing as _tracing
+    from nexus_deploy.config import ConfigError, NexusConfig
+    from nexus_deploy.infisical import BootstrapEnv
+    from nexus_deploy.orchestrator import Orchestrator
+
     if args:
         print(f"run-pre-bootstrap: unknown args {args!r}", file=sys.stderr)
         return 2
@@ -3207,6 +3324,11 @@ def _run_pre_bootstrap(args: list[str]) -> int:
         gitea_user_email=gitea_user_email,
         gitea_user_password=gitea_user_password,
         ssh_host=ssh_host,
+        ssh_multiplex=True,
+        max_parallel_phases=_phase_workers_from_env(),
+        skip_unchanged=_skip_unchanged_from_env(),
+        compose_max_weight=_compose_max_weight_from_env(),
+        stack_sync_mode=_stack_sync_mode_from_env(),
         domain=domain,
         firewall_json=firewall_json,
         project_root=project_root,
@@ -3219,7 +3341,8 @@ def _run_pre_bootstrap(args: list[str]) -> int:
     )
 
     try:
-        result = orchestrator.run_pre_bootstrap()
+        with _tracing.session(_tracing.path_from_env()):
+            result = orchestrator.run_pre_bootstrap()
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
         print(
             f"run-pre-bootstrap: transport failure ({type(exc).__name__})",
@@ -3238,6 +3361,7 @@ def _run_pre_bootstrap(args: list[str]) -> int:
         marker = {"ok": "✓", "partial": "⚠", "failed": "✗", "skipped": "—"}.get(phase.status, "?")
         detail = f" — {phase.detail}" if phase.detail else ""
         sys.stderr.write(f"  {marker} {phase.name}: {phase.status}{detail}\n")
+    _write_critical_path(result)
 
     # Eval-able stdout: 5 values for the caller. Always emit (with
     # empty values when not populated) so ``eval`` clears stale
@@ -3269,6 +3393,91 @@ def _run_pre_bootstrap(args: list[str]) -> int:
     return 0
 
 
+def _phase_workers_from_env() -> int:
+    """``NEXUS_PHASE_WORKERS`` → ``Orchestrator.max_parallel_phases``.
+
+    Unset / empty → 1 (the strict declared-order loop). A value that
+    isn't a positive integer is reported and treated as 1 rather than
+    aborting the deploy over a tuning knob.
+    """
+    raw = os.environ.get("NEXUS_PHASE_WORKERS", "").strip()
+    if not raw:
+        return 1
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        sys.stderr.write(f"  ⚠ NEXUS_PHASE_WORKERS={raw!r} is not a positive integer — using 1\n")
+        return 1
+    return workers
+
+
+def _compose_max_weight_from_env() -> int:
+    """``NEXUS_COMPOSE_PARALLELISM`` → ``Orchestrator.compose_max_weight``.
+
+    Unset / empty → ``compose_runner.DEFAULT_MAX_WEIGHT``. A value that
+    isn't a positive integer is reported and the default used instead.
+    """
+    from nexus_deploy.compose_runner import DEFAULT_MAX_WEIGHT
+
+    raw = os.environ.get("NEXUS_COMPOSE_PARALLELISM", "").strip()
+    if not raw:
+        return DEFAULT_MAX_WEIGHT
+    try:
+        weight = int(raw)
+    except ValueError:
+        weight = 0
+    if weight < 1:
+        sys.stderr.write(
+            f"  ⚠ NEXUS_COMPOSE_PARALLELISM={raw!r} is not a positive integer"
+            f" — using {DEFAULT_MAX_WEIGHT}\n"
+        )
+        return DEFAULT_MAX_WEIGHT
+    return weight
+
+
+def _stack_sync_mode_from_env() -> SyncMode:
+    """``NEXUS_STACK_SYNC_MODE`` → ``Orchestrator.stack_sync_mode``.
+
+    Unset / empty → ``bulk``. ``manifest`` opts the deploy into the
+    content-addressed delta sync (see :mod:`stack_manifest`). An
+    unknown value is reported and ``bulk`` used instead.
+    """
+    from nexus_deploy.stack_sync import SyncMode
+
+    raw = os.environ.get("NEXUS_STACK_SYNC_MODE", "").strip().lower()
+    if not raw:
+        return "bulk"
+    if raw not in get_args(SyncMode):
+        sys.stderr.write(
+            f"  ⚠ NEXUS_STACK_SYNC_MODE={raw!r} is not one of {', '.join(get_args(SyncMode))}"
+            " — using bulk\n"
+        )
+        return "bulk"
+    return cast("SyncMode", raw)
+
+
+def _skip_unchanged_from_env() -> bool:
+    """``Orchestrator.skip_unchanged`` unless ``NEXUS_FORCE_REDEPLOY`` is truthy.
+
+    The escape hatch for a server whose stamps lie (hand-edited stacks,
+    a container removed outside compose): one forced run re-syncs,
+    re-ups and re-configures every service and rewrites the stamps.
+    """
+    raw = os.environ.get("NEXUS_FORCE_REDEPLOY", "").strip().lower()
+    return raw not in {"1", "true", "yes"}
+
+
+def _write_critical_path(result: OrchestratorResult) -> None:
+    """One stderr line naming the phase chain that bounded the run."""
+    if not result.critical_path:
+        return
+    total = sum(seconds for _, seconds in result.critical_path)
+    chain = " → ".join(f"{name} {seconds:.1f}s" for name, seconds in result.critical_path)
+    sys.stderr.write(f"  ⏱ critical path {total:.1f}s: {chain}\n")
+
+
 def _allocate_free_port() -> int:
     """Ask the kernel for a free IPv4 ephemeral port on the loopback.
 
@@ -3317,6 +3526,37 @@ def _kestra_execution_hint(state: str) -> str:
     return _KESTRA_EXECUTION_HINTS.get(state, "")
 
 
+# Subcommand registry: argv prefix → handler, first match wins. Every
+# handler imports its own dependencies on entry (requests, pydantic,
+# the gitea/kestra/infisical/orchestrator stack, …), so a CLI call only
+# pays for the modules its command actually uses. Workflows invoke the
+# CLI many times per spin-up; tests/unit/test_cli_import_budget.py pins
+# what each command is allowed to import.
+_COMMANDS: tuple[tuple[tuple[str, ...], Callable[[list[str]], int]], ...] = (
+    (("config", "dump-shell"), _config_dump_shell),
+    (("infisical", "bootstrap"), _infisical_bootstrap),
+    (("infisical", "provision-admin"), _infisical_provision_admin),
+    (("secret-sync",), _secret_sync),
+    (("seed",), _seed),
+    (("compose",), _compose_up),
+    (("services",), _services_configure),
+    (("kestra", "register-system-flows"), _kestra_register_system_flows),
+    (("gitea", "configure"), _gitea_configure),
+    (("gitea", "woodpecker-oauth"), _gitea_woodpecker_oauth),
+    (("gitea", "mirror-setup"), _gitea_mirror_setup),
+    (("stack-sync",), _stack_sync),
+    (("setup",), _setup),
+    (("service-env",), _service_env),
+    (("run-all",), _run_all),
+    (("run-pre-bootstrap",), _run_pre_bootstrap),
+    (("select-capacity",), _select_capacity),
+    (("run-pipeline",), _run_pipeline),
+    (("s3-snapshot",), _s3_snapshot),
+    (("r2-tokens",), _r2_tokens),
+    (("firewall", "configure"), _firewall_configure),
+)
+
+
 def main() -> int:
     """Subcommand dispatcher. See the module docstring for the full
     list of subcommands.
@@ -3328,48 +3568,9 @@ def main() -> int:
     if args in ([], ["hello"]):
         print(hello())
         return 0
-    if args[:2] == ["config", "dump-shell"]:
-        return _config_dump_shell(args[2:])
-    if args[:2] == ["infisical", "bootstrap"]:
-        return _infisical_bootstrap(args[2:])
-    if args[:2] == ["infisical", "provision-admin"]:
-        return _infisical_provision_admin(args[2:])
-    if args[:1] == ["secret-sync"]:
-        return _secret_sync(args[1:])
-    if args[:1] == ["seed"]:
-        return _seed(args[1:])
-    if args[:1] == ["compose"]:
-        return _compose_up(args[1:])
-    if args[:1] == ["services"]:
-        return _services_configure(args[1:])
-    if args[:2] == ["kestra", "register-system-flows"]:
-        return _kestra_register_system_flows(args[2:])
-    if args[:2] == ["gitea", "configure"]:
-        return _gitea_configure(args[2:])
-    if args[:2] == ["gitea", "woodpecker-oauth"]:
-        return _gitea_woodpecker_oauth(args[2:])
-    if args[:2] == ["gitea", "mirror-setup"]:
-        return _gitea_mirror_setup(args[2:])
-    if args[:1] == ["stack-sync"]:
-        return _stack_sync(args[1:])
-    if args[:1] == ["setup"]:
-        return _setup(args[1:])
-    if args[:1] == ["service-env"]:
-        return _service_env(args[1:])
-    if args[:1] == ["run-all"]:
-        return _run_all(args[1:])
-    if args[:1] == ["run-pre-bootstrap"]:
-        return _run_pre_bootstrap(args[1:])
-    if args[:1] == ["select-capacity"]:
-        return _select_capacity(args[1:])
-    if args[:1] == ["run-pipeline"]:
-        return _run_pipeline(args[1:])
-    if args[:1] == ["s3-snapshot"]:
-        return _s3_snapshot(args[1:])
-    if args[:1] == ["r2-tokens"]:
-        return _r2_tokens(args[1:])
-    if args[:2] == ["firewall", "configure"]:
-        return _firewall_configure(args[2:])
+    for prefix, handler in _COMMANDS:
+        if tuple(args[: len(prefix)]) == prefix:
+            return handler(args[len(prefix) :])
     print(
         f"nexus_deploy {__version__}: unknown command {' '.join(args)!r}",
         file=sys.stderr,
@@ -3402,7 +3603,7 @@ def main() -> int:
         "check; reads HCLOUD_TOKEN + optional SERVER_PREFERENCES env, walks "
         "<type>:<location> preference list, rewrites server_type+server_location "
         "in PATH to first available pair; rc=2 if every preference is out of stock), "
-        "run-pipeline (top-level deploy entry; reads tofu state + "
+        "run-pipeline [--resume] (top-level deploy entry; reads tofu state + "
         "config.tfvars; optional env: SSH_PRIVATE_KEY_CONTENT, "
         "GH_MIRROR_TOKEN, GH_MIRROR_REPOS, DOCKERHUB_USER, DOCKERHUB_TOKEN, "
         "INFISICAL_ENV, PROJECT_ROOT), "
@@ -3,8 +3,9 @@
 Plain ``subprocess.run`` wrappers around ``ssh nexus <cmd>`` and
 ``rsync … nexus:…``. Coexists with :class:`nexus_deploy.ssh.SSHClient`,
 which is ALSO subprocess-based (it spawns ``ssh`` per call; see
-``ssh.py`` — no paramiko, no persistent connection, no SFTP). The
-two modules differ in ergonomics and intent, not transport:
+``ssh.py`` — no paramiko, no SFTP). The two modules differ in
+ergonomics and intent, not transport — they share the same
+multiplexed master when one is open (see below):
 ``_remote`` is a thin fire-and-forget pair of free functions used
 by the early-phase setup helpers; ``SSHClient`` carries the
 orchestrator-side conveniences (``run`` and ``run_script`` with
@@ -17,13 +18,36 @@ which the spin-up workflow's "Setup SSH config" step writes. That
 alias is the ground truth for connection params; the wrappers
 themselves don't know about hostnames, ports, or service tokens.
 
+Connection multiplexing: while an :class:`~nexus_deploy.ssh.SSHClient`
+opened with ``multiplex=True`` is live, it owns an OpenSSH
+``ControlMaster`` socket for its host alias and registers it here
+(:func:`open_control_master`). Every ``ssh`` / ``rsync`` spawned by
+this module — and by ``SSHClient`` itself — then passes
+``-o ControlPath=<socket>`` and rides the already-authenticated
+session instead of paying a fresh ``cloudflared access ssh`` +
+SSH handshake per call. Outside such a block (or when the master
+failed to start) the argv is exactly the plain ``ssh <host> …``
+form, so the fallback is the pre-multiplexing behaviour.
+
 Tests mock ``subprocess.run`` directly — see ``tests/unit/test_remote.py``.
 """
 
 from __future__ import annotations
 
+import contextlib
+import shlex
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, cast
+
+from nexus_deploy import tracing as _tracing
 
 # No subprocess timeout by default. A slow Hetzner control-plane
 # spin-up (creds rotation, first cold start, big rsync diff) can
@@ -33,6 +57,192 @@ from pathlib import Path
 # pass `timeout=<seconds>` explicitly.
 _DEFAULT_TIMEOUT_S: float | None = None
 
+# Budget for the one real handshake (cloudflared access + ssh auth)
+# when a ControlMaster comes up. Matches the upper end of
+# setup.wait_for_ssh's per-attempt ConnectTimeout ramp plus headroom
+# for the Cloudflare Access token exchange.
+_MASTER_START_TIMEOUT_S = 60.0
+
+
+@dataclass
+class ControlMaster:
+    """A live ``ssh -M`` master connection for one host alias.
+
+    ``handshake_s`` is the wall time the master took to authenticate —
+    the cost every non-multiplexed call would have paid again.
+    ``call_timings`` records ``(kind, seconds)`` for each ssh/rsync/scp
+    that rode the master, so :meth:`summary` can put the saving into
+    the deploy log.
+    """
+
+    host: str
+    control_path: Path
+    handshake_s: float
+    call_timings: list[tuple[str, float]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """One-line stderr summary: handshake, per-kind call timings, saving."""
+        calls = len(self.call_timings)
+        by_kind: dict[str, list[float]] = {}
+        for kind, elapsed in self.call_timings:
+            by_kind.setdefault(kind, []).append(elapsed)
+        per_kind = ", ".join(
+            f"{kind}={len(times)}x/{sum(times):.1f}s" for kind, times in sorted(by_kind.items())
+        )
+        saved = self.handshake_s * calls
+        return (
+            f"ssh-mux {self.host}: 1 handshake ({self.handshake_s:.2f}s), "
+            f"{calls} multiplexed call(s) [{per_kind or 'none'}], "
+            f"~{saved:.1f}s of per-call handshakes avoided"
+        )
+
+
+# host alias → live master. Populated only by open_control_master, so
+# code paths that never enter a multiplexed SSHClient see an empty
+# registry and keep the plain argv.
+_MASTERS: dict[str, ControlMaster] = {}
+
+
+def control_master(host: str) -> ControlMaster | None:
+    """Return the live :class:`ControlMaster` for ``host``, if any."""
+    return _MASTERS.get(host)
+
+
+def ssh_options(host: str) -> list[str]:
+    """``-o`` options that route an ssh/scp call through ``host``'s master.
+
+    Empty when no master is registered, so callers can splice the
+    result unconditionally: ``["ssh", *ssh_options(h), h, cmd]``.
+    ``ControlMaster=no`` keeps a client from promoting itself to a
+    second master if the socket has vanished — it falls back to a
+    plain connection instead.
+    """
+    master = _MASTERS.get(host)
+    if master is None:
+        return []
+    return ["-o", f"ControlPath={master.control_path}", "-o", "ControlMaster=no"]
+
+
+def rsync_shell_args(remote: str) -> list[str]:
+    """rsync ``-e`` override that reuses the master for ``remote``'s host.
+
+    ``remote`` is rsync's ``<host>:<path>`` destination; the host part
+    selects the master. Returns ``[]`` (rsync's default ``ssh``
+    transport) when no master is registered for that host.
+    """
+    host, sep, _ = remote.partition(":")
+    if not sep:
+        return []
+    opts = ssh_options(host)
+    if not opts:
+        return []
+    return ["-e", shlex.join(["ssh", *opts])]
+
+
+def record_call(host: str, kind: str, started: float) -> None:
+    """Attribute ``time.monotonic() - started`` to ``host``'s master.
+
+    The master timings only exist to quantify what multiplexing saved,
+    so they are skipped when the call didn't go through a master. The
+    call is always offered to the active trace (see :mod:`tracing`) as
+    a ``transport`` span — every ssh/rsync in the deploy passes here.
+    """
+    _tracing.record(kind, "transport", started, host=host)
+    master = _MASTERS.get(host)
+    if master is not None:
+        master.call_timings.append((kind, time.monotonic() - started))
+
+
+def open_control_master(
+    host: str,
+    *,
+    timeout: float = _MASTER_START_TIMEOUT_S,
+) -> ControlMaster | None:
+    """Start a persistent ``ssh -M`` master for ``host`` and register it.
+
+    Returns the new :class:`ControlMaster`, or ``None`` when a master
+    for ``host`` is already registered (the caller doesn't own it and
+    must not close it) or when the master could not be started. A
+    failed start is never fatal: every call site falls back to a
+    plain per-call ``ssh`` connection, i.e. the pre-multiplexing
+    behaviour.
+
+    ``-f`` backgrounds ssh only after authentication completes, so
+    the foreground ``subprocess.run`` duration IS the handshake time.
+    stdout/stderr go to DEVNULL: the backgrounded master inherits
+    the pipes, and capturing them would block ``run`` until the
+    master exits. It also keeps any ProxyCommand output (which may
+    echo credentials) out of our process, same rule as
+    ``SSHClient.port_forward``.
+    """
+    if host in _MASTERS:
+        return None
+    sock_dir = Path(tempfile.mkdtemp(prefix="nexus-ssh-"))
+    control_path = sock_dir / "cm"
+    started = time.monotonic()
+    try:
+        completed = subprocess.run(
+            [
+                "ssh",
+                "-M",
+                "-N",
+                "-f",
+                "-o",
+                f"ControlPath={control_path}",
+                "-o",
+                "ControlPersist=yes",
+                host,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            timeout=timeout,
+        )
+    except (subprocess.TimeoutExpired, OSError) as exc:
+        sys.stderr.write(
+            f"  ⚠ ssh-mux {host}: master did not start ({type(exc).__name__}) — "
+            "falling back to one connection per call\n",
+        )
+        shutil.rmtree(sock_dir, ignore_errors=True)
+        return None
+    handshake_s = time.monotonic() - started
+    if completed.returncode != 0 or not control_path.exists():
+        sys.stderr.write(
+            f"  ⚠ ssh-mux {host}: master did not start (rc={completed.returncode}) — "
+            "falling back to one connection per call\n",
+        )
+        shutil.rmtree(sock_dir, ignore_errors=True)
+        return None
+    master = ControlMaster(host=host, control_path=control_path, handshake_s=handshake_s)
+    _MASTERS[host] = master
+    sys.stderr.write(f"  → ssh-mux {host}: master up after {handshake_s:.2f}s handshake\n")
+    return master
+
+
+def close_control_master(host: str) -> ControlMaster | None:
+    """Stop ``host``'s master (``ssh -O exit``) and unregister it.
+
+    Writes the timing summary to stderr and returns the closed
+    master (``None`` if none was registered). Best-effort: a master
+    that already died (network drop, server reboot) is simply
+    unregistered; its socket directory is removed either way.
+    """
+    master = _MASTERS.pop(host, None)
+    if master is None:
+        return None
+    with contextlib.suppress(subprocess.TimeoutExpired, OSError):
+        subprocess.run(
+            ["ssh", "-o", f"ControlPath={master.control_path}", "-O", "exit", host],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            check=False,
+            timeout=10.0,
+        )
+    shutil.rmtree(master.control_path.parent, ignore_errors=True)
+    sys.stderr.write(f"  → {master.summary()}\n")
+    return master
+
 
 def ssh_run(
     cmd: str,
@@ -67,14 +277,18 @@ def ssh_run(
     # ValueError("stderr and capture_output may not both be used"). We
     # need explicit stderr control (STDOUT-merging in the default case)
     # so we set both pipes ourselves.
-    return subprocess.run(
-        ["ssh", host, cmd],
-        check=check,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
-        text=True,
-        timeout=timeout,
-    )
+    started = time.monotonic()
+    try:
+        return subprocess.run(
+            ["ssh", *ssh_options(host), host, cmd],
+            check=check,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
+    finally:
+        record_call(host, "ssh", started)
 
 
 def ssh_run_script(
@@ -99,15 +313,19 @@ def ssh_run_script(
     process command line entirely; only ``["ssh", "nexus", "bash",
     "-s"]`` is visible.
     """
-    return subprocess.run(
-        ["ssh", host, "bash", "-s"],
-        input=script,
-        check=check,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
-        text=True,
-        timeout=timeout,
-    )
+    started = time.monotonic()
+    try:
+        return subprocess.run(
+            ["ssh", *ssh_options(host), host, "bash", "-s"],
+            input=script,
+            check=check,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
+    finally:
+        record_call(host, "ssh", started)
 
 
 def rsync_to_remote(
@@ -129,14 +347,122 @@ def rsync_to_remote(
     remote location.
     """
     src = f"{local}/" if not str(local).endswith("/") else str(local)
-    args = ["rsync", "-aq"]
+    args = ["rsync", "-aq", *rsync_shell_args(remote)]
     if delete:
         args.append("--delete")
     args += [src, remote]
-    return subprocess.run(
-        args,
-        check=True,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+    started = time.monotonic()
+    try:
+        return subprocess.run(
+            args,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    finally:
+        record_call(remote.partition(":")[0], "rsync", started)
+
+
+def rsync_dirs_to_remote(
+    local_root: Path,
+    remote: str,
+    names: list[str],
+    *,
+    timeout: float | None = _DEFAULT_TIMEOUT_S,
+) -> subprocess.CompletedProcess[str]:
+    """Push several ``local_root/<name>/`` trees in ONE rsync invocation.
+
+    ``remote`` is the common parent (``"nexus:/opt/docker-server/stacks/"``);
+    each name lands at ``<remote>/<name>/``. The names go to rsync as a
+    ``--files-from`` list on stdin (which implies ``--relative``, so the
+    ``<name>/`` prefix is kept on the receiving side; ``-r`` has to be
+    explicit because ``--files-from`` turns off ``-a``'s implied
+    recursion). Callers must pre-validate the names.
+
+    Unlike :func:`rsync_to_remote` this never raises on a non-zero
+    exit: the caller gets rc + the ``--itemize-changes`` stdout + the
+    error stderr and attributes failures per name itself.
+    """
+    src = f"{local_root}/" if not str(local_root).endswith("/") else str(local_root)
+    args = [
+        "rsync",
+        "-ar",
+        "--itemize-changes",
+        "--files-from=-",
+        *rsync_shell_args(remote),
+        src,
+        remote,
+    ]
+    started = time.monotonic()
+    try:
+        return subprocess.run(
+            args,
+            input="".join(f"{name}\n" for name in names),
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    finally:
+        record_call(remote.partition(":")[0], "rsync", started)
+
+
+def ssh_stream_in(
+    cmd: str,
+    feed: Callable[[IO[bytes]], None],
+    *,
+    host: str = "nexus",
+    timeout: float | None = _DEFAULT_TIMEOUT_S,
+) -> subprocess.CompletedProcess[str]:
+    """Run ``cmd`` on the server with ``feed`` writing its stdin.
+
+    For payloads too big to hold in memory (a tar stream of every
+    stack): ``feed`` gets ssh's stdin pipe and writes as it goes.
+    ``cmd`` travels in argv like :func:`ssh_run`, so it must not
+    contain secrets. stdout+stderr are merged and drained on a thread
+    so a chatty remote can't deadlock the writer.
+
+    Raises :class:`subprocess.CalledProcessError` (``output`` set) on
+    a non-zero exit, like ``check=True``. A remote that exits early
+    shows up as that error rather than the ``BrokenPipeError`` the
+    writer hit; any other exception from ``feed`` kills ssh and
+    propagates. ``timeout`` applies to the wait after ``feed`` returns.
+    """
+    args = ["ssh", *ssh_options(host), host, cmd]
+    started = time.monotonic()
+    try:
+        with subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        ) as proc:
+            # Both are pipes (PIPE above); the casts only narrow Optional.
+            stdin = cast("IO[bytes]", proc.stdin)
+            stdout = cast("IO[bytes]", proc.stdout)
+            chunks: list[bytes] = []
+            reader = threading.Thread(target=lambda: chunks.append(stdout.read()), daemon=True)
+            reader.start()
+            try:
+                feed(stdin)
+            except BrokenPipeError:
+                pass
+            except BaseException:
+                proc.kill()
+                raise
+            finally:
+                with contextlib.suppress(BrokenPipeError):
+                    stdin.close()
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
+            reader.join()
+        output = b"".join(chunks).decode("utf-8", errors="replace")
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args, output=output)
+        return subprocess.CompletedProcess(args, returncode, stdout=output)
+    finally:
+        record_call(host, "ssh", started)
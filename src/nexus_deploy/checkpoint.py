@@ -0,0 +1,198 @@
+"""On-disk phase checkpoints for resumable deploys.
+
+When :meth:`Orchestrator.run_all` aborts on a late phase, a rerun of
+``run-pipeline`` used to redo Infisical bootstrap, services-configure,
+gitea-configure, compose-restart, … from scratch. The journal kept
+here records, for every phase that finished ``ok``:
+
+* an **inputs hash** — the orchestrator's deploy inputs plus the
+  ``OrchestratorState`` fields the phase reads, and
+* its **outputs** — the ``OrchestratorState`` fields it writes, so a
+  skipped phase still hands the same state to its downstream phases.
+
+With ``--resume`` a phase whose inputs hash matches its journal entry
+is skipped, and its outputs are restored.
+
+Two files make up a checkpoint:
+
+* **Local journal** (:func:`journal_path`, mode 0600 because outputs
+  include the Gitea token and the Woodpecker OAuth secret). It lives
+  under ``$XDG_STATE_HOME`` (``$RUNNER_TEMP`` on CI runners), never in
+  the checkout, so a journal left behind by a failed deploy can't be
+  committed by a later ``git add -A``. It is rewritten after every
+  recorded phase, so an abort at any point leaves a usable journal. It is deleted once
+  ``run_all`` finishes without a failed phase; the next deploy is a
+  full one again.
+* **Server stamp** (``/opt/docker-server/.nexus-state/checkpoint-run-id``)
+  holds the journal's random ``run_id``. A resume only trusts the
+  journal when the stamp on the server matches it. A rebuilt server
+  (``tofu destroy`` + ``apply`` in between) has no stamp, so every
+  phase runs again. Nothing secret is written to the server.
+
+Any journal problem — unreadable, wrong version, stamp mismatch,
+stamp write failure — degrades to "run everything". The checkpoint
+can make a retry faster, never wrong.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import secrets
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+JOURNAL_FILENAME = ".nexus-checkpoint.json"
+_STATE_SUBDIR = "nexus-deploy"
+REMOTE_STATE_DIR = "/opt/docker-server/.nexus-state"
+REMOTE_STAMP_PATH = f"{REMOTE_STATE_DIR}/checkpoint-run-id"
+_VERSION = 1
+
+
+def inputs_hash(*parts: str) -> str:
+    """sha256 over ``parts``, NUL-separated so ("ab","c") != ("a","bc")."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def journal_path(project_root: Path) -> Path:
+    """Where the journal for ``project_root`` lives, outside the checkout.
+
+    ``$XDG_STATE_HOME`` (default ``~/.local/state``), or ``$RUNNER_TEMP``
+    on a CI runner that doesn't set it. One journal per checkout: the
+    file name carries a hash of the resolved project root.
+    """
+    base = os.environ.get("XDG_STATE_HOME") or os.environ.get("RUNNER_TEMP")
+    state_dir = Path(base) if base else Path.home() / ".local" / "state"
+    root_id = hashlib.sha256(str(project_root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return state_dir / _STATE_SUBDIR / f"{root_id}{JOURNAL_FILENAME}"
+
+
+@dataclass(frozen=True)
+class CheckpointEntry:
+    """One recorded phase."""
+
+    inputs: str
+    outputs: dict[str, Any]
+    name: str
+    detail: str
+    recorded_at: str
+
+
+@dataclass
+class CheckpointJournal:
+    """The local journal: ``run_id`` + per-phase :class:`CheckpointEntry`.
+
+    Thread-safe: phases scheduled in parallel record concurrently.
+    """
+
+    path: Path
+    run_id: str = field(default_factory=lambda: secrets.token_hex(16))
+    entries: dict[str, CheckpointEntry] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(cls, path: Path) -> CheckpointJournal | None:
+        """Read ``path``; None when missing or not a journal we understand."""
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            sys.stderr.write(f"  ⚠ checkpoint: ignoring unreadable {path} ({type(exc).__name__})\n")
+            return None
+        if not isinstance(raw, dict) or raw.get("version") != _VERSION:
+            sys.stderr.write(f"  ⚠ checkpoint: ignoring {path} (unknown format)\n")
+            return None
+        try:
+            entries = {key: CheckpointEntry(**value) for key, value in raw["phases"].items()}
+            return cls(path=path, run_id=str(raw["run_id"]), entries=entries)
+        except (KeyError, TypeError, AttributeError):
+            sys.stderr.write(f"  ⚠ checkpoint: ignoring {path} (unknown format)\n")
+            return None
+
+    def lookup(self, key: str, inputs: str) -> CheckpointEntry | None:
+        """The entry for ``key`` if it was recorded with the same inputs."""
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None or entry.inputs != inputs:
+            return None
+        return entry
+
+    def record(
+        self,
+        key: str,
+        *,
+        inputs: str,
+        outputs: dict[str, Any],
+        name: str,
+        detail: str,
+    ) -> None:
+        """Add/replace ``key`` and persist the journal."""
+        entry = CheckpointEntry(
+            inputs=inputs,
+            outputs=outputs,
+            name=name,
+            detail=detail,
+            recorded_at=datetime.now(UTC).isoformat(timespec="seconds"),
+        )
+        with self._lock:
+            self.entries[key] = entry
+            self._save_locked()
+
+    def save(self) -> None:
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        body = json.dumps(
+            {
+                "version": _VERSION,
+                "run_id": self.run_id,
+                "phases": {
+                    key: {
+                        "inputs": e.inputs,
+                        "outputs": e.outputs,
+                        "name": e.name,
+                        "detail": e.detail,
+                        "recorded_at": e.recorded_at,
+                    }
+                    for key, e in self.entries.items()
+                },
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        # Write-then-rename so a kill mid-write leaves the previous
+        # journal intact; 0600 from creation since outputs hold tokens.
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(body + "\n")
+        tmp.replace(self.path)
+
+    def discard(self) -> None:
+        """Delete the local journal (run finished; next deploy is full)."""
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+
+__all__ = [
+    "JOURNAL_FILENAME",
+    "REMOTE_STAMP_PATH",
+    "REMOTE_STATE_DIR",
+    "CheckpointEntry",
+    "CheckpointJournal",
+    "inputs_hash",
+    "journal_path",
+]
@@ -2,8 +2,17 @@
 
 Walks the enabled-services list, expands virtual services to their
 parent stacks, starts each stack via ``docker compose up -d --build``
-in parallel via bash ``&``/``wait``, and verifies each container made
-it into ``docker ps``.
+in parallel as bash background jobs, and verifies each container
+made it into ``docker ps`` — and, where the image defines a
+healthcheck, whether it reports healthy.
+
+Parallelism is bounded by a weight budget: every stack has a weight
+(``compose_weight`` in ``services.yaml``, else ``1 + len(support_images)``)
+and the remote scheduler only admits the next stack, in queue order,
+while the weights of the stacks still starting fit ``max_weight``.
+Starting 30+ stacks at once on a 16 GB box turned into a herd of image
+pulls and JVM start-ups (Kestra, Trino, OpenMetadata) that thrashed
+memory and timed out.
 
 Server-side bash loop, consistent with :mod:`infisical` /
 :mod:`secret_sync` / :mod:`seeder`: one SSH round-trip; the rendered
@@ -15,11 +24,14 @@ Eight rounds of hardening preserved (one regression test per round in
 R1. ``set -euo pipefail`` first executable line.
 R2. Per-stack firewall override applied when
     ``docker-compose.firewall.yml`` exists on the server.
-R3. Background-jobs + ``wait`` for parallel deploy; failed PIDs
-    surface via the per-service exit code.
+R3. Background jobs for parallel deploy, admitted under the weight
+    budget; each job reports its exit code on a completion FIFO, so
+    failures surface per service.
 R4. ``docker ps`` verification — a container that ``compose up``
     "succeeded" but didn't actually start (e.g. immediate exit due
-    to bad config) is counted as failed.
+    to bad config) is counted as failed. One ``docker ps -a``
+    snapshot per reap pass covers every stack that finished in it
+    (exact-name lookup), and carries the healthcheck state too.
 R5. Virtual-service deduplication: a parent stack started for one
     virtual service is NOT started a second time when another
     virtual service from the same parent appears.
@@ -33,14 +45,23 @@ R8. RESULT line emitted at end with started/failed counts; orchestrator
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import shlex
 import subprocess
 import sys
-from collections.abc import Callable
+import textwrap
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
 
 from nexus_deploy import _remote
+from nexus_deploy import image_prepull as _image_prepull
+from nexus_deploy import stamps as _stamps
+from nexus_deploy import tracing as _tracing
 
 # Hardcoded deploy-config: parent-stack mapping and deferred services.
 # New stacks that fit one of the two patterns get added here.
@@ -65,15 +86,63 @@ _REMOTE_STACKS_DIR = "/opt/docker-server/stacks"
 # compose-up environment via `set -a; source ...; set +a`.
 _REMOTE_GLOBAL_ENV = "/opt/docker-server/stacks/.env"
 
+# Weight budget of the stacks starting at once. Sized for a cx43
+# (16 GB): roughly two JVM-heavy stacks plus a couple of light ones.
+DEFAULT_MAX_WEIGHT = 8
+
+# Image label carrying the build-input hash of a locally built image.
+BUILD_HASH_LABEL = "org.nexus-stack.build-hash"
+
 # RESULT-line shape (same wire-format family as infisical / secret_sync
 # / seeder — `RESULT key=value key=value`). started/failed are counts;
 # the human-readable per-service status reaches the operator via stderr
 # warnings forwarded from the remote loop.
 _RESULT_PATTERN = re.compile(
-    r"^RESULT started=(?P<started>\d+) failed=(?P<failed>\d+)$",
+    r"^RESULT started=(?P<started>\d+) failed=(?P<failed>\d+)(?: skipped=(?P<skipped>\d+))?$",
     re.MULTILINE,
 )
 
+# Per-stack timing line, one per stack the scheduler started:
+# `STACK <name> status=started|failed wait_ms=N up_ms=N health=H`.
+_STACK_PATTERN = re.compile(
+    r"^STACK (?P<service>\S+) status=(?P<status>started|failed) "
+    r"wait_ms=(?P<wait_ms>\d+) up_ms=(?P<up_ms>\d+)"
+    r"(?: health=(?P<health>healthy|unhealthy|starting|none))?$",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class StackTiming:
+    """Start latency of one stack, split at admission.
+
+    ``wait_ms`` is the time the stack spent queued behind the weight
+    budget; ``up_ms`` runs from admission to the ``docker ps`` check.
+    ``health`` is the container's healthcheck state at that check
+    (``healthy`` / ``unhealthy`` / ``starting``), or ``none`` when the
+    image defines no healthcheck or the container isn't there.
+    """
+
+    service: str
+    status: str
+    wait_ms: int
+    up_ms: int
+    health: str = "none"
+
+    @property
+    def latency_ms(self) -> int:
+        """Queue wait plus compose-up time."""
+        return self.wait_ms + self.up_ms
+
+
+@dataclass(frozen=True)
+class ServiceBuild:
+    """An image built from a stack's ``build:`` services, and its input hash."""
+
+    image: str
+    hash: str
+    services: tuple[str, ...]
+
 
 @dataclass(frozen=True)
 class ComposeUpResult:
@@ -84,16 +153,35 @@ class ComposeUpResult:
     invariant). ``failed`` counts everything else: compose-up
     non-zero exit, container missing from ``docker ps`` post-up,
     missing ``docker-compose.yml`` for an enabled service.
+    ``skipped`` counts stacks left alone because their compose inputs
+    matched the ``compose-up`` stamp and the container was running
+    (only with ``skip_unchanged``). ``stacks`` holds the per-stack
+    timings of everything the scheduler started, in completion order.
+
+    ``started`` means running; :attr:`healthy` / :attr:`unhealthy`
+    narrow that down for stacks whose container has a healthcheck.
     """
 
     started: int
     failed: int
+    skipped: int = 0
+    stacks: tuple[StackTiming, ...] = ()
 
     @property
     def is_success(self) -> bool:
         """True iff zero failures."""
         return self.failed == 0
 
+    @property
+    def healthy(self) -> int:
+        """Started stacks whose healthcheck already reported healthy."""
+        return sum(1 for t in self.stacks if t.status == "started" and t.health == "healthy")
+
+    @property
+    def unhealthy(self) -> int:
+        """Started stacks whose healthcheck reported unhealthy."""
+        return sum(1 for t in self.stacks if t.status == "started" and t.health == "unhealthy")
+
 
 # ---------------------------------------------------------------------------
 # Pure-logic helpers — virtual-service resolution.
@@ -137,6 +225,139 @@ def expand_targets(enabled: list[str]) -> tuple[list[str], list[str]]:
     return parents, leaves
 
 
+def load_stack_weights(services_yaml: Path) -> dict[str, int]:
+    """Scheduler weight per service from ``services.yaml``.
+
+    An explicit ``compose_weight`` wins; otherwise the weight is one
+    per container the stack brings up (``1 + len(support_images)``).
+    A missing file yields ``{}`` (every stack weighs 1); an unreadable
+    one is reported and yields ``{}`` too — weights only shape the
+    schedule, they're never a reason to fail a deploy.
+    """
+    if not services_yaml.is_file():
+        return {}
+    try:
+        data = yaml.safe_load(services_yaml.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as exc:
+        sys.stderr.write(
+            f"  ⚠ compose weights: cannot read {services_yaml} ({type(exc).__name__})\n"
+        )
+        return {}
+    services = data.get("services") if isinstance(data, dict) else None
+    if not isinstance(services, dict):
+        return {}
+    weights: dict[str, int] = {}
+    for name, meta in services.items():
+        if not isinstance(meta, dict):
+            continue
+        explicit = meta.get("compose_weight")
+        if isinstance(explicit, int) and not isinstance(explicit, bool) and explicit > 0:
+            weights[str(name)] = explicit
+        else:
+            support = meta.get("support_images")
+            weights[str(name)] = 1 + (len(support) if isinstance(support, dict) else 0)
+    return weights
+
+
+def _project_name(stack: str) -> str:
+    """Compose's default project name for a stack dir."""
+    return re.sub(r"[^a-z0-9_-]", "", stack.lower())
+
+
+def _file_sha(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _build_args(raw: object, env: Mapping[str, str]) -> dict[str, str]:
+    """``build.args`` (mapping or ``KEY=VALUE`` list), interpolated."""
+    items: list[tuple[object, object]] = []
+    if isinstance(raw, dict):
+        items = list(raw.items())
+    elif isinstance(raw, list):
+        for entry in raw:
+            key, _, value = str(entry).partition("=")
+            items.append((key, value))
+    return {
+        str(k): _image_prepull.interpolate(str(v), env) if v is not None else "" for k, v in items
+    }
+
+
+def stack_builds(
+    local_stacks_dir: Path,
+    stacks: Iterable[str],
+    image_versions: Mapping[str, object] | None = None,
+) -> dict[str, tuple[ServiceBuild, ...]]:
+    """Build-input hash of every locally built image, per stack.
+
+    For each service with a ``build:`` section: the image it is tagged
+    as (``image:`` interpolated like :mod:`image_prepull` does, else
+    compose's ``<project>-<service>``), hashed together with the
+    Dockerfile, build args, target and :func:`stamps.tree_hash` of the
+    whole context dir. The whole dir is what docker sends (no stack
+    has a ``.dockerignore``), so this errs towards rebuilding.
+
+    The hash leaves out the service name, so services that build the
+    same image (dagster + dagster-daemon) agree on the label. Stacks
+    whose contexts can't be hashed (remote URL, missing dir) are left
+    out and keep ``--build``.
+    """
+    pins = _image_prepull.image_env(image_versions or {})
+    builds: dict[str, tuple[ServiceBuild, ...]] = {}
+    for stack in stacks:
+        stack_dir = local_stacks_dir / stack
+        compose_file = stack_dir / "docker-compose.yml"
+        try:
+            data = yaml.safe_load(compose_file.read_text(encoding="utf-8"))
+        except (OSError, yaml.YAMLError):
+            continue
+        services = data.get("services") if isinstance(data, dict) else None
+        if not isinstance(services, dict):
+            continue
+        env = {**_image_prepull.read_dotenv(stack_dir / ".env"), **pins}
+        found: dict[str, ServiceBuild] = {}
+        hashable = True
+        for name, spec in services.items():
+            if not isinstance(spec, dict) or "build" not in spec:
+                continue
+            build = spec["build"]
+            if isinstance(build, str):
+                build = {"context": build}
+            if not isinstance(build, dict):
+                hashable = False
+                break
+            context = _image_prepull.interpolate(str(build.get("context", ".")), env)
+            context_dir = (stack_dir / context).resolve()
+            if "://" in context or not context_dir.is_dir():
+                hashable = False
+                break
+            dockerfile = str(build.get("dockerfile", "Dockerfile"))
+            raw_image = spec.get("image")
+            image = (
+                _image_prepull.interpolate(raw_image, env).strip()
+                if isinstance(raw_image, str)
+                else ""
+            ) or f"{_project_name(stack)}-{name}"
+            inputs = {
+                "image": image,
+                "context": context,
+                "dockerfile": dockerfile,
+                "dockerfile_sha": _file_sha(context_dir / dockerfile),
+                "args": _build_args(build.get("args"), env),
+                "target": str(build.get("target", "")),
+                "tree": _stamps.tree_hash(context_dir),
+            }
+            digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+            previous = found.get(image)
+            services_for_image = (*previous.services, str(name)) if previous else (str(name),)
+            found[image] = ServiceBuild(image=image, hash=digest, services=services_for_image)
+        if hashable and found:
+            builds[stack] = tuple(found.values())
+    return builds
+
+
 # ---------------------------------------------------------------------------
 # Bash rendering — produces the server-side script that
 # `_remote.ssh_run_script` will exec via stdin.
@@ -151,8 +372,13 @@ def render_remote_script(
     metabase_storage_prep: bool = False,
     stacks_dir: str = _REMOTE_STACKS_DIR,
     global_env: str = _REMOTE_GLOBAL_ENV,
+    skip_unchanged: bool = False,
+    stamps_dir: str | None = None,
+    weights: Mapping[str, int] | None = None,
+    max_weight: int = DEFAULT_MAX_WEIGHT,
+    builds: Mapping[str, Sequence[ServiceBuild]] | None = None,
 ) -> str:
-    """Render the bash that does parallel ``docker compose up`` + verify.
+    """Render the bash that does bounded-parallel ``docker compose up`` + verify.
 
     All inputs are shlex-quoted. Service names land in a bash array
     (one per line, quoted) so spaces / special chars in a hypothetical
@@ -162,31 +388,118 @@ def render_remote_script(
       1. ``set -euo pipefail``, ``set -a``+source the global env
          (image-version pins).
       2. Pre-deploy hooks (e.g. Dify storage perms) gated on flags.
-      3. Spawn ``docker compose up -d --build`` in the background
-         for every parent stack AND every leaf stack — PIDs from
-         both tiers accumulate in a single ``PIDS`` array, no
-         barrier between them. (Acceptable because parents and
-         leaves don't share docker-compose YAML or container
+      3. Queue every parent stack AND every leaf stack — one queue,
+         no barrier between the tiers. (Acceptable because parents
+         and leaves don't share docker-compose YAML or container
          dependencies in practice — the parent/leaf split is just
          a virtual-service-mapping convention, not a startup-order
          constraint.) Each leaf invocation also applies
          ``-f docker-compose.firewall.yml`` when present on disk.
-      4. ``wait`` each PID, then verify the container is in
-         ``docker ps`` (R4 — fixed-string + line-exact grep). The
-         rendered bash splits per-service ✓ to stdout and ✗ to
+      4. Admit queued stacks in order as background
+         ``docker compose up -d --build`` jobs while the summed
+         weight of the running ones stays within ``max_weight``.
+         A stack heavier than the whole budget still runs, alone,
+         once nothing else is running. Whichever job finishes
+         first is reaped (its exit code arrives on a completion
+         FIFO) together with any other job already done, and their
+         weight is freed for the next stacks. All stacks of one reap
+         pass are verified against a single ``docker ps -a``
+         snapshot (R4 — exact container-name lookup): a container
+         that isn't ``running`` fails the stack, and the snapshot's
+         healthcheck state is reported alongside.
+         The rendered bash splits per-service ✓ to stdout and ✗ to
          stderr, but ``_remote.ssh_run_script(merge_stderr=True)``
          merges them on capture, and ``run_compose_up`` then
-         forwards every non-RESULT line to local stderr. Net
+         forwards every non-wire line to local stderr. Net
          operator UX: both ✓ and ✗ land in the workflow-log
-         stderr stream alongside the bash warnings, in source
-         order. A future paramiko refactor could preserve the
-         split if desired.
+         stderr stream alongside the bash warnings, in completion
+         order. Each reaped stack also emits a
+         ``STACK <name> status=... wait_ms=N up_ms=N health=...`` line.
       5. Emit the RESULT line on stdout.
+
+    ``weights`` maps a stack name to its weight (missing → 1, values
+    below 1 are clamped to 1); see :func:`load_stack_weights`.
+
+    ``builds`` (see :func:`stack_builds`) lists, per stack, the images
+    its ``build:`` services produce and their input hash. Such a stack
+    starts without ``--build`` when every image already carries its
+    hash in the ``BUILD_HASH_LABEL`` label. Otherwise it builds with a
+    generated override file that adds the label. Stacks not in
+    ``builds`` always get ``--build`` (a no-op without ``build:``).
+
+    ``skip_unchanged`` adds a per-stack input hash (global env +
+    ``docker-compose*.yml`` + the stack's ``.env``, hashed on the
+    server). A stack whose hash matches its ``compose-up`` stamp and
+    whose container is running in the ``docker ps`` snapshot taken
+    before queueing is skipped. A stack
+    that starts and verifies gets its stamp (re)written. Stacks with
+    a ``build:`` section are never skipped because their build
+    contexts aren't part of the hash. The RESULT line gains
+    ``skipped=N``.
     """
+    if max_weight < 1:
+        raise ValueError(f"max_weight must be >= 1, got {max_weight}")
     stacks_q = shlex.quote(stacks_dir)
     env_q = shlex.quote(global_env)
     parents_q = " ".join(shlex.quote(p) for p in parents)
     leaves_q = " ".join(shlex.quote(le) for le in leaves)
+    known = weights or {}
+    build_block = build_select = ""
+    if builds:
+        checks_q = " ".join(
+            f"[{shlex.quote(stack)}]="
+            + shlex.quote(" ".join(f"{b.image} {b.hash}" for b in stack_images))
+            for stack, stack_images in builds.items()
+        )
+        labels_q = " ".join(
+            f"[{shlex.quote(stack)}]="
+            + shlex.quote(
+                json.dumps(
+                    {
+                        "services": {
+                            svc: {"build": {"labels": {BUILD_HASH_LABEL: b.hash}}}
+                            for b in stack_images
+                            for svc in b.services
+                        }
+                    }
+                )
+            )
+            for stack, stack_images in builds.items()
+        )
+        build_block = f"""
+# Locally built images: "<image> <hash> ..." per stack, and the
+# override (JSON is YAML) that stamps the hash label at build time.
+declare -A BUILD_CHECKS=({checks_q})
+declare -A BUILD_LABELS=({labels_q})
+LABELS_DIR=$(mktemp -d)
+trap 'rm -rf "$LABELS_DIR"' EXIT
+
+# True iff every image of the stack exists with its current hash label.
+build_current() {{
+    local pairs k have
+    read -r -a pairs <<< "${{BUILD_CHECKS[$1]}}"
+    for ((k = 0; k < ${{#pairs[@]}}; k += 2)); do
+        have=$(docker image inspect --format '{{{{index .Config.Labels "{BUILD_HASH_LABEL}"}}}}' \\
+            "${{pairs[k]}}" 2>/dev/null || true)
+        [ "$have" = "${{pairs[k+1]}}" ] || return 1
+    done
+}}
+"""
+        build_select = """    if [ -n "${BUILD_CHECKS[$svc]:-}" ]; then
+        if build_current "$svc"; then
+            build=()
+            echo "  ⏭ $svc images match their build inputs — not rebuilding"
+        else
+            [ "${#files[@]}" -gt 0 ] || files=(-f docker-compose.yml)
+            printf '%s\\n' "${BUILD_LABELS[$svc]}" > "$LABELS_DIR/$svc.yml"
+            files+=(-f "$LABELS_DIR/$svc.yml")
+        fi
+    fi
+"""
+    weights_q = " ".join(
+        f"[{shlex.quote(svc)}]={max(1, known.get(svc, 1))}"
+        for svc in dict.fromkeys([*parents, *leaves])
+    )
 
     dify_block = ""
     if dify_storage_prep:
@@ -219,10 +532,68 @@ if [ "$(stat -c '%u:%g' /mnt/nexus-data/metabase)" != "2000:2000" ]; then
 fi
 """
 
+    skip_block = parent_skip = leaf_skip = parent_record = leaf_record = ""
+    stamp_write = result_extra = ""
+    if skip_unchanged:
+        stamps_q = shlex.quote(stamps_dir or _stamps.stamp_dir("compose-up"))
+        skip_block = f"""
+STAMPS_DIR={stamps_q}
+SKIPPED=0
+Q_HASHES=()
+
+# Input hash of one stack; empty (= never skip) for stacks that build
+# images, whose contexts aren't hashed.
+compose_input_hash() {{
+    local dir="$STACKS_DIR/$1" f
+    local files=()
+    if grep -qsE '^[[:space:]]*build:' "$dir"/docker-compose*.yml; then
+        return 0
+    fi
+    for f in "$GLOBAL_ENV" "$dir"/docker-compose*.yml "$dir/.env"; do
+        if [ -f "$f" ]; then
+            files+=("$f")
+        fi
+    done
+    cat "${{files[@]}}" | sha256sum | cut -c1-64
+}}
+
+# Unchanged = stamp matches AND the container is running (one
+# snapshot for the whole queueing pass).
+snapshot
+stack_unchanged() {{
+    [ -n "$2" ] || return 1
+    [ "$(cat "$STAMPS_DIR/$1" 2>/dev/null || true)" = "$2" ] || return 1
+    case "${{CONTAINERS[$1]:-}}" in
+        "running "*) return 0 ;;
+        *) return 1 ;;
+    esac
+}}
+"""
+        # Same check at both indent levels (parents loop nests it
+        # inside the compose.yml-exists branch).
+        skip_check = textwrap.dedent("""\
+            h=$(compose_input_hash "$svc")
+            if stack_unchanged "$svc" "$h"; then
+                SKIPPED=$((SKIPPED+1))
+                echo "  ⏭ $svc unchanged — skipped"
+                continue
+            fi
+            """)
+        parent_skip = textwrap.indent(skip_check, " " * 8)
+        leaf_skip = textwrap.indent(skip_check, " " * 4)
+        parent_record = " " * 8 + 'Q_HASHES+=("$h")\n'
+        leaf_record = " " * 4 + 'Q_HASHES+=("$h")\n'
+        stamp_write = """            if [ -n "${Q_HASHES[$i]}" ]; then
+                { mkdir -p "$STAMPS_DIR" && echo "${Q_HASHES[$i]}" > "$STAMPS_DIR/$name"; } || true
+            fi
+"""
+        result_extra = " skipped=$SKIPPED"
+
     return f"""set -euo pipefail
 
 STACKS_DIR={stacks_q}
 GLOBAL_ENV={env_q}
+MAX_WEIGHT={max_weight}
 
 # Source image-version pins so compose-up sees the right tags.
 if [ -f "$GLOBAL_ENV" ]; then
@@ -234,74 +605,177 @@ fi
 
 PARENTS=({parents_q})
 LEAVES=({leaves_q})
-{dify_block}{metabase_block}
+declare -A WEIGHTS=({weights_q})
+
+# State of every container, "<state> <health>" by exact name, from ONE
+# `docker ps -a` call. health is the healthcheck verdict docker appends
+# to .Status, or "none" when the image defines no healthcheck.
+declare -A CONTAINERS=()
+snapshot() {{
+    local name state status health
+    CONTAINERS=()
+    while IFS=$'\t' read -r name state status; do
+        [ -n "$name" ] || continue
+        case "$status" in
+            *"(healthy)"*) health=healthy ;;
+            *"(unhealthy)"*) health=unhealthy ;;
+            *"(health: starting)"*) health=starting ;;
+            *) health=none ;;
+        esac
+        CONTAINERS[$name]="$state $health"
+    done < <(docker ps -a --format '{{{{.Names}}}}\t{{{{.State}}}}\t{{{{.Status}}}}' 2>/dev/null || true)
+}}
+{dify_block}{metabase_block}{skip_block}{build_block}
 STARTED=0
 FAILED=0
-PIDS=()
-NAMES=()
-
-# 1. Start parent stacks (parallel — see docstring for why no barrier
-#    between parents and leaves).
+# Queue of stacks to start: name, firewall-override flag, weight.
+Q_NAMES=()
+Q_FIREWALL=()
+Q_WEIGHTS=()
+
+enqueue() {{
+    Q_NAMES+=("$1")
+    Q_FIREWALL+=("$2")
+    Q_WEIGHTS+=("${{WEIGHTS[$1]:-1}}")
+}}
+
+# Milliseconds since the epoch, from bash's own clock (no fork).
+now_ms() {{
+    local us=${{EPOCHREALTIME/[.,]/}}
+    echo $((us / 1000))
+}}
+
+# 1. Queue parent stacks (no barrier between parents and leaves — see
+#    docstring).
 # A missing parent compose.yml is a real configuration error: a
 # virtual service is enabled, its parent is implied, and the
 # parent's compose.yml is missing — operators need to know. We
 # unify the two tiers (parent + leaf) so both treat it as failed.
 for svc in "${{PARENTS[@]}}"; do
     if [ -f "$STACKS_DIR/$svc/docker-compose.yml" ]; then
-        ( cd "$STACKS_DIR/$svc" && docker compose up -d --build 2>&1 ) &
-        PIDS+=($!)
-        NAMES+=("$svc")
-    else
+{parent_skip}        enqueue "$svc" 0
+{parent_record}    else
         echo "  ⚠ docker-compose.yml missing for parent $svc" >&2
         FAILED=$((FAILED+1))
     fi
 done
 
-# 2. Start leaf stacks in parallel, applying firewall override if present.
+# 2. Queue leaf stacks, noting which carry a firewall override.
 for svc in "${{LEAVES[@]}}"; do
     if [ ! -f "$STACKS_DIR/$svc/docker-compose.yml" ]; then
         echo "  ⚠ docker-compose.yml missing for $svc" >&2
         FAILED=$((FAILED+1))
         continue
     fi
-    if [ -f "$STACKS_DIR/$svc/docker-compose.firewall.yml" ]; then
-        ( cd "$STACKS_DIR/$svc" && docker compose -f docker-compose.yml -f docker-compose.firewall.yml up -d --build 2>&1 ) &
+{leaf_skip}    if [ -f "$STACKS_DIR/$svc/docker-compose.firewall.yml" ]; then
+        enqueue "$svc" 1
     else
-        ( cd "$STACKS_DIR/$svc" && docker compose up -d --build 2>&1 ) &
+        enqueue "$svc" 0
     fi
-    PIDS+=($!)
-    NAMES+=("$svc")
-done
+{leaf_record}done
+
+# 3. Admit queued stacks while their weights fit the budget; reap
+#    whichever finishes first, verify it, admit the next. Each job
+#    reports "<queue index> <rc>" on fd 3 (a FIFO) when it exits, so
+#    the scheduler blocks on `read` instead of `wait -n`, which misses
+#    jobs bash already reaped during a command substitution.
+DONE_FIFO=$(mktemp -u)
+mkfifo "$DONE_FIFO"
+exec 3<>"$DONE_FIFO"
+rm -f "$DONE_FIFO"
+PIDS=()
+ADMITTED_AT=()
+RUNNING=0
+RUNNING_WEIGHT=0
+NEXT=0
+T0=$(now_ms)
+
+start_stack() {{
+    local i=$1 svc=${{Q_NAMES[$1]}}
+    local files=() build=(--build)
+    if [ "${{Q_FIREWALL[$i]}}" = 1 ]; then
+        files=(-f docker-compose.yml -f docker-compose.firewall.yml)
+    fi
+{build_select}    (
+        if ( cd "$STACKS_DIR/$svc" && docker compose "${{files[@]}}" up -d "${{build[@]}}" 2>&1 ) 3>&-; then
+            rc=0
+        else
+            rc=$?
+        fi
+        echo "$i $rc" >&3
+    ) &
+    PIDS[$i]=$!
+    ADMITTED_AT[$i]=$(now_ms)
+    RUNNING=$((RUNNING+1))
+    RUNNING_WEIGHT=$((RUNNING_WEIGHT + Q_WEIGHTS[i]))
+}}
+
+while [ "$NEXT" -lt "${{#Q_NAMES[@]}}" ] || [ "$RUNNING" -gt 0 ]; do
+    # FIFO admission. With nothing running the head is always
+    # admitted, so a stack heavier than the budget runs alone.
+    while [ "$NEXT" -lt "${{#Q_NAMES[@]}}" ]; do
+        if [ "$RUNNING" -gt 0 ] \\
+            && [ $((RUNNING_WEIGHT + Q_WEIGHTS[NEXT])) -gt "$MAX_WEIGHT" ]; then
+            break
+        fi
+        start_stack "$NEXT"
+        NEXT=$((NEXT+1))
+    done
+
+    # Block for one finished job, then take every other one that is
+    # already done, so a single snapshot verifies them all.
+    read -r i rc <&3
+    DONE=("$i $rc")
+    while read -r -t 0 <&3; do
+        read -r i rc <&3
+        DONE+=("$i $rc")
+    done
+    for entry in "${{DONE[@]}}"; do
+        read -r i rc <<< "$entry"
+        wait "${{PIDS[$i]}}" || true
+        RUNNING=$((RUNNING-1))
+        RUNNING_WEIGHT=$((RUNNING_WEIGHT - Q_WEIGHTS[i]))
+    done
+    snapshot
+    now=$(now_ms)
+
+    for entry in "${{DONE[@]}}"; do
+        read -r i rc <<< "$entry"
+        name=${{Q_NAMES[$i]}}
+        wait_ms=$((ADMITTED_AT[i] - T0))
+        up_ms=$((now - ADMITTED_AT[i]))
+        # Exact-name lookup: no substring or pattern matching, so
+        # `foo` doesn't match `foo-bar` and `foo.bar` doesn't match
+        # `fooXbar` (the R4 cases).
+        read -r state health <<< "${{CONTAINERS[$name]:-missing none}}"
+
+        status=failed
+        if [ "$rc" -eq 0 ] && [ "$state" = running ]; then
+            status=started
+        fi
 
-# 3. Wait for all PIDs, verify container is running for each.
-for i in "${{!PIDS[@]}}"; do
-    pid=${{PIDS[$i]}}
-    name=${{NAMES[$i]}}
-    if wait "$pid"; then
-        # `docker ps --format '{{{{.Names}}}}' | grep -qFx -- "$name"`:
-        # -F treats $name as a fixed string (so a hypothetical future
-        # stack name with regex metacharacters like `.`, `[`, `*`
-        # can't false-match), -x requires the entire line to match,
-        # and `--` terminates options so a name starting with `-`
-        # doesn't get parsed as a flag. Equivalent semantic to
-        # `^name$` regex but safe for arbitrary inputs. Verified by
-        # R4 exec'd-bash test against substring-trap + regex-meta
-        # inputs.
-        if docker ps --format '{{{{.Names}}}}' | grep -qFx -- "$name"; then
+        if [ "$status" = started ]; then
             STARTED=$((STARTED+1))
-            echo "  ✓ $name started and running"
-        else
+            case "$health" in
+                healthy) echo "  ✓ $name started and healthy (${{up_ms}}ms, queued ${{wait_ms}}ms)" ;;
+                unhealthy) echo "  ⚠ $name started but its healthcheck reports unhealthy (${{up_ms}}ms)" ;;
+                *) echo "  ✓ $name started and running (${{up_ms}}ms, queued ${{wait_ms}}ms)" ;;
+            esac
+{stamp_write}        elif [ "$rc" -ne 0 ]; then
+            FAILED=$((FAILED+1))
+            echo "  ✗ $name compose up failed (rc=$rc)" >&2
+        elif [ "$state" = missing ]; then
             FAILED=$((FAILED+1))
             echo "  ✗ $name compose up succeeded but container not in 'docker ps'" >&2
+        else
+            FAILED=$((FAILED+1))
+            echo "  ✗ $name compose up succeeded but container is $state" >&2
         fi
-    else
-        rc=$?
-        FAILED=$((FAILED+1))
-        echo "  ✗ $name compose up failed (rc=$rc)" >&2
-    fi
+        echo "STACK $name status=$status wait_ms=$wait_ms up_ms=$up_ms health=$health"
+    done
 done
 
-echo "RESULT started=$STARTED failed=$FAILED"
+echo "RESULT started=$STARTED failed=$FAILED{result_extra}"
 """
 
 
@@ -315,7 +789,22 @@ def parse_result(stdout: str) -> ComposeUpResult | None:
     if match is None:
         return None
     g = match.groupdict()
-    return ComposeUpResult(started=int(g["started"]), failed=int(g["failed"]))
+    stacks = tuple(
+        StackTiming(
+            service=m["service"],
+            status=m["status"],
+            wait_ms=int(m["wait_ms"]),
+            up_ms=int(m["up_ms"]),
+            health=m["health"] or "none",
+        )
+        for m in _STACK_PATTERN.finditer(stdout)
+    )
+    return ComposeUpResult(
+        started=int(g["started"]),
+        failed=int(g["failed"]),
+        skipped=int(g["skipped"] or 0),
+        stacks=stacks,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -333,6 +822,11 @@ def run_compose_up(
     dify_storage_prep: bool | None = None,
     metabase_storage_prep: bool | None = None,
     script_runner: ScriptRunner | None = None,
+    skip_unchanged: bool = False,
+    weights: Mapping[str, int] | None = None,
+    max_weight: int = DEFAULT_MAX_WEIGHT,
+    local_stacks_dir: Path | None = None,
+    image_versions: Mapping[str, object] | None = None,
 ) -> ComposeUpResult:
     """Render → exec → parse.
 
@@ -360,6 +854,17 @@ def run_compose_up(
 
     ``script_runner`` is a dependency-injection seam for tests;
     production callers leave it None.
+
+    ``skip_unchanged`` leaves running stacks with unchanged inputs alone
+    (see :func:`render_remote_script`).
+
+    ``weights`` / ``max_weight`` bound how many stacks start at once
+    (see :func:`render_remote_script` and :func:`load_stack_weights`).
+
+    ``local_stacks_dir`` (the runner's ``stacks/`` tree, what stack-sync
+    pushed) turns on build-input hashing (:func:`stack_builds`), with
+    ``image_versions`` resolving the ``IMAGE_*`` tags. Without it every
+    stack gets ``--build``, as before.
     """
     parents, leaves = expand_targets(enabled)
     actual_dify = dify_storage_prep if dify_storage_prep is not None else "dify" in enabled
@@ -367,23 +872,35 @@ def run_compose_up(
         metabase_storage_prep if metabase_storage_prep is not None else "metabase" in enabled
     )
 
-    script = render_remote_script(
-        parents=parents,
-        leaves=leaves,
-        dify_storage_prep=actual_dify,
-        metabase_storage_prep=actual_metabase,
-    )
+    with _tracing.span("compose-up render", "render"):
+        builds = (
+            stack_builds(local_stacks_dir, [*parents, *leaves], image_versions)
+            if local_stacks_dir is not None
+            else {}
+        )
+        script = render_remote_script(
+            parents=parents,
+            leaves=leaves,
+            dify_storage_prep=actual_dify,
+            metabase_storage_prep=actual_metabase,
+            skip_unchanged=skip_unchanged,
+            weights=weights,
+            max_weight=max_weight,
+            builds=builds,
+        )
 
     run_script = script_runner or (lambda s: _remote.ssh_run_script(s, host=host))
     completed = run_script(script)
 
     # Forward remote per-service ✓/✗ + warnings to local stderr (Modul-1.2
-    # Round-4 pattern). The RESULT wire-format line is stripped.
+    # Round-4 pattern). The RESULT / STACK wire-format lines are stripped
+    # (the ✓ line already carries the timings).
     for line in completed.stdout.splitlines():
-        if not line.startswith("RESULT "):
+        if not line.startswith(("RESULT ", "STACK ")):
             sys.stderr.write(line + "\n")
 
-    result = parse_result(completed.stdout)
+    with _tracing.span("compose-up parse", "parse"):
+        result = parse_result(completed.stdout)
     if result is None:
         # No RESULT — count every requested service as failed (mirrors
         # seeder.py's assumption that none of them landed).
@@ -25,6 +25,9 @@ Two transports, used deliberately:
 - **REST via port-forward + requests** for token, email PATCH, repo
   CRUD, collaborator add. By the time the token is minted, the admin
   password has already been synced via CLI, so basic-auth works.
+  Every call goes through one pooled keep-alive session per client
+  family, so a runner's dozens of calls share a handful of tunnel
+  connections; idempotent calls retry 502/503/504 with backoff.
 
 R7 (token-not-in-LOCAL-argv): all REST calls use ``requests`` with
 ``auth=(user, pw)`` or ``headers={"Authorization": f"token {tok}"}``
@@ -53,14 +56,21 @@ Username/repo-name with shell metacharacters are rejected up front.
 
 from __future__ import annotations
 
+import dataclasses
 import re
 import shlex
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from types import TracebackType
 from typing import Literal
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from nexus_deploy.config import NexusConfig, service_host
 from nexus_deploy.ssh import SSHClient
@@ -69,6 +79,15 @@ _CONNECT_TIMEOUT_S: float = 3.0
 _READ_TIMEOUT_S: float = 15.0
 _HTTP_TIMEOUT: tuple[float, float] = (_CONNECT_TIMEOUT_S, _READ_TIMEOUT_S)
 
+# Mirrors migrated at once by run_mirror_setup. Each migrate blocks
+# while Gitea clones from GitHub; Gitea queues beyond its own worker
+# count anyway, so a small pool captures most of the win.
+DEFAULT_MIRROR_WORKERS = 4
+
+# First wait between mirror-sync completion checks; doubles up to the
+# caller's poll interval.
+_MIRROR_SYNC_FIRST_POLL_S = 0.25
+
 _PATH_SAFE_RE: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9._-]+$")
 
 # Services that have Git integration (clone the workspace repo on start).
@@ -83,6 +102,48 @@ _GIT_INTEGRATED_SERVICES: tuple[str, ...] = (
 )
 
 
+# One keep-alive pool per client family (``with_token`` derivatives
+# share it). Sized for the mirror runner's concurrent calls; the
+# port-forward is a single SSH channel per connection, so reuse saves
+# a tunnel handshake per call.
+_POOL_MAXSIZE = 8
+
+# Uniform retry policy for the API. Connect errors are retried for
+# every method (nothing reached Gitea). 502/503/504 and read errors
+# only for idempotent methods — a retried POST could mint a second
+# token or fork. Exhausted status retries hand back the last response
+# (raise_on_status=False) so callers keep their per-status handling.
+_API_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=1,
+    status=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}),
+    raise_on_status=False,
+)
+
+
+def _new_session(base_url: str) -> requests.Session:
+    """Pooled session: retrying adapter for ``/api/v1/``, plain for the rest.
+
+    ``/api/healthz`` (``wait_ready``) keeps a retry-free adapter — the
+    probe loop is its own retry and clamps every attempt to its
+    deadline, which adapter-level backoff would overrun.
+    """
+    session = requests.Session()
+    session.mount(
+        f"{base_url}/",
+        HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE, max_retries=0),
+    )
+    session.mount(
+        f"{base_url}/api/v1/",
+        HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE, max_retries=_API_RETRY),
+    )
+    return session
+
+
 def _http_timeout_for_deadline(deadline: float) -> tuple[float, float]:
     """Build a (connect, read) tuple clamped to time remaining.
 
@@ -267,6 +328,8 @@ class MirrorResult:
     name: str
     status: MirrorStatus
     detail: str = ""
+    # Wall time of migrate + collaborator add — shows the slow upstreams.
+    ms: int = 0
 
 
 @dataclass(frozen=True)
@@ -633,6 +696,9 @@ class GiteaClient:
     R5 path-safety regex before the f-string runs. Credentials in
     Authorization header only — ``with_token`` returns a new client
     instance so the pre/post-token modes don't share mutable state.
+    They do share the pooled :class:`requests.Session` (connections
+    carry no credentials), so the token client reuses the keep-alive
+    connections the basic-auth client opened.
     """
 
     def __init__(
@@ -649,6 +715,7 @@ class GiteaClient:
         self.admin_username = admin_username
         self._auth: tuple[str, str] | None = (admin_username, admin_password)
         self._token: str | None = None
+        self._session = _new_session(self.base_url)
 
     def with_token(self, token: str) -> GiteaClient:
         """Return a NEW client that uses token-auth instead of basic-auth.
@@ -666,8 +733,24 @@ class GiteaClient:
         new.admin_username = self.admin_username
         new._auth = None
         new._token = token
+        new._session = self._session
         return new
 
+    def close(self) -> None:
+        """Close the pooled connections (shared with ``with_token`` clients)."""
+        self._session.close()
+
+    def __enter__(self) -> GiteaClient:
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc: BaseException | None,
+        _tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def _request_kwargs(self) -> dict[str, object]:
         """Build auth kwargs (headers OR auth tuple, never both)."""
         if self._token is not None:
@@ -684,7 +767,7 @@ class GiteaClient:
         deadline = time.monotonic() + timeout_s
         while time.monotonic() < deadline:
             try:
-                resp = requests.get(
+                resp = self._session.get(
                     f"{self.base_url}/api/healthz",
                     timeout=_http_timeout_for_deadline(deadline),
                 )
@@ -711,7 +794,7 @@ class GiteaClient:
         _validate_path_segment(username, kind="username")
         body = {"email": email, "source_id": 0, "login_name": login_name}
         try:
-            resp = requests.patch(
+            resp = self._session.patch(
                 f"{self.base_url}/api/v1/admin/users/{username}",
                 json=body,
                 timeout=_HTTP_TIMEOUT,
@@ -725,7 +808,7 @@ class GiteaClient:
         _validate_path_segment(owner, kind="owner")
         _validate_path_segment(name, kind="repo_name")
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/api/v1/repos/{owner}/{name}",
                 timeout=_HTTP_TIMEOUT,
                 **self._request_kwargs(),  # type: ignore[arg-type]
@@ -761,7 +844,7 @@ class GiteaClient:
             "default_branch": default_branch,
         }
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/api/v1/user/repos",
                 json=body,
                 timeout=_HTTP_TIMEOUT,
@@ -793,7 +876,7 @@ class GiteaClient:
         _validate_path_segment(owner, kind="owner")
         _validate_path_segment(name, kind="repo_name")
         try:
-            resp = requests.patch(
+            resp = self._session.patch(
                 f"{self.base_url}/api/v1/repos/{owner}/{name}",
                 json={"private": private},
                 timeout=_HTTP_TIMEOUT,
@@ -819,7 +902,7 @@ class GiteaClient:
         _validate_path_segment(name, kind="repo_name")
         _validate_path_segment(collaborator, kind="collaborator")
         try:
-            resp = requests.put(
+            resp = self._session.put(
                 f"{self.base_url}/api/v1/repos/{owner}/{name}/collaborators/{collaborator}",
                 json={"permission": permission},
                 timeout=_HTTP_TIMEOUT,
@@ -843,7 +926,7 @@ class GiteaClient:
         """
         _validate_path_segment(username, kind="username")
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/api/v1/users/{username}",
                 timeout=_HTTP_TIMEOUT,
                 **self._request_kwargs(),  # type: ignore[arg-type]
@@ -910,7 +993,7 @@ class GiteaClient:
             "uid": owner_uid,
         }
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/api/v1/repos/migrate",
                 json=body,
                 timeout=_HTTP_TIMEOUT,
@@ -957,7 +1040,7 @@ class GiteaClient:
         _validate_path_segment(owner, kind="owner")
         _validate_path_segment(name, kind="repo_name")
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/api/v1/repos/{owner}/{name}/mirror-sync",
                 timeout=_HTTP_TIMEOUT,
                 **self._request_kwargs(),  # type: ignore[arg-type]
@@ -971,9 +1054,9 @@ class GiteaClient:
         commit SHA of the branch tip, or ``None`` on any failure
         (transport, 4xx, malformed response).
 
-        Used by :func:`run_mirror_setup` to poll for mirror-sync
-        completion: trigger the sync, then watch the mirror's HEAD
-        SHA until it changes from the pre-sync baseline.
+        Used by :func:`run_mirror_setup` to report what a mirror-sync
+        brought in, and as the completion signal when the server
+        doesn't report ``mirror_updated``.
 
         Branch names may legitimately contain slashes (``feat/foo``,
         ``release/1.2``); URL-encode the branch segment rather than
@@ -985,7 +1068,7 @@ class GiteaClient:
         _validate_path_segment(name, kind="repo_name")
         encoded_branch = urllib.parse.quote(branch, safe="")
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/api/v1/repos/{owner}/{name}/branches/{encoded_branch}",
                 timeout=_HTTP_TIMEOUT,
                 **self._request_kwargs(),  # type: ignore[arg-type]
@@ -1004,6 +1087,46 @@ class GiteaClient:
         sha = commit.get("id")
         return sha if isinstance(sha, str) else None
 
+    def get_mirror_updated(self, owner: str, name: str) -> tuple[datetime | None, datetime | None]:
+        """``GET /api/v1/repos/<o>/<n>`` — ``(mirror_updated, server_now)``.
+
+        Gitea stamps ``mirror_updated`` when a mirror fetch finishes,
+        whether or not the fetch brought new commits. ``server_now`` is
+        the response's ``Date`` header: a baseline on the server's clock
+        (same one-second resolution) for telling a fetch that finished
+        after this call from an earlier one. Either is ``None`` on any
+        failure, or when Gitea doesn't report it.
+        """
+        _validate_path_segment(owner, kind="owner")
+        _validate_path_segment(name, kind="repo_name")
+        try:
+            resp = self._session.get(
+                f"{self.base_url}/api/v1/repos/{owner}/{name}",
+                timeout=_HTTP_TIMEOUT,
+                **self._request_kwargs(),  # type: ignore[arg-type]
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            return None, None
+        if resp.status_code != 200:
+            return None, None
+        try:
+            server_now: datetime | None = parsedate_to_datetime(resp.headers.get("Date", ""))
+        except (TypeError, ValueError):
+            server_now = None
+        try:
+            payload = resp.json()
+        except ValueError:
+            return None, server_now
+        updated = payload.get("mirror_updated") if isinstance(payload, dict) else None
+        if not isinstance(updated, str):
+            return None, server_now
+        try:
+            stamp = datetime.fromisoformat(updated)
+        except ValueError:
+            return None, server_now
+        # Naive stamps can't be compared with the (UTC) Date header.
+        return (stamp if stamp.tzinfo is not None else None), server_now
+
     def merge_upstream(self, owner: str, name: str, branch: str) -> str:
         """``POST /api/v1/repos/<o>/<n>/merge-upstream`` — fast-forward fork
         from its parent's branch. Returns HTTP status code as a string
@@ -1025,7 +1148,7 @@ class GiteaClient:
         # passed in the body, not as a URL segment — no path-validation
         # needed for branch.
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/api/v1/repos/{owner}/{name}/merge-upstream",
                 json={"branch": branch},
                 timeout=_HTTP_TIMEOUT,
@@ -1067,7 +1190,7 @@ class GiteaClient:
 
         def _attempt() -> str | None:
             try:
-                resp = requests.post(
+                resp = self._session.post(
                     f"{self.base_url}/api/v1/users/{username}/tokens",
                     json=body,
                     auth=auth,
@@ -1115,7 +1238,7 @@ class GiteaClient:
         _validate_path_segment(username, kind="username")
         _validate_path_segment(token_name, kind="token_name")
         try:
-            resp = requests.delete(
+            resp = self._session.delete(
                 f"{self.base_url}/api/v1/users/{username}/tokens/{token_name}",
                 auth=(admin_username, admin_password),
                 timeout=_HTTP_TIMEOUT,
@@ -1146,7 +1269,7 @@ class GiteaClient:
         _validate_path_segment(source_name, kind="repo_name")
         _validate_path_segment(fork_name, kind="fork_name")
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/api/v1/repos/{source_owner}/{source_name}/forks",
                 json={"name": fork_name},
                 headers={"Authorization": f"token {user_token}"},
@@ -1171,7 +1294,7 @@ class GiteaClient:
         to skip the OAuth setup or hard-fail.
         """
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/api/v1/user/applications/oauth2",
                 timeout=_HTTP_TIMEOUT,
                 **self._request_kwargs(),  # type: ignore[arg-type]
@@ -1227,7 +1350,7 @@ class GiteaClient:
         if not isinstance(app_id, int) or app_id <= 0:
             raise GiteaError(f"delete_oauth_app: invalid app_id {app_id!r}")
         try:
-            resp = requests.delete(
+            resp = self._session.delete(
                 f"{self.base_url}/api/v1/user/applications/oauth2/{app_id}",
                 timeout=_HTTP_TIMEOUT,
                 **self._request_kwargs(),  # type: ignore[arg-type]
@@ -1276,7 +1399,7 @@ class GiteaClient:
             "confidential_client": confidential_client,
         }
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/api/v1/user/applications/oauth2",
                 json=body,
                 timeout=_HTTP_TIMEOUT,
@@ -1359,122 +1482,123 @@ def run_configure_gitea(
     db_password = config.gitea_db_password or ""
 
     cli = GiteaCli(ssh)
-    rest = GiteaClient(
+    with GiteaClient(
         base_url=base_url,
         admin_username=admin_username,
         admin_password=admin_password,
-    )
-
-    # 1. DB password sync
-    db_pw_synced = (
-        cli.sync_db_password(
-            db_password,
-            attempts=db_sync_attempts,
-            interval_s=db_sync_interval_s,
+    ) as rest:
+        # 1. DB password sync
+        db_pw_synced = (
+            cli.sync_db_password(
+                db_password,
+                attempts=db_sync_attempts,
+                interval_s=db_sync_interval_s,
+            )
+            if db_password
+            else False
         )
-        if db_password
-        else False
-    )
 
-    # 2. Wait for Gitea HTTP ready
-    if not rest.wait_ready(timeout_s=ready_timeout_s):
-        return GiteaResult(
-            db_pw_synced=db_pw_synced,
-            # Use the configured admin_username (Copilot round 2) — not
-            # the literal "admin" — so CreateUserResult.name carries
-            # the same value across all paths regardless of how the
-            # operator named the admin user.
-            admin=CreateUserResult(name=admin_username, status="failed", detail="gitea not ready"),
-            user=None,
-            token=None,
-            token_error="gitea not ready",  # noqa: S106 — diagnostic, not a credential
-            repo=None,
-            collaborator_added=False,
-            restart_services=_compute_restart_services(enabled_services),
-        )
+        # 2. Wait for Gitea HTTP ready
+        if not rest.wait_ready(timeout_s=ready_timeout_s):
+            return GiteaResult(
+                db_pw_synced=db_pw_synced,
+                # Use the configured admin_username (Copilot round 2) — not
+                # the literal "admin" — so CreateUserResult.name carries
+                # the same value across all paths regardless of how the
+                # operator named the admin user.
+                admin=CreateUserResult(
+                    name=admin_username, status="failed", detail="gitea not ready"
+                ),
+                user=None,
+                token=None,
+                token_error="gitea not ready",  # noqa: S106 — diagnostic, not a credential
+                repo=None,
+                collaborator_added=False,
+                restart_services=_compute_restart_services(enabled_services),
+            )
 
-    # 3. Admin: CLI list → parse → exists check → branch
-    admin_list = cli.list_admin_users()
-    admin_exists, current_admin_email = _parse_admin_list_for_user(admin_list, admin_username)
+        # 3. Admin: CLI list → parse → exists check → branch
+        admin_list = cli.list_admin_users()
+        admin_exists, current_admin_email = _parse_admin_list_for_user(admin_list, admin_username)
 
-    # 3a. Legacy email-collision PATCH (before sync_password — if PATCH
-    # fails because of password drift, sync_password later will fix
-    # the password and the next deploy's PATCH will succeed).
-    if admin_exists and gitea_user_email and current_admin_email == gitea_user_email:
-        # Best-effort. If it fails, the sync_password below still runs;
-        # next deploy will retry the PATCH.
-        rest.patch_user_email(admin_username, admin_email, login_name=admin_username)
+        # 3a. Legacy email-collision PATCH (before sync_password — if PATCH
+        # fails because of password drift, sync_password later will fix
+        # the password and the next deploy's PATCH will succeed).
+        if admin_exists and gitea_user_email and current_admin_email == gitea_user_email:
+            # Best-effort. If it fails, the sync_password below still runs;
+            # next deploy will retry the PATCH.
+            rest.patch_user_email(admin_username, admin_email, login_name=admin_username)
 
-    if admin_exists:
-        admin_result = cli.sync_password(admin_username, admin_password)
-    else:
-        admin_result = cli.create_admin(admin_username, admin_password, admin_email)
-        # CREATE returns ``already_exists`` when the existence check was a
-        # false negative (e.g. ssh+docker exec failed → empty list → CREATE
-        # path → "user already exists"). Without a follow-up sync, the
-        # admin password drift stays — the subsequent REST token mint
-        # uses basic-auth with the OpenTofu-generated password and 401s.
-        # Fall back to sync_password so we converge on the desired state.
-        # Defence-in-depth tightening of rerun-tolerance (Copilot
-        # round 1).
-        if admin_result.status == "already_exists":
+        if admin_exists:
             admin_result = cli.sync_password(admin_username, admin_password)
-
-    # 4. Regular user (only if email + password provided)
-    user_result: CreateUserResult | None = None
-    user_username: str | None = None
-    if gitea_user_email and gitea_user_password:
-        user_username = gitea_user_email.split("@", 1)[0]
-        user_list = cli.list_users()
-        user_exists, _ = _parse_admin_list_for_user(user_list, user_username)
-        if user_exists:
-            user_result = cli.sync_password(user_username, gitea_user_password)
         else:
-            user_result = cli.create_user(user_username, gitea_user_password, gitea_user_email)
-            # Same already_exists → sync_password fallback as for admin.
-            if user_result.status == "already_exists":
+            admin_result = cli.create_admin(admin_username, admin_password, admin_email)
+            # CREATE returns ``already_exists`` when the existence check was a
+            # false negative (e.g. ssh+docker exec failed → empty list → CREATE
+            # path → "user already exists"). Without a follow-up sync, the
+            # admin password drift stays — the subsequent REST token mint
+            # uses basic-auth with the OpenTofu-generated password and 401s.
+            # Fall back to sync_password so we converge on the desired state.
+            # Defence-in-depth tightening of rerun-tolerance (Copilot
+            # round 1).
+            if admin_result.status == "already_exists":
+                admin_result = cli.sync_password(admin_username, admin_password)
+
+        # 4. Regular user (only if email + password provided)
+        user_result: CreateUserResult | None = None
+        user_username: str | None = None
+        if gitea_user_email and gitea_user_password:
+            user_username = gitea_user_email.split("@", 1)[0]
+            user_list = cli.list_users()
+            user_exists, _ = _parse_admin_list_for_user(user_list, user_username)
+            if user_exists:
                 user_result = cli.sync_password(user_username, gitea_user_password)
-
-    # 5. Token via CLI peer auth (was: REST basic-auth in PR #519).
-    # Switched after production spin-up surfaced a silent 400 from
-    # POST /api/v1/users/<u>/tokens despite admin password sync
-    # reporting success — likely a subtle password-state race
-    # between the bcrypt commit and the next-millisecond REST
-    # auth check. CLI peer auth eliminates the chicken-egg: the
-    # docker-exec runs as the container's git user with no
-    # password verification needed.
-    token, token_error = cli.mint_token(admin_username, "nexus-automation", "all")
-
-    # 6+7. Repo + collaborator (skip in mirror mode)
-    repo_result: CreateRepoResult | None = None
-    collaborator_added = False
-    if not is_mirror_mode and token is not None:
-        rest_token = rest.with_token(token)
-        repo_result = rest_token.create_repo(
-            repo_name,
-            private=True,
-            auto_init=True,
-            default_branch="main",
-            description="Shared workspace for notebooks, workflows, and pipelines",
-        )
-        if repo_result.status == "already_exists":
-            # Belt-and-suspenders: ensure existing repo is private.
-            rest_token.patch_repo_private(gitea_repo_owner, repo_name, private=True)
-        if repo_result.status != "failed" and user_username is not None and gitea_user_password:
-            collaborator_added = rest_token.add_collaborator(
-                gitea_repo_owner, repo_name, user_username, permission="write"
+            else:
+                user_result = cli.create_user(user_username, gitea_user_password, gitea_user_email)
+                # Same already_exists → sync_password fallback as for admin.
+                if user_result.status == "already_exists":
+                    user_result = cli.sync_password(user_username, gitea_user_password)
+
+        # 5. Token via CLI peer auth (was: REST basic-auth in PR #519).
+        # Switched after production spin-up surfaced a silent 400 from
+        # POST /api/v1/users/<u>/tokens despite admin password sync
+        # reporting success — likely a subtle password-state race
+        # between the bcrypt commit and the next-millisecond REST
+        # auth check. CLI peer auth eliminates the chicken-egg: the
+        # docker-exec runs as the container's git user with no
+        # password verification needed.
+        token, token_error = cli.mint_token(admin_username, "nexus-automation", "all")
+
+        # 6+7. Repo + collaborator (skip in mirror mode)
+        repo_result: CreateRepoResult | None = None
+        collaborator_added = False
+        if not is_mirror_mode and token is not None:
+            rest_token = rest.with_token(token)
+            repo_result = rest_token.create_repo(
+                repo_name,
+                private=True,
+                auto_init=True,
+                default_branch="main",
+                description="Shared workspace for notebooks, workflows, and pipelines",
             )
+            if repo_result.status == "already_exists":
+                # Belt-and-suspenders: ensure existing repo is private.
+                rest_token.patch_repo_private(gitea_repo_owner, repo_name, private=True)
+            if repo_result.status != "failed" and user_username is not None and gitea_user_password:
+                collaborator_added = rest_token.add_collaborator(
+                    gitea_repo_owner, repo_name, user_username, permission="write"
+                )
 
-    return GiteaResult(
-        db_pw_synced=db_pw_synced,
-        admin=admin_result,
-        user=user_result,
-        token=token,
-        token_error=token_error,
-        repo=repo_result,
-        collaborator_added=collaborator_added,
-        restart_services=_compute_restart_services(enabled_services),
-    )
+        return GiteaResult(
+            db_pw_synced=db_pw_synced,
+            admin=admin_result,
+            user=user_result,
+            token=token,
+            token_error=token_error,
+            repo=repo_result,
+            collaborator_added=collaborator_added,
+            restart_services=_compute_restart_services(enabled_services),
+        )
 
 
 def run_woodpecker_oauth_setup(
@@ -1544,102 +1668,103 @@ def run_woodpecker_oauth_setup(
     # ``with_token`` returns a new client that uses token-auth instead
     # of basic-auth. The placeholder password is never sent — see
     # :meth:`GiteaClient.with_token`.
-    client = GiteaClient(
+    with GiteaClient(
         base_url=base_url,
         admin_username=admin_username,
         admin_password="placeholder-not-used",  # noqa: S106
-    ).with_token(gitea_token)
-
-    try:
-        apps = client.list_oauth_apps()
-    except GiteaError as exc:
-        # str(exc) is safe — GiteaError messages are constructed from
-        # fixed format strings + status codes only, never response bodies.
-        return None, f"list_oauth_apps: {exc}", False
-
-    # Find any existing app named exactly "Woodpecker CI" — Gitea
-    # allows multiple apps with the same name, so iterate the full
-    # list rather than break on first match. Each delete must
-    # SUCCEED (204 or 404) before we proceed to create — otherwise
-    # the rotation semantics break: we'd issue fresh credentials
-    # while the old app remains valid, leaving stale OAuth tokens
-    # active until the operator manually cleans up. (Copilot R1)
-    rotation_started = False
-    for app in apps:
-        if app.get("name") == "Woodpecker CI":
-            app_id = app.get("id")
-            if not isinstance(app_id, int):
-                # Defensive: Gitea's API contract returns integer ids,
-                # but a malformed list entry (proxy mangling, schema
-                # drift) could surface a None/string id. Silently
-                # skipping the delete here would let the create
-                # below produce a duplicate "Woodpecker CI" app —
-                # exactly the bug rotation semantics is meant to
-                # prevent. Bail with a definitive failure (rotation
-                # NOT started — we never reached the wire). (Copilot R6)
-                return (
-                    None,
-                    f"list entry has non-integer id: {app_id!r} — "
-                    "refusing to create duplicate (rotation NOT started)",
-                    rotation_started,
-                )
-            # Three-way dispatch on delete (Copilot R4):
-            #   - True: Gitea ACK'd, app gone → continue to create
-            #   - False: Gitea returned definitive non-success
-            #     (4xx with response) → server state KNOWN, app
-            #     still exists → rotation NOT started, safe to
-            #     warn-and-continue (the existing .env stays
-            #     consistent with Gitea)
-            #   - GiteaError: transport timeout/reset OR 5xx →
-            #     server state UNKNOWN, app may have been deleted
-            #     before the response was lost → conservatively
-            #     mark rotation_started=True so the CLI aborts
-            try:
-                deleted = client.delete_oauth_app(app_id)
-            except GiteaError as exc:
-                # Transport-ambiguity branch: server state UNKNOWN
-                # → mark rotation_started=True regardless of any
-                # prior loop progress.
-                return (
-                    None,
-                    f"delete_oauth_app(id={app_id}): {exc} — "
-                    "rotation broken (server state ambiguous)",
-                    True,
-                )
-            if not deleted:
-                # Definitive non-success on THIS app, but a PRIOR
-                # iteration in the same loop may have already
-                # successfully deleted a duplicate-named app —
-                # preserve the accumulated rotation_started state
-                # rather than discarding it. Without this, a
-                # multi-app deployment where the first delete
-                # succeeds and the second is rejected would
-                # report rotation_started=False (rc=1, deploy
-                # continues) while Woodpecker is now running on
-                # a creds pair Gitea has already invalidated.
-                # (Copilot R5)
-                return (
-                    None,
-                    f"delete_oauth_app(id={app_id}): rejected by Gitea — "
-                    "refusing to create duplicate (rotation "
-                    f"{'partially started' if rotation_started else 'NOT started'})",
-                    rotation_started,
-                )
-            rotation_started = True
+    ).with_token(gitea_token) as client:
+        try:
+            apps = client.list_oauth_apps()
+        except GiteaError as exc:
+            # str(exc) is safe — GiteaError messages are constructed from
+            # fixed format strings + status codes only, never response bodies.
+            return None, f"list_oauth_apps: {exc}", False
+
+        # Find any existing app named exactly "Woodpecker CI" — Gitea
+        # allows multiple apps with the same name, so iterate the full
+        # list rather than break on first match. Each delete must
+        # SUCCEED (204 or 404) before we proceed to create — otherwise
+        # the rotation semantics break: we'd issue fresh credentials
+        # while the old app remains valid, leaving stale OAuth tokens
+        # active until the operator manually cleans up. (Copilot R1)
+        rotation_started = False
+        for app in apps:
+            if app.get("name") == "Woodpecker CI":
+                app_id = app.get("id")
+                if not isinstance(app_id, int):
+                    # Defensive: Gitea's API contract returns integer ids,
+                    # but a malformed list entry (proxy mangling, schema
+                    # drift) could surface a None/string id. Silently
+                    # skipping the delete here would let the create
+                    # below produce a duplicate "Woodpecker CI" app —
+                    # exactly the bug rotation semantics is meant to
+                    # prevent. Bail with a definitive failure (rotation
+                    # NOT started — we never reached the wire). (Copilot R6)
+                    return (
+                        None,
+                        f"list entry has non-integer id: {app_id!r} — "
+                        "refusing to create duplicate (rotation NOT started)",
+                        rotation_started,
+                    )
+                # Three-way dispatch on delete (Copilot R4):
+                #   - True: Gitea ACK'd, app gone → continue to create
+                #   - False: Gitea returned definitive non-success
+                #     (4xx with response) → server state KNOWN, app
+                #     still exists → rotation NOT started, safe to
+                #     warn-and-continue (the existing .env stays
+                #     consistent with Gitea)
+                #   - GiteaError: transport timeout/reset OR 5xx →
+                #     server state UNKNOWN, app may have been deleted
+                #     before the response was lost → conservatively
+                #     mark rotation_started=True so the CLI aborts
+                try:
+                    deleted = client.delete_oauth_app(app_id)
+                except GiteaError as exc:
+                    # Transport-ambiguity branch: server state UNKNOWN
+                    # → mark rotation_started=True regardless of any
+                    # prior loop progress.
+                    return (
+                        None,
+                        f"delete_oauth_app(id={app_id}): {exc} — "
+                        "rotation broken (server state ambiguous)",
+                        True,
+                    )
+                if not deleted:
+                    # Definitive non-success on THIS app, but a PRIOR
+                    # iteration in the same loop may have already
+                    # successfully deleted a duplicate-named app —
+                    # preserve the accumulated rotation_started state
+                    # rather than discarding it. Without this, a
+                    # multi-app deployment where the first delete
+                    # succeeds and the second is rejected would
+                    # report rotation_started=False (rc=1, deploy
+                    # continues) while Woodpecker is now running on
+                    # a creds pair Gitea has already invalidated.
+                    # (Copilot R5)
+                    return (
+                        None,
+                        f"delete_oauth_app(id={app_id}): rejected by Gitea — "
+                        "refusing to create duplicate (rotation "
+                        f"{'partially started' if rotation_started else 'NOT started'})",
+                        rotation_started,
+                    )
+                rotation_started = True
 
-    redirect_uri = f"https://{service_host('woodpecker', domain, subdomain_separator)}/authorize"
-    try:
-        return (
-            client.create_oauth_app(
-                "Woodpecker CI",
-                [redirect_uri],
-                confidential_client=True,
-            ),
-            "",
-            rotation_started,
+        redirect_uri = (
+            f"https://{service_host('woodpecker', domain, subdomain_separator)}/authorize"
         )
-    except GiteaError as exc:
-        return None, f"create_oauth_app: {exc}", rotation_started
+        try:
+            return (
+                client.create_oauth_app(
+                    "Woodpecker CI",
+                    [redirect_uri],
+                    confidential_client=True,
+                ),
+                "",
+                rotation_started,
+            )
+        except GiteaError as exc:
+            return None, f"create_oauth_app: {exc}", rotation_started
 
 
 # ---------------------------------------------------------------------------
@@ -1689,6 +1814,128 @@ class MirrorSetupResult:
         return not (self.fork is not None and self.fork.status == "failed")
 
 
+MirrorSyncOutcome = Literal["landed", "unchanged", "timeout"]
+
+
+def _wait_mirror_sync(
+    client: GiteaClient,
+    owner: str,
+    name: str,
+    branch: str,
+    *,
+    before_sha: str | None,
+    baseline: datetime | None,
+    timeout_s: float,
+    max_interval_s: float,
+) -> tuple[MirrorSyncOutcome, str | None]:
+    """Wait for a triggered mirror-sync to finish; ``(outcome, head_sha)``.
+
+    ``baseline`` is the server's clock just before the trigger.
+    Completion is the mirror's ``mirror_updated`` reaching it (``>=``:
+    both have one-second resolution, so a fetch finishing within the
+    trigger's second still counts). Then the HEAD is read once and the
+    sync either ``landed`` (new SHA) or finished ``unchanged``. That
+    returns as soon as Gitea is done, including the no-new-commits case
+    the old HEAD poll could only end by timing out. Without a
+    ``baseline`` (older Gitea, no stamp) the HEAD change itself is the
+    signal.
+
+    Polls start at ``_MIRROR_SYNC_FIRST_POLL_S`` and double up to
+    ``max_interval_s``, so quick fetches are caught quickly and slow
+    upstreams aren't hammered. Sleeps are clamped to the deadline.
+    """
+    deadline = time.monotonic() + timeout_s
+    interval = min(_MIRROR_SYNC_FIRST_POLL_S, max_interval_s)
+    while time.monotonic() < deadline:
+        done = False
+        if baseline is not None:
+            updated, _ = client.get_mirror_updated(owner, name)
+            done = updated is not None and updated.replace(microsecond=0) >= baseline
+        if baseline is None or done:
+            after_sha = client.get_branch_head_sha(owner, name, branch)
+            if after_sha is not None and after_sha != before_sha:
+                return "landed", after_sha
+            if done:
+                return "unchanged", after_sha
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval_s)
+    return "timeout", None
+
+
+def _provision_mirror(
+    client: GiteaClient,
+    repo_url: str,
+    *,
+    admin_username: str,
+    admin_uid: int,
+    gh_mirror_token: str,
+    collaborator: str | None,
+) -> tuple[str, MirrorResult, bool]:
+    """Migrate (or find) one mirror and grant ``collaborator`` read access.
+
+    Returns ``(basename, result, collaborator_added)``; ``result.ms``
+    is the wall time of the whole step. Runs on a worker thread of
+    :func:`run_mirror_setup`'s pool — it never raises GiteaError, so
+    one bad URL can't take the other mirrors down with it.
+    """
+    started = time.monotonic()
+    orig_name = _basename_no_git(repo_url)
+    mirror_name = f"mirror-readonly-{orig_name}"
+
+    def _done(result: MirrorResult, added: bool = False) -> tuple[str, MirrorResult, bool]:
+        ms = int((time.monotonic() - started) * 1000)
+        return orig_name, dataclasses.replace(result, ms=ms), added
+
+    # Validate the derived mirror_name BEFORE calling repo_exists
+    # / migrate_mirror — both internally invoke
+    # ``_validate_path_segment`` which raises GiteaError on
+    # unsafe values. Without this guard, one bad URL with
+    # shell-meta chars in the basename (e.g.
+    # ``.../repo?evil`` or ``.../repo;sh``) would propagate the
+    # GiteaError out of the pool and turn into rc=2 (hard
+    # abort), defeating the per-mirror-failed-result intent.
+    # (Copilot R1)
+    try:
+        _validate_path_segment(mirror_name, kind="mirror_name")
+    except GiteaError as exc:
+        return _done(
+            MirrorResult(name=mirror_name, status="failed", detail=f"path validation: {exc}")
+        )
+
+    # Idempotent re-deploy: skip migration if mirror already exists.
+    try:
+        already_present = client.repo_exists(admin_username, mirror_name)
+    except GiteaError:
+        already_present = False
+
+    if already_present:
+        result = MirrorResult(
+            name=mirror_name,
+            status="already_exists",
+            detail="GET /repos returned 200",
+        )
+    else:
+        result = client.migrate_mirror(mirror_name, repo_url, admin_uid, gh_mirror_token)
+    if result.status == "failed":
+        return _done(result)
+
+    # Grant the user read-only access to the (private) mirror BEFORE
+    # the fork attempt. ``migrate_mirror`` creates the repo with
+    # ``"private": True``, and ``fork_repo_as_user`` runs as
+    # ``gitea_user_username`` — without prior collaborator access the
+    # user cannot see the mirror at all and Gitea returns 404 on
+    # ``POST .../forks`` (Gitea conflates not-found with permission-
+    # denied on private repos). The fork loop only starts once every
+    # mirror's collaborator step is done.
+    added = bool(collaborator) and client.add_collaborator(
+        admin_username, mirror_name, collaborator or "", permission="read"
+    )
+    return _done(result, added)
+
+
 def run_mirror_setup(
     *,
     base_url: str,
@@ -1702,27 +1949,33 @@ def run_mirror_setup(
     fork_token_name: str = "nexus-workspace-fork",  # noqa: S107
     mirror_sync_poll_seconds: float = 30.0,
     mirror_sync_poll_interval_seconds: float = 1.5,
+    mirror_workers: int = DEFAULT_MIRROR_WORKERS,
 ) -> MirrorSetupResult:
     """End-to-end GH_MIRROR_REPOS provisioning.
 
     1. GET admin's UID (required by Gitea's migrate API).
-    2. For each repo URL in ``gh_mirror_repos``:
+    2. For each repo URL in ``gh_mirror_repos``, concurrently on up
+       to ``mirror_workers`` threads:
        a. Compute mirror name ``mirror-readonly-<basename>``.
        b. POST /repos/migrate (or skip if 409/already_exists).
        c. Add the user as a read-collaborator on the mirror —
           MUST happen before (d) because the mirror is created
           private and the user's token (used in (d)) sees a
           private repo as 404 until collab is granted.
+       Each :class:`MirrorResult` carries the step's wall time in
+       ``ms``.
+    3. Then serially, in list order over the mirrors that came up:
        d. On the FIRST mirror with a configured user, fork it
           into the user's namespace via a temp user-token
           (created + deleted on this call).
        e. If the fork was created on this iteration: snapshot the
-          mirror's HEAD SHA, trigger ``mirror-sync`` on the mirror,
-          then poll the mirror's HEAD up to
-          ``mirror_sync_poll_seconds`` (with
-          ``mirror_sync_poll_interval_seconds`` between polls) waiting
-          for the upstream-fetch to land. Whether or not the SHA
-          actually changed, call ``merge-upstream`` on the fork at
+          mirror's HEAD SHA and the server's clock, trigger
+          ``mirror-sync`` on the mirror, then wait up to
+          ``mirror_sync_poll_seconds`` for ``mirror_updated`` to reach
+          that baseline (backoff polls capped at
+          ``mirror_sync_poll_interval_seconds``) — Gitea stamps it when
+          the fetch completes, new commits or not. Whether or not the
+          SHA actually changed, call ``merge-upstream`` on the fork at
           ``workspace_branch`` (best-effort — the mirror may already
           be ahead from Gitea's periodic cron-tick or the initial
           migrate-fetch). The pre/post SHA + merge result land in
@@ -1730,10 +1983,9 @@ def run_mirror_setup(
           'sync landed', 'sync skipped (no change)', and 'sync
           failed but merged anyway' apart.
 
-    The fork creation (step c) and fork-sync (step e) happen ONLY
-    on the first iteration that has both a successful migrate AND a
-    configured user — single-fork-per-stack semantics. Later
-    iterations still do mirror+collab.
+    The fork creation (step d) and fork-sync (step e) happen ONLY
+    on the first mirror that has both a successful migrate AND a
+    configured user — single-fork-per-stack semantics.
 
     All admin actions use ``gitea_token`` (token-bearer). The fork
     creation step uses a temporary token minted on behalf of
@@ -1745,278 +1997,271 @@ def run_mirror_setup(
     # immediately below.
     _validate_path_segment(admin_username, kind="admin_username")
 
-    client = GiteaClient(
+    with GiteaClient(
         base_url=base_url,
         admin_username=admin_username,
         admin_password=admin_password,
-    ).with_token(gitea_token)
-
-    # 1. Admin UID lookup. Failure → no migrate possible. Distinguish
-    # three failure modes so the CLI can surface the real cause
-    # instead of the misleading "admin UID not found" for every path
-    # (Copilot R4):
-    #   - get_user_id raises GiteaError: auth/transport/5xx —
-    #     stash exc message in admin_uid_error
-    #   - get_user_id returns None: 404 (user genuinely doesn't
-    #     exist) — admin_uid_error stays "" but admin_uid is None
-    admin_uid: int | None = None
-    admin_uid_error = ""
-    try:
-        admin_uid = client.get_user_id(admin_username)
-    except GiteaError as exc:
-        # GiteaError messages here are constructed from format
-        # strings only (HTTP status / type names), no secrets —
-        # safe to surface verbatim.
-        admin_uid_error = str(exc)
-    if admin_uid is None:
-        return MirrorSetupResult(
-            admin_uid=None,
-            admin_uid_error=admin_uid_error,
-            mirrors=(),
-            fork=None,
-            collaborator_added_count=0,
-            fork_synced=False,
-        )
-
-    mirrors: list[MirrorResult] = []
-    fork: ForkResult | None = None
-    last_fork_failure: ForkResult | None = None
-    fork_synced = False
-    collaborator_added_count = 0
-    sync_detail = ""
-
-    for repo_url in gh_mirror_repos:
-        repo_url = repo_url.strip()
-        if not repo_url:
-            continue
-        orig_name = _basename_no_git(repo_url)
-        mirror_name = f"mirror-readonly-{orig_name}"
-
-        # Validate the derived mirror_name BEFORE calling repo_exists
-        # / migrate_mirror — both internally invoke
-        # ``_validate_path_segment`` which raises GiteaError on
-        # unsafe values. Without this guard, one bad URL with
-        # shell-meta chars in the basename (e.g.
-        # ``.../repo?evil`` or ``.../repo;sh``) would propagate the
-        # GiteaError out of the loop and turn into rc=2 (hard
-        # abort), defeating the per-mirror-failed-result intent.
-        # (Copilot R1)
+    ).with_token(gitea_token) as client:
+        # 1. Admin UID lookup. Failure → no migrate possible. Distinguish
+        # three failure modes so the CLI can surface the real cause
+        # instead of the misleading "admin UID not found" for every path
+        # (Copilot R4):
+        #   - get_user_id raises GiteaError: auth/transport/5xx —
+        #     stash exc message in admin_uid_error
+        #   - get_user_id returns None: 404 (user genuinely doesn't
+        #     exist) — admin_uid_error stays "" but admin_uid is None
+        admin_uid: int | None = None
+        admin_uid_error = ""
         try:
-            _validate_path_segment(mirror_name, kind="mirror_name")
+            admin_uid = client.get_user_id(admin_username)
         except GiteaError as exc:
-            mirrors.append(
-                MirrorResult(
-                    name=mirror_name,
-                    status="failed",
-                    detail=f"path validation: {exc}",
-                )
+            # GiteaError messages here are constructed from format
+            # strings only (HTTP status / type names), no secrets —
+            # safe to surface verbatim.
+            admin_uid_error = str(exc)
+        if admin_uid is None:
+            return MirrorSetupResult(
+                admin_uid=None,
+                admin_uid_error=admin_uid_error,
+                mirrors=(),
+                fork=None,
+                collaborator_added_count=0,
+                fork_synced=False,
             )
-            continue
 
-        # Idempotent re-deploy: skip migration if mirror already exists.
-        try:
-            already_present = client.repo_exists(admin_username, mirror_name)
-        except GiteaError:
-            already_present = False
-
-        if already_present:
-            mirror_result = MirrorResult(
-                name=mirror_name,
-                status="already_exists",
-                detail="GET /repos returned 200",
+        # 2. Migrate + collaborator for every mirror through a bounded
+        # pool — each migrate POST blocks while Gitea clones from GitHub,
+        # so serially the slowest upstreams add up. Results keep the
+        # GH_MIRROR_REPOS order.
+        repo_urls = [u.strip() for u in gh_mirror_repos if u.strip()]
+        with ThreadPoolExecutor(max_workers=max(1, min(mirror_workers, len(repo_urls)))) as pool:
+            provisioned = list(
+                pool.map(
+                    lambda url: _provision_mirror(
+                        client,
+                        url,
+                        admin_username=admin_username,
+                        admin_uid=admin_uid,
+                        gh_mirror_token=gh_mirror_token,
+                        collaborator=gitea_user_username,
+                    ),
+                    repo_urls,
+                )
             )
-        else:
-            mirror_result = client.migrate_mirror(mirror_name, repo_url, admin_uid, gh_mirror_token)
-        mirrors.append(mirror_result)
 
-        if mirror_result.status == "failed":
-            # Don't try to fork off a failed mirror; continue to next
-            # iteration so a single bad URL doesn't abort the loop.
-            continue
-
-        # Grant the user read-only access to the (private) mirror BEFORE
-        # the fork attempt below. ``migrate_mirror`` creates the repo with
-        # ``"private": True``, and ``fork_repo_as_user`` runs as
-        # ``gitea_user_username`` — without prior collaborator access the
-        # user cannot see the mirror at all and Gitea returns 404 on
-        # ``POST .../forks`` (Gitea conflates not-found with permission-
-        # denied on private repos). Doing the add here guarantees the
-        # user can see the mirror by the time the fork POST hits.
-        if gitea_user_username and client.add_collaborator(
-            admin_username, mirror_name, gitea_user_username, permission="read"
-        ):
-            collaborator_added_count += 1
-
-        # Fork the FIRST successful mirror into the user's namespace
-        # (idempotent across spin-ups via the existing-fork 409 branch).
-        # On transient failure (token mint glitch, fork POST 5xx),
-        # retry on the next mirror iteration. Without retry, a
-        # single bad first mirror would prevent the fork on every
-        # later mirror in the same loop too. (Copilot R3)
-        if fork is None and gitea_user_username:
-            sanitized = _sanitize_user_for_fork_name(gitea_user_username)
-            fork_name = f"{orig_name}_{sanitized}"
-
-            user_token = client.create_user_token(
-                gitea_user_username,
-                fork_token_name,
-                ["all"],
-                admin_username=admin_username,
-                admin_password=admin_password,
-            )
-            if user_token is None:
-                attempt: ForkResult = ForkResult(
-                    name=fork_name,
-                    owner=gitea_user_username,
-                    status="failed",
-                    detail="could not create user token for fork",
+        mirrors: list[MirrorResult] = [m for _, m, _ in provisioned]
+        collaborator_added_count = sum(added for _, _, added in provisioned)
+        fork: ForkResult | None = None
+        last_fork_failure: ForkResult | None = None
+        fork_synced = False
+        sync_detail = ""
+
+        # 3. Fork + sync, serially in list order over the mirrors that
+        # came up — same first-successful-mirror semantics as before.
+        for orig_name, mirror_result, _ in provisioned:
+            if mirror_result.status == "failed":
+                # Don't try to fork off a failed mirror.
+                continue
+            mirror_name = mirror_result.name
+
+            # Fork the FIRST successful mirror into the user's namespace
+            # (idempotent across spin-ups via the existing-fork 409 branch).
+            # On transient failure (token mint glitch, fork POST 5xx),
+            # retry on the next mirror iteration. Without retry, a
+            # single bad first mirror would prevent the fork on every
+            # later mirror in the same loop too. (Copilot R3)
+            if fork is None and gitea_user_username:
+                sanitized = _sanitize_user_for_fork_name(gitea_user_username)
+                fork_name = f"{orig_name}_{sanitized}"
+
+                user_token = client.create_user_token(
+                    gitea_user_username,
+                    fork_token_name,
+                    ["all"],
+                    admin_username=admin_username,
+                    admin_password=admin_password,
                 )
-            else:
-                try:
-                    fork_status = client.fork_repo_as_user(
-                        admin_username,
-                        mirror_name,
-                        fork_name,
-                        user_token=user_token,
-                    )
-                finally:
-                    # Always cleanup the temp user-token regardless
-                    # of fork outcome.
-                    client.delete_user_token(
-                        gitea_user_username,
-                        fork_token_name,
-                        admin_username=admin_username,
-                        admin_password=admin_password,
-                    )
-
-                if fork_status == "202":
-                    attempt = ForkResult(
-                        name=fork_name,
-                        owner=gitea_user_username,
-                        status="created",
-                        detail="POST 202",
-                    )
-                elif fork_status == "409":
-                    attempt = ForkResult(
-                        name=fork_name,
-                        owner=gitea_user_username,
-                        status="already_exists",
-                        detail="POST 409",
-                    )
-                else:
-                    attempt = ForkResult(
+                if user_token is None:
+                    attempt: ForkResult = ForkResult(
                         name=fork_name,
                         owner=gitea_user_username,
                         status="failed",
-                        detail=f"POST {fork_status}",
+                        detail="could not create user token for fork",
                     )
-
-            if attempt.status in ("created", "already_exists"):
-                # Finalize — no more fork attempts on later iterations.
-                fork = attempt
-            else:
-                # Transient failure: keep ``fork=None`` so the next
-                # iteration retries. Save the most recent attempt's
-                # diagnostic so the FINAL result still surfaces the
-                # last failure if every iteration fails.
-                last_fork_failure = attempt
-
-        # Sync the fork from upstream — only on the first iteration
-        # where the fork was actually created/already-existed.
-        if fork is not None and fork.status in ("created", "already_exists") and not fork_synced:
-            fork_synced = True  # set even if the chain below soft-fails
-            # Step 1: snapshot the mirror's HEAD SHA so we can detect
-            # when the upstream-fetch lands.
-            before_sha = client.get_branch_head_sha(admin_username, mirror_name, workspace_branch)
-            triggered = client.trigger_mirror_sync(admin_username, mirror_name)
-            if not triggered:
-                # Don't return early — the mirror may ALREADY be ahead
-                # of the fork from (a) Gitea's periodic mirror cron-tick
-                # that ran between spin-ups, or (b) the migrate that
-                # ran a few seconds ago (which performs an initial
-                # fetch as part of repo creation). Skipping merge here
-                # would regress the legacy bash's best-effort behavior
-                # for those cases. Record the trigger failure but
-                # still try merge_upstream against whatever's currently
-                # in the mirror.
-                merge_status = client.merge_upstream(fork.owner, fork.name, workspace_branch)
-                sync_detail = (
-                    "trigger_mirror_sync returned non-200 (token / repo state); "
-                    f"merge_upstream against current mirror HEAD: {merge_status}"
+                else:
+                    try:
+                        fork_status = client.fork_repo_as_user(
+                            admin_username,
+                            mirror_name,
+                            fork_name,
+                            user_token=user_token,
+                        )
+                    finally:
+                        # Always cleanup the temp user-token regardless
+                        # of fork outcome.
+                        client.delete_user_token(
+                            gitea_user_username,
+                            fork_token_name,
+                            admin_username=admin_username,
+                            admin_password=admin_password,
+                        )
+
+                    if fork_status == "202":
+                        attempt = ForkResult(
+                            name=fork_name,
+                            owner=gitea_user_username,
+                            status="created",
+                            detail="POST 202",
+                        )
+                    elif fork_status == "409":
+                        attempt = ForkResult(
+                            name=fork_name,
+                            owner=gitea_user_username,
+                            status="already_exists",
+                            detail="POST 409",
+                        )
+                    else:
+                        attempt = ForkResult(
+                            name=fork_name,
+                            owner=gitea_user_username,
+                            status="failed",
+                            detail=f"POST {fork_status}",
+                        )
+
+                if attempt.status in ("created", "already_exists"):
+                    # Finalize — no more fork attempts on later iterations.
+                    fork = attempt
+                else:
+                    # Transient failure: keep ``fork=None`` so the next
+                    # iteration retries. Save the most recent attempt's
+                    # diagnostic so the FINAL result still surfaces the
+                    # last failure if every iteration fails.
+                    last_fork_failure = attempt
+
+            # Sync the fork from upstream — only on the first iteration
+            # where the fork was actually created/already-existed.
+            if (
+                fork is not None
+                and fork.status in ("created", "already_exists")
+                and not fork_synced
+            ):
+                fork_synced = True  # set even if the chain below soft-fails
+                # Step 1: snapshot the mirror's HEAD SHA and the server's
+                # clock (only if the mirror reports mirror_updated) so we
+                # can tell when the fetch is done and whether it brought
+                # anything.
+                before_sha = client.get_branch_head_sha(
+                    admin_username, mirror_name, workspace_branch
                 )
-            else:
-                # Step 2: poll the mirror's branch HEAD until it changes
-                # from the pre-sync snapshot. The previous fixed 3-second
-                # sleep was too short for medium repos — GitHub's clone
-                # finished but Gitea's mirror-fetch hadn't propagated by
-                # the time merge_upstream ran, so the fork merged the OLD
-                # mirror state and silently returned 409 "already up to
-                # date". Polling catches a freshly-arrived commit even on
-                # slow upstream fetches; the cap (mirror_sync_poll_seconds)
-                # protects against a wedged mirror.
-                deadline = time.monotonic() + mirror_sync_poll_seconds
-                landed = False
-                while time.monotonic() < deadline:
-                    after_sha = client.get_branch_head_sha(
-                        admin_username, mirror_name, workspace_branch
-                    )
-                    if after_sha is not None and after_sha != before_sha:
-                        landed = True
-                        break
-                    time.sleep(mirror_sync_poll_interval_seconds)
-                if landed:
-                    # Sync landed (after_sha differed from before_sha,
-                    # or before_sha was None but the poll observed any
-                    # SHA) — merge fork from the now-updated mirror.
+                before_updated, server_now = client.get_mirror_updated(admin_username, mirror_name)
+                baseline = server_now if before_updated is not None else None
+                triggered = client.trigger_mirror_sync(admin_username, mirror_name)
+                if not triggered:
+                    # Don't return early — the mirror may ALREADY be ahead
+                    # of the fork from (a) Gitea's periodic mirror cron-tick
+                    # that ran between spin-ups, or (b) the migrate that
+                    # ran a few seconds ago (which performs an initial
+                    # fetch as part of repo creation). Skipping merge here
+                    # would regress the legacy bash's best-effort behavior
+                    # for those cases. Record the trigger failure but
+                    # still try merge_upstream against whatever's currently
+                    # in the mirror.
                     merge_status = client.merge_upstream(fork.owner, fork.name, workspace_branch)
                     sync_detail = (
-                        f"mirror synced ({(before_sha or 'unknown')[:8]} -> "
-                        f"{(after_sha or '')[:8]}), merge_upstream={merge_status}"
-                    )
-                elif before_sha is None:
-                    # Mirror branch couldn't be read pre-sync (404 /
-                    # transport) AND polling never observed a SHA
-                    # either — we have no way to *verify* the sync,
-                    # but the mirror may still be ahead of the fork
-                    # from Gitea's periodic cron or the initial
-                    # migrate-fetch. Best-effort merge so fork_synced
-                    # (which is set unconditionally above) actually
-                    # corresponds to an attempted merge call —
-                    # otherwise the CLI would report "merge attempted"
-                    # when nothing happened.
-                    merge_status = client.merge_upstream(fork.owner, fork.name, workspace_branch)
-                    sync_detail = (
-                        "could not snapshot mirror HEAD before sync (no SHA observed during poll either); "
+                        "trigger_mirror_sync returned non-200 (token / repo state); "
                         f"merge_upstream against current mirror HEAD: {merge_status}"
                     )
                 else:
-                    # Sync was triggered but the mirror's HEAD didn't
-                    # move within the timeout. Could be: (a) upstream
-                    # unchanged (legitimate no-op), or (b) Gitea's
-                    # fetcher is wedged / token rejected. We still
-                    # call merge_upstream — it'll return 409 in case
-                    # (a), giving us a clean diagnostic.
-                    merge_status = client.merge_upstream(fork.owner, fork.name, workspace_branch)
-                    sync_detail = (
-                        f"mirror HEAD unchanged after {mirror_sync_poll_seconds:.0f}s "
-                        f"(before={(before_sha or '')[:8]}, "
-                        f"merge_upstream={merge_status})"
+                    # Step 2: wait for the sync to complete. The previous
+                    # fixed 3-second sleep was too short for medium repos —
+                    # GitHub's clone finished but Gitea's mirror-fetch hadn't
+                    # propagated by the time merge_upstream ran, so the fork
+                    # merged the OLD mirror state and silently returned 409
+                    # "already up to date". Watching mirror_updated returns
+                    # as soon as Gitea finishes the fetch, including the
+                    # nothing-new case; the cap (mirror_sync_poll_seconds)
+                    # protects against a wedged mirror.
+                    outcome, after_sha = _wait_mirror_sync(
+                        client,
+                        admin_username,
+                        mirror_name,
+                        workspace_branch,
+                        before_sha=before_sha,
+                        baseline=baseline,
+                        timeout_s=mirror_sync_poll_seconds,
+                        max_interval_s=mirror_sync_poll_interval_seconds,
                     )
+                    if outcome == "landed":
+                        # Sync landed (after_sha differed from before_sha,
+                        # or before_sha was None but the poll observed any
+                        # SHA) — merge fork from the now-updated mirror.
+                        merge_status = client.merge_upstream(
+                            fork.owner, fork.name, workspace_branch
+                        )
+                        sync_detail = (
+                            f"mirror synced ({(before_sha or 'unknown')[:8]} -> "
+                            f"{(after_sha or '')[:8]}), merge_upstream={merge_status}"
+                        )
+                    elif outcome == "unchanged" and (after_sha or before_sha):
+                        # Gitea finished the fetch and the branch didn't
+                        # move — upstream had nothing new. Still merge: the
+                        # fork may lag the mirror from an earlier fetch.
+                        merge_status = client.merge_upstream(
+                            fork.owner, fork.name, workspace_branch
+                        )
+                        sync_detail = (
+                            f"mirror sync completed, HEAD unchanged ({(after_sha or before_sha or '')[:8]}), "
+                            f"merge_upstream={merge_status}"
+                        )
+                    elif before_sha is None:
+                        # Mirror branch couldn't be read pre-sync (404 /
+                        # transport) AND no SHA was observed after the
+                        # sync either — we have no way to *verify* the sync,
+                        # but the mirror may still be ahead of the fork
+                        # from Gitea's periodic cron or the initial
+                        # migrate-fetch. Best-effort merge so fork_synced
+                        # (which is set unconditionally above) actually
+                        # corresponds to an attempted merge call —
+                        # otherwise the CLI would report "merge attempted"
+                        # when nothing happened.
+                        merge_status = client.merge_upstream(
+                            fork.owner, fork.name, workspace_branch
+                        )
+                        sync_detail = (
+                            "could not snapshot mirror HEAD before sync (no SHA observed during poll either); "
+                            f"merge_upstream against current mirror HEAD: {merge_status}"
+                        )
+                    else:
+                        # Sync was triggered but didn't complete (or, on a
+                        # Gitea without mirror_updated, the HEAD didn't move)
+                        # within the timeout. Could be: (a) upstream
+                        # unchanged (legitimate no-op), or (b) Gitea's
+                        # fetcher is wedged / token rejected. We still
+                        # call merge_upstream — it'll return 409 in case
+                        # (a), giving us a clean diagnostic.
+                        merge_status = client.merge_upstream(
+                            fork.owner, fork.name, workspace_branch
+                        )
+                        sync_detail = (
+                            f"mirror HEAD unchanged after {mirror_sync_poll_seconds:.0f}s "
+                            f"(before={(before_sha or '')[:8]}, "
+                            f"merge_upstream={merge_status})"
+                        )
+
+        # If every fork attempt across the loop failed, surface the last
+        # one's diagnostic in the final result so the operator can see WHY
+        # the fork never succeeded. (Copilot R3 — without this, a multi-
+        # mirror loop where every fork POST fails would return fork=None
+        # which is indistinguishable from the no-user-configured branch.)
+        if fork is None and last_fork_failure is not None:
+            fork = last_fork_failure
 
-    # If every fork attempt across the loop failed, surface the last
-    # one's diagnostic in the final result so the operator can see WHY
-    # the fork never succeeded. (Copilot R3 — without this, a multi-
-    # mirror loop where every fork POST fails would return fork=None
-    # which is indistinguishable from the no-user-configured branch.)
-    if fork is None and last_fork_failure is not None:
-        fork = last_fork_failure
-
-    return MirrorSetupResult(
-        admin_uid=admin_uid,
-        admin_uid_error="",  # admin_uid resolved successfully
-        mirrors=tuple(mirrors),
-        fork=fork,
-        collaborator_added_count=collaborator_added_count,
-        fork_synced=fork_synced,
-        sync_detail=sync_detail,
-    )
+        return MirrorSetupResult(
+            admin_uid=admin_uid,
+            admin_uid_error="",  # admin_uid resolved successfully
+            mirrors=tuple(mirrors),
+            fork=fork,
+            collaborator_added_count=collaborator_added_count,
+            fork_synced=fork_synced,
+            sync_detail=sync_detail,
+        )
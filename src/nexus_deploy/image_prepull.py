@@ -0,0 +1,375 @@
+"""Deduplicated, bounded-parallel image pre-pull before compose-up.
+
+``docker compose up`` pulls missing images itself, one stack at a
+time and without knowing that other stacks want the same image. So
+shared base images (``postgres:16-alpine`` appears in eight stacks)
+were pulled concurrently by several stacks at once, and a registry
+failure only surfaced once the stack that needed the image was
+already half up.
+
+This module resolves every ``image:`` of the stacks compose-up is
+about to start, deduplicates the list and pulls it on the server
+through a bounded ``xargs -P`` worker pool, ahead of compose-up:
+
+* Images are resolved **locally** from ``stacks/<svc>/docker-compose*.yml``
+  (the same files stack-sync pushes). ``${VAR}`` / ``${VAR:-default}``
+  are interpolated the way compose does it. The environment is the
+  ``IMAGE_*`` pins from ``image_versions``, which is exactly what
+  :meth:`Orchestrator._phase_global_env` writes to the global ``.env``
+  and compose-up sources, layered over the stack's own ``.env``.
+* Services with a ``build:`` section are skipped. Their ``image:`` is
+  the tag of the local build, not something to pull.
+* An image already present on the server is left alone. That is the
+  same rule compose applies (no ``pull_policy``), so pre-pulling never
+  changes which image a stack runs. It only moves the pull earlier
+  and dedupes it.
+
+Per image the remote script emits
+``PULL <image> status=pulled|present|failed ms=N bytes=N``. ``bytes``
+is the image size (``docker image inspect .Size``) after the pull.
+:func:`run_prepull` prints the pulled images slowest-first, so the
+heavy hitters sit at the top of the log.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shlex
+import subprocess
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from nexus_deploy import _remote
+from nexus_deploy import tracing as _tracing
+
+# Pulls running at once on the server. Pulls are network-bound and
+# dockerd already parallelises layer downloads within one pull.
+DEFAULT_PULL_WORKERS = 4
+
+# Compose variable syntax: ${VAR}, ${VAR:-def}, ${VAR-def},
+# ${VAR:?err}, ${VAR?err}, $VAR, and $$ for a literal dollar.
+_VARIABLE = re.compile(
+    r"\$\$"
+    r"|\$\{(?P<braced>[A-Za-z_][A-Za-z0-9_]*)(?:(?P<op>:?[-?])(?P<arg>[^}]*))?\}"
+    r"|\$(?P<bare>[A-Za-z_][A-Za-z0-9_]*)"
+)
+
+_PULL_PATTERN = re.compile(
+    r"^PULL (?P<image>\S+) status=(?P<status>pulled|present|failed) "
+    r"ms=(?P<ms>\d+) bytes=(?P<bytes>\d+)$",
+    re.MULTILINE,
+)
+_RESULT_PATTERN = re.compile(
+    r"^RESULT pulled=(?P<pulled>\d+) present=(?P<present>\d+) failed=(?P<failed>\d+)$",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class ImagePull:
+    """Outcome of one image: wall time of the pull and image size."""
+
+    image: str
+    status: str
+    ms: int
+    bytes: int
+
+
+@dataclass(frozen=True)
+class PrePullResult:
+    """Counters from the remote ``RESULT`` line plus per-image detail."""
+
+    pulled: int
+    present: int
+    failed: int
+    images: tuple[ImagePull, ...] = ()
+
+    @property
+    def is_success(self) -> bool:
+        """True iff zero failures."""
+        return self.failed == 0
+
+
+# ---------------------------------------------------------------------------
+# Pure logic — image resolution
+# ---------------------------------------------------------------------------
+
+
+def parse_image_versions(raw: str | None) -> dict[str, object]:
+    """``tofu output -json image_versions`` as a dict; ``{}`` when absent or malformed.
+
+    For callers that only resolve image tags. The global-env phase is
+    the one that validates the JSON and fails the run on bad input.
+    """
+    try:
+        parsed = json.loads(raw or "{}")
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def image_env(image_versions: Mapping[str, object]) -> dict[str, str]:
+    """``image_versions`` as the ``IMAGE_<KEY>`` variables of the global .env.
+
+    Same normalisation as the global-env phase: dashes → underscores,
+    upper-case, ``IMAGE_`` prefix.
+    """
+    return {
+        "IMAGE_" + str(key).replace("-", "_").upper(): str(value)
+        for key, value in image_versions.items()
+    }
+
+
+def read_dotenv(path: Path) -> dict[str, str]:
+    """``KEY=VALUE`` lines of a stack ``.env``; missing file → ``{}``.
+
+    The files are rendered by :mod:`service_env` (unquoted values), so
+    this only strips one layer of matching quotes for hand-written ones.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    env: dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        env[key.removeprefix("export ").strip()] = value
+    return env
+
+
+def interpolate(value: str, env: Mapping[str, str]) -> str:
+    """Compose-style variable interpolation of one string.
+
+    ``${VAR:?err}`` / ``${VAR?err}`` with the variable missing resolve
+    to ``""`` (compose would refuse the file; the caller drops empty
+    images and compose-up reports the real error).
+    """
+
+    def _sub(match: re.Match[str]) -> str:
+        if match.group(0) == "$$":
+            return "$"
+        name = match["braced"] or match["bare"]
+        op, arg = match["op"], match["arg"] or ""
+        current = env.get(name)
+        # The colon forms also treat an empty value as missing.
+        missing = not current if op in (":-", ":?") else current is None
+        if not missing:
+            return current or ""
+        return arg if op in (":-", "-") else ""
+
+    return _VARIABLE.sub(_sub, value)
+
+
+def stack_images(stack_dir: Path, env: Mapping[str, str]) -> list[str]:
+    """Resolved ``image:`` of every non-build service of one stack.
+
+    Reads ``docker-compose*.yml`` in sorted order (the firewall
+    override only carries ports). Unreadable files are skipped:
+    compose-up reports those itself.
+    """
+    images: list[str] = []
+    for compose_file in sorted(stack_dir.glob("docker-compose*.yml")):
+        try:
+            data = yaml.safe_load(compose_file.read_text(encoding="utf-8"))
+        except (OSError, yaml.YAMLError):
+            continue
+        services = data.get("services") if isinstance(data, dict) else None
+        if not isinstance(services, dict):
+            continue
+        for spec in services.values():
+            if not isinstance(spec, dict) or "build" in spec:
+                continue
+            raw = spec.get("image")
+            if isinstance(raw, str):
+                image = interpolate(raw, env).strip()
+                if image:
+                    images.append(image)
+    return images
+
+
+def collect_images(
+    stacks_dir: Path,
+    stacks: Iterable[str],
+    image_versions: Mapping[str, object],
+) -> list[str]:
+    """Deduplicated images of ``stacks``, in first-seen order.
+
+    Per stack the environment is the stack's ``.env`` overlaid with the
+    global ``IMAGE_*`` pins. Global wins because compose-up exports the
+    global .env into the shell environment, which compose ranks above
+    the project ``.env`` file.
+    """
+    pins = image_env(image_versions)
+    seen: dict[str, None] = {}
+    for svc in stacks:
+        env = {**read_dotenv(stacks_dir / svc / ".env"), **pins}
+        for image in stack_images(stacks_dir / svc, env):
+            seen.setdefault(image, None)
+    return list(seen)
+
+
+# ---------------------------------------------------------------------------
+# Bash rendering
+# ---------------------------------------------------------------------------
+
+
+def render_remote_script(images: list[str], *, workers: int = DEFAULT_PULL_WORKERS) -> str:
+    """Render the bash that pulls ``images`` through ``xargs -P workers``.
+
+    Each worker runs ``pull_one`` (exported into the ``bash -c`` the
+    worker spawns). It skips images that are already present, times
+    ``docker pull``, and appends its ``PULL`` line to a log. The
+    ``RESULT`` counts come from that log once every worker is done.
+    ``pull_one`` never fails, so one bad image can't stop ``xargs``
+    from handing out the rest.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    images_q = " ".join(shlex.quote(i) for i in images)
+    return f"""set -euo pipefail
+
+IMAGES=({images_q})
+PULL_LOG=$(mktemp)
+trap 'rm -f "$PULL_LOG"' EXIT
+export PULL_LOG
+
+pull_one() {{
+    local img=$1 started ended status bytes line
+    if docker image inspect "$img" >/dev/null 2>&1; then
+        line="PULL $img status=present ms=0 bytes=0"
+    else
+        started=${{EPOCHREALTIME/[.,]/}}
+        if docker pull --quiet "$img" >/dev/null 2>&1; then
+            status=pulled
+            bytes=$(docker image inspect --format '{{{{.Size}}}}' "$img" 2>/dev/null || echo 0)
+        else
+            status=failed
+            bytes=0
+            echo "  ⚠ docker pull $img failed" >&2
+        fi
+        ended=${{EPOCHREALTIME/[.,]/}}
+        line="PULL $img status=$status ms=$(((ended - started) / 1000)) bytes=${{bytes:-0}}"
+    fi
+    # One short write per line: safe to share between workers.
+    echo "$line" >> "$PULL_LOG"
+    echo "$line"
+}}
+export -f pull_one
+
+if [ "${{#IMAGES[@]}}" -gt 0 ]; then
+    printf '%s\\0' "${{IMAGES[@]}}" | xargs -0 -n 1 -P {workers} bash -c 'pull_one "$1"' _
+fi
+
+count() {{
+    grep -c " status=$1 " "$PULL_LOG" || true
+}}
+echo "RESULT pulled=$(count pulled) present=$(count present) failed=$(count failed)"
+"""
+
+
+def parse_result(stdout: str) -> PrePullResult | None:
+    """Extract ``RESULT`` + ``PULL`` lines; None without a RESULT line."""
+    match = _RESULT_PATTERN.search(stdout)
+    if match is None:
+        return None
+    images = tuple(
+        ImagePull(
+            image=m["image"],
+            status=m["status"],
+            ms=int(m["ms"]),
+            bytes=int(m["bytes"]),
+        )
+        for m in _PULL_PATTERN.finditer(stdout)
+    )
+    return PrePullResult(
+        pulled=int(match["pulled"]),
+        present=int(match["present"]),
+        failed=int(match["failed"]),
+        images=images,
+    )
+
+
+# ---------------------------------------------------------------------------
+# End-to-end orchestration
+# ---------------------------------------------------------------------------
+
+
+ScriptRunner = Callable[[str], subprocess.CompletedProcess[str]]
+
+
+def _format_bytes(n: int) -> str:
+    size = float(n)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GB"
+
+
+def run_prepull(
+    images: list[str],
+    *,
+    host: str = "nexus",
+    workers: int = DEFAULT_PULL_WORKERS,
+    script_runner: ScriptRunner | None = None,
+) -> PrePullResult:
+    """Render → exec → parse, then print the pulls slowest-first.
+
+    Returns ``PrePullResult(pulled=0, present=0, failed=len(images))``
+    when the remote script produced no parseable RESULT line.
+
+    ``script_runner`` is a dependency-injection seam for tests;
+    production callers leave it None.
+    """
+    with _tracing.span("image-prepull render", "render"):
+        script = render_remote_script(images, workers=workers)
+
+    run_script = script_runner or (lambda s: _remote.ssh_run_script(s, host=host))
+    completed = run_script(script)
+
+    # Bash warnings pass through; PULL / RESULT are wire format and
+    # are reported below in a readable form.
+    for line in completed.stdout.splitlines():
+        if not line.startswith(("PULL ", "RESULT ")):
+            sys.stderr.write(line + "\n")
+
+    with _tracing.span("image-prepull parse", "parse"):
+        result = parse_result(completed.stdout)
+    if result is None:
+        return PrePullResult(pulled=0, present=0, failed=len(images))
+
+    for pull in sorted(result.images, key=lambda p: p.ms, reverse=True):
+        if pull.status == "pulled":
+            sys.stderr.write(
+                f"  ✓ pulled {pull.image} in {pull.ms / 1000:.1f}s ({_format_bytes(pull.bytes)})\n"
+            )
+        elif pull.status == "failed":
+            sys.stderr.write(f"  ✗ pull {pull.image} failed after {pull.ms / 1000:.1f}s\n")
+    return result
+
+
+__all__ = [
+    "DEFAULT_PULL_WORKERS",
+    "ImagePull",
+    "PrePullResult",
+    "collect_images",
+    "image_env",
+    "interpolate",
+    "parse_image_versions",
+    "parse_result",
+    "read_dotenv",
+    "render_remote_script",
+    "run_prepull",
+    "stack_images",
+]
@@ -13,6 +13,11 @@ on the server. The flow:
   loop that POSTs each folder (200 + 409 both treated as success) and
   PATCHes the corresponding ``secrets/batch`` payload. Returns
   :class:`BootstrapResult` with pushed/failed counts.
+- ``bootstrap(..., stream=True)`` skips the push dir and rsync: the
+  payloads travel as one framed ndjson document appended to the
+  script on ``ssh nexus bash -s``'s stdin, consumed line by line by
+  the remote loop — one round trip, no secret-bearing files on either
+  end.
 - :func:`provision_admin` — separate helper for one-time admin-account
   creation, called once after the initial Infisical container start.
 
@@ -985,6 +990,36 @@ class InfisicalClient:
             )
         return out
 
+    def encode_stream(self, folders: list[FolderSpec]) -> str:
+        """Return the framed ndjson document for :meth:`_build_remote_stream_loop`.
+
+        One frame per line, ``<tag> <compact-json>``:
+
+        - ``BEGIN <n>`` — number of ``S`` frames that follow, so the
+          remote loop can count a truncated stream's missing PATCHes
+          as failures instead of silently under-reporting.
+        - ``F <folder-payload>`` for every folder, then
+        - ``S <secrets-payload>`` for every folder (same order as
+          :meth:`encode_payloads`: all folder POSTs before the PATCHes
+          that need them).
+        - ``END`` — closing frame.
+
+        ``json.dumps`` escapes control characters, so a payload can
+        never contain a raw newline and split its frame.
+        """
+        lines = [f"BEGIN {len(folders)}"]
+        lines.extend(
+            "F " + json.dumps(spec.folder_payload(self.project_id, self.env), separators=(",", ":"))
+            for spec in folders
+        )
+        lines.extend(
+            "S "
+            + json.dumps(spec.secrets_payload(self.project_id, self.env), separators=(",", ":"))
+            for spec in folders
+        )
+        lines.append("END")
+        return "\n".join(lines) + "\n"
+
     def _build_remote_loop(self) -> str:
         """Build the server-side bash that POSTs folders + PATCHes secrets."""
         token_quoted = shlex.quote(self.token)
@@ -1024,6 +1059,61 @@ for f in {_REMOTE_PUSH_DIR}/s-*.json; do
 done
 rm -rf {_REMOTE_PUSH_DIR}
 echo "$OK:$FAIL"
+"""
+
+    def _build_remote_stream_loop(self) -> str:
+        """Build the bash that consumes :meth:`encode_stream` from its own stdin.
+
+        Same POST/PATCH semantics and ``OK:FAIL`` output as
+        :meth:`_build_remote_loop`. The document follows the script on
+        ``bash -s``'s stdin: bash reads a script from a pipe
+        byte-by-byte, so ``main; exit $?`` is the last line it parses
+        and ``main``'s ``read`` gets the frames. Payloads reach curl
+        through a pipe (``--data-binary @-``), never a file.
+        """
+        token_quoted = shlex.quote(self.token)
+        folders_url = f"http://{_INFISICAL_HOST}:{_INFISICAL_PORT}{_FOLDERS_PATH}"
+        secrets_url = f"http://{_INFISICAL_HOST}:{_INFISICAL_PORT}{_SECRETS_BATCH_PATH}"
+        return f"""
+TOKEN=$(cat {_REMOTE_TOKEN_FALLBACK_FILE} 2>/dev/null || printf '%s' {token_quoted})
+main() {{
+    local line EXPECTED=0 SEEN=0 ENDED=0
+    OK=0; FAIL=0
+    while IFS= read -r line; do
+        case "$line" in
+            "BEGIN "*) EXPECTED=${{line#BEGIN }} ;;
+            "F "*)
+                [ -n "$TOKEN" ] || continue
+                printf '%s' "${{line#F }}" | curl -s -X POST '{folders_url}' \\
+                    -H "Authorization: Bearer $TOKEN" \\
+                    -H 'Content-Type: application/json' \\
+                    --data-binary @- >/dev/null 2>&1 || true
+                ;;
+            "S "*)
+                SEEN=$((SEEN+1))
+                [ -n "$TOKEN" ] || continue
+                RESULT=$(printf '%s' "${{line#S }}" | curl -s -X PATCH '{secrets_url}' \\
+                    -H "Authorization: Bearer $TOKEN" \\
+                    -H 'Content-Type: application/json' \\
+                    --data-binary @- 2>&1)
+                CURL_RC=$?
+                if [ "$CURL_RC" -ne 0 ] || echo "$RESULT" | grep -q '"error"'; then
+                    FAIL=$((FAIL+1))
+                else
+                    OK=$((OK+1))
+                fi
+                ;;
+            END) ENDED=1 ;;
+        esac
+    done
+    if [ -z "$TOKEN" ]; then echo '0:0'; return 0; fi
+    if [ "$ENDED" -ne 1 ] || [ "$SEEN" -lt "$EXPECTED" ]; then
+        echo "  ⚠ Infisical payload stream truncated ($SEEN/$EXPECTED secret batches)" >&2
+        FAIL=$((FAIL + EXPECTED - SEEN))
+    fi
+    echo "$OK:$FAIL"
+}}
+main; exit $?
 """
 
     def bootstrap(
@@ -1032,6 +1122,7 @@ echo "$OK:$FAIL"
         *,
         ssh_runner: SshRunner | None = None,
         rsync_runner: RsyncRunner | None = None,
+        stream: bool = False,
     ) -> BootstrapResult:
         """Write payloads, rsync, run the curl loop. Return push counts.
 
@@ -1050,8 +1141,16 @@ echo "$OK:$FAIL"
         keeps it out of ``ps``, CI argv-logging, and any
         ``CalledProcessError`` / ``TimeoutExpired`` exception messages
         that would otherwise dump the full argv.
+
+        ``stream=True`` sends :meth:`encode_stream` on that same stdin,
+        right after :meth:`_build_remote_stream_loop` — no push dir, no
+        rsync, no second SSH session, and no payload file on either
+        end. ``rsync_runner`` / ``push_dir`` are unused then.
         """
         ssh = ssh_runner or (lambda script: _remote.ssh_run_script(script))
+        if stream:
+            completed = ssh(self._build_remote_stream_loop() + self.encode_stream(folders))
+            return self._parse_counts(completed.stdout, folders)
         rsync = rsync_runner or (
             lambda local, remote: _remote.rsync_to_remote(local, remote, delete=True)
         )
@@ -1103,20 +1202,8 @@ echo "$OK:$FAIL"
             # 3. Run the server-side curl loop.
             completed = ssh(self._build_remote_loop())
 
-            # 4. Parse the final `OK:FAIL` line. The server's stdout
-            #    may include earlier echoes (warnings from the
-            #    baseline-capture step); take the last line.
-            last_line = completed.stdout.strip().splitlines()[-1] if completed.stdout else "0:0"
-            try:
-                ok_str, fail_str = last_line.split(":", 1)
-                pushed = int(ok_str)
-                failed = int(fail_str)
-            except (ValueError, IndexError):
-                # Unparseable output is itself a failure signal.
-                pushed = 0
-                failed = len(folders)
-
-            return BootstrapResult(folders_built=len(folders), pushed=pushed, failed=failed)
+            # 4. Parse the final `OK:FAIL` line.
+            return self._parse_counts(completed.stdout, folders)
         finally:
             # Best-effort: secret-bearing payloads must not survive a
             # bootstrap call (success OR failure). We delete only the
@@ -1124,3 +1211,22 @@ echo "$OK:$FAIL"
             # the dir may pre-exist with operator state we don't own.
             for payload in self.push_dir.glob("[fs]-*.json"):
                 payload.unlink(missing_ok=True)
+
+    @staticmethod
+    def _parse_counts(stdout: str, folders: list[FolderSpec]) -> BootstrapResult:
+        """Parse the remote loop's final ``OK:FAIL`` line.
+
+        The server's stdout may include earlier echoes (warnings from
+        the baseline-capture step); take the last line.
+        """
+        last_line = stdout.strip().splitlines()[-1] if stdout else "0:0"
+        try:
+            ok_str, fail_str = last_line.split(":", 1)
+            pushed = int(ok_str)
+            failed = int(fail_str)
+        except (ValueError, IndexError):
+            # Unparseable output is itself a failure signal.
+            pushed = 0
+            failed = len(folders)
+
+        return BootstrapResult(folders_built=len(folders), pushed=pushed, failed=failed)
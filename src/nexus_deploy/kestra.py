@@ -15,6 +15,7 @@ API:
 
 - :class:`KestraClient` — basic-auth REST client. ``wait_ready``,
   ``register_flow`` (POST 200/201 / 422 → PUT 200/201 / failed),
+  ``register_flows_bulk`` (one multi-document upload per namespace),
   ``execute_flow``, ``wait_for_execution``.
 - :func:`render_system_flow_yaml` — string-template YAML builder for
   the two system flows.
@@ -37,7 +38,9 @@ no service-side credentials in argv).
 from __future__ import annotations
 
 import contextlib
+import json
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Literal
 
@@ -99,6 +102,39 @@ ExecutionState = Literal[
     "SEED_FLOW_MISSING",
 ]
 
+
+def _execution_state_from_payload(payload: object) -> ExecutionState:
+    """Map an execution JSON body to its ``state.current``.
+
+    Kestra-side states we recognise pass through; others (PAUSED,
+    etc.) and malformed shapes coalesce to ``"UNKNOWN"`` so the
+    caller's poll-until-terminal logic doesn't loop forever.
+    """
+    if not isinstance(payload, dict):
+        return "UNKNOWN"
+    state_obj = payload.get("state")
+    if not isinstance(state_obj, dict):
+        return "UNKNOWN"
+    current = state_obj.get("current")
+    if current in ("SUCCESS", "FAILED", "KILLED", "RUNNING", "CREATED"):
+        return current  # type: ignore[no-any-return]
+    return "UNKNOWN"
+
+
+def _execution_state_of(data: str) -> ExecutionState | None:
+    """Parse one SSE ``data:`` payload from the execution follow stream.
+
+    Returns ``None`` for keep-alive / non-JSON frames so
+    :meth:`KestraClient.follow_execution` can skip them without
+    reporting a spurious ``UNKNOWN`` transition.
+    """
+    try:
+        payload = json.loads(data)
+    except ValueError:
+        return None
+    return _execution_state_from_payload(payload)
+
+
 # Canonical seeded flow that system.flow-sync should produce after
 # pulling nexus_seeds/kestra/flows/ from the workspace repo. Hardcoded
 # because it's the single ship-with-Nexus-Stack tutorial flow under
@@ -294,6 +330,62 @@ class KestraClient:
             detail=f"POST 422 → PUT {put_resp.status_code}",
         )
 
+    def register_flows_bulk(
+        self,
+        namespace: str,
+        flows: dict[str, str],
+    ) -> dict[str, RegisterResult] | None:
+        """Create-or-update every flow of one namespace in a single request.
+
+        ``POST /api/v1/flows/bulk?namespace=<ns>&delete=false`` with the
+        flows as one multi-document YAML body. ``delete=false`` is
+        load-bearing: Kestra's default deletes every flow of the
+        namespace that isn't in the upload.
+
+        ``flows`` maps flow id → YAML. Returns ``{full_name: result}``
+        for the flows Kestra echoed back — revision 1 is ``created``,
+        anything later ``updated``. Returns ``None`` when the bulk
+        path is unusable (transport error, any non-200 — older Kestra
+        without the endpoint answers 404/405, and one invalid flow
+        fails the whole batch with 422) so the caller falls back to
+        per-flow :meth:`register_flow` and gets per-flow diagnostics.
+        """
+        body = "\n---\n".join(yaml_body.rstrip("\n") for yaml_body in flows.values())
+        try:
+            resp = requests.post(
+                f"{self.base_url}/api/v1/flows/bulk",
+                params={"namespace": namespace, "delete": "false"},
+                auth=self._auth,
+                headers={"Content-Type": "application/x-yaml"},
+                data=(body + "\n").encode("utf-8"),
+                timeout=_HTTP_TIMEOUT,
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            return None
+        if resp.status_code != 200:
+            return None
+        try:
+            payload = resp.json()
+        except ValueError:
+            return None
+        if not isinstance(payload, list):
+            return None
+        results: dict[str, RegisterResult] = {}
+        for entry in payload:
+            if not isinstance(entry, dict):
+                continue
+            flow_id = entry.get("id")
+            if entry.get("namespace") != namespace or flow_id not in flows:
+                continue
+            revision = entry.get("revision")
+            full_name = f"{namespace}.{flow_id}"
+            results[full_name] = RegisterResult(
+                name=full_name,
+                status="created" if revision == 1 else "updated",
+                detail=f"bulk 200 (revision {revision})",
+            )
+        return results
+
     def execute_flow(self, namespace: str, flow_id: str) -> str:
         """Trigger an execution. Returns the execution ID.
 
@@ -351,17 +443,7 @@ class KestraClient:
             payload = resp.json()
         except ValueError:
             return "UNKNOWN"
-        if not isinstance(payload, dict):
-            return "UNKNOWN"
-        state_obj = payload.get("state")
-        if not isinstance(state_obj, dict):
-            return "UNKNOWN"
-        current = state_obj.get("current")
-        # Kestra-side states we recognise; others (PAUSED, etc.) coalesce to UNKNOWN
-        # so the caller's poll-until-terminal logic doesn't loop forever.
-        if current in ("SUCCESS", "FAILED", "KILLED", "RUNNING", "CREATED"):
-            return current  # type: ignore[no-any-return]
-        return "UNKNOWN"
+        return _execution_state_from_payload(payload)
 
     def flow_exists(self, namespace: str, flow_id: str) -> bool:
         """``GET /api/v1/flows/<ns>/<id>`` — 200 → exists, 404 → not.
@@ -387,6 +469,57 @@ class KestraClient:
             return False
         raise KestraError(f"flow_exists HTTP {resp.status_code}")
 
+    def follow_execution(
+        self, exec_id: str, *, timeout_s: float = 60.0
+    ) -> Iterator[ExecutionState]:
+        """Stream state transitions from ``GET /api/v1/executions/<id>/follow``.
+
+        Kestra pushes the execution as server-sent events whenever it
+        changes; each ``data:`` line is the execution JSON. Yields the
+        state every time it changes and stops right after a terminal
+        one (``SUCCESS`` / ``FAILED`` / ``KILLED``), when the server
+        closes the stream, or at ``timeout_s``.
+
+        Raises :class:`KestraError` when the stream can't be opened
+        (transport, non-200 — e.g. a proxy that doesn't pass SSE) or
+        breaks mid-way; :meth:`wait_for_execution` falls back to
+        polling then.
+        """
+        deadline = time.monotonic() + timeout_s
+        try:
+            resp = requests.get(
+                f"{self.base_url}/api/v1/executions/{exec_id}/follow",
+                auth=self._auth,
+                headers={"Accept": "text/event-stream"},
+                stream=True,
+                timeout=_http_timeout_for_deadline(deadline),
+            )
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise KestraError(f"follow_execution transport ({type(exc).__name__})") from exc
+        with resp:
+            if resp.status_code != 200:
+                raise KestraError(f"follow_execution HTTP {resp.status_code}")
+            last: ExecutionState | None = None
+            try:
+                for line in resp.iter_lines(decode_unicode=True):
+                    if time.monotonic() >= deadline:
+                        return
+                    if not line or not line.startswith("data:"):
+                        continue
+                    state = _execution_state_of(line.removeprefix("data:").strip())
+                    if state is None or state == last:
+                        continue
+                    last = state
+                    yield state
+                    if state in ("SUCCESS", "FAILED", "KILLED"):
+                        return
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as exc:
+                raise KestraError(f"follow_execution stream ({type(exc).__name__})") from exc
+
     def wait_for_execution(
         self,
         exec_id: str,
@@ -394,19 +527,28 @@ class KestraClient:
         timeout_s: float = 60.0,
         interval_s: float = 2.0,
     ) -> ExecutionState:
-        """Poll ``get_execution_state`` until terminal or timeout.
+        """Wait until the execution is terminal or ``timeout_s`` passes.
 
         Terminal states: ``SUCCESS``, ``FAILED``, ``KILLED``. Returns
         whichever was reached, or ``"RUNNING"`` if the timeout fired
         before the execution settled (caller maps to a warning, not a
         deploy failure — the execution may finish in the next minute).
 
-        Sleep is clamped to the deadline (same pattern as
-        :meth:`wait_ready`) so short ``timeout_s`` values aren't
-        floored to ``interval_s``.
+        Follows the execution's SSE stream first (:meth:`follow_execution`),
+        which returns the moment Kestra reports the terminal state.
+        If the stream can't be opened, breaks, or closes early, the
+        rest of the budget is spent polling ``get_execution_state``
+        every ``interval_s``. Sleep is clamped to the deadline (same
+        pattern as :meth:`wait_ready`) so short ``timeout_s`` values
+        aren't floored to ``interval_s``.
         """
         deadline = time.monotonic() + timeout_s
         last: ExecutionState = "CREATED"
+        # The stream failing is not an error: polling picks up below.
+        with contextlib.suppress(KestraError):
+            for last in self.follow_execution(exec_id, timeout_s=timeout_s):
+                if last in ("SUCCESS", "FAILED", "KILLED"):
+                    return last
         while time.monotonic() < deadline:
             try:
                 last = self.get_execution_state(
@@ -623,9 +765,28 @@ def register_all_system_flows(
     client: KestraClient,
     flows: dict[str, str],
 ) -> tuple[RegisterResult, ...]:
-    """Register every flow in ``flows``. Order = caller-provided dict order."""
+    """Register every flow in ``flows``. Order = caller-provided dict order.
+
+    One :meth:`KestraClient.register_flows_bulk` request per namespace
+    instead of a POST (+ PUT) per flow. Flows the bulk path didn't
+    confirm — endpoint missing on an older Kestra, batch rejected, flow
+    absent from the response — go through per-flow
+    :meth:`KestraClient.register_flow`.
+    """
+    by_namespace: dict[str, dict[str, str]] = {}
+    for full_name, yaml in flows.items():
+        ns, _, flow_id = full_name.partition(".")
+        by_namespace.setdefault(ns, {})[flow_id] = yaml
+
+    registered: dict[str, RegisterResult] = {}
+    for ns, ns_flows in by_namespace.items():
+        registered.update(client.register_flows_bulk(ns, ns_flows) or {})
+
     results: list[RegisterResult] = []
     for full_name, yaml in flows.items():
+        if full_name in registered:
+            results.append(registered[full_name])
+            continue
         ns, _, flow_id = full_name.partition(".")
         results.append(client.register_flow(yaml, namespace=ns, flow_id=flow_id))
     return tuple(results)
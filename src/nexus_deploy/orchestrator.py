@@ -46,18 +46,23 @@ import re
 import shlex
 import socket
 import subprocess
+import sys
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from functools import partial
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from nexus_deploy import _remote
+from nexus_deploy import checkpoint as _checkpoint
 from nexus_deploy import compose_restart as _compose_restart
 from nexus_deploy import compose_runner as _compose_runner
 from nexus_deploy import firewall as _firewall
 from nexus_deploy import gitea as _gitea
+from nexus_deploy import image_prepull as _image_prepull
 from nexus_deploy import infisical as _infisical
 from nexus_deploy import kestra as _kestra
+from nexus_deploy import phase_scheduler as _phase_scheduler
 from nexus_deploy import secret_sync as _secret_sync
 from nexus_deploy import seeder as _seeder
 from nexus_deploy import service_env as _service_env
@@ -130,11 +135,23 @@ class OrchestratorState:
 @dataclass(frozen=True)
 class PhaseResult:
     """Outcome of a single phase. Same shape as the per-module
-    Result dataclasses (RsyncResult, OAuthAppResult, etc.)."""
+    Result dataclasses (RsyncResult, OAuthAppResult, etc.).
+
+    ``started`` / ``finished`` are ``time.monotonic()`` values stamped
+    by the scheduler (only their differences are meaningful; 0.0 for
+    results built by hand). They're excluded from equality so results
+    still compare by outcome.
+    """
 
     name: str
     status: Literal["ok", "partial", "failed", "skipped"]
     detail: str = ""
+    started: float = field(default=0.0, compare=False)
+    finished: float = field(default=0.0, compare=False)
+
+    @property
+    def duration_s(self) -> float:
+        return self.finished - self.started
 
 
 @dataclass(frozen=True)
@@ -143,6 +160,9 @@ class OrchestratorResult:
 
     phases: tuple[PhaseResult, ...]
     state: OrchestratorState
+    # (phase name, wall seconds) along the longest dependency chain —
+    # see phase_scheduler. Empty for results built by hand (tests).
+    critical_path: tuple[tuple[str, float], ...] = ()
 
     @property
     def is_success(self) -> bool:
@@ -159,6 +179,20 @@ class OrchestratorResult:
         return any(p.status == "failed" for p in self.phases)
 
 
+def _unchanged_suffix(count: int) -> str:
+    """`` unchanged=N`` for phase details when stamps skipped work.
+
+    Omitted at zero so details from runs without stamps (first deploy,
+    ``skip_unchanged`` off) read exactly as before.
+    """
+    return f" unchanged={count}" if count else ""
+
+
+def _unhealthy_suffix(count: int) -> str:
+    """`` unhealthy=N`` for compose-up details; omitted at zero."""
+    return f" unhealthy={count}" if count else ""
+
+
 def _allocate_free_port() -> int:
     """Same primitive as :func:`__main__._allocate_free_port`. Inlined
     here so orchestrator.py doesn't depend on __main__."""
@@ -195,6 +229,35 @@ class Orchestrator:
     gitea_user_email: str | None = None
     gitea_user_password: str | None = None
     ssh_host: str = "nexus"
+    # Share one ControlMaster across every phase's ssh/rsync call (see
+    # ssh.SSHClient). Off by default so constructing/running an
+    # Orchestrator in tests never opens a real connection; the CLI
+    # handlers and pipeline.run_pipeline turn it on.
+    ssh_multiplex: bool = False
+    # Upper bound on phases running at once. Phases declare the state
+    # fields / remote resources they read + write (see _run_all_specs /
+    # _pre_bootstrap_specs) and only independent ones overlap. 1 keeps
+    # the strict declared-order loop.
+    max_parallel_phases: int = 1
+    # Checkpoint journal for resumable run_all (see checkpoint.py).
+    # None disables journaling entirely; ``resume`` additionally skips
+    # phases the journal recorded with unchanged inputs.
+    checkpoint_path: Path | None = None
+    resume: bool = False
+    # Skip per-service work whose input hash matches the server-side
+    # stamp (stack-sync / compose-up / admin-setup; see stamps.py).
+    # Off by default so direct callers keep the redo-everything
+    # behaviour; the CLI and pipeline turn it on.
+    skip_unchanged: bool = False
+    # Weight budget of stacks compose-up starts at once (weights come
+    # from services.yaml; see compose_runner.load_stack_weights).
+    compose_max_weight: int = _compose_runner.DEFAULT_MAX_WEIGHT
+    # stack-sync transport (see stack_sync.rsync_enabled_stacks).
+    # "manifest" ships only changed files but deletes what the previous
+    # manifest listed and is gone locally, so it stays opt-in.
+    stack_sync_mode: _stack_sync.SyncMode = "bulk"
+    # Concurrent `docker pull`s of the image pre-pull phase.
+    image_pull_workers: int = _image_prepull.DEFAULT_PULL_WORKERS
     project_id: str | None = None
     infisical_token: str | None = None
     infisical_env: str = "dev"
@@ -232,7 +295,10 @@ class Orchestrator:
     def run_all(self) -> OrchestratorResult:
         """Execute all phases in deterministic order.
 
-        ExitStack ensures any opened ssh-tunnels / temp-files clean
+        With ``max_parallel_phases > 1`` phases whose declared reads /
+        writes don't conflict run concurrently (see
+        :meth:`_run_all_specs`); ``self.results`` still lists them in
+        declared order. ExitStack ensures any opened ssh-tunnels / temp-files clean
         up before return, even on early-fail. A phase with
         status='failed' aborts the run; status='partial' continues
         with a recorded warning.
@@ -243,37 +309,260 @@ class Orchestrator:
         tests may pre-seed state to skip earlier phases).
         """
         self.results = []
+        journal: _checkpoint.CheckpointJournal | None = None
         with contextlib.ExitStack() as stack:
-            ssh = stack.enter_context(SSHClient(self.ssh_host))
-            # Phases interleave to honor state-handoff dependencies:
-            #   - compose-restart consumes state.restart_services from gitea
-            #   - kestra-secret-sync runs BEFORE kestra-register
-            #   - woodpecker-apply consumes state.woodpecker_* from oauth
-            #   - mirror-seed-rerun consumes state.fork_* from mirror-setup
-            #   - mirror-finalize is best-effort wakeup after mirror-seed
-            phases: list[Callable[[SSHClient], PhaseResult]] = [
-                self._phase_infisical_bootstrap,
-                self._phase_services_configure,
+            ssh = stack.enter_context(SSHClient(self.ssh_host, multiplex=self.ssh_multiplex))
+            specs = self._run_all_specs(ssh)
+            if self.checkpoint_path is not None:
+                journal = self._open_checkpoint(ssh, self.checkpoint_path)
+            if journal is not None:
+                specs = self._checkpointed(specs, journal)
+            critical_path = self._schedule(specs)
+        result = OrchestratorResult(
+            phases=tuple(self.results), state=self.state, critical_path=critical_path
+        )
+        if journal is not None and not result.has_hard_failure:
+            journal.discard()
+        return result
+
+    def _run_all_specs(self, ssh: SSHClient) -> list[_phase_scheduler.PhaseSpec[PhaseResult]]:
+        """Post-bootstrap phases in declared order, with their I/O.
+
+        Declared order is the order the old linear loop used; the
+        scheduler only reorders phases whose declarations don't
+        conflict. State-handoff dependencies:
+          - compose-restart consumes state.restart_services from gitea
+          - kestra-secret-sync runs BEFORE kestra-register (both touch
+            the kestra container; secret-sync force-recreates it)
+          - woodpecker-apply consumes state.woodpecker_* from oauth
+          - mirror-seed-rerun consumes state.fork_* from mirror-setup
+          - mirror-finalize is best-effort wakeup after mirror-seed
+          - secret-sync-<stack> restarts <stack>, so it stays after
+            compose-restart / mirror-finalize restarting the same one
+
+        ``stack:<svc>`` = the running container, ``gitea.repo`` = repo
+        contents in Gitea, ``infisical`` = the secrets held there.
+        """
+        git_stacks = frozenset(f"stack:{s}" for s in _gitea._GIT_INTEGRATED_SERVICES)
+        token = frozenset({"state.gitea_token"})
+
+        def spec(
+            phase: Callable[[SSHClient], PhaseResult],
+            reads: frozenset[str] = frozenset(),
+            writes: frozenset[str] = frozenset(),
+        ) -> _phase_scheduler.PhaseSpec[PhaseResult]:
+            key = getattr(phase, "__name__", "").removeprefix("_phase_")
+            return _phase_scheduler.PhaseSpec(partial(phase, ssh), reads, writes, key)
+
+        return [
+            spec(self._phase_infisical_bootstrap, writes=frozenset({"infisical"})),
+            spec(self._phase_services_configure, writes=frozenset({"admin-hooks"})),
+            spec(
                 self._phase_gitea_configure,
+                writes=token | {"state.restart_services", "gitea"},
+            ),
+            spec(
                 self._phase_compose_restart,
+                reads=frozenset({"state.restart_services"}),
+                writes=git_stacks,
+            ),
+            spec(
                 self._phase_kestra_secret_sync,
-                self._phase_kestra_register,
-                self._phase_seed,  # skipped in mirror mode
+                reads=token | {"infisical"},
+                writes=frozenset({"stack:kestra"}),
+            ),
+            spec(self._phase_kestra_register, writes=frozenset({"stack:kestra"})),
+            # skipped in mirror mode
+            spec(self._phase_seed, reads=token, writes=frozenset({"gitea.repo"})),
+            spec(
                 self._phase_woodpecker_oauth,
+                reads=token,
+                writes=frozenset({"state.woodpecker_client_id", "state.woodpecker_client_secret"}),
+            ),
+            spec(
                 self._phase_woodpecker_apply,
+                reads=frozenset({"state.woodpecker_client_id", "state.woodpecker_client_secret"}),
+                writes=frozenset({"stack:woodpecker"}),
+            ),
+            spec(
                 self._phase_mirror_setup,
+                reads=token,
+                writes=frozenset({"state.fork_name", "state.fork_owner", "gitea.repo"}),
+            ),
+            spec(
                 self._phase_mirror_seed_rerun,
+                reads=token | {"state.fork_name", "state.fork_owner"},
+                writes=frozenset({"state.repo_name", "state.gitea_repo_owner", "gitea.repo"}),
+            ),
+            spec(
                 self._phase_mirror_finalize,
+                reads=frozenset({"state.fork_name", "gitea.repo"}),
+                writes=git_stacks | {"stack:kestra"},
+            ),
+            spec(
                 self._phase_secret_sync_jupyter,
+                reads=token | {"infisical"},
+                writes=frozenset({"stack:jupyter"}),
+            ),
+            spec(
                 self._phase_secret_sync_marimo,
+                reads=token | {"infisical"},
+                writes=frozenset({"stack:marimo"}),
+            ),
+            spec(
                 self._phase_secret_sync_code_server,
-            ]
-            for phase in phases:
-                result = phase(ssh)
-                self.results.append(result)
-                if result.status == "failed":
-                    break
-        return OrchestratorResult(phases=tuple(self.results), state=self.state)
+                reads=token | {"infisical"},
+                writes=frozenset({"stack:code-server"}),
+            ),
+        ]
+
+    def _open_checkpoint(self, ssh: SSHClient, path: Path) -> _checkpoint.CheckpointJournal | None:
+        """Load (``resume``) or start the checkpoint journal.
+
+        A loaded journal is only trusted when the server's stamp carries
+        its ``run_id`` — otherwise the server was rebuilt (or another
+        runner deployed) since it was written. A new journal gets its
+        stamp written first; if that fails, run without a journal
+        rather than record one no resume could ever verify.
+        """
+        stamp_path = shlex.quote(_checkpoint.REMOTE_STAMP_PATH)
+        if self.resume:
+            journal = _checkpoint.CheckpointJournal.load(path)
+            if journal is not None:
+                try:
+                    stamp = ssh.run(f"cat {stamp_path} 2>/dev/null || true", check=False)
+                    remote_run_id = stamp.stdout.strip()
+                except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+                    remote_run_id = ""
+                if remote_run_id == journal.run_id:
+                    sys.stderr.write(
+                        f"  → checkpoint: resuming run {journal.run_id[:8]} "
+                        f"({len(journal.entries)} phase(s) recorded)\n"
+                    )
+                    return journal
+                sys.stderr.write(
+                    "  ⚠ checkpoint: server stamp does not match the local journal "
+                    "— running every phase\n"
+                )
+            else:
+                sys.stderr.write("  → checkpoint: no journal to resume — running every phase\n")
+        journal = _checkpoint.CheckpointJournal(path)
+        try:
+            ssh.run(
+                f"mkdir -p {shlex.quote(_checkpoint.REMOTE_STATE_DIR)} && "
+                f"echo {shlex.quote(journal.run_id)} > {stamp_path}"
+            )
+            journal.save()
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+            sys.stderr.write(
+                f"  ⚠ checkpoint: could not stamp the server ({type(exc).__name__}) "
+                "— this run won't be resumable\n"
+            )
+            return None
+        return journal
+
+    def _checkpoint_fingerprint(self) -> str:
+        """Hash of the deploy inputs every phase implicitly depends on.
+
+        Everything the constructor was given, minus runtime knobs and
+        the mutable ``state`` / ``results`` (per-phase state reads are
+        hashed separately in :meth:`_run_checkpointed`).
+        """
+        skip = {
+            "state",
+            "results",
+            "ssh_multiplex",
+            "max_parallel_phases",
+            "checkpoint_path",
+            "resume",
+            "skip_unchanged",
+            "compose_max_weight",
+            "stack_sync_mode",
+            "image_pull_workers",
+        }
+        parts = [self.config.model_dump_json()]
+        parts.extend(
+            f"{f.name}={getattr(self, f.name)!r}" for f in fields(self) if f.name not in skip
+        )
+        return _checkpoint.inputs_hash(*parts)
+
+    def _checkpointed(
+        self,
+        specs: list[_phase_scheduler.PhaseSpec[PhaseResult]],
+        journal: _checkpoint.CheckpointJournal,
+    ) -> list[_phase_scheduler.PhaseSpec[PhaseResult]]:
+        """Wrap each spec with journal lookup (on resume) + recording."""
+        fingerprint = self._checkpoint_fingerprint()
+        deps = _phase_scheduler.dependencies(specs)
+        executed: set[int] = set()
+        return [
+            _phase_scheduler.PhaseSpec(
+                partial(self._run_checkpointed, spec, journal, fingerprint, i, deps[i], executed),
+                spec.reads,
+                spec.writes,
+                spec.key,
+            )
+            for i, spec in enumerate(specs)
+        ]
+
+    def _run_checkpointed(
+        self,
+        spec: _phase_scheduler.PhaseSpec[PhaseResult],
+        journal: _checkpoint.CheckpointJournal,
+        fingerprint: str,
+        index: int,
+        deps: tuple[int, ...],
+        executed: set[int],
+    ) -> PhaseResult:
+        """Skip ``spec`` if the journal has it with identical inputs and
+        none of its upstream phases re-ran in this attempt (a re-run
+        upstream may have changed server-side state that the phase
+        consumes without it showing up in ``OrchestratorState``).
+        Otherwise run it and, on ``ok``, record its state outputs."""
+        state_reads = sorted(r.removeprefix("state.") for r in spec.reads if r.startswith("state."))
+        state_writes = sorted(
+            w.removeprefix("state.") for w in spec.writes if w.startswith("state.")
+        )
+        inputs = _checkpoint.inputs_hash(
+            fingerprint,
+            spec.key,
+            *(f"{attr}={getattr(self.state, attr)!r}" for attr in state_reads),
+        )
+        entry = journal.lookup(spec.key, inputs) if spec.key else None
+        if self.resume and entry is not None and not executed.intersection(deps):
+            for attr, value in entry.outputs.items():
+                if attr in state_writes:
+                    current = getattr(self.state, attr)
+                    setattr(self.state, attr, tuple(value) if isinstance(current, tuple) else value)
+            return PhaseResult(
+                name=entry.name,
+                status="skipped",
+                detail=f"resumed: unchanged since {entry.recorded_at}",
+            )
+        executed.add(index)
+        result = spec.run()
+        if result.status == "ok" and spec.key:
+            outputs: dict[str, Any] = {}
+            for attr in state_writes:
+                value = getattr(self.state, attr)
+                outputs[attr] = list(value) if isinstance(value, tuple) else value
+            journal.record(
+                spec.key, inputs=inputs, outputs=outputs, name=result.name, detail=result.detail
+            )
+        return result
+
+    def _schedule(
+        self, specs: list[_phase_scheduler.PhaseSpec[PhaseResult]]
+    ) -> tuple[tuple[str, float], ...]:
+        """Run ``specs`` through the phase scheduler into ``self.results``.
+
+        Returns the critical path as (phase name, seconds) pairs.
+        """
+        report = _phase_scheduler.run_phases(specs, max_workers=self.max_parallel_phases)
+        self.results.extend(
+            replace(r.result, started=r.started, finished=r.finished) for r in report.runs
+        )
+        return tuple((r.result.name, r.duration_s) for r in report.critical_path)
 
     # -----------------------------------------------------------------
     # Phase methods. Each calls into the existing migrated module's
@@ -301,7 +590,7 @@ class Orchestrator:
                 push_dir=Path("/tmp/infisical-push"),  # noqa: S108
             )
             folders = _infisical.compute_folders(self.config, self.bootstrap_env)
-            result = client.bootstrap(folders)
+            result = client.bootstrap(folders, stream=True)
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
             return PhaseResult(
                 name="infisical-bootstrap",
@@ -334,6 +623,8 @@ class Orchestrator:
                 self.config,
                 self.bootstrap_env,
                 self.enabled_services,
+                ssh=ssh,
+                skip_unchanged=self.skip_unchanged,
             )
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
             return PhaseResult(
@@ -354,6 +645,7 @@ class Orchestrator:
                 detail=(
                     f"configured={result.configured} already-configured={result.already_configured} "
                     f"skipped-not-ready={result.skipped_not_ready} failed={result.failed}"
+                    + _unchanged_suffix(result.skipped_unchanged)
                 ),
             )
         return PhaseResult(
@@ -362,6 +654,7 @@ class Orchestrator:
             detail=(
                 f"configured={result.configured} already-configured={result.already_configured} "
                 f"skipped-not-ready={result.skipped_not_ready}"
+                + _unchanged_suffix(result.skipped_unchanged)
             ),
         )
 
@@ -451,6 +744,9 @@ class Orchestrator:
                 repo_name=self.repo_name,
                 root=seeds_root,
                 token=self.state.gitea_token,
+                batch=True,
+                tree_diff=True,
+                stream=True,
             )
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
             return PhaseResult(
@@ -670,6 +966,9 @@ class Orchestrator:
         # the upstream fetch actually landed during this spin-up (vs. silently
         # leaving the fork at a stale commit).
         detail_parts = [f"mirrors={len(result.mirrors)}"]
+        if result.mirrors:
+            slowest = max(result.mirrors, key=lambda m: m.ms)
+            detail_parts.append(f"slowest={slowest.name} {slowest.ms / 1000:.1f}s")
         if result.sync_detail:
             detail_parts.append(result.sync_detail)
         return PhaseResult(name="mirror-setup", status="ok", detail=" | ".join(detail_parts))
@@ -899,6 +1198,8 @@ class Orchestrator:
                 self.project_root / "stacks",
                 self.enabled_services,
                 host=self.ssh_host,
+                skip_unchanged=self.skip_unchanged,
+                sync_mode=self.stack_sync_mode,
             )
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
             return PhaseResult(
@@ -933,12 +1234,16 @@ class Orchestrator:
                 detail=(
                     f"rsync_synced={result.synced} rsync_failed={result.failed_rsync} "
                     f"cleanup_removed={cleanup_removed} cleanup_failed={cleanup_failed}"
+                    + _unchanged_suffix(result.unchanged)
                 ),
             )
         return PhaseResult(
             name="stack-sync",
             status="ok",
-            detail=(f"rsync_synced={result.synced} cleanup_removed={cleanup_removed}"),
+            detail=(
+                f"rsync_synced={result.synced} cleanup_removed={cleanup_removed}"
+                + _unchanged_suffix(result.unchanged)
+            ),
         )
 
     def _phase_firewall_configure(self) -> PhaseResult:
@@ -1017,6 +1322,44 @@ class Orchestrator:
             detail=(f"rendered={len(gen.compiled)} redpanda={'yes' if gen.redpanda else 'no'}"),
         )
 
+    def _image_versions(self) -> dict[str, object]:
+        """``image_versions_json`` via :func:`image_prepull.parse_image_versions`."""
+        return _image_prepull.parse_image_versions(self.image_versions_json)
+
+    def _phase_image_prepull(self) -> PhaseResult:
+        """Pull the images compose-up is about to need, deduplicated.
+
+        See :mod:`image_prepull`. Images are resolved from the local
+        ``stacks/`` tree (what stack-sync pushes) against the same
+        ``image_versions`` pins global-env wrote. Nothing here is
+        fatal: compose-up pulls whatever is still missing itself, so
+        pull failures and transport errors only downgrade to partial.
+        """
+        parents, leaves = _compose_runner.expand_targets(self.enabled_services)
+        images = _image_prepull.collect_images(
+            self.project_root / "stacks", [*parents, *leaves], self._image_versions()
+        )
+        if not images:
+            return PhaseResult(name="image-prepull", status="skipped", detail="no images")
+        try:
+            result = _image_prepull.run_prepull(
+                images,
+                host=self.ssh_host,
+                workers=self.image_pull_workers,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+            return PhaseResult(
+                name="image-prepull",
+                status="partial",
+                detail=f"transport ({type(exc).__name__}); compose-up pulls instead",
+            )
+        detail = f"pulled={result.pulled} present={result.present} failed={result.failed}"
+        return PhaseResult(
+            name="image-prepull",
+            status="ok" if result.is_success else "partial",
+            detail=detail,
+        )
+
     def _phase_compose_up(self) -> PhaseResult:
         """Start containers in parallel via
         :func:`compose_runner.run_compose_up`.
@@ -1032,6 +1375,11 @@ class Orchestrator:
             result = _compose_runner.run_compose_up(
                 self.enabled_services,
                 host=self.ssh_host,
+                skip_unchanged=self.skip_unchanged,
+                weights=_compose_runner.load_stack_weights(self.project_root / "services.yaml"),
+                max_weight=self.compose_max_weight,
+                local_stacks_dir=self.project_root / "stacks",
+                image_versions=self._image_versions(),
             )
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
             return PhaseResult(
@@ -1049,12 +1397,16 @@ class Orchestrator:
             return PhaseResult(
                 name="compose-up",
                 status="partial",
-                detail=f"started={result.started} failed={result.failed}",
+                detail=f"started={result.started} failed={result.failed}"
+                + _unhealthy_suffix(result.unhealthy)
+                + _unchanged_suffix(result.skipped),
             )
         return PhaseResult(
             name="compose-up",
             status="ok",
-            detail=f"started={result.started}",
+            detail=f"started={result.started}"
+            + _unhealthy_suffix(result.unhealthy)
+            + _unchanged_suffix(result.skipped),
         )
 
     def _phase_infisical_provision(self) -> PhaseResult:
@@ -1367,6 +1719,7 @@ class Orchestrator:
                     [
                         "scp",
                         "-q",
+                        *_remote.ssh_options(self.ssh_host),
                         str(source),
                         f"{self.ssh_host}:{_REMOTE_STACKS_DIR}/redpanda/config/redpanda.yaml",
                     ],
@@ -1553,7 +1906,12 @@ class Orchestrator:
             # command is just `cat > <path>`, env_content goes through
             # stdin where bash treats it as bytes, not script source.
             subprocess.run(
-                ["ssh", self.ssh_host, f"cat > {_REMOTE_STACKS_DIR}/.env"],
+                [
+                    "ssh",
+                    *_remote.ssh_options(self.ssh_host),
+                    self.ssh_host,
+                    f"cat > {_REMOTE_STACKS_DIR}/.env",
+                ],
                 input=env_content,
                 check=True,
                 capture_output=True,
@@ -1963,6 +2321,9 @@ class Orchestrator:
                 repo_name=fork_name,
                 root=seeds_root,
                 token=self.state.gitea_token,
+                batch=True,
+                tree_diff=True,
+                stream=True,
             )
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
             return PhaseResult(
@@ -2063,9 +2424,7 @@ class Orchestrator:
 
         # Sub-step 2: git-restart loop (subset of git-integrated services).
         git_services = [
-            svc
-            for svc in ("jupyter", "marimo", "code-server", "meltano", "prefect")
-            if svc in self.enabled_services
+            svc for svc in _gitea._GIT_INTEGRATED_SERVICES if svc in self.enabled_services
         ]
         try:
             restart_result = _compose_restart.run_restart(git_services, host=self.ssh_host)
@@ -2118,7 +2477,7 @@ class Orchestrator:
 
     def run_pre_bootstrap(self) -> OrchestratorResult:
         """Run the pre-bootstrap pipeline: service-env →
-        firewall-configure → stack-sync → compose-up →
+        firewall-configure → stack-sync → image-prepull → compose-up →
         infisical-provision. (Order corrected in PR #532 R5 #1 so
         firewall overrides are part of what stack-sync rsyncs to the
         server.)
@@ -2174,6 +2533,25 @@ class Orchestrator:
         self.repo_name = ""
         self.gitea_repo_owner = ""
         self.workspace_branch = "main"
+        # The phases take no SSHClient, but their helpers' _remote
+        # calls still ride this block's ControlMaster when
+        # ssh_multiplex is on (or an enclosing pipeline-level one).
+        with SSHClient(self.ssh_host, multiplex=self.ssh_multiplex):
+            critical_path = self._schedule(self._pre_bootstrap_specs())
+        return OrchestratorResult(
+            phases=tuple(self.results), state=self.state, critical_path=critical_path
+        )
+
+    def _pre_bootstrap_specs(self) -> list[_phase_scheduler.PhaseSpec[PhaseResult]]:
+        """Pre-bootstrap phases in declared order, with their I/O.
+
+        ``fs:*`` = files written under ``project_root/stacks`` on the
+        runner, ``remote:*`` = files under ``_REMOTE_STACKS_DIR``
+        (``remote:images``: the server's docker image store).
+        firewall-configure overlaps the coords → service-env chain,
+        firewall-sync overlaps global-env and image-prepull overlaps
+        everything from stack-sync to global-env; the rest is a chain.
+        """
         # Phase ordering (order matters; downstream phases gate on
         # state populated by upstream ones):
         #   workspace-coords — derive REPO_NAME etc. (other phases gate
@@ -2197,25 +2575,56 @@ class Orchestrator:
         #                      (DOMAIN + image versions). AFTER
         #                      stack-sync (which mkdir -p's the dir) so
         #                      we save an ssh round-trip.
+        #   image-prepull    — pulls the deduplicated images of the
+        #                      stacks about to start. Resolves them from
+        #                      the local tree + image_versions, so with
+        #                      NEXUS_PHASE_WORKERS > 1 it overlaps
+        #                      stack-sync / firewall-sync / global-env
         #   compose-up       — sees the synced overrides → containers
         #                      start with correct firewall exposure
         #   infisical-provision — bootstraps Infisical admin + workspace
-        phases: list[Callable[[], PhaseResult]] = [
-            self._phase_workspace_coords,  # NEW (4b1)
-            self._phase_service_env,
-            self._phase_firewall_configure,
-            self._phase_stack_sync,
-            self._phase_firewall_sync,  # NEW (4b1)
-            self._phase_global_env,  # NEW (4b1)
-            self._phase_compose_up,
-            self._phase_infisical_provision,
+        spec = _phase_scheduler.PhaseSpec
+        return [
+            spec(self._phase_workspace_coords, writes=frozenset({"coords"})),
+            spec(
+                self._phase_service_env,
+                reads=frozenset({"coords"}),
+                writes=frozenset({"fs:env"}),
+            ),
+            spec(self._phase_firewall_configure, writes=frozenset({"fs:firewall"})),
+            spec(
+                self._phase_stack_sync,
+                reads=frozenset({"fs:env", "fs:firewall"}),
+                writes=frozenset({"remote:stacks"}),
+            ),
+            spec(
+                self._phase_firewall_sync,
+                reads=frozenset({"fs:firewall", "remote:stacks"}),
+                writes=frozenset({"remote:firewall"}),
+            ),
+            spec(
+                self._phase_global_env,
+                reads=frozenset({"remote:stacks"}),
+                writes=frozenset({"remote:global-env"}),
+            ),
+            spec(
+                self._phase_image_prepull,
+                reads=frozenset({"fs:env"}),
+                writes=frozenset({"remote:images"}),
+            ),
+            spec(
+                self._phase_compose_up,
+                reads=frozenset(
+                    {"remote:stacks", "remote:firewall", "remote:global-env", "remote:images"}
+                ),
+                writes=frozenset({"containers"}),
+            ),
+            spec(
+                self._phase_infisical_provision,
+                reads=frozenset({"containers"}),
+                writes=frozenset({"infisical"}),
+            ),
         ]
-        for phase in phases:
-            result = phase()
-            self.results.append(result)
-            if result.status == "failed":
-                break
-        return OrchestratorResult(phases=tuple(self.results), state=self.state)
 
 
 # Module-level helper so the CLI handler can shell out cleanly.
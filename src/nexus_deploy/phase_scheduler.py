@@ -0,0 +1,248 @@
+"""Dependency-aware phase scheduler for the orchestrator.
+
+:meth:`Orchestrator.run_all` / :meth:`Orchestrator.run_pre_bootstrap`
+used to walk a hard-coded list of ``_phase_*`` methods one after the
+other, even though only a handful of them actually depend on each
+other (compose-restart needs gitea's ``restart_services``,
+woodpecker-apply needs the OAuth credentials, mirror-seed-rerun needs
+the fork, …). Each phase now declares the resources it **reads** and
+**writes** — ``OrchestratorState`` fields (``"state.gitea_token"``)
+plus a few coarse side-effect resources (``"stack:kestra"``,
+``"remote:stacks"``, ``"infisical"``) — and this module derives the
+DAG from those declarations:
+
+* Phase B depends on an earlier phase A if A writes something B reads
+  (read-after-write), B writes something A reads (write-after-read) or
+  both write the same resource (write-after-write). "Earlier" is the
+  declared list order, so the list stays the tie-breaker and a
+  conflicting pair always runs in the same order as the old linear
+  loop.
+* Independent phases run concurrently on a thread pool capped at
+  ``max_workers``. Phases are blocking (subprocess ssh + ``requests``
+  through port-forwards), so threads are the right primitive; each
+  phase writes only the state fields it declares, so no two running
+  phases touch the same attribute.
+
+Contract kept from the linear loop:
+
+* A result with ``status == "failed"`` stops the run — nothing new is
+  started; phases already in flight are allowed to finish (killing a
+  thread mid-ssh isn't possible and would leave remote state
+  half-applied anyway) and their results are recorded.
+* Results come back in declared order, so the per-phase log reads the
+  same as before regardless of completion order.
+* ``max_workers=1`` runs every phase inline in the calling thread, in
+  declared order — byte-for-byte the old behaviour, exceptions
+  included.
+
+The report also carries the **critical path**: the chain of dependent
+phases whose summed wall time is longest, i.e. the phase chain that
+bounds the run no matter how many workers are added.
+
+Every phase that returns is also recorded as a ``phase`` span in the
+active trace (:mod:`tracing`), from the thread that ran it.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from nexus_deploy import tracing as _tracing
+
+
+class _PhaseOutcome(Protocol):
+    """Shape the scheduler needs from a phase's return value."""
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def status(self) -> str: ...
+
+
+@dataclass(frozen=True)
+class PhaseSpec[R: _PhaseOutcome]:
+    """One schedulable phase: a zero-arg callable plus its declared I/O.
+
+    ``key`` is a stable identifier for callers that keep per-phase
+    records across runs (the checkpoint journal); the scheduler itself
+    doesn't use it.
+    """
+
+    run: Callable[[], R]
+    reads: frozenset[str] = field(default_factory=frozenset)
+    writes: frozenset[str] = field(default_factory=frozenset)
+    key: str = ""
+
+
+@dataclass(frozen=True)
+class PhaseRun[R: _PhaseOutcome]:
+    """A phase that actually ran: result, wall-clock window, direct deps.
+
+    ``started`` / ``finished`` are ``time.monotonic()`` values; only
+    their differences are meaningful. ``deps`` are indices into the
+    spec list passed to :func:`run_phases`.
+    """
+
+    index: int
+    result: R
+    started: float
+    finished: float
+    deps: tuple[int, ...]
+
+    @property
+    def duration_s(self) -> float:
+        return self.finished - self.started
+
+
+@dataclass(frozen=True)
+class ScheduleReport[R: _PhaseOutcome]:
+    """Outcome of :func:`run_phases`."""
+
+    runs: tuple[PhaseRun[R], ...]
+    critical_path: tuple[PhaseRun[R], ...]
+
+    @property
+    def results(self) -> tuple[R, ...]:
+        return tuple(r.result for r in self.runs)
+
+    @property
+    def critical_path_s(self) -> float:
+        return sum(r.duration_s for r in self.critical_path)
+
+
+def dependencies[R: _PhaseOutcome](specs: Sequence[PhaseSpec[R]]) -> list[tuple[int, ...]]:
+    """Direct dependencies of each spec (indices of earlier specs).
+
+    Only earlier specs can be dependencies, so the result is acyclic
+    by construction and declared order is a valid topological order.
+    """
+    deps: list[tuple[int, ...]] = []
+    for i, spec in enumerate(specs):
+        mine: list[int] = []
+        for j in range(i):
+            other = specs[j]
+            if other.writes & spec.reads or other.reads & spec.writes or other.writes & spec.writes:
+                mine.append(j)
+        deps.append(tuple(mine))
+    return deps
+
+
+def run_phases[R: _PhaseOutcome](
+    specs: Sequence[PhaseSpec[R]],
+    *,
+    max_workers: int = 1,
+) -> ScheduleReport[R]:
+    """Run ``specs`` respecting their derived dependencies.
+
+    See the module docstring for the failure + ordering contract.
+    Exceptions raised by a phase propagate to the caller (phases are
+    expected to convert failures into a ``failed`` result themselves;
+    an escaping exception is a bug, and the linear loop propagated it
+    too). With ``max_workers > 1`` in-flight siblings are still
+    awaited before the exception surfaces.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    deps = dependencies(specs)
+    runs: dict[int, PhaseRun[R]] = {}
+
+    if max_workers == 1:
+        for i, spec in enumerate(specs):
+            started = time.monotonic()
+            result = spec.run()
+            _tracing.record(result.name, "phase", started, status=result.status)
+            runs[i] = PhaseRun(i, result, started, time.monotonic(), deps[i])
+            if result.status == "failed":
+                break
+    else:
+        _run_concurrently(specs, deps, runs, max_workers)
+
+    ordered = tuple(runs[i] for i in sorted(runs))
+    return ScheduleReport(runs=ordered, critical_path=_critical_path(ordered, runs))
+
+
+def _run_concurrently[R: _PhaseOutcome](
+    specs: Sequence[PhaseSpec[R]],
+    deps: list[tuple[int, ...]],
+    runs: dict[int, PhaseRun[R]],
+    max_workers: int,
+) -> None:
+    """Thread-pool body of :func:`run_phases`; fills ``runs`` in place."""
+
+    def _timed(i: int) -> PhaseRun[R]:
+        started = time.monotonic()
+        result = specs[i].run()
+        _tracing.record(result.name, "phase", started, status=result.status)
+        return PhaseRun(i, result, started, time.monotonic(), deps[i])
+
+    pending = list(range(len(specs)))
+    in_flight: dict[concurrent.futures.Future[PhaseRun[R]], int] = {}
+    stop = False
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="phase",
+    ) as pool:
+        while True:
+            if not stop:
+                # Lowest declared index first among the ready phases,
+                # so the schedule is deterministic for a given timing.
+                for i in [p for p in pending if all(d in runs for d in deps[p])]:
+                    if len(in_flight) >= max_workers:
+                        break
+                    pending.remove(i)
+                    in_flight[pool.submit(_timed, i)] = i
+            if not in_flight:
+                break
+            done, _ = concurrent.futures.wait(
+                in_flight,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                in_flight.pop(future)
+                try:
+                    run = future.result()
+                except BaseException:
+                    # Let siblings finish (the with-block joins them),
+                    # then surface the bug.
+                    stop = True
+                    raise
+                runs[run.index] = run
+                if run.result.status == "failed":
+                    stop = True
+
+
+def _critical_path[R: _PhaseOutcome](
+    ordered: tuple[PhaseRun[R], ...],
+    runs: dict[int, PhaseRun[R]],
+) -> tuple[PhaseRun[R], ...]:
+    """Longest duration-weighted dependency chain among the phases that ran."""
+    best: dict[int, tuple[float, int | None]] = {}
+    for run in ordered:  # declared order is topological
+        prev: int | None = None
+        prev_len = 0.0
+        for d in run.deps:
+            if d in best and best[d][0] > prev_len:
+                prev, prev_len = d, best[d][0]
+        best[run.index] = (prev_len + run.duration_s, prev)
+    if not best:
+        return ()
+    tail: int | None = max(best, key=lambda i: best[i][0])
+    chain: list[PhaseRun[R]] = []
+    while tail is not None:
+        chain.append(runs[tail])
+        tail = best[tail][1]
+    return tuple(reversed(chain))
+
+
+__all__ = [
+    "PhaseRun",
+    "PhaseSpec",
+    "ScheduleReport",
+    "dependencies",
+    "run_phases",
+]
@@ -55,10 +55,15 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from nexus_deploy import _remote
+from nexus_deploy import checkpoint as _checkpoint
+from nexus_deploy import compose_runner as _compose_runner
 from nexus_deploy import s3_restore as _s3_restore
 from nexus_deploy import setup as _setup
+from nexus_deploy import stack_sync as _stack_sync
 from nexus_deploy import tfvars as _tfvars
 from nexus_deploy import tofu as _tofu
+from nexus_deploy import tracing as _tracing
 from nexus_deploy.config import ConfigError, NexusConfig, service_host
 from nexus_deploy.infisical import BootstrapEnv
 from nexus_deploy.orchestrator import Orchestrator, OrchestratorResult
@@ -110,6 +115,21 @@ class PipelineOptions:
     dockerhub_user: str | None = None
     dockerhub_token: str | None = None
     infisical_env: str = "dev"
+    # Forwarded to Orchestrator.max_parallel_phases; 1 = strict
+    # declared-order phase loop.
+    max_parallel_phases: int = 1
+    # Skip run_all phases the checkpoint journal recorded with
+    # unchanged inputs (``run-pipeline --resume``; see checkpoint.py).
+    resume: bool = False
+    # Forwarded to Orchestrator.skip_unchanged: skip per-service
+    # stack-sync / compose-up / admin-setup work whose input-hash stamp
+    # matches (see stamps.py). ``NEXUS_FORCE_REDEPLOY=1`` turns it off.
+    skip_unchanged: bool = True
+    # Forwarded to Orchestrator.compose_max_weight: weight budget of
+    # stacks compose-up starts at once.
+    compose_max_weight: int = _compose_runner.DEFAULT_MAX_WEIGHT
+    # Forwarded to Orchestrator.stack_sync_mode (``NEXUS_STACK_SYNC_MODE``).
+    stack_sync_mode: _stack_sync.SyncMode = "bulk"
 
 
 # ---------------------------------------------------------------------------
@@ -164,7 +184,12 @@ def _docker_hub_login(host: str, dockerhub_user: str, dockerhub_token: str) -> N
     """
     quoted_user = shlex.quote(dockerhub_user)
     subprocess.run(
-        ["ssh", host, f"docker login -u {quoted_user} --password-stdin"],
+        [
+            "ssh",
+            *_remote.ssh_options(host),
+            host,
+            f"docker login -u {quoted_user} --password-stdin",
+        ],
         input=dockerhub_token,
         check=True,
         capture_output=True,
@@ -244,7 +269,9 @@ def run_pipeline(
     # 2. tofu state pre-flight.
     tofu_dir = project_root / "tofu" / "stack"
     runner = tofu_runner if tofu_runner is not None else _tofu.TofuRunner(tofu_dir=tofu_dir)
-    if not runner.state_list_ok():
+    with _tracing.span("tofu state list"):
+        state_ok = runner.state_list_ok()
+    if not state_ok:
         # PR #535 R2 #2: surface the actual cause when available so
         # operators can distinguish "state not initialised" from
         # "tofu binary missing" / "backend timed out" / "rc=N + stderr".
@@ -283,8 +310,11 @@ def run_pipeline(
     identity = _tfvars.derive_gitea_identity(tfvars_config)
 
     # 4. Read tofu outputs. Required ones use no default → raise on
-    #    missing. Optional ones default to safe empty values.
-    secrets_json = runner.output_json("secrets", default={})
+    #    missing. Optional ones default to safe empty values. The first
+    #    read runs the one ``tofu output -json`` the runner caches; every
+    #    later read (incl. service_urls in step 11) is served from it.
+    with _tracing.span("tofu output -json"):
+        secrets_json = runner.output_json("secrets", default={})
     if not secrets_json:
         raise PipelineError(
             "tofu output -json secrets is empty — state corrupt or Tofu not yet applied",
@@ -305,20 +335,21 @@ def run_pipeline(
     # state_list_ok() above doesn't catch the partial-apply case
     # (state file exists, but the specific outputs were never
     # populated by a complete tofu run).
-    try:
-        image_versions = runner.output_json("image_versions")
-        enabled_services_raw = runner.output_json("enabled_services")
-        firewall_rules = runner.output_json("firewall_rules")
-        ssh_service_token = runner.output_json("ssh_service_token")
-    except _tofu.TofuError as exc:
-        raise PipelineError(
-            f"required tofu output missing or invalid: {exc} — "
-            "state may be partially applied; re-run initial-setup",
-        ) from exc
-    # ``server_ip`` is optional — missing means ssh-keygen cleanup
-    # has fewer targets. ``persistent_volume_id`` is gone in the
-    # RFC 0001 cutover; persistence lives in R2 via s3_restore.
-    server_ip = runner.output_raw("server_ip", default="")
+    with _tracing.span("tofu outputs"):
+        try:
+            image_versions = runner.output_json("image_versions")
+            enabled_services_raw = runner.output_json("enabled_services")
+            firewall_rules = runner.output_json("firewall_rules")
+            ssh_service_token = runner.output_json("ssh_service_token")
+        except _tofu.TofuError as exc:
+            raise PipelineError(
+                f"required tofu output missing or invalid: {exc} — "
+                "state may be partially applied; re-run initial-setup",
+            ) from exc
+        # ``server_ip`` is optional — missing means ssh-keygen cleanup
+        # has fewer targets. ``persistent_volume_id`` is gone in the
+        # RFC 0001 cutover; persistence lives in R2 via s3_restore.
+        server_ip = runner.output_raw("server_ip", default="")
 
     if not isinstance(enabled_services_raw, list):
         raise PipelineError(
@@ -345,14 +376,22 @@ def run_pipeline(
                 cf_client_secret=cf_client_secret,
             ),
         )
-        readiness = _setup.wait_for_ssh()
+        with _tracing.span("wait_for_ssh"):
+            readiness = _setup.wait_for_ssh()
         if not readiness.succeeded:
             raise PipelineError(
                 f"SSH did not become ready after {readiness.attempts} attempts: "
                 f"{readiness.last_error[:500]}",
             )
 
-        ssh = stack.enter_context(SSHClient("nexus"))
+        # multiplex=True: this block owns the ControlMaster that every
+        # later step shares — ensure_jq, the s3-restore halves and all
+        # orchestrator phases (their own SSHClient / _remote calls join
+        # it) — so the run pays one Cloudflare-Access handshake instead
+        # of one per ssh/rsync. The handshake-timing summary lands in
+        # stderr when the block exits.
+        with _tracing.span("ssh ControlMaster"):
+            ssh = stack.enter_context(SSHClient("nexus", multiplex=True))
         _setup.ensure_jq(ssh)
         # rclone MUST be installed before restore_from_s3 runs. Without
         # this, the rendered restore script's `rclone lsd / rclone lsf`
@@ -375,7 +414,8 @@ def run_pipeline(
         # trees (gitea repos/lfs, dify storage/weaviate/plugins).
         # On a fresh-start the script short-circuits with rc=0; on
         # an existing snapshot rclone-syncs the trees onto local SSD.
-        s3_fs_result = _s3_restore.restore_from_s3(ssh, phase="filesystem")
+        with _tracing.span("s3-restore filesystem"):
+            s3_fs_result = _s3_restore.restore_from_s3(ssh, phase="filesystem")
         # rclone writes restored files as the SSH user (root), but
         # gitea + postgres containers expect their container UIDs
         # on the bind-mount sources. Idempotent — fine to run on
@@ -444,9 +484,17 @@ def run_pipeline(
             woodpecker_agent_secret=config.woodpecker_agent_secret,
             project_root=project_root,
             infisical_env=options.infisical_env,
+            ssh_multiplex=True,
+            max_parallel_phases=options.max_parallel_phases,
+            checkpoint_path=_checkpoint.journal_path(project_root),
+            resume=options.resume,
+            skip_unchanged=options.skip_unchanged,
+            compose_max_weight=options.compose_max_weight,
+            stack_sync_mode=options.stack_sync_mode,
         )
 
-        pre_result = orchestrator.run_pre_bootstrap()
+        with _tracing.span("run_pre_bootstrap"):
+            pre_result = orchestrator.run_pre_bootstrap()
         if pre_result.has_hard_failure:
             raise PipelineError(
                 "pre-bootstrap pipeline aborted (see per-phase log above)",
@@ -460,7 +508,8 @@ def run_pipeline(
         # gitea database — restored snapshot has to be in place
         # first or gitea-configure would write into a soon-to-be-
         # clobbered database. Fresh-start short-circuits at rc=0.
-        s3_pg_result = _s3_restore.restore_from_s3(ssh, phase="postgres")
+        with _tracing.span("s3-restore postgres"):
+            s3_pg_result = _s3_restore.restore_from_s3(ssh, phase="postgres")
         if isinstance(s3_pg_result, _s3_restore.S3RestoreApplied):
             sys.stderr.write(
                 f"✓ s3-restore (postgres): applied snapshot {s3_pg_result.snapshot_timestamp}\n",
@@ -468,7 +517,8 @@ def run_pipeline(
         # No need to re-log fresh_start_empty_s3 here — the
         # filesystem halve above already emitted that diagnostic.
 
-        all_result = orchestrator.run_all()
+        with _tracing.span("run_all"):
+            all_result = orchestrator.run_all()
         if all_result.has_hard_failure:
             raise PipelineError(
                 "post-bootstrap pipeline aborted (see per-phase log above)",
@@ -651,7 +701,7 @@ def run_snapshot(
                 f"SSH did not become ready after {readiness.attempts} attempts: "
                 f"{readiness.last_error[:500]}",
             )
-        ssh = stack.enter_context(SSHClient("nexus"))
+        ssh = stack.enter_context(SSHClient("nexus", multiplex=True))
         outcome = _s3_restore.snapshot_to_s3(
             ssh,
             stack_slug=stack_slug,
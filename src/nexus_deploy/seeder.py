@@ -26,19 +26,52 @@ R5. ``Path.resolve()`` rejects ``..``-escape from ``root``.
 R6. Symlinks skipped (regular files only).
 R7. File ordering deterministic (operators rely on it for log debug).
 R8. Token never in stdout / stderr / exception messages.
+
+Batch mode (``run_seed_for_repo(batch=True)``, what the orchestrator
+and the ``seed`` CLI use) groups the seeds into chunks and sends each
+chunk as ONE multi-file ``POST /repos/{owner}/{repo}/contents`` (Gitea
+ChangeFiles) — one commit, one curl and one repo lock per chunk
+instead of per file. ChangeFiles is all-or-nothing, so chunks are only
+built from files the tree-diff pre-pass found missing: a re-run never
+sends a chunk that is bound to 422. A chunk that still hits an
+existing file (a concurrent push) or a Gitea without the endpoint
+(404/405) falls back to the per-file POST for that chunk;
+created/skipped attribution stays per file and :class:`SeedResult`
+keeps its shape.
+
+Tree-diff pre-pass (``run_seed_for_repo(tree_diff=True)``): one remote
+call lists the repo's default-branch tree (git trees API, recursive)
+and its blob SHAs are compared against locally computed git blob
+hashes. Identical files count as skipped without being pushed;
+files whose remote blob differs are also skipped, with a "would
+overwrite a student edit" warning instead of a doomed 422 write.
+Only files missing from the tree are rsynced + POSTed.
+
+Stream mode (``run_seed_for_repo(stream=True)``) replaces the
+push-dir + rsync round trip: the rendered script and length-prefixed
+chunk frames (:func:`iter_stream_frames`) share one ``ssh nexus bash
+-s`` stdin, and files are read + base64-encoded only as they are
+written to the pipe, so memory stays bounded however large the seed
+corpus grows. The remote side copies each frame with ``head -c`` into
+a temp file that jq and curl read, so no payload passes through a
+bash variable either. The push-dir path stays as the
+``stream=False`` default — the contract the R1-R8 tests pin, same
+split as :mod:`infisical`'s ``bootstrap(stream=...)``.
 """
 
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import re
 import shlex
 import subprocess
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 from urllib.parse import quote
 
 from nexus_deploy import _remote
@@ -63,6 +96,30 @@ _REMOTE_PUSH_DIR = "/tmp/seed-push"  # noqa: S108 — server path, not credentia
 # filenames AND against directory-traversal.
 _VALID_REPO_PATH_RE = re.compile(r"^[A-Za-z0-9._/-]+$")
 
+# Batch-mode chunk caps. Files per chunk bounds the commit size shown
+# in the Gitea UI; bytes per chunk (base64 chars) keeps each request
+# body well under Gitea's / the reverse proxy's body limits. A single
+# file larger than the byte cap still gets its own chunk.
+_BATCH_MAX_FILES = 50
+_BATCH_MAX_BYTES = 4 * 1024 * 1024
+
+# Read size for hashing / base64-streaming lazy seed files. A multiple
+# of 3 so each piece base64-encodes without padding and the pieces
+# concatenate to the encoding of the whole file.
+_READ_CHUNK = 3 * 256 * 1024
+
+# Tree-listing wire format from :func:`render_remote_tree_fetch`:
+# ``BLOB <sha> <path>`` per blob, closed by one ``TREE <status>`` line.
+# ``ok`` / ``empty`` mean the listing is complete (``empty`` = repo has
+# no commits yet); ``unavailable`` means the caller must fall back to
+# uploading everything.
+_TREE_BLOB_PATTERN = re.compile(r"^BLOB (?P<sha>[0-9a-f]{40}) (?P<path>.+)$")
+_TREE_STATUS_PATTERN = re.compile(r"^TREE (?P<status>ok|empty|unavailable)$", re.MULTILINE)
+
+# Git trees API page size. Gitea caps per_page server-side anyway; the
+# loop follows ``truncated`` until the listing is complete.
+_TREE_PAGE_SIZE = 1000
+
 # RESULT-line format. Same wire-format shape as the secret-sync
 # runner (``RESULT key=value key=value ...``) so the parser can stay simple.
 _RESULT_PATTERN = re.compile(
@@ -84,13 +141,21 @@ class SeedFile:
     needed for these chars, but special chars in segment names get
     properly escaped). ``content_b64`` is the file bytes base64-encoded
     in one line (no MIME-style 76-char wrapping — Gitea's API expects
-    raw base64).
+    raw base64). ``blob_sha`` is the git blob hash of the bytes, what
+    the tree-diff pre-pass compares against the repo tree.
+
+    Lazy entries (``list_seed_files(lazy=True)``) leave
+    ``content_b64`` empty and set ``local_path`` + ``size`` instead;
+    :func:`iter_stream_frames` reads and encodes them as it streams.
     """
 
     repo_path: str
     url_path: str
     content_b64: str
     commit_message: str
+    blob_sha: str = ""
+    local_path: Path | None = None
+    size: int = 0
 
 
 @dataclass(frozen=True)
@@ -132,6 +197,20 @@ def _is_safe_repo_path(path: str) -> bool:
     return bool(_VALID_REPO_PATH_RE.fullmatch(path))
 
 
+def _git_blob_sha(data: bytes) -> str:
+    """Git's object id for ``data`` as a blob (``git hash-object``)."""
+    return hashlib.sha1(f"blob {len(data)}\0".encode() + data, usedforsecurity=False).hexdigest()
+
+
+def _git_blob_sha_of_file(path: Path, size: int) -> str:
+    """:func:`_git_blob_sha` of a file, hashed in ``_READ_CHUNK`` pieces."""
+    digest = hashlib.sha1(f"blob {size}\0".encode(), usedforsecurity=False)
+    with path.open("rb") as fh:
+        for piece in iter(lambda: fh.read(_READ_CHUNK), b""):
+            digest.update(piece)
+    return digest.hexdigest()
+
+
 def _url_encode_path(path: str) -> str:
     """URL-encode each path segment, then join with ``/``.
 
@@ -143,7 +222,9 @@ def _url_encode_path(path: str) -> str:
     return "/".join(quote(seg, safe="") for seg in path.split("/"))
 
 
-def list_seed_files(root: Path, prefix: str = "nexus_seeds/") -> list[SeedFile]:
+def list_seed_files(
+    root: Path, prefix: str = "nexus_seeds/", *, lazy: bool = False
+) -> list[SeedFile]:
     """Walk ``root`` recursively, return SeedFiles sorted by ``repo_path``.
 
     Behaviour:
@@ -160,6 +241,11 @@ def list_seed_files(root: Path, prefix: str = "nexus_seeds/") -> list[SeedFile]:
       ``created`` than expected.
 
     Output is sorted by ``repo_path`` for deterministic ordering (R7).
+
+    ``lazy=True`` keeps file contents out of memory: each SeedFile
+    carries ``local_path`` / ``size`` and a blob SHA hashed in pieces,
+    with an empty ``content_b64`` — the streaming path encodes on the
+    fly.
     """
     if not root.is_dir():
         return []
@@ -188,15 +274,29 @@ def list_seed_files(root: Path, prefix: str = "nexus_seeds/") -> list[SeedFile]:
             sys.stderr.write(f"  ⚠ Skipping seed with unsafe path: {repo_path}\n")
             continue
 
-        content = base64.b64encode(local_path.read_bytes()).decode("ascii")
+        commit_message = f"chore(seed): add {repo_path} from Nexus-Stack examples/workspace-seeds/"
+        if lazy:
+            size = local_path.stat().st_size
+            results.append(
+                SeedFile(
+                    repo_path=repo_path,
+                    url_path=_url_encode_path(repo_path),
+                    content_b64="",
+                    commit_message=commit_message,
+                    blob_sha=_git_blob_sha_of_file(local_path, size),
+                    local_path=local_path,
+                    size=size,
+                )
+            )
+            continue
+        data = local_path.read_bytes()
         results.append(
             SeedFile(
                 repo_path=repo_path,
                 url_path=_url_encode_path(repo_path),
-                content_b64=content,
-                commit_message=(
-                    f"chore(seed): add {repo_path} from Nexus-Stack examples/workspace-seeds/"
-                ),
+                content_b64=base64.b64encode(data).decode("ascii"),
+                commit_message=commit_message,
+                blob_sha=_git_blob_sha(data),
             )
         )
 
@@ -230,6 +330,137 @@ def encode_payloads(files: list[SeedFile]) -> dict[str, str]:
     }
 
 
+def _b64_len(f: SeedFile) -> int:
+    """Encoded size of ``f`` without reading a lazy file."""
+    if f.local_path is None:
+        return len(f.content_b64)
+    return 4 * -(-f.size // 3)
+
+
+def _chunk_seed_files(
+    files: list[SeedFile], *, max_files: int, max_bytes: int
+) -> list[list[SeedFile]]:
+    """Greedily split ``files`` into order-preserving chunks under both caps."""
+    chunks: list[list[SeedFile]] = []
+    current: list[SeedFile] = []
+    current_bytes = 0
+    for f in files:
+        size = _b64_len(f)
+        if current and (len(current) >= max_files or current_bytes + size > max_bytes):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append(f)
+        current_bytes += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def diff_against_tree(
+    files: list[SeedFile], tree: dict[str, str]
+) -> tuple[list[SeedFile], list[SeedFile], list[SeedFile]]:
+    """Split ``files`` into (missing, unchanged, diverged) against ``tree``.
+
+    ``tree`` maps repo path → remote blob SHA. ``unchanged`` files
+    already hold the seed's exact bytes; ``diverged`` ones exist with
+    other content (a student edit the seed must not overwrite). Only
+    ``missing`` files need uploading. Input order is preserved.
+    """
+    missing: list[SeedFile] = []
+    unchanged: list[SeedFile] = []
+    diverged: list[SeedFile] = []
+    for f in files:
+        remote_sha = tree.get(f.repo_path)
+        if remote_sha is None:
+            missing.append(f)
+        elif remote_sha == f.blob_sha:
+            unchanged.append(f)
+        else:
+            diverged.append(f)
+    return missing, unchanged, diverged
+
+
+def _iter_content_b64(f: SeedFile) -> Iterator[bytes]:
+    """Base64 of ``f``'s bytes in pieces; one read buffer at a time for lazy files.
+
+    A lazy file must still be exactly ``f.size`` bytes: the frame
+    length was announced from that size, so a file that changed since
+    the walk raises :class:`OSError` instead of desyncing the stream.
+    """
+    if f.local_path is None:
+        yield f.content_b64.encode("ascii")
+        return
+    remaining = f.size
+    with f.local_path.open("rb") as fh:
+        while remaining:
+            piece = fh.read(min(_READ_CHUNK, remaining))
+            if not piece:
+                break
+            remaining -= len(piece)
+            yield base64.b64encode(piece)
+        if remaining or fh.read(1):
+            raise OSError(f"Seed file {f.repo_path} changed size while streaming")
+
+
+def iter_stream_frames(
+    files: list[SeedFile],
+    *,
+    max_files: int = _BATCH_MAX_FILES,
+    max_bytes: int = _BATCH_MAX_BYTES,
+) -> Iterator[bytes]:
+    """Yield the frame stream for :func:`render_remote_stream_loop`.
+
+    One frame per chunk: an ``<nbytes>`` header line, then exactly nbytes
+    of ``{"message", "files": [{"operation", "path", "content",
+    "url_path", "message"}, ...]}`` (``max_files=1`` gives one file
+    per frame for the per-file mode). The remote loop strips each
+    entry down to ``{operation, path, content}`` for the ChangeFiles
+    body; ``url_path`` + the per-file ``message`` are only read by the
+    per-file POST, so one frame serves both. Each frame is emitted in
+    pieces — entry metadata, then the file's base64 as it is read — so
+    local memory stays at one read buffer no matter how big the corpus
+    or a single file is. Chunk boundaries and frame lengths come from
+    file sizes, not contents, so nothing has to be read ahead.
+    """
+    for chunk in _chunk_seed_files(files, max_files=max_files, max_bytes=max_bytes):
+        heads: list[bytes] = []
+        tails: list[bytes] = []
+        for idx, f in enumerate(chunk):
+            # base64 needs no JSON escaping, so the content string is
+            # spliced in raw; the rest goes through json.dumps.
+            rest = json.dumps(
+                {
+                    "message": f.commit_message,
+                    "operation": "create",
+                    "path": f.repo_path,
+                    "url_path": f.url_path,
+                },
+                separators=(",", ":"),
+                sort_keys=True,
+            )
+            heads.append(b',{"content":"' if idx else b'{"content":"')
+            tails.append(b'",' + rest[1:].encode("utf-8"))
+        message = json.dumps(
+            f"chore(seed): add {len(chunk)} file(s) from Nexus-Stack examples/workspace-seeds/"
+        )
+        opening = b'{"files":['
+        closing = b'],"message":' + message.encode("utf-8") + b"}"
+        length = (
+            len(opening)
+            + len(closing)
+            + sum(
+                len(head) + _b64_len(f) + len(tail)
+                for f, head, tail in zip(chunk, heads, tails, strict=True)
+            )
+        )
+        yield f"{length}\n".encode("ascii") + opening
+        for f, head, tail in zip(chunk, heads, tails, strict=True):
+            yield head
+            yield from _iter_content_b64(f)
+            yield tail
+        yield closing
+
+
 # ---------------------------------------------------------------------------
 # Bash rendering — produces the server-side script that
 # `_remote.ssh_run_script` will exec via stdin.
@@ -317,6 +548,227 @@ echo "RESULT created=$CREATED skipped=$SKIPPED failed=$FAILED"
 """
 
 
+# Bash functions of the stream write loop. Plain string (not an
+# f-string) — spliced into the rendered script after
+# the preamble that sets OWNER / REPO / BASE_URL / CFG / WORK and the
+# CREATED / SKIPPED / FAILED counters. "$1" is always a file path:
+# jq reads the payload from it and pipes the request body to curl, so
+# no payload ever sits in a bash variable.
+_SEED_POST_FNS = r"""
+# One per-file POST; "$1" holds a compact chunk entry.
+post_one() {
+    local entry=$1 URL_PATH HTTP_CODE
+    URL_PATH=$(jq -r '.url_path' "$entry")
+    if [ -z "$URL_PATH" ] || [ "$URL_PATH" = "null" ]; then
+        FAILED=$((FAILED+1))
+        echo "  ⚠ Seed payload missing url_path" >&2
+        return 0
+    fi
+    HTTP_CODE=$(jq -c '{content, message}' "$entry" | curl -s -o /dev/null -w '%{http_code}' \
+        -X POST "$BASE_URL/api/v1/repos/$OWNER/$REPO/contents/$URL_PATH" \
+        --config "$CFG" \
+        -H 'Content-Type: application/json' \
+        --data-binary @- 2>/dev/null) || HTTP_CODE=000
+    case "$HTTP_CODE" in
+        200|201) CREATED=$((CREATED+1)) ;;
+        422)     SKIPPED=$((SKIPPED+1)) ;;
+        *)
+            FAILED=$((FAILED+1))
+            echo "  ⚠ Seed POST $URL_PATH returned HTTP $HTTP_CODE" >&2
+            ;;
+    esac
+}
+
+# Per-file POST for every entry of the chunk file "$1", one entry file each.
+post_entries() {
+    local entry
+    rm -f "$WORK"/entry-*
+    jq -c '.files[]' "$1" | split -l 1 -a 4 -d - "$WORK/entry-"
+    for entry in "$WORK"/entry-*; do
+        [ -e "$entry" ] || continue
+        post_one "$entry"
+    done
+}
+
+# One ChangeFiles POST for the chunk file "$1" ("$2" labels warnings).
+post_chunk() {
+    local chunk=$1 label=$2 N HTTP_CODE
+    N=$(jq '.files | length' "$chunk")
+    HTTP_CODE=$(jq -c '{message, files: [.files[] | {operation, path, content}]}' "$chunk" | curl -s -o /dev/null -w '%{http_code}' \
+        -X POST "$BASE_URL/api/v1/repos/$OWNER/$REPO/contents" \
+        --config "$CFG" \
+        -H 'Content-Type: application/json' \
+        --data-binary @- 2>/dev/null) || HTTP_CODE=000
+    case "$HTTP_CODE" in
+        200|201) CREATED=$((CREATED+N)) ;;
+        404|405|422)
+            # Not an error yet: an existing file (or no ChangeFiles
+            # endpoint) rejects the whole chunk, so attribute per file.
+            post_entries "$chunk"
+            ;;
+        *)
+            FAILED=$((FAILED+N))
+            echo "  ⚠ Seed batch $label ($N files) returned HTTP $HTTP_CODE" >&2
+            ;;
+    esac
+}
+"""
+
+
+def _render_write_preamble(*, token: str, repo_owner: str, repo_name: str) -> str:
+    """Strict mode, token → ``--config`` tmpfile, EXIT trap, jq check, counters.
+
+    Same R1-R3 handling as :func:`render_remote_loop`, with a
+    ``mktemp -d`` work dir for the frame in flight in place of the
+    push-dir; the EXIT trap removes both.
+    """
+    return f"""set -euo pipefail
+
+TOKEN={shlex.quote(token)}
+OWNER={shlex.quote(repo_owner)}
+REPO={shlex.quote(repo_name)}
+BASE_URL={shlex.quote(_GITEA_BASE_URL)}
+
+CFG=$(mktemp)
+chmod 600 "$CFG"
+WORK=$(mktemp -d)
+trap 'rm -f "$CFG"; [ -n "$WORK" ] && rm -rf "$WORK"; true' EXIT
+printf 'header = "Authorization: token %s"\\n' "$TOKEN" > "$CFG"
+
+if ! command -v jq >/dev/null 2>&1; then
+    echo "  ⚠ jq is not installed on the remote VM — seeder needs jq, install with: sudo apt-get install -y jq" >&2
+    echo "RESULT created=0 skipped=0 failed=0"
+    exit 0
+fi
+
+CREATED=0; SKIPPED=0; FAILED=0
+"""
+
+
+def render_remote_stream_loop(*, token: str, repo_owner: str, repo_name: str, batch: bool) -> str:
+    """Render the remote bash that consumes seed chunks from its own stdin.
+
+    Sent as the head of ``ssh nexus bash -s``'s stdin, followed by
+    :func:`iter_stream_frames`. bash reads a script from a pipe
+    byte-by-byte, so the ``main; exit`` line is the last thing it
+    parses and ``main`` gets the frames: ``read`` takes the length
+    header, ``head -c`` copies exactly that many bytes into a file in
+    ``$WORK`` and the post functions hand the file to jq and curl.
+    Each frame is posted as it arrives: one ChangeFiles call per chunk
+    with ``batch=True``, per-file POSTs otherwise. A bad header or a
+    short frame stops the loop with a warning; the files it never got
+    to are missing from RESULT, and the caller counts them as failed.
+    """
+    preamble = _render_write_preamble(token=token, repo_owner=repo_owner, repo_name=repo_name)
+    post = 'post_chunk "$FRAME" "stream chunk $IDX"' if batch else 'post_entries "$FRAME"'
+    return (
+        preamble
+        + _SEED_POST_FNS
+        + f"""
+main() {{
+    local len IDX=0 FRAME="$WORK/frame.json"
+    while IFS= read -r len; do
+        case "$len" in
+            ''|*[!0-9]*)
+                echo "  ⚠ Seed stream frame header is not a byte count, stopping" >&2
+                break
+                ;;
+        esac
+        IDX=$((IDX+1))
+        head -c "$len" > "$FRAME"
+        if [ "$(wc -c < "$FRAME")" -ne "$len" ]; then
+            echo "  ⚠ Seed stream truncated in chunk $IDX, stopping" >&2
+            break
+        fi
+        # </dev/null: nothing in the post path may eat the frame stream.
+        {post} </dev/null
+    done
+    echo "RESULT created=$CREATED skipped=$SKIPPED failed=$FAILED"
+}}
+main; exit $?
+"""
+    )
+
+
+def render_remote_tree_fetch(*, token: str, repo_owner: str, repo_name: str) -> str:
+    """Render the remote bash that lists the repo's default-branch tree.
+
+    Read-only; same token handling as the write loops (R1-R3, minus
+    the push-dir). Resolves ``default_branch`` via ``GET /repos/…``,
+    then pages ``GET /repos/…/git/trees/<branch>?recursive=true``
+    until ``truncated`` is false, printing ``BLOB <sha> <path>`` per
+    blob and a closing ``TREE ok``. A 404 tree (repo without commits)
+    prints ``TREE empty``; anything else — no jq, transport, other
+    HTTP codes — prints ``TREE unavailable`` so the caller seeds
+    without the diff.
+    """
+    token_q = shlex.quote(token)
+    owner_q = shlex.quote(repo_owner)
+    repo_q = shlex.quote(repo_name)
+    base_url_q = shlex.quote(_GITEA_BASE_URL)
+
+    return f"""set -euo pipefail
+
+TOKEN={token_q}
+OWNER={owner_q}
+REPO={repo_q}
+BASE_URL={base_url_q}
+
+CFG=$(mktemp)
+chmod 600 "$CFG"
+trap 'rm -f "$CFG"; true' EXIT
+printf 'header = "Authorization: token %s"\\n' "$TOKEN" > "$CFG"
+
+if ! command -v jq >/dev/null 2>&1; then
+    echo "TREE unavailable"
+    exit 0
+fi
+
+BRANCH=$(curl -sf --config "$CFG" "$BASE_URL/api/v1/repos/$OWNER/$REPO" 2>/dev/null \\
+    | jq -r '.default_branch // empty | @uri') || BRANCH=""
+if [ -z "$BRANCH" ]; then
+    echo "TREE unavailable"
+    exit 0
+fi
+
+PAGE=1
+while :; do
+    RESP=$(curl -s -w '\\n%{{http_code}}' --config "$CFG" \\
+        "$BASE_URL/api/v1/repos/$OWNER/$REPO/git/trees/$BRANCH?recursive=true&per_page={_TREE_PAGE_SIZE}&page=$PAGE" \\
+        2>/dev/null) || RESP=$'\\n000'
+    HTTP_CODE=${{RESP##*$'\\n'}}
+    BODY=${{RESP%$'\\n'*}}
+    case "$HTTP_CODE" in
+        200) ;;
+        404) echo "TREE empty"; exit 0 ;;
+        *)   echo "TREE unavailable"; exit 0 ;;
+    esac
+    printf '%s' "$BODY" | jq -r '.tree[]? | select(.type == "blob") | "BLOB \\(.sha) \\(.path)"'
+    [ "$(printf '%s' "$BODY" | jq -r '.truncated // false')" = "true" ] || break
+    PAGE=$((PAGE+1))
+done
+echo "TREE ok"
+"""
+
+
+def parse_tree_listing(stdout: str) -> dict[str, str] | None:
+    """Parse :func:`render_remote_tree_fetch` output into path → blob SHA.
+
+    Returns None when the listing is unavailable or incomplete (no
+    ``TREE ok`` / ``TREE empty`` line, e.g. the script died between
+    pages) — the caller then seeds without the diff.
+    """
+    status = _TREE_STATUS_PATTERN.search(stdout)
+    if status is None or status.group("status") == "unavailable":
+        return None
+    tree: dict[str, str] = {}
+    for line in stdout.splitlines():
+        match = _TREE_BLOB_PATTERN.match(line)
+        if match is not None:
+            tree[match.group("path")] = match.group("sha")
+    return tree
+
+
 def parse_result(stdout: str) -> SeedResult | None:
     """Extract the ``RESULT`` line from remote stdout.
 
@@ -341,6 +793,7 @@ def parse_result(stdout: str) -> SeedResult | None:
 
 ScriptRunner = Callable[[str], subprocess.CompletedProcess[str]]
 RsyncRunner = Callable[[Path, str], subprocess.CompletedProcess[str]]
+StreamRunner = Callable[[str, Callable[[IO[bytes]], None]], subprocess.CompletedProcess[str]]
 
 
 def write_payloads(push_dir: Path, payloads: dict[str, str]) -> None:
@@ -372,33 +825,99 @@ def run_seed_for_repo(
     push_dir: Path | None = None,
     script_runner: ScriptRunner | None = None,
     rsync_runner: RsyncRunner | None = None,
+    batch: bool = False,
+    tree_diff: bool = False,
+    stream: bool = False,
+    stream_runner: StreamRunner | None = None,
 ) -> SeedResult:
     """Render → write payloads → rsync → exec → parse.
 
+    ``batch=True`` (needs ``stream=True``) sends ChangeFiles chunks,
+    one Gitea commit per chunk, for the files a successful tree
+    listing (``tree_diff=True``) showed missing. Without a listing it
+    posts per file: on a re-run every file exists, so each chunk
+    would 422 and then be retried file by file anyway.
+
+    ``tree_diff=True`` first lists the repo tree
+    (:func:`render_remote_tree_fetch`) and drops files already present
+    from the upload; they are counted as ``skipped`` in the result,
+    diverged ones with a stderr warning. When every file is present,
+    no payloads are pushed and the write loop doesn't run. An
+    unavailable listing falls back to uploading everything.
+
+    ``stream=True`` skips the push-dir and rsync entirely: the files
+    are walked lazily, and :func:`render_remote_stream_loop` plus
+    :func:`iter_stream_frames` go down one ``ssh nexus bash -s``
+    stdin, so memory stays bounded by one read buffer (one chunk
+    file on the remote side) whatever the corpus size. Files the
+    RESULT line doesn't account for (a stream cut short) count as
+    failed. The non-stream push-dir path stays the default — the
+    contract the R1-R8 tests pin.
+
     On a missing/malformed RESULT line, returns ``SeedResult(created=0,
-    skipped=0, failed=N)`` where N is the number of files we attempted
-    to seed — the assumption being that none of them landed and the
-    operator needs every file accounted for in the failure count.
-    Diverges from secret_sync.py's defensive parse (which returns
-    all-zeros) because here we have a known file count to attribute
-    the failure to.
-
-    ``script_runner`` / ``rsync_runner`` are dependency-injection
-    seams for tests; production callers leave them None.
+    skipped=<pre-skipped>, failed=N)`` where N is the number of files
+    we attempted to seed — the assumption being that none of them
+    landed and the operator needs every file accounted for in the
+    failure count. Diverges from secret_sync.py's defensive parse
+    (which returns all-zeros) because here we have a known file count
+    to attribute the failure to.
+
+    ``script_runner`` / ``rsync_runner`` / ``stream_runner`` are
+    dependency-injection seams for tests; production callers leave
+    them None.
     """
-    files = list_seed_files(root, prefix=prefix)
-    payloads = encode_payloads(files)
-
-    actual_push_dir = push_dir or Path("/tmp/seed-push")  # noqa: S108
-    write_payloads(actual_push_dir, payloads)
+    if batch and not stream:
+        raise ValueError("batch=True needs stream=True")
+    files = list_seed_files(root, prefix=prefix, lazy=stream)
 
     run_script = script_runner or (lambda s: _remote.ssh_run_script(s))
     run_rsync = rsync_runner or (lambda src, dst: _remote.rsync_to_remote(src, dst, delete=True))
 
-    run_rsync(actual_push_dir, f"nexus:{_REMOTE_PUSH_DIR}/")
+    pre_skipped = 0
+    listed = False
+    if tree_diff:
+        fetched = run_script(
+            render_remote_tree_fetch(token=token, repo_owner=repo_owner, repo_name=repo_name)
+        )
+        tree = parse_tree_listing(fetched.stdout)
+        if tree is None:
+            sys.stderr.write("  ⚠ Seed tree listing unavailable — uploading every seed\n")
+        else:
+            listed = True
+            files, unchanged, diverged = diff_against_tree(files, tree)
+            for f in diverged:
+                sys.stderr.write(
+                    f"  ⚠ Seed {f.repo_path} differs in the repo — would overwrite a "
+                    "student edit, kept\n"
+                )
+            pre_skipped = len(unchanged) + len(diverged)
+            if not files:
+                return SeedResult(created=0, skipped=pre_skipped, failed=0)
+
+    if stream:
+        chunked = batch and listed
+        script = render_remote_stream_loop(
+            token=token, repo_owner=repo_owner, repo_name=repo_name, batch=chunked
+        )
+        frames = iter_stream_frames(files, max_files=_BATCH_MAX_FILES if chunked else 1)
+
+        def feed(stdin: IO[bytes]) -> None:
+            # Script first (it ends in `main; exit`), frames after it.
+            stdin.write(script.encode("utf-8"))
+            for piece in frames:
+                stdin.write(piece)
+
+        # `bash -s` keeps the token-bearing script out of argv.
+        run_stream = stream_runner or (lambda cmd, f: _remote.ssh_stream_in(cmd, f))
+        completed = run_stream("bash -s", feed)
+    else:
+        actual_push_dir = push_dir or Path("/tmp/seed-push")  # noqa: S108
+        write_payloads(actual_push_dir, encode_payloads(files))
 
-    script = render_remote_loop(token=token, repo_owner=repo_owner, repo_name=repo_name)
-    completed = run_script(script)
+        run_rsync(actual_push_dir, f"nexus:{_REMOTE_PUSH_DIR}/")
+
+        script = render_remote_loop(token=token, repo_owner=repo_owner, repo_name=repo_name)
+        completed = run_script(script)
 
     # Forward remote diagnostics to local stderr (Modul-1.2 Round-4
     # lesson: warnings about HTTP failures, missing jq, etc. must be
@@ -410,5 +929,13 @@ def run_seed_for_repo(
     result = parse_result(completed.stdout)
     if result is None:
         # No RESULT line — count as failure (rc=2 territory in the CLI).
-        return SeedResult(created=0, skipped=0, failed=len(files))
-    return result
+        return SeedResult(created=0, skipped=pre_skipped, failed=len(files))
+    failed = result.failed
+    if stream:
+        # A stream cut short reports only the chunks it got to.
+        failed += max(0, len(files) - (result.created + result.skipped + result.failed))
+    return SeedResult(
+        created=result.created,
+        skipped=result.skipped + pre_skipped,
+        failed=failed,
+    )
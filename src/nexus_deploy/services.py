@@ -2,14 +2,23 @@
 
 Three hook families cover the supported services:
 
-**REST first-init** (Portainer, n8n, Metabase, LakeFS, OpenMetadata):
+**REST first-init** (Portainer, n8n, Metabase, LakeFS, OpenMetadata,
+Wiki.js, Dify, Windmill), driven from Python:
 
-  1. Waits for the service container to be HTTP-ready
-  2. Optionally checks "already configured" (idempotent skip)
-  3. POSTs the admin-init / first-setup payload
-  4. Yellow-warns on failure, never aborts
+  1. Opens one ``ssh -L`` tunnel to the service's host port
+     (:meth:`SSHClient.port_forward`) and one keep-alive
+     ``requests.Session`` over it
+  2. Waits for the service to be HTTP-ready (exponential backoff +
+     jitter, bounded by the per-hook timeout)
+  3. Optionally checks "already configured" (idempotent skip)
+  4. POSTs the admin-init / first-setup payload
+  5. Yellow-warns on failure, never aborts
+
+  Every REST call of a hook reuses the session's one TCP connection
+  instead of a fresh ``curl`` process + connection per request, and
+  all REST hooks run side by side in a thread pool (R7).
 
-**docker-exec CLI** (RedPanda, Superset):
+**docker-exec CLI** (RedPanda, Superset, Garage, SFTPGo, pg-ducklake):
 
   1. Waits for the service container to be HTTP-ready
   2. Runs an in-container CLI (``rpk`` for RedPanda, ``superset
@@ -34,14 +43,16 @@ Three hook families cover the supported services:
   family). The win: JSON mutation is pure-Python testable, replacing
   a 100-line jq chain with a typed dict transform.
 
-Additional hooks (Wikijs, Dify, Windmill, Garage, SFTPGo) live
-alongside these in the same file using whichever family fits the
-service.
-
-Why one ssh round-trip with rendered bash (consistent with
-:mod:`infisical` / :mod:`secret_sync` / :mod:`seeder` /
-:mod:`compose_runner`): the curl loop is proven, one SSH connection
-vs N, and the rendered script is testable as a string.
+Why the docker-exec family stays one ssh round-trip with rendered
+bash (consistent with :mod:`infisical` / :mod:`secret_sync` /
+:mod:`seeder` / :mod:`compose_runner`): those hooks talk to
+``docker``, not to an HTTP port, so there is nothing to tunnel; one
+SSH connection vs N, and the rendered script is testable as a
+string. Inside that one script the hooks run side by side, each
+polling its own service with exponential backoff + jitter and
+starting its setup as soon as the service answers; their output is
+buffered per hook and replayed in order (R7). The script runs
+concurrently with the REST hooks.
 
 Eight rounds of hardening preserved (one regression test per round
 in ``tests/unit/test_services.py``):
@@ -53,14 +64,12 @@ R1. Orchestrator script begins with ``set -u`` (unset-var detection)
     hooks either. R3 below is the corollary on tmpfile cleanup.
 R2. Per-spec healthcheck timeout (Metabase 120s, OpenMetadata 180s,
     LakeFS 60s, Portainer 5s, n8n 60s — NOT a global default).
-R3. Per-hook tmpfile cleanup. LakeFS + OpenMetadata create mode-600
-    `mktemp` curl-config files (R4 — auth via --config, NOT argv)
-    and clean them up via per-hook ``trap ... RETURN`` + explicit
-    ``rm -f`` after the curl call. No shared cross-hook tmpfiles
-    or EXIT trap; each hook is self-contained. (Portainer + n8n +
-    Metabase don't need a tmpfile — their POST endpoints are
-    auth-free, only the body is sensitive, and that travels via
-    --data-binary @- stdin.)
+R3. Per-hook tmpfile cleanup. SFTPGo creates mode-600 `mktemp`
+    curl-config files (R4 — auth via --config, NOT argv) and cleans
+    them up via per-hook ``trap ... RETURN`` + explicit ``rm -f``
+    after the curl call. No shared cross-hook tmpfiles; each hook is
+    self-contained. REST hooks need no tmpfiles at all: credentials
+    stay inside the Python process and only travel the tunnel.
 R4. JSON setup-body built via jq with secrets injected as env vars
     (``NEXUS_P=value jq -n 'env.NEXUS_P'``), NOT positional
     ``--arg`` values that would land in jq's argv (visible via
@@ -69,38 +78,56 @@ R4. JSON setup-body built via jq with secrets injected as env vars
     argv. Auth headers / basic-auth go via ``curl --config <tmpfile>``
     (mode 600, RETURN-trap cleanup) — never via ``-H`` / ``-u``
     argv either. Together: no fork visible via ``ps -ef`` carries
-    a credential value.
+    a credential value. REST hooks fork nothing on the server.
 R5. Idempotent skip when ``already_configured_substring`` appears in
     the pre-setup probe response (e.g. ``"setup_complete":true``).
 R6. error_strategy=continue: a failed hook NEVER aborts the orchestrator;
     the next hook still runs (yellow-warn-and-continue).
-R7. Hook execution order matches the caller-provided ``enabled_hooks``
+R7. Hook output order matches the caller-provided ``enabled_hooks``
     argument (NOT registry insertion order). Operators get the order
-    they typed.
+    they typed. Hooks themselves run in parallel, each with its own
+    buffered log that is replayed in that order.
 R8. RESULT-line-per-hook: ``RESULT hook=<name> status=<configured|
-    already-configured|failed|skipped-not-ready>``. The orchestrator
-    parses one line per hook, never grepping for emoji.
+    already-configured|failed|skipped-not-ready|skipped-unchanged>``.
+    The orchestrator parses one line per hook, never grepping for emoji.
+    REST hooks return the same :data:`HookStatus` values directly.
+R9. With ``skip_unchanged`` a hook whose inputs (rendered body, or a
+    REST hook's credentials) and stack ``compose-up`` stamp both match
+    its ``admin-setup`` stamp reports ``skipped-unchanged`` without
+    running (see :mod:`stamps`).
 """
 
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
+import random
 import re
+import secrets
 import shlex
+import socket
 import subprocess
 import sys
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 
+import requests
+
 from nexus_deploy import _remote
+from nexus_deploy import stamps as _stamps
+from nexus_deploy import tracing as _tracing
 from nexus_deploy.config import NexusConfig, service_host
 from nexus_deploy.infisical import BootstrapEnv
+from nexus_deploy.ssh import SSHClient, SSHError
 
 _RESULT_LINE_RE = re.compile(
     r"^RESULT hook=(?P<name>[A-Za-z0-9_-]+) "
-    r"status=(?P<status>configured|already-configured|failed|skipped-not-ready)$",
+    r"status=(?P<status>configured|already-configured|failed|skipped-not-ready|skipped-unchanged)$",
     re.MULTILINE,
 )
 
@@ -114,7 +141,9 @@ _RESULT_LINE_RE = re.compile(
 # dash), so this is defence in depth.
 _VALID_HOOK_NAME_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 
-HookStatus = Literal["configured", "already-configured", "failed", "skipped-not-ready"]
+HookStatus = Literal[
+    "configured", "already-configured", "failed", "skipped-not-ready", "skipped-unchanged"
+]
 
 
 @dataclass(frozen=True)
@@ -143,6 +172,10 @@ class SetupResult:
     def skipped_not_ready(self) -> int:
         return sum(1 for h in self.hooks if h.status == "skipped-not-ready")
 
+    @property
+    def skipped_unchanged(self) -> int:
+        return sum(1 for h in self.hooks if h.status == "skipped-unchanged")
+
     @property
     def failed(self) -> int:
         return sum(1 for h in self.hooks if h.status == "failed")
@@ -160,6 +193,29 @@ class SetupResult:
 # ---------------------------------------------------------------------------
 
 
+# First delay of every readiness loop; it doubles per probe up to the
+# loop's cap.
+_BACKOFF_START_MS = 250
+
+
+def _backoff_sleep(cap_seconds: int) -> str:
+    """One bash line: sleep for ``$DELAY_MS`` with jitter, then double it.
+
+    Sleeps a random time between half and all of the current delay
+    (``$RANDOM``), so hooks polling side by side don't probe in
+    lockstep. The loop sets ``DELAY_MS`` to :data:`_BACKOFF_START_MS`
+    before its first probe; the delay doubles up to ``cap_seconds``.
+    Builtins only, apart from the ``sleep`` itself.
+    """
+    cap_ms = cap_seconds * 1000
+    return (
+        "BACKOFF_MS=$((DELAY_MS / 2 + RANDOM % (DELAY_MS / 2 + 1))); "
+        "printf -v BACKOFF_S '%d.%03d' $((BACKOFF_MS / 1000)) $((BACKOFF_MS % 1000)); "
+        'sleep "$BACKOFF_S"; '
+        f"DELAY_MS=$((DELAY_MS * 2 < {cap_ms} ? DELAY_MS * 2 : {cap_ms}))"
+    )
+
+
 def _render_wait_healthy(
     *,
     name: str,
@@ -185,6 +241,11 @@ def _render_wait_healthy(
     ~+7s; not exact, but bounded and accurate enough for the
     "after Ns — skipping" warning.
 
+    Between probes the loop backs off exponentially with jitter
+    (:func:`_backoff_sleep`), from 250ms up to ``interval_seconds``:
+    a service that's already up is seen within a fraction of a
+    second, one that's slow to boot isn't hammered.
+
     The predicate runs against ``$STATUS`` (HTTP code from curl
     ``-w '%{http_code}'``). Specs that need a body-substring check
     (OpenMetadata's ``grep 'version'``) build a custom inner block
@@ -193,10 +254,11 @@ def _render_wait_healthy(
     return f"""
 READY=false
 SECONDS=0
+DELAY_MS={_BACKOFF_START_MS}
 while [ "$SECONDS" -lt {timeout_seconds} ]; do
     STATUS=$(curl -s -o /dev/null -w '%{{http_code}}' --connect-timeout 3 --max-time 5 {shlex.quote(url)} 2>/dev/null || echo "000")
     if {predicate}; then READY=true; break; fi
-    sleep {interval_seconds}
+    {_backoff_sleep(interval_seconds)}
 done
 if [ "$READY" != "true" ]; then
     echo "  ⚠ {name} not ready after {timeout_seconds}s — skipping setup" >&2
@@ -206,332 +268,759 @@ fi
 """
 
 
-def render_portainer_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """Portainer first-init: ``POST /api/users/admin/init`` (no auth).
+# ---------------------------------------------------------------------------
+# REST hooks: Portainer, n8n, Metabase, LakeFS, OpenMetadata, Wiki.js,
+# Dify, Windmill.
+#
+# Each hook is an :class:`HttpHook` spec: the host port to tunnel to,
+# a readiness probe, an ``inputs`` function that pulls the credentials
+# out of NexusConfig / BootstrapEnv (``None`` → skipped-not-ready, no
+# tunnel opened) and a ``setup`` function that talks to the service
+# through a :class:`HookClient`. The engine (:func:`_run_http_hooks`)
+# opens one tunnel + one keep-alive session per hook and runs the
+# hooks in a thread pool. Response checks are the ones the bash
+# versions made (``"key":value`` greps become JSON lookups), so the
+# statuses are unchanged.
+# ---------------------------------------------------------------------------
+
+# (connect, read) seconds. Same read budget as curl's --max-time 30
+# for setup calls; probes use the bash loop's 3s / 5s.
+_HTTP_TIMEOUT = (3.0, 30.0)
+_PROBE_TIMEOUT = (3.0, 5.0)
 
-    Secrets reach jq via env vars (``NEXUS_U`` / ``NEXUS_P``) and are
-    referenced in the filter as ``env.NEXUS_U`` / ``env.NEXUS_P`` —
-    NEVER as positional ``--arg`` values, which would put them in
-    jq's argv (visible via ``ps``). The body is then piped to curl
-    via stdin (``--data-binary @-``) so neither jq nor curl carry
-    secrets in argv (R4).
+HookInputs = dict[str, str]
+
+
+class HookClient:
+    """One service's keep-alive session behind its SSH tunnel.
+
+    Transport errors (refused, reset, timeout) come back as ``None`` /
+    ``""`` — the same as the bash hooks' ``|| echo ""`` — so a setup
+    function only ever branches on response content. Redirects are
+    not followed (curl's default; Dify's readiness relies on seeing
+    the 302/307 itself). Warnings go to :attr:`log` and are printed by
+    the engine once all hooks are done (R7).
+    """
+
+    def __init__(self, base_url: str, session: requests.Session) -> None:
+        self.base_url = base_url
+        self.session = session
+        self.log: list[str] = []
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: object = None,
+        headers: dict[str, str] | None = None,
+        auth: tuple[str, str] | None = None,
+        timeout: tuple[float, float] = _HTTP_TIMEOUT,
+    ) -> requests.Response | None:
+        try:
+            return self.session.request(
+                method,
+                f"{self.base_url}{path}",
+                json=body,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                allow_redirects=False,
+            )
+        except requests.RequestException:
+            return None
+
+    def text(self, method: str, path: str, **kwargs: Any) -> str:
+        """Response body, ``""`` on transport failure."""
+        resp = self.request(method, path, **kwargs)
+        return resp.text if resp is not None else ""
+
+    def json(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Decoded JSON body, ``None`` on transport failure or non-JSON."""
+        resp = self.request(method, path, **kwargs)
+        if resp is None:
+            return None
+        try:
+            return resp.json()
+        except ValueError:
+            return None
+
+    def warn(self, message: str) -> None:
+        self.log.append(f"  ⚠ {message}")
+
+
+def _json_path(body: str, *keys: str) -> Any:
+    """``body`` decoded and indexed by ``keys``; None if it isn't JSON or a key is missing.
+
+    Replaces the bash hooks' ``grep '"key":value'`` on response bodies,
+    which only matched compact JSON.
+    """
+    try:
+        value: Any = json.loads(body)
+    except ValueError:
+        return None
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _status_200(resp: requests.Response) -> bool:
+    return resp.status_code == 200
+
+
+@dataclass(frozen=True)
+class HttpHook:
+    """Spec of one REST admin-setup hook (see the section comment)."""
+
+    name: str
+    port: int
+    health_path: str
+    timeout_s: int
+    inputs: Callable[[NexusConfig, BootstrapEnv], HookInputs | None]
+    setup: Callable[[HookClient, HookInputs], HookStatus]
+    ready: Callable[[requests.Response], bool] = _status_200
+    # Upper bound of the backoff between readiness probes.
+    max_backoff_s: float = 2.0
+    # Pause between "ready" and the first setup call.
+    settle_s: float = 0.0
+
+
+def _wait_ready(client: HookClient, hook: HttpHook) -> bool:
+    """Probe ``hook.health_path`` until ``hook.ready`` or the timeout.
+
+    Same shape as :func:`_render_wait_healthy`: wall-clock bound,
+    first retry after ~250ms, doubling with jitter (half to all of the
+    current delay) up to ``max_backoff_s``. The last sleep is clamped
+    to the deadline.
     """
+    deadline = time.monotonic() + hook.timeout_s
+    delay = _BACKOFF_START_MS / 1000
+    while True:
+        resp = client.request("GET", hook.health_path, timeout=_PROBE_TIMEOUT)
+        if resp is not None and hook.ready(resp):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(random.uniform(delay / 2, delay), remaining))  # noqa: S311 — jitter
+        delay = min(delay * 2, hook.max_backoff_s)
+
+
+def _portainer_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
     del env  # not used; signature uniform across hooks
-    username = config.admin_username or "admin"
     password = config.portainer_admin_password or ""
     if not password:
-        return 'echo "RESULT hook=portainer status=skipped-not-ready"\n'
-    username_q = shlex.quote(username)
-    password_q = shlex.quote(password)
-    wait = _render_wait_healthy(
-        name="portainer",
-        url="http://localhost:9090/api/system/status",
-        timeout_seconds=5,
-        interval_seconds=1,
-    )
-    return f"""
-portainer_hook() {{
-    {wait}
-    BODY=$(NEXUS_U={username_q} NEXUS_P={password_q} jq -n \\
-        '{{Username: env.NEXUS_U, Password: env.NEXUS_P}}')
-    RESP=$(printf '%s' "$BODY" | curl -s -X POST 'http://localhost:9090/api/users/admin/init' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    if echo "$RESP" | grep -q '"Id"'; then
-        echo "RESULT hook=portainer status=configured"
-    elif echo "$RESP" | grep -q 'already initialized'; then
-        echo "RESULT hook=portainer status=already-configured"
-    else
-        echo "RESULT hook=portainer status=failed"
-    fi
-}}
-portainer_hook
-"""
+        return None
+    return {"username": config.admin_username or "admin", "password": password}
 
 
-def render_n8n_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """n8n owner-setup: ``POST /rest/owner/setup`` (no auth, idempotent via /rest/settings).
+def _portainer_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """Portainer first-init: ``POST /api/users/admin/init`` (no auth)."""
+    resp = client.text(
+        "POST",
+        "/api/users/admin/init",
+        body={"Username": inputs["username"], "Password": inputs["password"]},
+    )
+    if '"Id"' in resp:
+        return "configured"
+    if "already initialized" in resp:
+        return "already-configured"
+    return "failed"
 
-    Body built with secrets injected via env vars (``NEXUS_E`` /
-    ``NEXUS_P``), referenced in jq's filter as ``env.NEXUS_E`` /
-    ``env.NEXUS_P``. The body is then piped to curl via stdin
-    (``--data-binary @-``). Neither jq nor curl carry the password
-    in argv (R4).
-    """
+
+def _n8n_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
     email = env.admin_email or ""
     password = config.n8n_admin_password or ""
     if not password or not email:
-        return 'echo "RESULT hook=n8n status=skipped-not-ready"\n'
-    email_q = shlex.quote(email)
-    password_q = shlex.quote(password)
-    wait = _render_wait_healthy(
-        name="n8n",
-        url="http://localhost:5678/healthz",
-        timeout_seconds=60,
+        return None
+    return {"email": email, "password": password}
+
+
+def _n8n_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """n8n owner-setup: ``POST /rest/owner/setup`` (no auth, idempotent via /rest/settings).
+
+    Only an explicit ``showSetupOnFirstLoad: false`` counts as already
+    set up; an unreadable settings response falls through to the POST.
+    """
+    settings = client.json("GET", "/rest/settings", timeout=(3.0, 10.0))
+    if isinstance(settings, dict):
+        data = settings.get("data")
+        user_management = data.get("userManagement") if isinstance(data, dict) else None
+        if (
+            isinstance(user_management, dict)
+            and user_management.get("showSetupOnFirstLoad") is False
+        ):
+            return "already-configured"
+    resp = client.text(
+        "POST",
+        "/rest/owner/setup",
+        body={
+            "email": inputs["email"],
+            "firstName": "Admin",
+            "lastName": "User",
+            "password": inputs["password"],
+        },
     )
-    return f"""
-n8n_hook() {{
-    {wait}
-    SETTINGS=$(curl -s --max-time 10 'http://localhost:5678/rest/settings' 2>/dev/null || echo "{{}}")
-    NEEDS_SETUP=$(printf '%s' "$SETTINGS" | jq -r '.data.userManagement.showSetupOnFirstLoad // true | if . then "true" else "false" end' 2>/dev/null || echo "true")
-    if [ "$NEEDS_SETUP" = "false" ]; then
-        echo "RESULT hook=n8n status=already-configured"
-        return 0
-    fi
-    BODY=$(NEXUS_E={email_q} NEXUS_P={password_q} jq -n \\
-        '{{email: env.NEXUS_E, firstName: "Admin", lastName: "User", password: env.NEXUS_P}}')
-    RESP=$(printf '%s' "$BODY" | curl -s -X POST 'http://localhost:5678/rest/owner/setup' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    if echo "$RESP" | grep -q '"id"'; then
-        echo "RESULT hook=n8n status=configured"
-    else
-        echo "RESULT hook=n8n status=failed"
-    fi
-}}
-n8n_hook
-"""
+    return "configured" if '"id"' in resp else "failed"
 
 
-def render_metabase_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """Metabase first-setup: ``POST /api/setup`` with one-time setup token."""
+def _metabase_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
     email = env.admin_email or ""
     password = config.metabase_admin_password or ""
     if not password or not email:
-        return 'echo "RESULT hook=metabase status=skipped-not-ready"\n'
-    email_q = shlex.quote(email)
-    password_q = shlex.quote(password)
-    wait = _render_wait_healthy(
-        name="metabase",
-        url="http://localhost:3000/api/health",
-        timeout_seconds=120,
-    )
-    return f"""
-metabase_hook() {{
-    {wait}
-    SETUP_TOKEN=$(curl -s --max-time 10 'http://localhost:3000/api/session/properties' 2>/dev/null \\
-        | jq -r '."setup-token" // empty' 2>/dev/null || echo "")
-    if [ -z "$SETUP_TOKEN" ]; then
-        echo "RESULT hook=metabase status=already-configured"
-        return 0
-    fi
-    BODY=$(NEXUS_TOKEN="$SETUP_TOKEN" NEXUS_E={email_q} NEXUS_P={password_q} jq -n \\
-        '{{token: env.NEXUS_TOKEN, user: {{email: env.NEXUS_E, first_name: "Admin", last_name: "User", password: env.NEXUS_P}}, prefs: {{site_name: "Nexus Stack Analytics", allow_tracking: false}}}}')
-    RESP=$(printf '%s' "$BODY" | curl -s -X POST 'http://localhost:3000/api/setup' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    if echo "$RESP" | grep -q '"id"'; then
-        echo "RESULT hook=metabase status=configured"
-    else
-        echo "RESULT hook=metabase status=failed"
-    fi
-}}
-metabase_hook
-"""
+        return None
+    return {"email": email, "password": password}
 
 
-def render_lakefs_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """LakeFS: ``POST /api/v1/setup_lakefs`` then ``POST /api/v1/repositories``.
+def _metabase_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """Metabase first-setup: ``POST /api/setup`` with the one-time setup token.
 
-    Two-step: setup admin user (no auth, idempotent via ``/api/v1/config``
-    ``setup_complete`` flag) THEN create the default repo (basic-auth
-    using the just-created credentials, idempotent via "already exists"
-    response substring). Both reported as one ``RESULT`` line; the
-    repo step's status is folded into the overall hook outcome.
+    No token in ``/api/session/properties`` means setup already ran.
     """
+    props = client.json("GET", "/api/session/properties", timeout=(3.0, 10.0))
+    token = props.get("setup-token") if isinstance(props, dict) else None
+    if not token:
+        return "already-configured"
+    resp = client.text(
+        "POST",
+        "/api/setup",
+        body={
+            "token": token,
+            "user": {
+                "email": inputs["email"],
+                "first_name": "Admin",
+                "last_name": "User",
+                "password": inputs["password"],
+            },
+            "prefs": {"site_name": "Nexus Stack Analytics", "allow_tracking": False},
+        },
+    )
+    return "configured" if '"id"' in resp else "failed"
+
+
+def _lakefs_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
     del env  # not used; signature uniform across hooks
     access_key = config.lakefs_admin_access_key or ""
     secret_key = config.lakefs_admin_secret_key or ""
     if not access_key or not secret_key:
-        return 'echo "RESULT hook=lakefs status=skipped-not-ready"\n'
-    access_q = shlex.quote(access_key)
-    secret_q = shlex.quote(secret_key)
+        return None
     # Storage namespace selection: BOTH HETZNER_S3_SERVER AND
-    # HETZNER_S3_BUCKET must be set. Bucket alone isn't enough because LakeFS
-    # also needs the endpoint URL to read/write S3, and a partially
-    # configured tofu state (bucket without server) would land us in
-    # the s3:// branch with broken connectivity. Both NexusConfig
-    # fields are shlex-quoted into the rendered bash as literals, NOT
-    # read from a remote env var — keeps the renderer pure.
-    hetzner_bucket = config.hetzner_s3_bucket_lakefs or ""
-    hetzner_server = config.hetzner_s3_server or ""
-    hetzner_bucket_q = shlex.quote(hetzner_bucket)
-    hetzner_server_q = shlex.quote(hetzner_server)
-    wait = _render_wait_healthy(
-        name="lakefs",
-        url="http://localhost:8000/api/v1/healthcheck",
-        timeout_seconds=60,
+    # HETZNER_S3_BUCKET must be set. Bucket alone isn't enough because
+    # LakeFS also needs the endpoint URL to read/write S3, and a
+    # partially configured tofu state (bucket without server) would
+    # land us in the s3:// branch with broken connectivity.
+    bucket = config.hetzner_s3_bucket_lakefs or ""
+    if bucket and config.hetzner_s3_server:
+        namespace, repo = f"s3://{bucket}/lakefs/", "hetzner-object-storage"
+    else:
+        namespace, repo = "local://data/lakefs/", "local-storage"
+    return {
+        "access_key": access_key,
+        "secret_key": secret_key,
+        "storage_namespace": namespace,
+        "repo_name": repo,
+    }
+
+
+def _lakefs_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """LakeFS: ``POST /api/v1/setup_lakefs`` then ``POST /api/v1/repositories``.
+
+    Two-step: setup admin user (no auth, idempotent via ``/api/v1/config``
+    ``setup_complete`` flag) THEN create the default repo (basic-auth
+    using the just-created credentials, idempotent via "already exists"
+    response substring). The repo step's status is folded into the
+    overall hook outcome.
+    """
+    lakefs_config = client.text("GET", "/api/v1/config", timeout=(3.0, 10.0))
+    setup_done = _json_path(lakefs_config, "setup_complete") is True
+    if not setup_done:
+        resp = client.text(
+            "POST",
+            "/api/v1/setup_lakefs",
+            body={
+                "username": "nexus-lakefs",
+                "key": {
+                    "access_key_id": inputs["access_key"],
+                    "secret_access_key": inputs["secret_key"],
+                },
+            },
+        )
+        if "access_key_id" not in resp and "already" not in resp.lower():
+            return "failed"
+    repo_resp = client.text(
+        "POST",
+        "/api/v1/repositories",
+        body={
+            "name": inputs["repo_name"],
+            "storage_namespace": inputs["storage_namespace"],
+            "default_branch": "main",
+            "sample_data": False,
+        },
+        auth=(inputs["access_key"], inputs["secret_key"]),
     )
-    return f"""
-lakefs_hook() {{
-    {wait}
-    CFG=$(curl -s --max-time 10 'http://localhost:8000/api/v1/config' 2>/dev/null || echo "")
-    SETUP_DONE=false
-    if echo "$CFG" | grep -q '"setup_complete":true'; then
-        SETUP_DONE=true
-    fi
-    if [ "$SETUP_DONE" = "false" ]; then
-        SETUP_BODY=$(NEXUS_AK={access_q} NEXUS_SK={secret_q} jq -n \\
-            '{{username: "nexus-lakefs", key: {{access_key_id: env.NEXUS_AK, secret_access_key: env.NEXUS_SK}}}}')
-        SETUP_RESP=$(printf '%s' "$SETUP_BODY" | curl -s -X POST 'http://localhost:8000/api/v1/setup_lakefs' \\
-            --max-time 30 \\
-            -H 'Content-Type: application/json' \\
-            --data-binary @- 2>/dev/null || echo "")
-        if ! echo "$SETUP_RESP" | grep -q 'access_key_id'; then
-            if ! echo "$SETUP_RESP" | grep -qi 'already'; then
-                echo "RESULT hook=lakefs status=failed"
-                return 0
-            fi
-        fi
-    fi
-    HETZNER_BUCKET={hetzner_bucket_q}
-    HETZNER_SERVER={hetzner_server_q}
-    # BOTH must be set to pick the s3:// namespace (bucket alone
-    # without endpoint would break read/write).
-    if [ -n "$HETZNER_BUCKET" ] && [ -n "$HETZNER_SERVER" ]; then
-        STORAGE_NS="s3://${{HETZNER_BUCKET}}/lakefs/"
-        REPO_NAME="hetzner-object-storage"
-    else
-        STORAGE_NS="local://data/lakefs/"
-        REPO_NAME="local-storage"
-    fi
-    REPO_BODY=$(jq -n \\
-        --arg name "$REPO_NAME" \\
-        --arg ns "$STORAGE_NS" \\
-        '{{name: $name, storage_namespace: $ns, default_branch: "main", sample_data: false}}')
-    # R4: basic-auth via curl --config tmpfile, NOT -u user:secret
-    # in argv. The tmpfile is mode 600 + cleaned up by a function-
-    # scoped RETURN trap (fires when lakefs_hook returns) plus an
-    # explicit `rm -f` after the curl call.
-    LFS_CFG=$(mktemp)
-    chmod 600 "$LFS_CFG"
-    trap 'rm -f "$LFS_CFG"' RETURN
-    printf 'user = "%s:%s"\\n' {access_q} {secret_q} > "$LFS_CFG"
-    REPO_RESP=$(printf '%s' "$REPO_BODY" | curl -s -X POST 'http://localhost:8000/api/v1/repositories' \\
-        --config "$LFS_CFG" \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    rm -f "$LFS_CFG"
-    trap - RETURN
-    if echo "$REPO_RESP" | grep -q '"id"'; then
-        echo "RESULT hook=lakefs status=configured"
-    elif echo "$REPO_RESP" | grep -q 'already exists'; then
-        if [ "$SETUP_DONE" = "true" ]; then
-            echo "RESULT hook=lakefs status=already-configured"
-        else
-            echo "RESULT hook=lakefs status=configured"
-        fi
-    else
-        echo "RESULT hook=lakefs status=failed"
-    fi
-}}
-lakefs_hook
-"""
+    if '"id"' in repo_resp:
+        return "configured"
+    if "already exists" in repo_resp:
+        return "already-configured" if setup_done else "configured"
+    return "failed"
+
+
+def _openmetadata_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
+    password = config.openmetadata_admin_password or ""
+    email = env.admin_email or ""
+    if not password or not email:
+        return None
+    # `cut -d@ -f2` semantics: no "@" → the whole string.
+    domain = email.split("@")[1] if "@" in email else email
+    return {"login": f"admin@{domain}", "password": password}
 
 
-def render_openmetadata_hook(config: NexusConfig, env: BootstrapEnv) -> str:
+def _b64(value: str) -> str:
+    return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def _access_token(body: str) -> str:
+    """``accessToken`` of an OpenMetadata login response, ``""`` if absent."""
+    token = _json_path(body, "accessToken")
+    return token if isinstance(token, str) else ""
+
+
+def _openmetadata_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
     """OpenMetadata: 3-step (default-pwd login → change-password → verify).
 
     Login API takes base64-encoded passwords; changePassword takes
-    plain text. The orchestrator detects "already configured" via
-    the default-login failing with ``invalid|unauthorized``.
+    plain text. The default login failing with
+    ``invalid|unauthorized|credentials`` means the password was
+    already changed.
     """
-    new_password = config.openmetadata_admin_password or ""
+    login = client.text(
+        "POST",
+        "/api/v1/users/login",
+        body={"email": inputs["login"], "password": _b64("admin")},
+    )
+    token = _access_token(login)
+    if not token:
+        if re.search(r"invalid|unauthorized|credentials", login, re.IGNORECASE):
+            return "already-configured"
+        return "failed"
+    client.request(
+        "PUT",
+        "/api/v1/users/changePassword",
+        body={
+            "username": "admin",
+            "oldPassword": "admin",
+            "newPassword": inputs["password"],
+            "confirmPassword": inputs["password"],
+            "requestType": "SELF",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    verify = client.text(
+        "POST",
+        "/api/v1/users/login",
+        body={"email": inputs["login"], "password": _b64(inputs["password"])},
+    )
+    return "configured" if _access_token(verify) else "failed"
+
+
+def _openmetadata_ready(resp: requests.Response) -> bool:
+    return "version" in resp.text
+
+
+def _wikijs_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
+    """Email source: ``env.gitea_user_email`` if non-empty, else
+    ``env.admin_email`` (single-address user identity for the Wiki)."""
+    password = config.wikijs_admin_password or ""
+    email = env.gitea_user_email or env.admin_email or ""
+    domain = env.domain or ""
+    if not password or not email or not domain:
+        return None
+    return {
+        "email": email,
+        "password": password,
+        "site_url": f"https://{service_host('wiki', domain, env.subdomain_separator)}",
+    }
+
+
+_WIKIJS_SETUP_MUTATION = (
+    "mutation ($input: SetupInput!) "
+    "{ setup(input: $input) { responseResult { succeeded message } } }"
+)
+
+
+def _wikijs_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """Wiki.js: GraphQL ``setup`` mutation (creates admin + finalises install).
+
+    Wiki.js returns ``{succeeded: true}`` on first run and a message
+    containing "already" on re-run.
+    """
+    resp = client.text(
+        "POST",
+        "/graphql",
+        body={
+            "query": _WIKIJS_SETUP_MUTATION,
+            "variables": {
+                "input": {
+                    "adminEmail": inputs["email"],
+                    "adminPassword": inputs["password"],
+                    "adminPasswordConfirm": inputs["password"],
+                    "siteUrl": inputs["site_url"],
+                    "telemetry": False,
+                }
+            },
+        },
+    )
+    if _json_path(resp, "data", "setup", "responseResult", "succeeded") is True:
+        return "configured"
+    if "already" in resp.lower():
+        return "already-configured"
+    return "failed"
+
+
+def _dify_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
+    password = config.dify_admin_password or ""
     email = env.admin_email or ""
-    if not new_password or not email:
-        return 'echo "RESULT hook=openmetadata status=skipped-not-ready"\n'
-    new_pw_q = shlex.quote(new_password)
-    email_q = shlex.quote(email)
-    # OpenMetadata's wait check is a body-substring grep, not an HTTP
-    # status check — we render a custom wait loop here instead of using
-    # _render_wait_healthy.
-    return f"""
-openmetadata_hook() {{
-    EMAIL={email_q}
-    DOMAIN=$(printf '%s' "$EMAIL" | cut -d'@' -f2)
-    # Wall-clock-bounded wait (matches _render_wait_healthy's pattern):
-    # each iteration spends up to ~5s in curl + 3s sleep, so an
-    # iteration-counted loop would blow well past 180s in the
-    # worst case. ``$SECONDS`` caps the real wall-time at 180.
-    READY=false
-    SECONDS=0
-    while [ "$SECONDS" -lt 180 ]; do
-        if curl -s --connect-timeout 3 --max-time 5 'http://localhost:8585/api/v1/system/version' 2>/dev/null | grep -q 'version'; then
-            READY=true; break
-        fi
-        sleep 3
-    done
-    if [ "$READY" != "true" ]; then
-        echo "  ⚠ openmetadata not ready after 180s — skipping setup" >&2
-        echo "RESULT hook=openmetadata status=skipped-not-ready"
-        return 0
-    fi
-    DEFAULT_PW_B64=$(printf 'admin' | base64 | tr -d '\\n')
-    # NEXUS_PW carries the base64 of "admin" (default OpenMetadata
-    # password) — public knowledge, but keep it out of jq's argv
-    # uniformly with the other hooks. NEXUS_E is the email address.
-    LOGIN_BODY=$(NEXUS_E="admin@${{DOMAIN}}" NEXUS_PW="$DEFAULT_PW_B64" jq -n \\
-        '{{email: env.NEXUS_E, password: env.NEXUS_PW}}')
-    LOGIN_RESP=$(printf '%s' "$LOGIN_BODY" | curl -s -X POST 'http://localhost:8585/api/v1/users/login' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    TOKEN=$(printf '%s' "$LOGIN_RESP" | jq -r '.accessToken // empty' 2>/dev/null)
-    if [ -z "$TOKEN" ] || [ "$TOKEN" = "null" ]; then
-        if echo "$LOGIN_RESP" | grep -qi 'invalid\\|unauthorized\\|credentials'; then
-            echo "RESULT hook=openmetadata status=already-configured"
-        else
-            echo "RESULT hook=openmetadata status=failed"
-        fi
-        return 0
-    fi
-    PW_BODY=$(NEXUS_NEW={new_pw_q} jq -n \\
-        '{{username: "admin", oldPassword: "admin", newPassword: env.NEXUS_NEW, confirmPassword: env.NEXUS_NEW, requestType: "SELF"}}')
-    # R4: Bearer token via curl --config tmpfile, NOT -H argv. The
-    # tmpfile is mode 600 + cleaned up by a function-scoped RETURN
-    # trap (fires when openmetadata_hook returns) plus an explicit
-    # `rm -f` after the curl call.
-    OM_CFG=$(mktemp)
-    chmod 600 "$OM_CFG"
-    trap 'rm -f "$OM_CFG"' RETURN
-    printf 'header = "Authorization: Bearer %s"\\n' "$TOKEN" > "$OM_CFG"
-    printf '%s' "$PW_BODY" | curl -s -X PUT 'http://localhost:8585/api/v1/users/changePassword' \\
-        --config "$OM_CFG" \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- >/dev/null 2>&1 || true
-    rm -f "$OM_CFG"
-    trap - RETURN
-    # base64 reads the new password from stdin (printf is a bash
-    # builtin → no fork → no `ps` exposure for the printf).
-    NEW_PW_B64=$(printf '%s' {new_pw_q} | base64 | tr -d '\\n')
-    # NEXUS_PW carries the base64-of-new-password — even base64 of
-    # the password is sensitive (trivially reversible), so we route
-    # via env var to keep it out of jq's argv.
-    VERIFY_BODY=$(NEXUS_E="admin@${{DOMAIN}}" NEXUS_PW="$NEW_PW_B64" jq -n \\
-        '{{email: env.NEXUS_E, password: env.NEXUS_PW}}')
-    VERIFY_RESP=$(printf '%s' "$VERIFY_BODY" | curl -s -X POST 'http://localhost:8585/api/v1/users/login' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    if printf '%s' "$VERIFY_RESP" | jq -r '.accessToken // empty' 2>/dev/null | grep -q '.'; then
-        echo "RESULT hook=openmetadata status=configured"
-    else
-        echo "RESULT hook=openmetadata status=failed"
-    fi
-}}
-openmetadata_hook
+    if not password or not email:
+        return None
+    return {"email": email, "password": password}
+
+
+def _dify_ready(resp: requests.Response) -> bool:
+    # Dify answers / with a redirect to /install while it's alive but
+    # not set up; a 200-only check would skip it as not ready.
+    return resp.status_code in (200, 302, 307)
+
+
+def _dify_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """Dify: 2-step admin bootstrap (``/console/api/init`` → ``/console/api/setup``).
+
+    ``/console/api/setup`` reporting ``"step":"finished"`` means setup
+    already ran. Otherwise validate the init password (the session
+    keeps the cookie it sets) and create the admin account.
+    """
+    setup = client.text("GET", "/console/api/setup", timeout=(3.0, 10.0))
+    if _json_path(setup, "step") == "finished":
+        return "already-configured"
+    init = client.text("POST", "/console/api/init", body={"password": inputs["password"]})
+    if _json_path(init, "result") != "success":
+        client.warn("Dify init validation failed — configure manually at /install")
+        return "failed"
+    resp = client.text(
+        "POST",
+        "/console/api/setup",
+        body={"email": inputs["email"], "name": "Admin", "password": inputs["password"]},
+    )
+    if _json_path(resp, "result") == "success":
+        return "configured"
+    if "already" in resp.lower():
+        return "already-configured"
+    return "failed"
+
+
+def _windmill_inputs(config: NexusConfig, env: BootstrapEnv) -> HookInputs | None:
+    secret = config.windmill_superadmin_secret or ""
+    password = config.windmill_admin_password or ""
+    admin_email = env.admin_email or ""
+    if not secret or not password or not admin_email:
+        return None
+    return {
+        "secret": secret,
+        "password": password,
+        "admin_email": admin_email,
+        "user_email": env.gitea_user_email or "",
+    }
+
+
+def _windmill_setup(client: HookClient, inputs: HookInputs) -> HookStatus:
+    """Windmill: admin user, optional regular user, workspace, secure default account.
+
+    All calls use ``WINDMILL_SUPERADMIN_SECRET`` as the Bearer token
+    (Windmill's superadmin secret authenticates the Admin API
+    directly).
+
+    1. ``/users/create`` for the admin email (``super_admin: true``).
+    2. ``/users/create`` for ``gitea_user_email`` if it differs
+       (``super_admin: false``, same password). "Already exists" on
+       either is fine.
+    3. ``/workspaces/create`` ``{id: "nexus"}``: ``"nexus"`` body or
+       "created" → configured, "already exists" → already-configured.
+    4. **Always** ``/users/setpassword`` to a fresh random password,
+       rotating ``admin@windmill.dev`` away from the superadmin
+       secret. If that fails the hook fails, whatever step 3 said —
+       the default admin would still be usable with the secret.
+    """
+    headers = {"Authorization": f"Bearer {inputs['secret']}"}
+    client.request(
+        "POST",
+        "/api/users/create",
+        body={
+            "email": inputs["admin_email"],
+            "password": inputs["password"],
+            "super_admin": True,
+            "name": "Admin",
+        },
+        headers=headers,
+    )
+    user_email = inputs["user_email"]
+    if user_email and user_email != inputs["admin_email"]:
+        client.request(
+            "POST",
+            "/api/users/create",
+            body={
+                "email": user_email,
+                "password": inputs["password"],
+                "super_admin": False,
+                "name": "User",
+            },
+            headers=headers,
+        )
+    workspace = client.text(
+        "POST",
+        "/api/workspaces/create",
+        body={"id": "nexus", "name": "Nexus Stack"},
+        headers=headers,
+    )
+    rotated = client.request(
+        "POST",
+        "/api/users/setpassword",
+        body={"password": secrets.token_urlsafe(32)},
+        headers=headers,
+    )
+    rotated_status = rotated.status_code if rotated is not None else 0
+    if rotated_status not in (200, 204):
+        client.warn(
+            f"Windmill default-admin password rotation returned HTTP {rotated_status:03d} — "
+            "admin@windmill.dev may still be usable with the superadmin secret"
+        )
+        return "failed"
+    if workspace == '"nexus"' or "created" in workspace.lower():
+        return "configured"
+    if "already exists" in workspace.lower():
+        return "already-configured"
+    client.warn(f"Windmill workspace create response: {workspace or 'no response'}")
+    return "failed"
+
+
+_HTTP_HOOK_REGISTRY: dict[str, HttpHook] = {
+    hook.name: hook
+    for hook in (
+        HttpHook(
+            "portainer",
+            9090,
+            "/api/system/status",
+            5,
+            _portainer_inputs,
+            _portainer_setup,
+            max_backoff_s=1.0,
+        ),
+        HttpHook("n8n", 5678, "/healthz", 60, _n8n_inputs, _n8n_setup),
+        HttpHook("metabase", 3000, "/api/health", 120, _metabase_inputs, _metabase_setup),
+        HttpHook("lakefs", 8000, "/api/v1/healthcheck", 60, _lakefs_inputs, _lakefs_setup),
+        HttpHook(
+            "openmetadata",
+            8585,
+            "/api/v1/system/version",
+            180,
+            _openmetadata_inputs,
+            _openmetadata_setup,
+            ready=_openmetadata_ready,
+            max_backoff_s=3.0,
+        ),
+        HttpHook(
+            "wikijs",
+            3005,
+            "/healthz",
+            90,
+            _wikijs_inputs,
+            _wikijs_setup,
+            max_backoff_s=3.0,
+        ),
+        HttpHook(
+            "dify",
+            8501,
+            "/",
+            120,
+            _dify_inputs,
+            _dify_setup,
+            ready=_dify_ready,
+            max_backoff_s=3.0,
+            # Brief settling delay for Dify's API container after the
+            # web front answers.
+            settle_s=5.0,
+        ),
+        HttpHook(
+            "windmill",
+            8200,
+            "/api/version",
+            120,
+            _windmill_inputs,
+            _windmill_setup,
+            max_backoff_s=3.0,
+        ),
+    )
+}
+
+
+def _reserve_local_ports(count: int) -> list[int]:
+    """``count`` distinct free loopback ports for the hook tunnels.
+
+    Same primitive as :func:`orchestrator._allocate_free_port`, but all
+    sockets stay bound until every port is picked, so tunnels opened
+    side by side never get the same one.
+    """
+    socks: list[socket.socket] = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            socks.append(sock)
+            sock.bind(("127.0.0.1", 0))
+        return [int(sock.getsockname()[1]) for sock in socks]
+    finally:
+        for sock in socks:
+            sock.close()
+
+
+def _run_http_hook(
+    hook: HttpHook, inputs: HookInputs, *, ssh: SSHClient, local_port: int
+) -> tuple[HookStatus, list[str]]:
+    """Tunnel + session + readiness wait + setup for one hook; returns its status and log."""
+    try:
+        with (
+            _tracing.span(f"admin-setup {hook.name}", "hook"),
+            ssh.port_forward(local_port, "localhost", hook.port) as port,
+            requests.Session() as session,
+        ):
+            client = HookClient(f"http://localhost:{port}", session)
+            if not _wait_ready(client, hook):
+                client.warn(f"{hook.name} not ready after {hook.timeout_s}s — skipping setup")
+                return "skipped-not-ready", client.log
+            if hook.settle_s:
+                time.sleep(hook.settle_s)
+            return hook.setup(client, inputs), client.log
+    except SSHError:
+        return "failed", [f"  ✗ {hook.name}: ssh tunnel to port {hook.port} failed"]
+
+
+_HOOK_STAMP_RE = re.compile(
+    r"^HOOKSTAMP (?P<name>[A-Za-z0-9_-]+) (?P<have>\S+) (?P<compose>\S+)$", re.MULTILINE
+)
+
+
+def _render_hook_stamps_fetch(names: list[str]) -> str:
+    """Bash printing ``HOOKSTAMP <name> <admin-setup> <compose-up>`` per hook (``-`` if absent)."""
+    names_q = " ".join(shlex.quote(n) for n in names)
+    return f"""set -u
+ADMIN={shlex.quote(_stamps.stamp_dir("admin-setup"))}
+COMPOSE={shlex.quote(_stamps.stamp_dir("compose-up"))}
+for name in {names_q}; do
+    HAVE=$(head -c 64 "$ADMIN/$name" 2>/dev/null || true)
+    UP=$(head -c 64 "$COMPOSE/$name" 2>/dev/null || true)
+    echo "HOOKSTAMP $name ${{HAVE:--}} ${{UP:--}}"
+done
 """
 
 
+def _http_hook_stamp(inputs: HookInputs, compose_stamp: str) -> str:
+    """R9 for REST hooks: sha256 of the hook's inputs joined with its stack's compose-up stamp."""
+    payload = f"{json.dumps(inputs, sort_keys=True)}:{compose_stamp}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _fetch_hook_stamps(names: list[str], runner: ScriptRunner) -> dict[str, tuple[str, str]]:
+    """``{name: (admin-setup stamp, compose-up stamp)}``; ``{}`` (run everything) on failure."""
+    try:
+        completed = runner(_render_hook_stamps_fetch(names))
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+        sys.stderr.write(
+            f"  ⚠ admin-setup stamps unavailable ({type(exc).__name__}) — running all\n"
+        )
+        return {}
+    return {
+        m["name"]: (
+            "" if m["have"] == "-" else m["have"],
+            "" if m["compose"] == "-" else m["compose"],
+        )
+        for m in _HOOK_STAMP_RE.finditer(completed.stdout)
+    }
+
+
+def _run_http_hooks(
+    config: NexusConfig,
+    env: BootstrapEnv,
+    names: list[str],
+    *,
+    ssh: SSHClient,
+    runner: ScriptRunner,
+    skip_unchanged: bool,
+) -> tuple[HookResult, ...]:
+    """Run the REST hooks in ``names`` side by side; logs printed in ``names`` order.
+
+    A hook without credentials is ``skipped-not-ready`` without a
+    tunnel. With ``skip_unchanged`` one ssh call reads the stamps
+    first and one stores the new ones for hooks that ended
+    configured / already-configured (windmill always runs).
+    """
+    hooks = [_HTTP_HOOK_REGISTRY[n] for n in names]
+    inputs = {hook.name: hook.inputs(config, env) for hook in hooks}
+    statuses: dict[str, HookStatus] = {}
+    logs: dict[str, list[str]] = {}
+    for name, hook_inputs in inputs.items():
+        if hook_inputs is None:
+            statuses[name] = "skipped-not-ready"
+
+    wanted: dict[str, str] = {}
+    if skip_unchanged:
+        stamped = [n for n, i in inputs.items() if i is not None and n not in _ALWAYS_RUN_HOOKS]
+        current = _fetch_hook_stamps(stamped, runner) if stamped else {}
+        for name in stamped:
+            have, compose = current.get(name, ("", ""))
+            wanted[name] = _http_hook_stamp(cast("HookInputs", inputs[name]), compose)
+            if have == wanted[name]:
+                statuses[name] = "skipped-unchanged"
+                logs[name] = [f"  ⏭ {name} admin setup unchanged — skipped"]
+
+    to_run = [hook for hook in hooks if hook.name not in statuses]
+    if to_run:
+        ports = _reserve_local_ports(len(to_run))
+        with ThreadPoolExecutor(max_workers=len(to_run)) as pool:
+            futures = {
+                hook.name: pool.submit(
+                    _run_http_hook,
+                    hook,
+                    cast("HookInputs", inputs[hook.name]),
+                    ssh=ssh,
+                    local_port=port,
+                )
+                for hook, port in zip(to_run, ports, strict=True)
+            }
+            for name, future in futures.items():
+                statuses[name], logs[name] = future.result()
+
+    for name in names:
+        for line in logs.get(name, ()):
+            sys.stderr.write(line + "\n")
+
+    if skip_unchanged:
+        done = {
+            name: sha
+            for name, sha in wanted.items()
+            if statuses[name] in ("configured", "already-configured")
+        }
+        if done:
+            try:
+                runner(_stamps.render_store_script("admin-setup", done))
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+                sys.stderr.write(f"  ⚠ admin-setup stamps not saved ({type(exc).__name__})\n")
+
+    return tuple(HookResult(name=name, status=statuses[name]) for name in names)
+
+
 # ---------------------------------------------------------------------------
 # docker-exec hooks: RedPanda, Superset.
 #
-# Different family from the 5 REST hooks above. Pattern:
+# Different family from the REST hooks (see "REST hooks" above). Pattern:
 #   1. Wait for HTTP healthcheck (mostly via ``docker exec curl`` from
 #      inside the container, since some endpoints aren't exposed
 #      externally).
@@ -605,11 +1094,12 @@ redpanda_hook() {{
     # SASL setup run while RedPanda was still "not ready".
     READY=false
     SECONDS=0
+    DELAY_MS={_BACKOFF_START_MS}
     while [ "$SECONDS" -lt 60 ]; do
         if docker exec redpanda curl -sf --connect-timeout 2 --max-time 5 'http://localhost:9644/v1/status/ready' >/dev/null 2>&1; then
             READY=true; break
         fi
-        sleep 2
+        {_backoff_sleep(2)}
     done
     if [ "$READY" != "true" ]; then
         echo "  ⚠ redpanda admin API not ready after 60s — skipping SASL setup" >&2
@@ -689,9 +1179,10 @@ redpanda_hook() {{
         sleep 5
         # Wait for restart-readiness. `curl -sf` for proper status check.
         SECONDS=0
+        DELAY_MS={_BACKOFF_START_MS}
         while [ "$SECONDS" -lt 30 ]; do
             if docker exec redpanda curl -sf --connect-timeout 2 --max-time 5 'http://localhost:9644/v1/status/ready' >/dev/null 2>&1; then break; fi
-            sleep 2
+            {_backoff_sleep(2)}
         done
     fi
     # Verify the user is in place after all state changes. `curl -sf`
@@ -730,11 +1221,12 @@ superset_hook() {{
     # boot (db upgrade + init) — generous 5min timeout.
     READY=false
     SECONDS=0
+    DELAY_MS={_BACKOFF_START_MS}
     while [ "$SECONDS" -lt 300 ]; do
         if curl -s --connect-timeout 2 --max-time 5 'http://localhost:8089/health' 2>/dev/null | grep -q 'OK'; then
             READY=true; break
         fi
-        sleep 5
+        {_backoff_sleep(5)}
     done
     if [ "$READY" != "true" ]; then
         echo "  ⚠ superset not ready after 5min — skipping admin setup" >&2
@@ -768,11 +1260,11 @@ superset_hook
 
 # ---------------------------------------------------------------------------
 # Admin-setup hooks for the bash-render family: Uptime Kuma, Garage,
-# Wiki.js, Dify, Windmill, SFTPGo. SFTPGo was originally a candidate
-# for the filestash-style Python hook (two SSH round-trips), but its
-# JSON construction is built remote-side via ``jq -n env``, so no
-# Python-side mutation is needed and the bash-render pattern is
-# uniform across all six.
+# SFTPGo. SFTPGo was originally a candidate for the filestash-style
+# Python hook (two SSH round-trips), but its JSON construction is
+# built remote-side via ``jq -n env`` and every call goes through
+# ``docker exec``, so no Python-side mutation is needed and it stays
+# a rendered bash hook.
 # ---------------------------------------------------------------------------
 
 
@@ -889,308 +1381,6 @@ garage_hook
 """
 
 
-def render_wikijs_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """Wiki.js: GraphQL ``setup`` mutation (creates admin + finalises install).
-
-    Two-step:
-    1. Wait for ``/healthz`` to return HTTP 200. Bounded to 90s.
-       (Wiki.js returns plain ``OK`` only when status is 200, so a
-       status-only check is equivalent to a body-grep.)
-    2. POST GraphQL mutation ``setup($input: SetupInput!)`` with
-       admin email + password (twice, "confirm" field) + site URL.
-       Wiki.js returns ``{succeeded: true}`` on first run,
-       ``{...message: "...already...}`` on re-run.
-
-    Idempotency contract:
-    - First run: setup succeeds → ``configured``
-    - Re-run: response message contains "already" → ``already-configured``
-    - Other: ``failed``
-
-    Email source: ``env.gitea_user_email`` if non-empty, else
-    ``env.admin_email`` (single-address user identity for the Wiki).
-    """
-    password = config.wikijs_admin_password or ""
-    email = env.gitea_user_email or env.admin_email or ""
-    domain = env.domain or ""
-    if not password or not email or not domain:
-        return 'echo "RESULT hook=wikijs status=skipped-not-ready"\n'
-    password_q = shlex.quote(password)
-    email_q = shlex.quote(email)
-    site_url_q = shlex.quote(f"https://{service_host('wiki', domain, env.subdomain_separator)}")
-    wait = _render_wait_healthy(
-        name="wikijs",
-        url="http://localhost:3005/healthz",
-        timeout_seconds=90,
-        interval_seconds=3,
-        # Wiki.js's /healthz returns plain text "OK" with 200; a
-        # STATUS check is sufficient (a body-grep for "ok" is the
-        # same signal).
-    )
-    return f"""
-wikijs_hook() {{
-{wait}
-    # Build the GraphQL setup mutation body via jq -n with env-var
-    # inputs (NOT --arg, which would put values into jq's argv).
-    SETUP_BODY=$(NEXUS_E={email_q} NEXUS_P={password_q} NEXUS_U={site_url_q} jq -n \\
-        '{{query: "mutation ($input: SetupInput!) {{ setup(input: $input) {{ responseResult {{ succeeded message }} }} }}",
-           variables: {{input: {{adminEmail: env.NEXUS_E, adminPassword: env.NEXUS_P, adminPasswordConfirm: env.NEXUS_P, siteUrl: env.NEXUS_U, telemetry: false}}}}}}')
-    SETUP_RESP=$(printf '%s' "$SETUP_BODY" | curl -s -X POST 'http://localhost:3005/graphql' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    if echo "$SETUP_RESP" | grep -q '"succeeded":true'; then
-        echo "RESULT hook=wikijs status=configured"
-    elif echo "$SETUP_RESP" | grep -qi 'already'; then
-        echo "RESULT hook=wikijs status=already-configured"
-    else
-        echo "RESULT hook=wikijs status=failed"
-    fi
-}}
-wikijs_hook
-"""
-
-
-def render_dify_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """Dify: 2-step admin bootstrap (``/console/api/init`` → ``/console/api/setup``).
-
-    Three stages:
-    1. Wait for the API to return 200/302/307 on ``/`` (Dify's
-       redirect-to-/install pattern indicates the API is alive).
-       Bounded to 120s — Dify cold-starts slowly.
-    2. Pre-check ``/console/api/setup`` GET — if step ``finished``,
-       skip with ``already-configured``.
-    3. POST ``/console/api/init`` with the init password (cookie-jar
-       captures the session). Then POST ``/console/api/setup`` with
-       admin email + name + password (using the cookie). Dify
-       responds ``{result:"success"}`` on success.
-
-    Idempotency contract:
-    - ``/setup`` reports ``"step":"finished"`` → ``already-configured``
-    - Init+setup both succeed → ``configured``
-    - Init validation fails → ``failed`` (init password is the same
-      as admin password — if init rejects it, setup will too)
-    - Other → ``failed``
-
-    Cookie-jar is a mode-600 tmpfile cleaned via RETURN trap.
-    """
-    password = config.dify_admin_password or ""
-    email = env.admin_email or ""
-    if not password or not email:
-        return 'echo "RESULT hook=dify status=skipped-not-ready"\n'
-    password_q = shlex.quote(password)
-    email_q = shlex.quote(email)
-    # Dify's wait predicate is "200 OR 302 OR 307" — uniform 200-only
-    # check would skip-not-ready while Dify is doing its install
-    # redirect dance. Render a custom wait loop instead of using
-    # _render_wait_healthy.
-    return f"""
-dify_hook() {{
-    # Two-stage readiness: wait for HTTP 200/302/307 on /.
-    READY=false
-    SECONDS=0
-    while [ "$SECONDS" -lt 120 ]; do
-        STATUS=$(curl -s -o /dev/null -w '%{{http_code}}' --connect-timeout 3 --max-time 5 'http://localhost:8501/' 2>/dev/null || echo "000")
-        case "$STATUS" in
-            200|302|307) READY=true; break ;;
-        esac
-        sleep 3
-    done
-    if [ "$READY" != "true" ]; then
-        echo "  ⚠ dify not ready after 120s — skipping setup" >&2
-        echo "RESULT hook=dify status=skipped-not-ready"
-        return 0
-    fi
-    # Brief settling delay for Dify's API container — mirrors the
-    # legacy 5s sleep after readiness probes returned.
-    sleep 5
-    SETUP_CHECK=$(curl -s --max-time 10 'http://localhost:8501/console/api/setup' 2>/dev/null || echo "")
-    if echo "$SETUP_CHECK" | grep -q '"step":"finished"'; then
-        echo "RESULT hook=dify status=already-configured"
-        return 0
-    fi
-    # Cookie jar tmpfile — mode-600, cleaned on RETURN.
-    DIFY_COOKIES=$(mktemp)
-    chmod 600 "$DIFY_COOKIES"
-    trap 'rm -f "$DIFY_COOKIES"' RETURN
-    # Step 1: validate init password.
-    INIT_BODY=$(NEXUS_P={password_q} jq -n '{{password: env.NEXUS_P}}')
-    INIT_RESP=$(printf '%s' "$INIT_BODY" | curl -s -c "$DIFY_COOKIES" \\
-        -X POST 'http://localhost:8501/console/api/init' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    if ! echo "$INIT_RESP" | grep -q '"result":"success"'; then
-        # Cleanup + trap reset on early-exit too — same set-u-leak
-        # concern as the success-path cleanup below. R6 fixed only
-        # the success path; R7 caught this matching failure path.
-        rm -f "$DIFY_COOKIES"
-        trap - RETURN
-        echo "  ⚠ Dify init validation failed — configure manually at /install" >&2
-        echo "RESULT hook=dify status=failed"
-        return 0
-    fi
-    # Step 2: create admin account using the session cookie.
-    SETUP_BODY=$(NEXUS_E={email_q} NEXUS_P={password_q} jq -n \\
-        '{{email: env.NEXUS_E, name: "Admin", password: env.NEXUS_P}}')
-    SETUP_RESP=$(printf '%s' "$SETUP_BODY" | curl -s -b "$DIFY_COOKIES" \\
-        -X POST 'http://localhost:8501/console/api/setup' \\
-        --max-time 30 \\
-        -H 'Content-Type: application/json' \\
-        --data-binary @- 2>/dev/null || echo "")
-    # Explicit cleanup + trap reset before exit. The orchestrator
-    # runs all hooks in one shell with `set -u`; a lingering RETURN
-    # trap referencing $DIFY_COOKIES would fire on a later hook's
-    # function-return and could trip set -u if the var is unset.
-    # Same pattern as LakeFS / OpenMetadata.
-    rm -f "$DIFY_COOKIES"
-    trap - RETURN
-    if echo "$SETUP_RESP" | grep -q '"result":"success"'; then
-        echo "RESULT hook=dify status=configured"
-    elif echo "$SETUP_RESP" | grep -qi 'already'; then
-        echo "RESULT hook=dify status=already-configured"
-    else
-        echo "RESULT hook=dify status=failed"
-    fi
-}}
-dify_hook
-"""
-
-
-def render_windmill_hook(config: NexusConfig, env: BootstrapEnv) -> str:
-    """Windmill: 5-stage bootstrap (readiness wait, admin user,
-    optional regular user, workspace, secure default account).
-
-    All API stages use ``WINDMILL_SUPERADMIN_SECRET`` as the Bearer
-    token (NOT a session cookie — Windmill's superadmin secret
-    authenticates the Admin API directly).
-
-    Stages:
-    1. Wait for ``/api/version`` to return 200 (Windmill is up).
-    2. POST ``/users/create`` for ``$ADMIN_EMAIL`` with
-       ``super_admin: true`` and ``$WINDMILL_ADMIN_PASS`` —
-       gives operators the documented login.
-    3. POST ``/users/create`` for ``$GITEA_USER_EMAIL`` (only if it
-       differs from $ADMIN_EMAIL) with ``super_admin: false`` and
-       the same password — non-admin user identity for workflow
-       authorship.
-    4. POST ``/workspaces/create`` with ``{id: "nexus", name: "Nexus
-       Stack"}`` — creates the working namespace.
-    5. POST ``/users/setpassword`` with a newly-generated random
-       password to rotate the bootstrapped ``admin@windmill.dev``
-       account away from ``$WINDMILL_SUPERADMIN_SECRET``. **Critical
-       security step** — without this, anyone with the secret could
-       log in as the default admin.
-
-    Idempotency contract:
-    - Step 2/3 see "already exists" → continue (legacy did the same)
-    - Step 4 returns ``"nexus"`` body or "created" → configured;
-      "already exists" → already-configured
-    - Step 5 always re-rotates (cheap and ensures the default
-      account stays sealed across re-runs)
-    - Final hook status is driven by Step 4's outcome:
-      - 200/201 / "nexus" body → ``configured``
-      - 409 / "already exists" → ``already-configured``
-      - else → ``failed``
-
-    Bearer-token transport: ``WINDMILL_SUPERADMIN_SECRET`` is written
-    to a mode-600 ``curl --config`` tmpfile (RETURN-trap cleanup) so
-    it never reaches curl's argv via ``-H``. Same pattern as LakeFS /
-    OpenMetadata.
-    """
-    superadmin_secret = config.windmill_superadmin_secret or ""
-    admin_password = config.windmill_admin_password or ""
-    admin_email = env.admin_email or ""
-    if not superadmin_secret or not admin_password or not admin_email:
-        return 'echo "RESULT hook=windmill status=skipped-not-ready"\n'
-    secret_q = shlex.quote(superadmin_secret)
-    pw_q = shlex.quote(admin_password)
-    admin_q = shlex.quote(admin_email)
-    user_email_q = shlex.quote(env.gitea_user_email or "")
-    wait = _render_wait_healthy(
-        name="windmill",
-        url="http://localhost:8200/api/version",
-        timeout_seconds=120,
-        interval_seconds=3,
-    )
-    return f"""
-windmill_hook() {{
-{wait}
-    # Bearer-token tmpfile — mode-600, cleaned via RETURN trap.
-    WM_CFG=$(mktemp)
-    chmod 600 "$WM_CFG"
-    trap 'rm -f "$WM_CFG"' RETURN
-    NEXUS_S={secret_q} sh -c 'printf "header = \\"Authorization: Bearer %s\\"\\nheader = \\"Content-Type: application/json\\"\\n" "$NEXUS_S"' > "$WM_CFG"
-    # Step 1: create the admin user (super_admin=true) for ADMIN_EMAIL.
-    # NEXUS_E / NEXUS_P route email + password through env vars to jq —
-    # NEVER `--arg`, which would land them in jq's argv.
-    ADMIN_CREATE_BODY=$(NEXUS_E={admin_q} NEXUS_P={pw_q} jq -n \\
-        '{{email: env.NEXUS_E, password: env.NEXUS_P, super_admin: true, name: "Admin"}}')
-    printf '%s' "$ADMIN_CREATE_BODY" | curl -s --config "$WM_CFG" \\
-        -X POST 'http://localhost:8200/api/users/create' \\
-        --max-time 30 --data-binary @- >/dev/null 2>&1 || true
-    # Step 2: optional regular user for GITEA_USER_EMAIL (if set and
-    # differs from ADMIN_EMAIL). Single-address: USER_EMAIL may be a
-    # comma-list, GITEA_USER_EMAIL is the single resolved address.
-    GITEA_UE={user_email_q}
-    if [ -n "$GITEA_UE" ] && [ "$GITEA_UE" != {admin_q} ]; then
-        USER_CREATE_BODY=$(NEXUS_E="$GITEA_UE" NEXUS_P={pw_q} jq -n \\
-            '{{email: env.NEXUS_E, password: env.NEXUS_P, super_admin: false, name: "User"}}')
-        printf '%s' "$USER_CREATE_BODY" | curl -s --config "$WM_CFG" \\
-            -X POST 'http://localhost:8200/api/users/create' \\
-            --max-time 30 --data-binary @- >/dev/null 2>&1 || true
-    fi
-    # Step 3: create the `nexus` workspace. Capture HTTP body (rather
-    # than just status code) because Windmill returns the workspace id
-    # as a JSON-encoded string on success (e.g. \"nexus\").
-    WS_BODY=$(jq -n '{{id: "nexus", name: "Nexus Stack"}}')
-    WS_RESP=$(printf '%s' "$WS_BODY" | curl -s --config "$WM_CFG" \\
-        -X POST 'http://localhost:8200/api/workspaces/create' \\
-        --max-time 30 --data-binary @- 2>/dev/null || echo "")
-    # Step 4 (always): rotate `admin@windmill.dev` away from
-    # WINDMILL_SUPERADMIN_SECRET. Critical security step — without
-    # this, anyone with the (long-lived) secret could log in as the
-    # default admin. Generate a fresh random password every spin-up.
-    # Capture the HTTP status — if the rotation fails (wrong secret,
-    # API error), emit a stderr warning AND override the final hook
-    # status to `failed`. Silencing this with `|| true` would have
-    # left the default admin usable while the hook reported success.
-    RANDOM_PW=$(openssl rand -base64 32)
-    DEFPW_BODY=$(NEXUS_RP="$RANDOM_PW" jq -n '{{password: env.NEXUS_RP}}')
-    DEFPW_STATUS=$(printf '%s' "$DEFPW_BODY" | curl -s --config "$WM_CFG" \\
-        -o /dev/null -w '%{{http_code}}' \\
-        -X POST 'http://localhost:8200/api/users/setpassword' \\
-        --max-time 30 --data-binary @- 2>/dev/null || echo "000")
-    unset RANDOM_PW
-    # Explicit cleanup + trap reset. Orchestrator runs all hooks
-    # in one shell with `set -u`; a lingering RETURN trap referencing
-    # $WM_CFG would fire on a later hook's function-return and trip
-    # set -u once the var is unset. Same pattern as LakeFS / OpenMetadata.
-    rm -f "$WM_CFG"
-    trap - RETURN
-    # Final status combines workspace-create outcome AND the
-    # security-critical default-admin rotation. Either failing →
-    # hook reports failed.
-    case "$DEFPW_STATUS" in
-        200|204) ;;  # rotation succeeded
-        *)
-            echo "  ⚠ Windmill default-admin password rotation returned HTTP $DEFPW_STATUS — admin@windmill.dev may still be usable with the superadmin secret" >&2
-            echo "RESULT hook=windmill status=failed"
-            return 0
-            ;;
-    esac
-    if [ "$WS_RESP" = '"nexus"' ] || echo "$WS_RESP" | grep -qi 'created'; then
-        echo "RESULT hook=windmill status=configured"
-    elif echo "$WS_RESP" | grep -qi 'already exists'; then
-        echo "RESULT hook=windmill status=already-configured"
-    else
-        echo "  ⚠ Windmill workspace create response: ${{WS_RESP:-no response}}" >&2
-        echo "RESULT hook=windmill status=failed"
-    fi
-}}
-windmill_hook
-"""
-
-
 def render_sftpgo_hook(config: NexusConfig, env: BootstrapEnv) -> str:
     """SFTPGo: 6-stage admin bootstrap + R2 default-user creation.
 
@@ -1203,7 +1393,7 @@ def render_sftpgo_hook(config: NexusConfig, env: BootstrapEnv) -> str:
     Stages:
     1. Two-stage readiness: ``/healthz`` 200 AND ``/api/v2/token``
        basic-auth login succeeds (admin SQLite row written). Bounded
-       to 60 iterations of 2s = 120s. Without the second check we'd
+       to 120s wall-clock, backing off up to 2s between probes. Without the second check we'd
        hit the token endpoint before admin-init finished writing.
     2. R2 credentials guard: SFTPGo runs but no default user is
        created if R2 creds are missing (operator must configure
@@ -1286,6 +1476,7 @@ sftpgo_hook() {{
     SFTPGO_HZ_ENDPOINT_B64=$(printf '%s' {shlex.quote(hz_server)} | base64 | tr -d '\\n')
     READY=false
     SECONDS=0
+    DELAY_MS={_BACKOFF_START_MS}
     while [ "$SECONDS" -lt 120 ]; do
         STATUS=$(curl -s -o /dev/null -w '%{{http_code}}' --connect-timeout 3 --max-time 5 'http://localhost:8090/healthz' 2>/dev/null || echo "000")
         if [ "$STATUS" = "200" ]; then
@@ -1298,7 +1489,7 @@ sftpgo_hook() {{
             unset ADMIN_PW
             if [ "$TOKEN_STATUS" = "200" ]; then READY=true; break; fi
         fi
-        sleep 2
+        {_backoff_sleep(2)}
     done
     if [ "$READY" != "true" ]; then
         echo "  ⚠ sftpgo not ready after 120s — skipping default-user creation" >&2
@@ -1426,8 +1617,7 @@ def render_pg_ducklake_hook(config: NexusConfig, env: BootstrapEnv) -> str:
 
     Two stages:
     1. Wait for ``pg_isready`` — 30s wall-clock bound (``$SECONDS``-gated
-       loop, ``sleep 2`` per iteration, so up to ~15 probes plus the
-       partial second the loop entered on).
+       loop, backing off from 250ms to 2s between probes).
     2. Exec ``psql -f /docker-entrypoint-initdb.d/00-ducklake-bootstrap.sql``
        inside the container. Idempotent — the SQL itself uses
        ``DO $$ ... drop_secret EXCEPTION WHEN OTHERS THEN NULL ... $$``
@@ -1443,17 +1633,18 @@ def render_pg_ducklake_hook(config: NexusConfig, env: BootstrapEnv) -> str:
       SQL file don't match what Postgres expects)
     """
     del config, env
-    return """
-pg_ducklake_hook() {
+    return f"""
+pg_ducklake_hook() {{
     READY=false
     SECONDS=0
+    DELAY_MS={_BACKOFF_START_MS}
     while [ "$SECONDS" -lt 30 ]; do
         if docker exec pg-ducklake pg_isready -U nexus-pgducklake -d ducklake \\
                 >/dev/null 2>&1; then
             READY=true
             break
         fi
-        sleep 2
+        {_backoff_sleep(2)}
     done
     if [ "$READY" != "true" ]; then
         echo "  ⚠ pg_ducklake not ready after 30s — skipping bootstrap re-apply" >&2
@@ -1469,7 +1660,7 @@ pg_ducklake_hook() {
         echo "    ssh nexus 'docker exec pg-ducklake psql -U nexus-pgducklake -d ducklake -f /docker-entrypoint-initdb.d/00-ducklake-bootstrap.sql'" >&2
         echo "RESULT hook=pg-ducklake status=failed"
     fi
-}
+}}
 pg_ducklake_hook
 """
 
@@ -1659,12 +1850,13 @@ def _render_filestash_pull_script() -> str:
 set -u
 READY=false
 SECONDS=0
+DELAY_MS={_BACKOFF_START_MS}
 while [ "$SECONDS" -lt 45 ]; do
     if curl -sf --connect-timeout 2 --max-time 5 \\
         'http://localhost:8334/healthz' >/dev/null 2>&1; then
         READY=true; break
     fi
-    sleep 3
+    {_backoff_sleep(3)}
 done
 if [ "$READY" != "true" ]; then
     echo "  ⚠ filestash not ready after 45s — skipping setup" >&2
@@ -1674,12 +1866,13 @@ fi
 
 CONFIG_PRESENT=false
 SECONDS=0
+DELAY_MS={_BACKOFF_START_MS}
 while [ "$SECONDS" -lt 30 ]; do
     if docker exec filestash test -f {shlex.quote(_FILESTASH_CONFIG_PATH)} \\
         >/dev/null 2>&1; then
         CONFIG_PRESENT=true; break
     fi
-    sleep 3
+    {_backoff_sleep(3)}
 done
 if [ "$CONFIG_PRESENT" != "true" ]; then
     echo "  ⚠ filestash config.json absent after 30s — skipping" >&2
@@ -1767,12 +1960,13 @@ fi
 # typically <10s on cax31; longer than that means something is wrong.
 RESTARTED=false
 SECONDS=0
+DELAY_MS={_BACKOFF_START_MS}
 while [ "$SECONDS" -lt 30 ]; do
     if curl -sf --connect-timeout 2 --max-time 5 \\
         'http://localhost:8334/healthz' >/dev/null 2>&1; then
         RESTARTED=true; break
     fi
-    sleep 2
+    {_backoff_sleep(2)}
 done
 if [ "$RESTARTED" != "true" ]; then
     echo "  ✗ filestash not ready 30s after restart" >&2
@@ -1835,6 +2029,7 @@ def configure_filestash(
     config: NexusConfig,
     *,
     script_runner: ScriptRunner | None = None,
+    skip_unchanged: bool = False,
 ) -> HookResult:
     """End-to-end Filestash admin setup.
 
@@ -1850,6 +2045,10 @@ def configure_filestash(
     ``script_runner`` defaults to :func:`_remote.ssh_run_script` so
     tests can substitute a mock; the production caller
     (``run_admin_setups``) passes the same callable through.
+
+    ``skip_unchanged``: when the mutated config equals the pulled one,
+    report ``skipped-unchanged`` instead of pushing it back — the push
+    stage restarts the container, which is the expensive part.
     """
     runner = script_runner or _remote.ssh_run_script
 
@@ -1865,6 +2064,9 @@ def configure_filestash(
 
     # Stage 2: mutate locally
     new_config = _filestash_mutate_config(pulled, config=config)
+    if skip_unchanged and new_config == pulled:
+        sys.stderr.write("  ⏭ filestash config unchanged — skipped\n")
+        return HookResult(name="filestash", status="skipped-unchanged")
     new_b64 = base64.b64encode(json.dumps(new_config).encode("utf-8")).decode("ascii")
 
     # Stage 3: push + restart + wait
@@ -1885,27 +2087,19 @@ ScriptRunner = Callable[[str], "subprocess.CompletedProcess[str]"]
 # execution-order source of truth — render_remote_script iterates the
 # caller-provided ``enabled_hooks`` list, so the operator (or the CLI
 # parser) controls the order. The dict insertion order here is only a
-# debugging convenience (``supported_hooks()`` returns it).
+# debugging convenience (``supported_hooks()`` returns it). REST hooks
+# live in ``_HTTP_HOOK_REGISTRY`` (see "REST hooks" above).
 # ---------------------------------------------------------------------------
 
 HookRenderer = Callable[[NexusConfig, BootstrapEnv], str]
 
 _HOOK_REGISTRY: dict[str, HookRenderer] = {
-    # REST first-init hooks
-    "portainer": render_portainer_hook,
-    "n8n": render_n8n_hook,
-    "metabase": render_metabase_hook,
-    "lakefs": render_lakefs_hook,
-    "openmetadata": render_openmetadata_hook,
     # docker-exec CLI hooks
     "redpanda": render_redpanda_hook,
     "superset": render_superset_hook,
-    # Remaining REST + docker-exec admin-setups
+    # Remaining bash admin-setups
     "uptime-kuma": render_uptime_kuma_hook,
     "garage": render_garage_hook,
-    "wikijs": render_wikijs_hook,
-    "dify": render_dify_hook,
-    "windmill": render_windmill_hook,
     "sftpgo": render_sftpgo_hook,
     # pg-ducklake bootstrap re-apply (handles cred rotation on
     # persistent-volume deploys where the entrypoint-initdb scripts
@@ -1917,12 +2111,14 @@ _HOOK_REGISTRY: dict[str, HookRenderer] = {
 # Python-side hooks — separate registry because their orchestration
 # shape differs from bash renderers: they need to issue multiple SSH
 # round-trips with Python-side mutation in between.
-PythonHookFn = Callable[[NexusConfig, ScriptRunner], HookResult]
+PythonHookFn = Callable[[NexusConfig, ScriptRunner, bool], HookResult]
 
 
-def _filestash_python_hook(config: NexusConfig, runner: ScriptRunner) -> HookResult:
-    """Adapter: pin the (config, runner) signature for the registry."""
-    return configure_filestash(config, script_runner=runner)
+def _filestash_python_hook(
+    config: NexusConfig, runner: ScriptRunner, skip_unchanged: bool
+) -> HookResult:
+    """Adapter: pin the (config, runner, skip_unchanged) signature for the registry."""
+    return configure_filestash(config, script_runner=runner, skip_unchanged=skip_unchanged)
 
 
 _PYTHON_HOOK_REGISTRY: dict[str, PythonHookFn] = {
@@ -1930,24 +2126,28 @@ _PYTHON_HOOK_REGISTRY: dict[str, PythonHookFn] = {
 }
 
 # Single-source-of-truth invariant: a name lives in exactly one registry.
-# A name in both would silently double-dispatch in run_admin_setups (one
-# bash run + one python run). Checked at import time so any future
+# A name in two would silently double-dispatch in run_admin_setups (e.g.
+# one bash run + one python run). Checked at import time so any future
 # refactor that violates the invariant fails the test suite, not
 # production. If you genuinely need cross-registry routing, route via a
 # wrapper function that lives in only one registry.
-if _overlap := set(_HOOK_REGISTRY) & set(_PYTHON_HOOK_REGISTRY):
-    raise RuntimeError(f"hook names in both registries: {sorted(_overlap)}")
+if _overlap := (
+    (set(_HOOK_REGISTRY) & set(_HTTP_HOOK_REGISTRY))
+    | (set(_HOOK_REGISTRY) & set(_PYTHON_HOOK_REGISTRY))
+    | (set(_HTTP_HOOK_REGISTRY) & set(_PYTHON_HOOK_REGISTRY))
+):
+    raise RuntimeError(f"hook names in more than one registry: {sorted(_overlap)}")
 
 
 def supported_hooks() -> tuple[str, ...]:
-    """All service names with admin-setup hooks (bash + python families).
+    """All service names with admin-setup hooks (REST + bash + python families).
 
-    Order: bash-registry insertion order, then python-registry insertion
-    order. ``dict.fromkeys`` preserves order while de-duplicating —
-    redundant given the import-time invariant above, but defence in depth
-    if a future refactor weakens that assertion.
+    Order: REST-registry insertion order, then bash, then python.
+    ``dict.fromkeys`` preserves order while de-duplicating — redundant
+    given the import-time invariant above, but defence in depth if a
+    future refactor weakens that assertion.
     """
-    return tuple(dict.fromkeys((*_HOOK_REGISTRY, *_PYTHON_HOOK_REGISTRY)))
+    return tuple(dict.fromkeys((*_HTTP_HOOK_REGISTRY, *_HOOK_REGISTRY, *_PYTHON_HOOK_REGISTRY)))
 
 
 # ---------------------------------------------------------------------------
@@ -1960,6 +2160,7 @@ def render_remote_script(
     config: NexusConfig,
     env: BootstrapEnv,
     enabled_hooks: list[str],
+    skip_unchanged: bool = False,
 ) -> str:
     """Render the combined bash script for all enabled admin-setup hooks.
 
@@ -1969,22 +2170,28 @@ def render_remote_script(
     on its bail-out paths and the orchestrator script has no
     ``set -e`` in the outer scope).
 
-    Hook execution is sequential (NOT parallel). **Order matches the
-    caller-provided ``enabled_hooks`` argument** — NOT
-    ``_HOOK_REGISTRY`` insertion order. Callers (the CLI in
-    ``__main__._services_configure``) determine the order; the
-    registry is only a name → renderer map.
-
-    KNOWN-LIMITATION: hooks run sequentially. Several of them
-    (Portainer, LakeFS, OpenMetadata) are independent and could run
-    in parallel; sequential wall-time can reach ~``sum(per-hook
-    timeouts)`` — about 7 minutes worst case for the currently-shipped
-    hooks. A future paramiko + asyncio refactor would naturally
-    restore parallelism via ``asyncio.gather``. Until then we accept
-    the increased wall-time in exchange for predictable, easy-to-grep
-    linear logs.
+    Hooks run in parallel: each one is a background subshell, so
+    every hook polls its own service's readiness at the same time
+    and fires the moment that service answers. Every hook touches
+    only its own container / port, so there is nothing to order
+    between them. Wall-time is the slowest hook rather than the
+    sum of all per-hook timeouts (which reached ~7 minutes).
+
+    Each hook's stdout and stderr are buffered to files and
+    replayed once all hooks are done, hook by hook, **in the
+    caller-provided ``enabled_hooks`` order** — NOT
+    ``_HOOK_REGISTRY`` insertion order. So the log reads exactly
+    like a sequential run: one contiguous block per hook, easy to
+    grep. Callers (the CLI in ``__main__._services_configure``)
+    determine the order; the registry is only a name → renderer map.
+
+    ``skip_unchanged`` wraps each hook in :func:`_wrap_with_stamp` (R9).
     """
-    parts: list[str] = ["set -u  # -e omitted: hook failures must not abort the orchestrator\n"]
+    parts: list[str] = [
+        "set -u  # -e omitted: hook failures must not abort the orchestrator\n",
+        "HOOK_LOGS=$(mktemp -d)\ntrap 'rm -rf \"$HOOK_LOGS\"' EXIT\n",
+    ]
+    slots = 0
     for name in enabled_hooks:
         # Defence in depth: drop any hook name with shell-meta chars
         # before interpolating into the rendered bash. Logged to local
@@ -1999,12 +2206,71 @@ def render_remote_script(
         if renderer is None:
             # Unknown but well-formed hook → emit a skip line so the
             # operator can see the name in the workflow log.
-            parts.append(f'echo "RESULT hook={name} status=skipped-not-ready"\n')
-            continue
-        parts.append(renderer(config, env))
+            body = f'echo "RESULT hook={name} status=skipped-not-ready"\n'
+        else:
+            body = renderer(config, env)
+            if skip_unchanged and name not in _ALWAYS_RUN_HOOKS:
+                body = _wrap_with_stamp(name, body)
+        # Numbered slots, not names: a repeated name gets its own buffer.
+        parts.append(f'(\n{body}\n) >"$HOOK_LOGS/{slots}.out" 2>"$HOOK_LOGS/{slots}.err" &\n')
+        slots += 1
+    parts.append("wait\n")
+    parts.append(
+        f"for i in $(seq 0 {slots - 1}); do\n"
+        '    cat "$HOOK_LOGS/$i.out"\n'
+        '    cat "$HOOK_LOGS/$i.err" >&2\n'
+        "done\n"
+        if slots
+        else ""
+    )
     return "".join(parts)
 
 
+# Hooks that must run on every deploy regardless of stamps: windmill
+# rotates the default admin's password to a fresh random value each
+# spin-up (see _windmill_setup) — skipping it would leave the
+# previous rotation in place indefinitely, which is the one thing that
+# hook exists to avoid.
+_ALWAYS_RUN_HOOKS: frozenset[str] = frozenset({"windmill"})
+
+
+def _wrap_with_stamp(name: str, body: str) -> str:
+    """Run ``body`` only when its inputs changed since the last success.
+
+    The stamp is the sha256 of the rendered body (config + secrets it
+    embeds) joined with the stack's current ``compose-up`` stamp, so a
+    re-created stack re-runs its hook. The body runs unchanged in a
+    ``( … )`` subshell — heredocs, ``case`` arms and ``exit`` behave
+    exactly as in an unwrapped hook — with its stdout captured to a
+    tmpfile so the RESULT line can be inspected, then replayed (the
+    caller only reads stdout after the whole script finishes, so the
+    buffering is invisible). stderr passes straight through. A stamp
+    is written only when the body exits 0 AND reports ``configured``
+    / ``already-configured``.
+    """
+    digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    stamps_q = shlex.quote(_stamps.stamp_dir("admin-setup"))
+    compose_stamp_q = shlex.quote(f"{_stamps.stamp_dir('compose-up')}/{name}")
+    return f"""
+HOOK_WANT="{digest}:$(cat {compose_stamp_q} 2>/dev/null || true)"
+if [ "$(cat {stamps_q}/{name} 2>/dev/null || true)" = "$HOOK_WANT" ]; then
+    echo "  ⏭ {name} admin setup unchanged — skipped"
+    echo "RESULT hook={name} status=skipped-unchanged"
+else
+    HOOK_OUT_FILE=$(mktemp)
+    (
+{body}
+    ) >"$HOOK_OUT_FILE"
+    HOOK_RC=$?
+    cat "$HOOK_OUT_FILE"
+    if [ "$HOOK_RC" -eq 0 ] && grep -qE '^RESULT hook={name} status=(already-)?configured$' "$HOOK_OUT_FILE"; then
+        {{ mkdir -p {stamps_q} && printf '%s\n' "$HOOK_WANT" > {stamps_q}/{name}; }} || true
+    fi
+    rm -f "$HOOK_OUT_FILE"
+fi
+"""
+
+
 def parse_results(stdout: str) -> tuple[HookResult, ...]:
     """Extract one HookResult per ``RESULT hook=…`` line in remote stdout.
 
@@ -2033,65 +2299,108 @@ def run_admin_setups(
     enabled: list[str],
     *,
     script_runner: ScriptRunner | None = None,
+    ssh: SSHClient | None = None,
+    skip_unchanged: bool = False,
 ) -> SetupResult:
-    """Render → exec → parse, dispatching to bash or python hook family.
+    """Run every enabled hook, dispatching to the REST, bash or python family.
 
     ``enabled`` is the full enabled-services list (the same shape
     used everywhere else in the package). Hooks are filtered to those
-    that have an entry in either ``_HOOK_REGISTRY`` (bash-rendered)
-    or ``_PYTHON_HOOK_REGISTRY`` (Python-side, e.g. Filestash);
-    unknown services are dropped silently (they belong to other
-    modules: seeder, compose_runner, future hooks).
+    that have an entry in ``_HTTP_HOOK_REGISTRY`` (REST, over SSH
+    tunnels), ``_HOOK_REGISTRY`` (bash-rendered) or
+    ``_PYTHON_HOOK_REGISTRY`` (Python-side, e.g. Filestash); unknown
+    services are dropped silently (they belong to other modules:
+    seeder, compose_runner, future hooks).
+
+    The bash script runs in a worker thread while the REST hooks run
+    in theirs; Filestash follows once both are done. ``ssh`` carries
+    the REST hooks' tunnels; when None, a client for the default host
+    is opened for the duration of the call.
 
     Returns :class:`SetupResult` with one :class:`HookResult` per
-    enabled+supported hook. Bash hooks that report no RESULT line
+    enabled+supported hook, in ``enabled`` order whichever family ran
+    it. Bash hooks that report no RESULT line
     (e.g. a server-side ssh failure mid-script) are reflected as
     ``status=failed`` for accountability.
+
+    ``skip_unchanged`` is forwarded to every family: bash and REST
+    hooks use the ``admin-setup`` stamps (R9), Filestash skips its
+    push when the mutated config equals the pulled one.
     """
+    http_hooks = [s for s in enabled if s in _HTTP_HOOK_REGISTRY]
     bash_hooks = [s for s in enabled if s in _HOOK_REGISTRY]
     py_hooks = [s for s in enabled if s in _PYTHON_HOOK_REGISTRY]
-    if not bash_hooks and not py_hooks:
+    if not http_hooks and not bash_hooks and not py_hooks:
         return SetupResult(hooks=())
 
     runner = script_runner or (lambda s: _remote.ssh_run_script(s))
 
     bash_results: tuple[HookResult, ...] = ()
-    if bash_hooks:
-        script = render_remote_script(config=config, env=env, enabled_hooks=bash_hooks)
-        completed = runner(script)
-        # Forward remote ⚠ warnings + "  ✓/✗" lines to local stderr
-        # (Modul-1.2 Round-4 pattern); strip the RESULT wire-format lines.
-        for line in completed.stdout.splitlines():
-            if not line.startswith("RESULT hook="):
-                sys.stderr.write(line + "\n")
-        parsed = parse_results(completed.stdout)
-        parsed_names = {r.name for r in parsed}
-        # Any enabled bash-hook with no RESULT line counts as failed.
-        missing = tuple(
-            HookResult(name=h, status="failed") for h in bash_hooks if h not in parsed_names
+    http_results: tuple[HookResult, ...] = ()
+    with ExitStack() as stack:
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+        bash_future = (
+            pool.submit(_run_bash_hooks, config, env, bash_hooks, runner, skip_unchanged)
+            if bash_hooks
+            else None
         )
-        bash_results = tuple(parsed) + missing
+        if http_hooks:
+            if ssh is None:
+                ssh = stack.enter_context(SSHClient())
+            http_results = _run_http_hooks(
+                config, env, http_hooks, ssh=ssh, runner=runner, skip_unchanged=skip_unchanged
+            )
+        if bash_future is not None:
+            bash_results, bash_output = bash_future.result()
+            # Forward remote ⚠ warnings + "  ✓/✗" lines to local stderr
+            # (Modul-1.2 Round-4 pattern); strip the RESULT wire-format lines.
+            for line in bash_output.splitlines():
+                if not line.startswith("RESULT hook="):
+                    sys.stderr.write(line + "\n")
 
     py_results: list[HookResult] = []
     for name in py_hooks:
         hook_fn = _PYTHON_HOOK_REGISTRY[name]
-        py_results.append(hook_fn(config, runner))
+        with _tracing.span(f"admin-setup {name}", "hook"):
+            py_results.append(hook_fn(config, runner, skip_unchanged))
+
+    position = {name: i for i, name in enumerate(enabled)}
+    results = bash_results + http_results + tuple(py_results)
+    return SetupResult(
+        hooks=tuple(sorted(results, key=lambda r: position.get(r.name, len(enabled))))
+    )
+
 
-    return SetupResult(hooks=bash_results + tuple(py_results))
+def _run_bash_hooks(
+    config: NexusConfig,
+    env: BootstrapEnv,
+    names: list[str],
+    runner: ScriptRunner,
+    skip_unchanged: bool,
+) -> tuple[tuple[HookResult, ...], str]:
+    """Render → exec → parse the bash family; returns the results and raw stdout."""
+    with _tracing.span("admin-setup render", "render"):
+        script = render_remote_script(
+            config=config, env=env, enabled_hooks=names, skip_unchanged=skip_unchanged
+        )
+    completed = runner(script)
+    with _tracing.span("admin-setup parse", "parse"):
+        parsed = parse_results(completed.stdout)
+    parsed_names = {r.name for r in parsed}
+    # Any enabled bash-hook with no RESULT line counts as failed.
+    missing = tuple(HookResult(name=h, status="failed") for h in names if h not in parsed_names)
+    return tuple(parsed) + missing, completed.stdout
 
 
 # Re-export the keys for tests that want to discover them programmatically.
 __all__ = [
+    "HookClient",
     "HookResult",
     "HookStatus",
+    "HttpHook",
     "SetupResult",
     "configure_filestash",
     "parse_results",
-    "render_lakefs_hook",
-    "render_metabase_hook",
-    "render_n8n_hook",
-    "render_openmetadata_hook",
-    "render_portainer_hook",
     "render_redpanda_hook",
     "render_remote_script",
     "render_superset_hook",
@@ -23,13 +23,29 @@ battle-tested across PRs #506-#515 and adds zero new auth-failure
 modes. Port-forwarding via ``ssh -N -L`` works through ProxyCommand
 transparently for free.
 
-If we ever need persistent connection-multiplexing, paramiko, or
-SFTP-API niceties, the API surface here is small enough to swap the
-backend without changing call sites.
+Connection multiplexing (``multiplex=True``): ``__enter__`` starts an
+OpenSSH ``ControlMaster`` for the host alias and registers it with
+:mod:`nexus_deploy._remote`; ``__exit__`` stops it and writes a
+handshake-timing summary to stderr. While the master is live,
+``run`` / ``run_script`` / ``rsync_to`` and every ``_remote`` helper
+reuse the one authenticated Cloudflare-Access session. A nested
+``SSHClient`` for the same host joins the existing master instead of
+starting a second one. ``port_forward`` deliberately keeps its own
+connection: a ``-L`` forward requested through a mux client outlives
+that client inside the master, which would break the tunnel's
+"torn down when the with-block exits" contract.
+
+:class:`AsyncSSHClient` is the asyncio flavour of ``run`` /
+``run_script`` for callers that want to ``asyncio.gather``
+independent remote scripts instead of waiting on each round trip.
+
+If we ever need paramiko or SFTP-API niceties, the API surface here
+is small enough to swap the backend without changing call sites.
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import socket
 import subprocess
@@ -39,6 +55,8 @@ from contextlib import contextmanager
 from pathlib import Path
 from types import TracebackType
 
+from nexus_deploy import _remote
+
 
 class SSHError(Exception):
     """Raised for SSH-side errors not modelled by ``CalledProcessError``.
@@ -65,12 +83,24 @@ class SSHClient:
     slow first-cold-start on Hetzner can legitimately take several
     minutes; a default cap would convert "slow" into spurious
     ``TimeoutExpired`` errors.
+
+    ``multiplex=True`` makes the with-block own a ControlMaster (see
+    the module docstring). It is opt-in so that constructing a client
+    never opens a network connection as a side effect; the pipeline
+    and orchestrator entry points turn it on.
     """
 
-    def __init__(self, host: str = "nexus") -> None:
+    def __init__(self, host: str = "nexus", *, multiplex: bool = False) -> None:
         self.host = host
+        self.multiplex = multiplex
+        self._master: _remote.ControlMaster | None = None
 
     def __enter__(self) -> SSHClient:
+        if self.multiplex:
+            # None when another client already owns the master for this
+            # host (we join it) or when it failed to start (per-call
+            # fallback) — either way there is nothing for us to close.
+            self._master = _remote.open_control_master(self.host)
         return self
 
     def __exit__(
@@ -79,10 +109,12 @@ class SSHClient:
         _exc: BaseException | None,
         _tb: TracebackType | None,
     ) -> None:
-        # No persistent state to clean up at the connection level —
-        # individual port_forward() context managers handle their own
-        # subprocess lifecycle.
-        return None
+        # Individual port_forward() context managers handle their own
+        # subprocess lifecycle; the only connection-level state is the
+        # ControlMaster, and only if this client started it.
+        if self._master is not None:
+            self._master = None
+            _remote.close_control_master(self.host)
 
     def run(
         self,
@@ -102,14 +134,18 @@ class SSHClient:
         With ``merge_stderr=True`` (default), stderr is folded into
         stdout (the ``ssh nexus "..." 2>&1`` equivalent).
         """
-        return subprocess.run(
-            ["ssh", self.host, cmd],
-            check=check,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
-            text=True,
-            timeout=timeout,
-        )
+        started = time.monotonic()
+        try:
+            return subprocess.run(
+                ["ssh", *_remote.ssh_options(self.host), self.host, cmd],
+                check=check,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+                text=True,
+                timeout=timeout,
+            )
+        finally:
+            _remote.record_call(self.host, "ssh", started)
 
     def run_script(
         self,
@@ -130,15 +166,19 @@ class SSHClient:
         Use this whenever the script may contain secret values
         (Infisical tokens, generated passwords, base64-encoded payloads).
         """
-        return subprocess.run(
-            ["ssh", self.host, "bash", "-s"],
-            input=script,
-            check=check,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
-            text=True,
-            timeout=timeout,
-        )
+        started = time.monotonic()
+        try:
+            return subprocess.run(
+                ["ssh", *_remote.ssh_options(self.host), self.host, "bash", "-s"],
+                input=script,
+                check=check,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+                text=True,
+                timeout=timeout,
+            )
+        finally:
+            _remote.record_call(self.host, "ssh", started)
 
     def rsync_to(
         self,
@@ -161,17 +201,21 @@ class SSHClient:
         source-of-truth for that remote location.
         """
         src = f"{local}/" if not str(local).endswith("/") else str(local)
-        args = ["rsync", "-aq"]
+        args = ["rsync", "-aq", *_remote.rsync_shell_args(remote)]
         if delete:
             args.append("--delete")
         args += [src, remote]
-        return subprocess.run(
-            args,
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        started = time.monotonic()
+        try:
+            return subprocess.run(
+                args,
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        finally:
+            _remote.record_call(remote.partition(":")[0], "rsync", started)
 
     @contextmanager
     def port_forward(
@@ -277,3 +321,145 @@ class SSHClient:
         raise SSHError(
             f"ssh tunnel to local port {port} did not come up within {timeout_s}s",
         )
+
+
+class AsyncSSHClient:
+    """asyncio counterpart of :class:`SSHClient` for overlapping remote work.
+
+    Same transport (system ``ssh``, same host alias, same ControlMaster
+    when one is registered) and the same secret rule as
+    :meth:`SSHClient.run_script`: the script body goes over stdin, so
+    only ``["ssh", "<host>", "bash", "-s"]`` ever appears in argv or
+    in ``CalledProcessError.cmd`` / ``TimeoutExpired.cmd``. Results are
+    plain ``subprocess.CompletedProcess[str]`` objects so sync and
+    async callers parse output identically::
+
+        async with AsyncSSHClient("nexus", multiplex=True) as ssh:
+            a, b = await asyncio.gather(
+                ssh.run_script_async(script_a, timeout=120),
+                ssh.run_script_async(script_b, timeout=120),
+            )
+
+    ``max_concurrency`` caps in-flight ssh processes. Through a
+    ControlMaster every call is a session on ONE connection and sshd's
+    default ``MaxSessions`` is 10 — going above that makes the extra
+    sessions fail with "administratively prohibited", so the default
+    stays below it.
+
+    Cancelling the awaiting task (or hitting ``timeout``) kills the
+    local ssh process and reaps it before the exception propagates;
+    the remote side sees the channel close and bash gets SIGHUP.
+    """
+
+    def __init__(
+        self,
+        host: str = "nexus",
+        *,
+        multiplex: bool = False,
+        max_concurrency: int = 8,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self.host = host
+        self.multiplex = multiplex
+        self.max_concurrency = max_concurrency
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._master: _remote.ControlMaster | None = None
+
+    async def __aenter__(self) -> AsyncSSHClient:
+        if self.multiplex:
+            # The master start blocks on the handshake; keep the event
+            # loop free while it does.
+            self._master = await asyncio.to_thread(_remote.open_control_master, self.host)
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc: BaseException | None,
+        _tb: TracebackType | None,
+    ) -> None:
+        if self._master is not None:
+            self._master = None
+            await asyncio.to_thread(_remote.close_control_master, self.host)
+
+    async def run_async(
+        self,
+        cmd: str,
+        *,
+        check: bool = True,
+        timeout: float | None = None,
+        merge_stderr: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        """Async :meth:`SSHClient.run`. ``cmd`` is argv-visible — no secrets."""
+        argv = ["ssh", *_remote.ssh_options(self.host), self.host, cmd]
+        return await self._exec(argv, None, check=check, timeout=timeout, merge_stderr=merge_stderr)
+
+    async def run_script_async(
+        self,
+        script: str,
+        *,
+        check: bool = True,
+        timeout: float | None = None,
+        merge_stderr: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        """Async :meth:`SSHClient.run_script` — script fed over stdin, never argv."""
+        argv = ["ssh", *_remote.ssh_options(self.host), self.host, "bash", "-s"]
+        return await self._exec(
+            argv, script, check=check, timeout=timeout, merge_stderr=merge_stderr
+        )
+
+    async def _exec(
+        self,
+        argv: list[str],
+        stdin_text: str | None,
+        *,
+        check: bool,
+        timeout: float | None,
+        merge_stderr: bool,
+    ) -> subprocess.CompletedProcess[str]:
+        """Spawn ``argv``, feed ``stdin_text``, collect output.
+
+        ``timeout`` covers the process run only, not the wait for a
+        concurrency slot — a queued call shouldn't time out because
+        its siblings were slow.
+        """
+        async with self._slots:
+            started = time.monotonic()
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=subprocess.PIPE if stdin_text is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+            )
+            try:
+                stdout_b, stderr_b = await asyncio.wait_for(
+                    proc.communicate(
+                        stdin_text.encode("utf-8") if stdin_text is not None else None
+                    ),
+                    timeout=timeout,
+                )
+            except TimeoutError:
+                await self._kill(proc)
+                # ``timeout`` is non-None here: wait_for(None) never times out.
+                raise subprocess.TimeoutExpired(argv, timeout or 0.0) from None
+            except asyncio.CancelledError:
+                await self._kill(proc)
+                raise
+            finally:
+                _remote.record_call(self.host, "ssh", started)
+        stdout = stdout_b.decode("utf-8", errors="replace") if stdout_b is not None else ""
+        stderr = stderr_b.decode("utf-8", errors="replace") if stderr_b is not None else None
+        returncode = proc.returncode if proc.returncode is not None else -1
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, argv, output=stdout, stderr=stderr)
+        return subprocess.CompletedProcess(argv, returncode, stdout=stdout, stderr=stderr)
+
+    @staticmethod
+    async def _kill(proc: asyncio.subprocess.Process) -> None:
+        """Kill + reap ``proc``; tolerates a process that already exited."""
+        if proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError, OSError):
+                proc.kill()
+        with contextlib.suppress(ProcessLookupError, OSError):
+            await proc.wait()
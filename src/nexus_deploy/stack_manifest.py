@@ -0,0 +1,435 @@
+"""Content-addressed delta sync for stack trees.
+
+rsync walks and compares every file of every enabled stack on every
+deploy, and its per-file protocol is slow for a first sync of a big
+tree (n8n's node_modules alone is thousands of files). Manifest sync
+keeps, per stack, a manifest on the server of what the last sync
+shipped::
+
+    /opt/docker-server/.nexus-state/manifests/<svc>.json   {relpath: entry}
+
+``entry`` is ``"f <exec-bit> <sha256>"`` for a file, ``"l <target>"``
+for a symlink and ``"d"`` for a directory (:func:`build_manifest`).
+
+One sync:
+
+1. Hash the local ``stacks/<svc>/`` trees into manifests.
+2. Fetch the server's manifests in one ssh call
+   (:func:`render_fetch_script`). The same call reports whether the
+   server has ``zstd``.
+3. Diff (:func:`diff_manifests`): entries that are new or changed are
+   shipped, and paths that were in the server's manifest but no longer
+   exist locally are deleted. A stack with an empty diff is
+   ``unchanged``.
+4. Stream ONE compressed tar of every changed entry over ssh stdin
+   (:func:`_remote.ssh_stream_in`). It is zstd when both sides have
+   the binary, gzip otherwise. The tar also carries the new manifests
+   and the delete lists. The server-side script
+   (:func:`render_apply_script`) extracts it, applies the deletes, and
+   only then moves each new manifest into place. A broken stream
+   leaves the old manifest, so the next deploy re-ships.
+
+A stack without a server manifest gets a full push of its tree. That
+covers a cold server, a newly enabled stack, and manifests cleared by
+hand. A single tar stream is much cheaper than rsync's per-file
+round-trips for that first sync.
+
+Deletes are limited to paths listed in the stack's previous manifest,
+i.e. files an earlier manifest sync shipped. Anything else under
+``stacks/<svc>/`` on the server (runtime data, files pushed by a
+bulk rsync before the first manifest existed) is never touched. This
+is the one behaviour difference from rsync mode, which deletes
+nothing.
+
+The manifest records what was shipped, not what is on the server's
+disk. An out-of-band edit on the server goes unnoticed until the file
+changes locally. ``stack-sync --mode bulk`` (rsync) repairs that.
+Any failure here is reported to the caller as "not settled", and
+:mod:`stack_sync` falls back to rsync for those stacks.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import gzip
+import hashlib
+import io
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tarfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Literal, cast
+
+from nexus_deploy import _remote
+from nexus_deploy import tracing as _tracing
+from nexus_deploy.checkpoint import REMOTE_STATE_DIR
+
+REMOTE_MANIFESTS_DIR = f"{REMOTE_STATE_DIR}/manifests"
+
+# Staging dir for the manifests + delete lists inside the tar. It lives
+# under the stacks dir so extraction needs a single ``-C``; the leading
+# dot keeps it out of the cleanup loop's ``"$STACKS_DIR"/*/`` glob.
+_INCOMING = ".nexus-sync"
+
+Codec = Literal["zstd", "gzip"]
+Manifest = dict[str, str]
+ScriptRunner = Callable[[str], subprocess.CompletedProcess[str]]
+StreamRunner = Callable[[str, Callable[[IO[bytes]], None]], subprocess.CompletedProcess[str]]
+
+
+@dataclass(frozen=True)
+class StackDelta:
+    """What one stack needs: entries to ship and paths to delete.
+
+    ``cold`` means the server had no manifest for the stack, so every
+    entry is shipped (plus the stack root itself).
+    """
+
+    service: str
+    manifest: Manifest
+    changed: tuple[str, ...]
+    deleted: tuple[str, ...]
+    cold: bool
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.cold and not self.changed and not self.deleted
+
+
+@dataclass(frozen=True)
+class DeltaResult:
+    """Per-stack outcome of :func:`push_stacks`."""
+
+    service: str
+    status: Literal["synced", "unchanged"]
+    shipped: int = 0
+    deleted: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Pure logic — manifests, diffing, script rendering.
+# ---------------------------------------------------------------------------
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(root: Path) -> Manifest:
+    """``{relpath: entry}`` for everything under ``root`` (root excluded).
+
+    Symlinks are recorded by target, never followed — same as rsync
+    ``-a`` and :func:`stamps.tree_hash`.
+    """
+    manifest: Manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        base = Path(dirpath)
+        for name in list(dirnames):
+            path = base / name
+            rel = path.relative_to(root).as_posix()
+            if path.is_symlink():
+                # os.walk lists a symlinked dir under dirnames but
+                # doesn't descend into it (followlinks=False).
+                manifest[rel] = f"l {path.readlink()}"
+            else:
+                manifest[rel] = "d"
+        for name in sorted(filenames):
+            path = base / name
+            rel = path.relative_to(root).as_posix()
+            if path.is_symlink():
+                manifest[rel] = f"l {path.readlink()}"
+            else:
+                manifest[rel] = f"f {int(os.access(path, os.X_OK))} {_file_sha256(path)}"
+    return manifest
+
+
+def manifest_hash(manifest: Manifest) -> str:
+    """sha256 of ``manifest`` in canonical form — the ``stack-sync`` stamp."""
+    return hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()
+
+
+def _is_safe_relpath(path: str) -> bool:
+    """Reject anything that could escape the stack dir once on the server."""
+    if not path or path.startswith("/") or "\0" in path:
+        return False
+    return all(part not in ("", ".", "..") for part in path.split("/"))
+
+
+def diff_manifests(service: str, local: Manifest, remote: Manifest | None) -> StackDelta:
+    """Entries to ship (new/changed) and paths to delete (gone locally).
+
+    Delete paths come from the server's manifest, so they are checked
+    with :func:`_is_safe_relpath`; a path that fails is dropped rather
+    than trusted.
+    """
+    if remote is None:
+        return StackDelta(service, local, tuple(sorted(local)), (), cold=True)
+    changed = tuple(sorted(p for p, entry in local.items() if remote.get(p) != entry))
+    deleted = tuple(sorted(p for p in remote if p not in local and _is_safe_relpath(p)))
+    return StackDelta(service, local, changed, deleted, cold=False)
+
+
+def render_fetch_script(
+    names: list[str],
+    *,
+    stacks_dir: str,
+    manifests_dir: str = REMOTE_MANIFESTS_DIR,
+) -> str:
+    """Bash printing ``CODEC zstd`` (if available) + ``MANIFEST <svc> <b64>`` lines.
+
+    A manifest is only reported while ``<stacks_dir>/<svc>`` exists, so
+    a stack removed by the cleanup loop gets a full push when it comes
+    back. Callers pre-validate ``names``.
+    """
+    names_q = " ".join(shlex.quote(n) for n in names)
+    return f"""set -u
+STACKS={shlex.quote(stacks_dir)}
+MANIFESTS={shlex.quote(manifests_dir)}
+if command -v zstd >/dev/null 2>&1; then
+    echo "CODEC zstd"
+fi
+for name in {names_q}; do
+    if [ -d "$STACKS/$name" ] && [ -f "$MANIFESTS/$name.json" ]; then
+        printf 'MANIFEST %s ' "$name"
+        base64 -w0 "$MANIFESTS/$name.json"
+        echo
+    fi
+done
+"""
+
+
+def parse_fetch_output(stdout: str) -> tuple[bool, dict[str, Manifest]]:
+    """``(server_has_zstd, {svc: manifest})`` from :func:`render_fetch_script`.
+
+    A manifest that doesn't decode to ``{str: str}`` is left out, so
+    that stack gets a full push.
+    """
+    has_zstd = False
+    manifests: dict[str, Manifest] = {}
+    for line in stdout.splitlines():
+        if line == "CODEC zstd":
+            has_zstd = True
+            continue
+        parts = line.split(" ")
+        if len(parts) != 3 or parts[0] != "MANIFEST":
+            continue
+        try:
+            raw = json.loads(base64.b64decode(parts[2], validate=True))
+        except (binascii.Error, ValueError):
+            continue
+        if isinstance(raw, dict) and all(
+            isinstance(k, str) and isinstance(v, str) for k, v in raw.items()
+        ):
+            manifests[parts[1]] = raw
+    return has_zstd, manifests
+
+
+def render_apply_script(
+    names: list[str],
+    codec: Codec,
+    *,
+    stacks_dir: str,
+    manifests_dir: str = REMOTE_MANIFESTS_DIR,
+) -> str:
+    """Bash that extracts the tar on stdin and commits each stack's manifest.
+
+    Prints ``APPLIED <svc>`` once a stack's deletes ran and its
+    manifest is in place. ``set -e`` stops at the first failure, so a
+    stack without that line wasn't committed. Carries no secrets; it
+    runs as the ssh command line.
+    """
+    decompress = "zstd -dc" if codec == "zstd" else "gzip -dc"
+    names_q = " ".join(shlex.quote(n) for n in names)
+    return f"""set -euo pipefail
+STACKS={shlex.quote(stacks_dir)}
+MANIFESTS={shlex.quote(manifests_dir)}
+INCOMING="$STACKS/{_INCOMING}"
+rm -rf "$INCOMING"
+mkdir -p "$STACKS" "$MANIFESTS"
+{decompress} | tar -xf - -C "$STACKS"
+for name in {names_q}; do
+    if [ -s "$INCOMING/$name.deleted" ]; then
+        ( cd "$STACKS/$name" && xargs -0 rm -rf -- < "$INCOMING/$name.deleted" )
+    fi
+    mv -f "$INCOMING/$name.json" "$MANIFESTS/$name.json"
+    echo "APPLIED $name"
+done
+rm -rf "$INCOMING"
+"""
+
+
+def parse_applied(stdout: str) -> set[str]:
+    return {line[len("APPLIED ") :] for line in stdout.splitlines() if line.startswith("APPLIED ")}
+
+
+# ---------------------------------------------------------------------------
+# Side-effect functions — tar stream + push orchestration.
+# ---------------------------------------------------------------------------
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o600
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def write_tar(out: IO[bytes], local_stacks_dir: Path, deltas: list[StackDelta]) -> None:
+    """Uncompressed tar stream of ``deltas`` into ``out``.
+
+    Stack entries come first (``<svc>/<relpath>``, metadata from the
+    local file like rsync ``-a``), then ``.nexus-sync/<svc>.json`` and
+    ``.nexus-sync/<svc>.deleted`` (NUL-separated) for the apply script.
+    """
+    with tarfile.open(fileobj=out, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        for delta in deltas:
+            root = local_stacks_dir / delta.service
+            if delta.cold:
+                tar.add(root, arcname=delta.service, recursive=False)
+            for rel in delta.changed:
+                tar.add(root / rel, arcname=f"{delta.service}/{rel}", recursive=False)
+        for delta in deltas:
+            body = json.dumps(delta.manifest, sort_keys=True).encode()
+            _add_bytes(tar, f"{_INCOMING}/{delta.service}.json", body)
+            if delta.deleted:
+                deleted = b"".join(p.encode() + b"\0" for p in delta.deleted)
+                _add_bytes(tar, f"{_INCOMING}/{delta.service}.deleted", deleted)
+
+
+def _feed(
+    local_stacks_dir: Path, deltas: list[StackDelta], codec: Codec
+) -> Callable[[IO[bytes]], None]:
+    """Writer for :func:`_remote.ssh_stream_in`: tar → codec → ssh stdin.
+
+    zstd runs as a subprocess writing straight into the ssh pipe (the
+    stdlib has no zstd before 3.14); gzip is done in-process.
+    """
+
+    def feed(sink: IO[bytes]) -> None:
+        if codec == "gzip":
+            with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=6) as gz:
+                write_tar(cast("IO[bytes]", gz), local_stacks_dir, deltas)
+            return
+        with subprocess.Popen(["zstd", "-q", "-c", "-T0"], stdin=subprocess.PIPE, stdout=sink) as z:
+            write_tar(cast("IO[bytes]", z.stdin), local_stacks_dir, deltas)
+        if z.returncode != 0:
+            raise OSError(f"zstd exited {z.returncode}")
+
+    return feed
+
+
+def _local_codec(server_has_zstd: bool) -> Codec:
+    return "zstd" if server_has_zstd and shutil.which("zstd") else "gzip"
+
+
+def push_stacks(
+    local_stacks_dir: Path,
+    names: list[str],
+    *,
+    remote_stacks_dir: str,
+    host: str = "nexus",
+    script_runner: ScriptRunner | None = None,
+    stream_runner: StreamRunner | None = None,
+    manifests_dir: str = REMOTE_MANIFESTS_DIR,
+    manifests: dict[str, Manifest] | None = None,
+) -> dict[str, DeltaResult]:
+    """Delta-sync ``names`` (pre-validated, existing local dirs).
+
+    Returns a :class:`DeltaResult` for every stack it settled. A stack
+    missing from the dict was not committed on the server (manifest
+    fetch failed, stream/apply failed before its ``APPLIED`` line), and
+    the caller should sync it another way.
+
+    ``script_runner`` / ``stream_runner`` are DI seams for tests;
+    production gets :func:`_remote.ssh_run_script` for the manifest
+    fetch and :func:`_remote.ssh_stream_in` (``bash -c <script>``) for
+    the tar stream. ``manifests`` holds local manifests the caller
+    already built; any stack missing from it is walked here.
+    """
+    run_script = script_runner or (lambda s: _remote.ssh_run_script(s, host=host))
+    stream = stream_runner or (
+        lambda s, feed: _remote.ssh_stream_in(f"bash -c {shlex.quote(s)}", feed, host=host)
+    )
+    with _tracing.span("stack manifests", "render"):
+        given = manifests or {}
+        local = {
+            svc: given[svc] if svc in given else build_manifest(local_stacks_dir / svc)
+            for svc in names
+        }
+    fetch = render_fetch_script(names, stacks_dir=remote_stacks_dir, manifests_dir=manifests_dir)
+    try:
+        completed = run_script(fetch)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+        sys.stderr.write(f"  ⚠ stack manifests unavailable ({type(exc).__name__}) — using rsync\n")
+        return {}
+    server_has_zstd, remote = parse_fetch_output(completed.stdout)
+
+    settled: dict[str, DeltaResult] = {}
+    deltas: list[StackDelta] = []
+    for svc in names:
+        delta = diff_manifests(svc, local[svc], remote.get(svc))
+        if delta.is_empty:
+            settled[svc] = DeltaResult(svc, "unchanged")
+        else:
+            deltas.append(delta)
+    if not deltas:
+        return settled
+
+    codec = _local_codec(server_has_zstd)
+    shipping = [d.service for d in deltas]
+    script = render_apply_script(
+        shipping, codec, stacks_dir=remote_stacks_dir, manifests_dir=manifests_dir
+    )
+    try:
+        applied_out = stream(script, _feed(local_stacks_dir, deltas, codec)).stdout
+    except subprocess.CalledProcessError as exc:
+        applied_out = exc.output or ""
+        sys.stderr.write(
+            f"  ⚠ stack delta push failed (rc={exc.returncode}) — rsync for the rest\n"
+        )
+        for line in applied_out.splitlines():
+            if not line.startswith("APPLIED "):
+                sys.stderr.write(f"      {line}\n")
+    except (subprocess.TimeoutExpired, OSError) as exc:
+        sys.stderr.write(f"  ⚠ stack delta push failed ({type(exc).__name__}) — using rsync\n")
+        return settled
+    applied = parse_applied(applied_out)
+    for delta in deltas:
+        if delta.service in applied:
+            settled[delta.service] = DeltaResult(
+                delta.service,
+                "synced",
+                shipped=len(delta.changed),
+                deleted=len(delta.deleted),
+            )
+    return settled
+
+
+__all__ = [
+    "REMOTE_MANIFESTS_DIR",
+    "DeltaResult",
+    "StackDelta",
+    "build_manifest",
+    "diff_manifests",
+    "manifest_hash",
+    "parse_applied",
+    "parse_fetch_output",
+    "push_stacks",
+    "render_apply_script",
+    "render_fetch_script",
+    "write_tar",
+]
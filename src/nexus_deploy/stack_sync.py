@@ -2,8 +2,8 @@
 
 Two pieces of the deploy pipeline live here:
 
-* Per-stack rsync loop — for every entry in ``$ENABLED_SERVICES``,
-  rsync ``stacks/<svc>/`` → ``nexus:/opt/docker-server/stacks/<svc>/``.
+* Stack rsync — for every entry in ``$ENABLED_SERVICES``, push
+  ``stacks/<svc>/`` → ``nexus:/opt/docker-server/stacks/<svc>/``.
   Missing local stack folders produce a yellow warning and are skipped.
 * Disabled-stack cleanup — server-side bash loop that walks
   ``/opt/docker-server/stacks/*/``, ``docker compose down`` + ``rm -rf``
@@ -11,10 +11,28 @@ Two pieces of the deploy pipeline live here:
 
 Two transports:
 
-1. **Local rsync** (one subprocess per service) via
-   :func:`_remote.rsync_to_remote`. Each service rsyncs independently
-   so a single failure doesn't abort the rest of the loop — partial
-   failures continue with a per-service ``failed`` counter.
+1. **Stack push**, in one of three modes:
+
+   * ``bulk`` (default) — ONE rsync for every enabled stack via
+     :func:`_remote.rsync_dirs_to_remote` (names as a ``--files-from``
+     list), i.e. one ssh session instead of one per service. rsync
+     keeps going past per-file errors and exits 23/24; the quoted
+     paths in its error lines name the stack they belong to, so each
+     service still gets its own :class:`RsyncResult`. Errors that
+     can't be pinned to a service, and any other non-zero exit (ssh
+     down, protocol error), send the unsettled services through the
+     per-service loop.
+   * ``per-service`` — one subprocess per service via
+     :func:`_remote.rsync_to_remote`. Each service rsyncs independently
+     so a single failure doesn't abort the rest of the loop — partial
+     failures continue with a per-service ``failed`` counter.
+   * ``manifest`` (opt-in) — content-addressed delta sync, see
+     :mod:`stack_manifest`: only files whose hash changed since the
+     last sync travel, as one compressed tar stream. Stacks it can't
+     settle go through ``bulk``. Unlike rsync (which never deletes),
+     this mode removes files that were in the stack's previous
+     manifest but are gone locally; anything else on the server is
+     left alone.
 2. **Server-side cleanup script** via :func:`_remote.ssh_run_script`
    (stdin) — one ssh round-trip. The list of enabled service names
    is interpolated as a single ``shlex.quote``'d bash string literal
@@ -45,6 +63,9 @@ from pathlib import Path
 from typing import Literal
 
 from nexus_deploy import _remote
+from nexus_deploy import stack_manifest as _stack_manifest
+from nexus_deploy import stamps as _stamps
+from nexus_deploy import tracing as _tracing
 
 # Canonical location on the nexus server where every stack's
 # ``docker-compose.yml`` lives. Adjacent stacks are sibling folders
@@ -67,6 +88,19 @@ _RESULT_PATTERN = re.compile(
     re.MULTILINE,
 )
 
+# rsync exit codes for "the transfer ran but some files failed" (23)
+# and "some source files vanished" (24). Only these can be attributed
+# per service; anything else broke the transfer as a whole.
+_PARTIAL_TRANSFER_RCS = frozenset({23, 24})
+
+# One ``--itemize-changes`` line: the 11-char change code, a space,
+# then the path relative to the transfer root (``jupyter/compose.yml``).
+_ITEMIZED_LINE = re.compile(r"^[<>ch.*][fdLDS]\S* (?P<path>.+)$")
+_QUOTED_PATH = re.compile(r'"([^"]+)"')
+
+# Truncation bound for RsyncResult.stderr_excerpt (tail is kept).
+_EXCERPT_LIMIT = 2000
+
 
 @dataclass(frozen=True)
 class RsyncResult:
@@ -74,14 +108,20 @@ class RsyncResult:
 
     ``status`` values:
 
-    * ``synced`` — rsync exited 0; the service's stacks/<svc>/ dir
-      now matches the server's copy.
+    * ``synced`` — rsync exited 0 (bulk: no error line named this
+      service); the service's stacks/<svc>/ dir now matches the
+      server's copy. In bulk / manifest mode ``detail`` counts the
+      items rsync itemised / the tar shipped (empty when rsync
+      changed nothing).
     * ``missing-local`` — local stacks/<svc>/ does NOT exist; the
       runner emits a yellow warning and continues with the next
       service.
     * ``failed`` — rsync exited non-zero (transport problem, permission
       issue, broken pipe), OR the service name failed path-safety.
       ``detail`` carries the rc / reason for the operator log.
+    * ``unchanged`` — the local tree hashes to the server's
+      ``stack-sync`` stamp (see :mod:`stamps`), or the manifest diff
+      found nothing to ship; no transfer ran.
 
     ``stderr_excerpt`` carries the captured rsync stderr (truncated)
     when status='failed' due to rsync rc≠0. Empty for the other two
@@ -93,7 +133,7 @@ class RsyncResult:
     """
 
     service: str
-    status: Literal["synced", "missing-local", "failed"]
+    status: Literal["synced", "missing-local", "failed", "unchanged"]
     detail: str = ""
     stderr_excerpt: str = ""
 
@@ -147,6 +187,10 @@ class StackSyncResult:
     def missing(self) -> int:
         return sum(1 for r in self.rsync if r.status == "missing-local")
 
+    @property
+    def unchanged(self) -> int:
+        return sum(1 for r in self.rsync if r.status == "unchanged")
+
     @property
     def failed_rsync(self) -> int:
         return sum(1 for r in self.rsync if r.status == "failed")
@@ -282,7 +326,166 @@ def parse_cleanup_result(stdout: str) -> CleanupResult | None:
 
 
 RsyncRunner = Callable[[Path, str], subprocess.CompletedProcess[str]]
+BulkRsyncRunner = Callable[[Path, str, list[str]], subprocess.CompletedProcess[str]]
 ScriptRunner = Callable[[str], subprocess.CompletedProcess[str]]
+SyncMode = Literal["manifest", "bulk", "per-service"]
+
+
+def _excerpt(text: str) -> str:
+    return (text[-_EXCERPT_LIMIT:] if len(text) > _EXCERPT_LIMIT else text).rstrip()
+
+
+def _service_of(path: str, names: frozenset[str], prefixes: tuple[str, ...]) -> str | None:
+    """The stack ``path`` belongs to, if it names one of ``names``.
+
+    rsync prints absolute paths (local source or remote destination)
+    or paths relative to the transfer root, depending on which side
+    reports the error; ``prefixes`` are the roots to strip.
+    """
+    for prefix in prefixes:
+        if path.startswith(prefix):
+            path = path[len(prefix) :]
+            break
+    else:
+        if path.startswith("/"):
+            return None
+    head = path.lstrip("/").split("/", 1)[0]
+    return head if head in names else None
+
+
+def _attribute_rsync_errors(
+    stderr: str,
+    names: list[str],
+    prefixes: tuple[str, ...],
+) -> tuple[dict[str, list[str]], list[str]]:
+    """Split bulk-rsync stderr into per-service error lines + the rest.
+
+    The closing ``rsync error: … (code 23)`` / ``rsync warning: …``
+    summary lines carry no path and are dropped; every other line is
+    either attributed via its quoted path(s) or returned as
+    unattributed.
+    """
+    wanted = frozenset(names)
+    per_service: dict[str, list[str]] = {}
+    unattributed: list[str] = []
+    for raw in stderr.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith(("rsync error: ", "rsync warning: ")):
+            continue
+        owners = {
+            svc
+            for svc in (_service_of(p, wanted, prefixes) for p in _QUOTED_PATH.findall(line))
+            if svc is not None
+        }
+        if not owners:
+            unattributed.append(line)
+        for svc in owners:
+            per_service.setdefault(svc, []).append(line)
+    return per_service, unattributed
+
+
+def _itemized_counts(stdout: str) -> dict[str, int]:
+    """Items rsync reported as changed, per top-level directory."""
+    counts: dict[str, int] = {}
+    for line in stdout.splitlines():
+        match = _ITEMIZED_LINE.match(line)
+        if match is None:
+            continue
+        head = match.group("path").split("/", 1)[0]
+        counts[head] = counts.get(head, 0) + 1
+    return counts
+
+
+def _rsync_bulk(
+    local_stacks_dir: Path,
+    names: list[str],
+    *,
+    runner: BulkRsyncRunner,
+    remote_stacks_dir: str,
+    host: str,
+) -> dict[str, RsyncResult]:
+    """One rsync for all ``names``; results for the names it could settle.
+
+    Names missing from the returned dict need the per-service loop:
+    either the whole transfer broke (rc not 23/24) or rsync reported
+    errors that no quoted path ties to a service.
+    """
+    completed = runner(local_stacks_dir, f"{host}:{remote_stacks_dir}/", names)
+    rc = completed.returncode
+    counts = _itemized_counts(completed.stdout or "")
+
+    def synced(svc: str) -> RsyncResult:
+        items = counts.get(svc, 0)
+        return RsyncResult(svc, "synced", detail=f"{items} item(s)" if items else "")
+
+    if rc == 0:
+        return {svc: synced(svc) for svc in names}
+    if rc not in _PARTIAL_TRANSFER_RCS:
+        sys.stderr.write(f"  ⚠ bulk rsync failed (rc={rc}) — retrying per service\n")
+        return {}
+    prefixes = (f"{local_stacks_dir}/", f"{local_stacks_dir.resolve()}/", f"{remote_stacks_dir}/")
+    failed, unattributed = _attribute_rsync_errors(completed.stderr or "", names, prefixes)
+    settled = {
+        svc: RsyncResult(
+            svc,
+            "failed",
+            detail=f"rsync rc={rc}",
+            stderr_excerpt=_excerpt("\n".join(lines)),
+        )
+        for svc, lines in failed.items()
+    }
+    if unattributed:
+        sys.stderr.write(
+            f"  ⚠ bulk rsync: {len(unattributed)} error line(s) name no stack "
+            "— retrying the rest per service\n"
+        )
+        return settled
+    return {svc: settled.get(svc) or synced(svc) for svc in names}
+
+
+def _delta_to_rsync_result(delta: _stack_manifest.DeltaResult) -> RsyncResult:
+    if delta.status == "unchanged":
+        return RsyncResult(delta.service, "unchanged")
+    detail = f"{delta.shipped} item(s)"
+    if delta.deleted:
+        detail += f", {delta.deleted} deleted"
+    return RsyncResult(delta.service, "synced", detail=detail)
+
+
+def _rsync_one(
+    local: Path,
+    svc: str,
+    *,
+    runner: RsyncRunner,
+    remote_stacks_dir: str,
+    host: str,
+) -> RsyncResult:
+    """Per-service rsync of ``local`` → ``<host>:<remote_stacks_dir>/<svc>/``."""
+    try:
+        runner(local, f"{host}:{remote_stacks_dir}/{svc}/")
+    except subprocess.CalledProcessError as exc:
+        # rsync's stderr for a stack-dir push contains only file
+        # paths + permission errors — no secrets. We surface it
+        # so operators can see WHY a sync failed instead of just
+        # the bare rc (Round-2 PR #523 finding: the previous
+        # version captured stderr via _remote.rsync_to_remote's
+        # capture_output=True but discarded it, leaving only
+        # `rsync rc=N` for diagnosis).
+        #
+        # Truncate at 2000 chars: enough for a screen of file-
+        # path errors but bounded so a pathological retry loop
+        # can't flood the deploy log. exc.stderr/stdout may be
+        # None if the runner was a test stub raising a bare
+        # CalledProcessError without those fields populated;
+        # default to empty string for both branches.
+        stderr = (exc.stderr or "") + (exc.stdout or "")
+        return RsyncResult(
+            service=svc,
+            status="failed",
+            detail=f"rsync rc={exc.returncode}",
+            stderr_excerpt=_excerpt(stderr),
+        )
+    return RsyncResult(service=svc, status="synced")
 
 
 def rsync_enabled_stacks(
@@ -292,67 +495,97 @@ def rsync_enabled_stacks(
     rsync_runner: RsyncRunner | None = None,
     remote_stacks_dir: str = _REMOTE_STACKS_DIR,
     host: str = "nexus",
+    unchanged: frozenset[str] = frozenset(),
+    mode: SyncMode = "per-service",
+    bulk_rsync_runner: BulkRsyncRunner | None = None,
+    script_runner: ScriptRunner | None = None,
+    stream_runner: _stack_manifest.StreamRunner | None = None,
+    manifests: dict[str, _stack_manifest.Manifest] | None = None,
 ) -> tuple[RsyncResult, ...]:
     """Rsync each enabled service's local stack folder to the server.
 
-    One rsync subprocess per service. A failed rsync produces a
-    ``failed`` RsyncResult with the rc in ``detail``; the loop
-    continues for the remaining services (partial failures don't
-    abort the whole stack-sync step).
-
-    ``rsync_runner`` is a dependency-injection seam for tests.
-    Production callers leave it None and get :func:`_remote.rsync_to_remote`,
-    which wraps ``rsync -aq`` with capture_output. ``-aq`` (rather
-    than ``-av``) is deliberate: rsync's per-file output for an
-    entire stack tree (n8n's node_modules alone is thousands of
-    files) would dominate the deploy log; capture_output gives us
-    the diagnostic on failure without the happy-path noise.
+    ``mode="per-service"``: one rsync subprocess per service. A failed
+    rsync produces a ``failed`` RsyncResult with the rc in ``detail``;
+    the loop continues for the remaining services (partial failures
+    don't abort the whole stack-sync step).
+
+    ``mode="bulk"``: one rsync for every service that needs a push
+    (see the module docstring); services it can't settle fall back
+    to the per-service loop.
+
+    ``mode="manifest"``: delta sync via :mod:`stack_manifest` (one
+    manifest fetch through ``script_runner`` + one tar stream through
+    ``stream_runner``); services it can't settle go through ``bulk``
+    and then the per-service loop. ``manifests`` are local manifests
+    the caller already built (saves a second walk). Results come back
+    in ``enabled`` order in every mode.
+
+    ``rsync_runner`` / ``bulk_rsync_runner`` / ``script_runner`` /
+    ``stream_runner`` are dependency-injection seams for tests. Production callers leave them None and get
+    :func:`_remote.rsync_to_remote` (``rsync -aq`` with
+    capture_output) / :func:`_remote.rsync_dirs_to_remote`. ``-q``
+    (rather than ``-v``) is deliberate: rsync's per-file output for
+    an entire stack tree (n8n's node_modules alone is thousands of
+    files) would dominate the deploy log; capture_output gives us the
+    diagnostic on failure without the happy-path noise. The bulk
+    transport's ``--itemize-changes`` output is captured too and only
+    summarised as a per-service item count.
+
+    Services in ``unchanged`` (computed by :func:`run_stack_sync` from
+    the stamps) are reported as ``unchanged`` without an rsync.
     """
     runner = rsync_runner or (lambda local, remote: _remote.rsync_to_remote(local, remote))
-    results: list[RsyncResult] = []
+    slots: list[RsyncResult | None] = []
     for svc in enabled:
         if not _is_safe_name(svc):
-            results.append(
+            slots.append(
                 RsyncResult(
                     service=svc,
                     status="failed",
                     detail="unsafe name (must match [A-Za-z0-9._-]+)",
                 ),
             )
-            continue
-        local = local_stacks_dir / svc
-        if not local.is_dir():
-            results.append(RsyncResult(service=svc, status="missing-local"))
-            continue
-        try:
-            runner(local, f"{host}:{remote_stacks_dir}/{svc}/")
-        except subprocess.CalledProcessError as exc:
-            # rsync's stderr for a stack-dir push contains only file
-            # paths + permission errors — no secrets. We surface it
-            # so operators can see WHY a sync failed instead of just
-            # the bare rc (Round-2 PR #523 finding: the previous
-            # version captured stderr via _remote.rsync_to_remote's
-            # capture_output=True but discarded it, leaving only
-            # `rsync rc=N` for diagnosis).
-            #
-            # Truncate at 2000 chars: enough for a screen of file-
-            # path errors but bounded so a pathological retry loop
-            # can't flood the deploy log. exc.stderr/stdout may be
-            # None if the runner was a test stub raising a bare
-            # CalledProcessError without those fields populated;
-            # default to empty string for both branches.
-            stderr = (exc.stderr or "") + (exc.stdout or "")
-            excerpt = stderr[-2000:] if len(stderr) > 2000 else stderr
-            results.append(
-                RsyncResult(
-                    service=svc,
-                    status="failed",
-                    detail=f"rsync rc={exc.returncode}",
-                    stderr_excerpt=excerpt.rstrip(),
-                ),
+        elif not (local_stacks_dir / svc).is_dir():
+            slots.append(RsyncResult(service=svc, status="missing-local"))
+        elif svc in unchanged:
+            slots.append(RsyncResult(service=svc, status="unchanged"))
+        else:
+            slots.append(None)
+    pending = [svc for svc, slot in zip(enabled, slots, strict=True) if slot is None]
+
+    settled: dict[str, RsyncResult] = {}
+    if mode == "manifest" and pending:
+        pushed = _stack_manifest.push_stacks(
+            local_stacks_dir,
+            pending,
+            remote_stacks_dir=remote_stacks_dir,
+            host=host,
+            script_runner=script_runner,
+            stream_runner=stream_runner,
+            manifests=manifests,
+        )
+        settled = {svc: _delta_to_rsync_result(d) for svc, d in pushed.items()}
+        pending = [svc for svc in pending if svc not in settled]
+    if mode in ("manifest", "bulk") and pending:
+        settled |= _rsync_bulk(
+            local_stacks_dir,
+            pending,
+            runner=bulk_rsync_runner or _remote.rsync_dirs_to_remote,
+            remote_stacks_dir=remote_stacks_dir,
+            host=host,
+        )
+
+    results: list[RsyncResult] = []
+    for svc, slot in zip(enabled, slots, strict=True):
+        if slot is None:
+            slot = settled.get(svc) or _rsync_one(
+                local_stacks_dir / svc,
+                svc,
+                runner=runner,
+                remote_stacks_dir=remote_stacks_dir,
+                host=host,
             )
-            continue
-        results.append(RsyncResult(service=svc, status="synced"))
+        results.append(slot)
     return tuple(results)
 
 
@@ -404,6 +637,31 @@ def cleanup_disabled_stacks(
     return parse_cleanup_result(completed.stdout)
 
 
+def _fetch_stamps(
+    names: list[str], run_script: ScriptRunner, remote_stacks_dir: str
+) -> dict[str, str]:
+    """Server-side ``stack-sync`` stamps; ``{}`` (sync everything) on any failure."""
+    if not names:
+        return {}
+    script = _stamps.render_fetch_script("stack-sync", names, require_dir=remote_stacks_dir)
+    try:
+        completed = run_script(script)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+        sys.stderr.write(
+            f"  ⚠ stack-sync stamps unavailable ({type(exc).__name__}) — syncing all\n"
+        )
+        return {}
+    return _stamps.parse_stamps(completed.stdout)
+
+
+def _store_stamps(stamps: dict[str, str], run_script: ScriptRunner) -> None:
+    """Persist ``stack-sync`` stamps; a failure only costs the next deploy a re-sync."""
+    try:
+        run_script(_stamps.render_store_script("stack-sync", stamps))
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+        sys.stderr.write(f"  ⚠ stack-sync stamps not saved ({type(exc).__name__})\n")
+
+
 def run_stack_sync(
     local_stacks_dir: Path,
     enabled: list[str],
@@ -412,6 +670,10 @@ def run_stack_sync(
     script_runner: ScriptRunner | None = None,
     remote_stacks_dir: str = _REMOTE_STACKS_DIR,
     host: str = "nexus",
+    skip_unchanged: bool = False,
+    sync_mode: SyncMode = "bulk",
+    bulk_rsync_runner: BulkRsyncRunner | None = None,
+    stream_runner: _stack_manifest.StreamRunner | None = None,
 ) -> StackSyncResult:
     """End-to-end orchestrator: rsync each enabled stack, then cleanup
     disabled ones.
@@ -421,14 +683,56 @@ def run_stack_sync(
     the cleanup loop has a chance to see it as "not in enabled" (it
     IS in enabled). The cleanup loop's enabled-list and the rsync
     loop's enabled-list are the same — there's no race window.
+
+    ``skip_unchanged``: hash each local stack tree, skip the rsync for
+    services whose hash matches the server's ``stack-sync`` stamp, and
+    stamp the ones that synced. Costs two extra ssh round-trips (fetch
+    + store) through ``script_runner``. The hash is taken from the
+    stack's manifest (:func:`stack_manifest.manifest_hash`), so the
+    tree is walked once even in ``"manifest"`` mode.
+
+    ``sync_mode`` picks the transport (see :func:`rsync_enabled_stacks`).
+    ``"bulk"`` (default) / ``"per-service"`` rsync without deleting
+    anything; ``"manifest"`` ships only changed files, deletes files
+    dropped since its last sync, and falls back to rsync on its own.
     """
+    run_script = script_runner or (lambda s: _remote.ssh_run_script(s, host=host))
+    manifests: dict[str, _stack_manifest.Manifest] | None = None
+    hashes: dict[str, str] = {}
+    unchanged: frozenset[str] = frozenset()
+    if skip_unchanged:
+        with _tracing.span("stack-sync hash", "render"):
+            manifests = {
+                svc: _stack_manifest.build_manifest(local_stacks_dir / svc)
+                for svc in enabled
+                if _is_safe_name(svc) and (local_stacks_dir / svc).is_dir()
+            }
+            hashes = {svc: _stack_manifest.manifest_hash(m) for svc, m in manifests.items()}
+        previous = _fetch_stamps(list(hashes), run_script, remote_stacks_dir)
+        unchanged = frozenset(svc for svc, h in hashes.items() if previous.get(svc) == h)
     rsync_results = rsync_enabled_stacks(
         local_stacks_dir,
         enabled,
         rsync_runner=rsync_runner,
         remote_stacks_dir=remote_stacks_dir,
         host=host,
+        unchanged=unchanged,
+        mode=sync_mode,
+        bulk_rsync_runner=bulk_rsync_runner,
+        script_runner=script_runner,
+        stream_runner=stream_runner,
+        manifests=manifests,
     )
+    if skip_unchanged:
+        # Also stamp stacks the manifest diff found unchanged (their
+        # stamp was missing or stale), so the next run skips them early.
+        synced = {
+            r.service: hashes[r.service]
+            for r in rsync_results
+            if r.status == "synced" or (r.status == "unchanged" and r.service not in unchanged)
+        }
+        if synced:
+            _store_stamps(synced, run_script)
     cleanup = cleanup_disabled_stacks(
         enabled,
         host=host,
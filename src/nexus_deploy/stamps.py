@@ -0,0 +1,137 @@
+"""Input-hash stamps: skip per-service work whose inputs didn't change.
+
+Most redeploys change one or two services, yet stack-sync, compose-up
+and the admin-setup hooks used to redo every enabled stack. Each of
+those steps now hashes its per-service inputs and compares the hash
+with a stamp kept on the server. When they match, it skips that
+service and counts it as ``unchanged`` in the phase detail.
+
+Stamp layout (one file per service, body = hex sha256)::
+
+    /opt/docker-server/.nexus-state/stamps/<kind>/<service>
+
+``kind`` is ``stack-sync`` / ``compose-up`` / ``admin-setup``. Stamps
+live on the server, not the runner, because the server is what they
+describe. A rebuilt server has none and redoes everything. Clearing
+``stamps/`` by hand forces a full redeploy.
+
+Who hashes what:
+
+* **stack-sync** — the runner hashes the manifest of the local
+  ``stacks/<svc>/`` tree (:func:`stack_manifest.manifest_hash`) after
+  service-env / firewall-configure rendered into it; the manifest mode
+  of the sync reuses the same walk. One ssh call fetches all stamps
+  (:func:`render_fetch_script`) and one stores the new ones
+  (:func:`render_store_script`). A stamp is only reported while
+  ``stacks/<svc>/`` still exists on the server, so a stack that was
+  disabled (and removed by the cleanup loop) and is then re-enabled
+  gets re-synced.
+* **compose-up** / **admin-setup** — hashed server-side inside their
+  own remote scripts (see :mod:`compose_runner` / :mod:`services`).
+  The files being hashed are already on the server, so this costs no
+  extra round-trip.
+
+Stamps are an optimisation only. A failed fetch means "no stamps" and
+a failed store is a warning; neither fails the phase.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shlex
+from collections.abc import Iterable
+from pathlib import Path
+
+from nexus_deploy.checkpoint import REMOTE_STATE_DIR
+
+REMOTE_STAMPS_DIR = f"{REMOTE_STATE_DIR}/stamps"
+
+# Same allow-list as stack_sync._SAFE_NAME — names land in file paths.
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9._-]+$")
+_HEX64 = re.compile(r"^[0-9a-f]{64}$")
+_STAMP_LINE = re.compile(
+    r"^STAMP (?P<name>[A-Za-z0-9._-]+) (?P<hash>[0-9a-f]{64})$",
+    re.MULTILINE,
+)
+
+
+def stamp_dir(kind: str) -> str:
+    """Server-side directory holding the ``kind`` stamps."""
+    if not _SAFE_NAME.fullmatch(kind):
+        raise ValueError(f"unsafe stamp kind: {kind!r}")
+    return f"{REMOTE_STAMPS_DIR}/{kind}"
+
+
+def tree_hash(root: Path) -> str:
+    """sha256 over every file under ``root``: relative path, exec bit, content.
+
+    Used for compose build contexts (:mod:`compose_runner`); the
+    stack-sync stamp hashes the stack manifest instead.
+
+    Walk order is sorted so the hash is stable across filesystems.
+    Symlinks are hashed by their target string (rsync ``-a`` copies the
+    link, not the file it points at).
+    """
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            rel = path.relative_to(root).as_posix()
+            if path.is_symlink():
+                digest.update(f"L {rel} {path.readlink()}\0".encode())
+                continue
+            executable = os.access(path, os.X_OK)
+            digest.update(f"F {rel} {int(executable)}\0".encode())
+            with path.open("rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 16), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def render_fetch_script(kind: str, names: Iterable[str], *, require_dir: str) -> str:
+    """Bash printing ``STAMP <name> <sha>`` for every stamped ``name``.
+
+    A name is only reported while ``<require_dir>/<name>`` exists on
+    the server. Unsafe names are dropped (never stamped, never skipped).
+    """
+    safe = [n for n in names if _SAFE_NAME.fullmatch(n)]
+    names_q = " ".join(shlex.quote(n) for n in safe)
+    return f"""set -u
+STAMPS={shlex.quote(stamp_dir(kind))}
+BASE={shlex.quote(require_dir)}
+for name in {names_q}; do
+    if [ -d "$BASE/$name" ] && [ -f "$STAMPS/$name" ]; then
+        echo "STAMP $name $(head -c 64 "$STAMPS/$name")"
+    fi
+done
+"""
+
+
+def parse_stamps(stdout: str) -> dict[str, str]:
+    """``{name: sha}`` from :func:`render_fetch_script` output."""
+    return {m.group("name"): m.group("hash") for m in _STAMP_LINE.finditer(stdout)}
+
+
+def render_store_script(kind: str, stamps: dict[str, str]) -> str:
+    """Bash writing ``stamps`` (name → sha) under :func:`stamp_dir`."""
+    lines = ["set -eu", f"mkdir -p {shlex.quote(stamp_dir(kind))}"]
+    for name, sha in stamps.items():
+        if not _SAFE_NAME.fullmatch(name) or not _HEX64.fullmatch(sha):
+            continue
+        path = shlex.quote(f"{stamp_dir(kind)}/{name}")
+        lines.append(f"echo {sha} > {path}")
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "REMOTE_STAMPS_DIR",
+    "parse_stamps",
+    "render_fetch_script",
+    "render_store_script",
+    "stamp_dir",
+    "tree_hash",
+]
@@ -3,7 +3,8 @@
 :class:`TofuRunner` is a thin typed wrapper around ``tofu output``
 with explicit per-call default handling: callers pass ``default=...``
 to opt into the silent-fallback semantic, omit it to require a
-successful read.
+successful read. All outputs come from one cached ``tofu output
+-json`` call per runner.
 
 ``TofuRunner`` also carries :meth:`TofuRunner.state_list_ok` and
 :meth:`TofuRunner.diagnose_state` for the pre-flight ``tofu state
@@ -44,10 +45,71 @@ class TofuRunner:
     The default ``tofu_dir`` is ``tofu/stack`` (the canonical state
     directory). Pass an explicit path for tests or when wrapping the
     secondary ``tofu/control-plane`` state.
+
+    Output reads are served from ONE ``tofu output -json`` call (every
+    output in a single document), made on first use and cached for the
+    runner's lifetime. Each ``tofu output`` spawn re-initialises the R2
+    backend and downloads the state, so the pipeline's seven reads used
+    to cost seven state downloads. A failed fetch is cached too: every
+    read then takes its own default-or-raise path, exactly as if its
+    own ``tofu output`` had failed. Call :meth:`refresh` after anything
+    that changes the state (``tofu apply``) to re-read it.
     """
 
     def __init__(self, tofu_dir: Path = Path("tofu/stack")) -> None:
         self.tofu_dir = tofu_dir
+        self._outputs: dict[str, Any] | None = None
+        self._fetch_error: str | None = None
+        # The exception behind ``_fetch_error`` (when there was one), so
+        # the TofuError raised on a later read keeps tofu's stderr as
+        # its ``__cause__`` like a direct ``tofu output`` call would.
+        self._fetch_exc: Exception | None = None
+
+    def refresh(self) -> None:
+        """Drop the cached outputs; the next read runs ``tofu output`` again."""
+        self._outputs = None
+        self._fetch_error = None
+        self._fetch_exc = None
+
+    def _lookup(self, name: str) -> tuple[bool, Any, str]:
+        """``(found, value, failure)`` for ``name`` from the cached document.
+
+        ``failure`` is ``"failed"`` (tofu missing / non-zero exit /
+        output not defined) or ``"non-JSON"`` (unparseable stdout), for
+        the caller's error message; empty when found.
+        """
+        if self._outputs is None and self._fetch_error is None:
+            self._fetch_all()
+        if self._outputs is None:
+            return False, None, self._fetch_error or "failed"
+        entry = self._outputs.get(name)
+        if not isinstance(entry, dict) or "value" not in entry:
+            return False, None, "failed"
+        return True, entry["value"], ""
+
+    def _fetch_all(self) -> None:
+        try:
+            completed = subprocess.run(
+                ["tofu", "output", "-json"],
+                cwd=self.tofu_dir,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError) as exc:
+            self._fetch_error = "failed"
+            self._fetch_exc = exc
+            return
+        try:
+            document = json.loads(completed.stdout)
+        except json.JSONDecodeError as exc:
+            self._fetch_error = "non-JSON"
+            self._fetch_exc = exc
+            return
+        if not isinstance(document, dict):
+            self._fetch_error = "non-JSON"
+            return
+        self._outputs = document
 
     @overload
     def output_raw(self, name: str) -> str: ...
@@ -55,23 +117,20 @@ class TofuRunner:
     def output_raw(self, name: str, *, default: str) -> str: ...
 
     def output_raw(self, name: str, *, default: Any = _MISSING) -> str:
-        """``tofu output -raw <name>``.
+        """``tofu output -raw <name>``, served from the cached document.
 
         Pass ``default=""`` for the silent-fallback semantic; omit
         ``default`` to make a missing/erroring output raise
-        :class:`TofuError`.
+        :class:`TofuError`. Like ``-raw`` itself, only strings, numbers
+        and bools have a raw form; lists/maps/null count as failures.
         """
-        try:
-            completed = subprocess.run(
-                ["tofu", "output", "-raw", name],
-                cwd=self.tofu_dir,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except (FileNotFoundError, subprocess.CalledProcessError) as exc:
+        found, value, _failure = self._lookup(name)
+        raw = _raw_form(value) if found else None
+        if raw is None:
             if default is _MISSING:
-                raise TofuError(f"tofu output -raw {name} failed in {self.tofu_dir}") from exc
+                raise TofuError(
+                    f"tofu output -raw {name} failed in {self.tofu_dir}"
+                ) from self._fetch_exc
             return str(default)
         # Strip trailing newlines to match the POSIX $(...) command-
         # substitution semantic that callers expect: $() removes ALL
@@ -79,7 +138,7 @@ class TofuRunner:
         # lands without the `\n`. Returning raw stdout would diverge
         # subtly: `f"http://{server_ip}/api"` becomes
         # `"http://1.2.3.4\n/api"` — silent breakage downstream.
-        return completed.stdout.rstrip("\n")
+        return raw.rstrip("\n")
 
     @overload
     def output_json(self, name: str) -> Any: ...
@@ -87,31 +146,23 @@ class TofuRunner:
     def output_json(self, name: str, *, default: Any) -> Any: ...
 
     def output_json(self, name: str, *, default: Any = _MISSING) -> Any:
-        """``tofu output -json <name>``, parsed.
+        """``tofu output -json <name>``, served from the cached document.
 
         Three failure modes are collapsed into ``default`` when
-        provided: tofu binary missing, tofu exited non-zero, stdout
-        not valid JSON. Without ``default`` any of those raise
-        :class:`TofuError`.
+        provided: tofu binary missing, tofu exited non-zero (or the
+        output isn't defined), stdout not valid JSON. Without
+        ``default`` any of those raise :class:`TofuError`.
         """
-        try:
-            completed = subprocess.run(
-                ["tofu", "output", "-json", name],
-                cwd=self.tofu_dir,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except (FileNotFoundError, subprocess.CalledProcessError) as exc:
-            if default is _MISSING:
-                raise TofuError(f"tofu output -json {name} failed in {self.tofu_dir}") from exc
-            return default
-        try:
-            return json.loads(completed.stdout)
-        except json.JSONDecodeError as exc:
-            if default is _MISSING:
-                raise TofuError(f"tofu output -json {name} returned non-JSON stdout") from exc
+        found, value, failure = self._lookup(name)
+        if found:
+            return value
+        if default is not _MISSING:
             return default
+        if failure == "non-JSON":
+            raise TofuError(
+                f"tofu output -json {name} returned non-JSON stdout"
+            ) from self._fetch_exc
+        raise TofuError(f"tofu output -json {name} failed in {self.tofu_dir}") from self._fetch_exc
 
     def state_list_ok(self) -> bool:
         """Return True iff ``tofu state list`` exits 0.
@@ -165,6 +216,17 @@ class TofuRunner:
         return f"state list failed (rc={completed.returncode})"
 
 
+def _raw_form(value: Any) -> str | None:
+    """What ``tofu output -raw`` prints for ``value``; None where it errors."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return json.dumps(value)
+    return None
+
+
 @dataclass(frozen=True)
 class R2Credentials:
     """Parsed contents of ``tofu/.r2-credentials``.
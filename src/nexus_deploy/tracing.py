@@ -0,0 +1,201 @@
+"""Wall-clock spans for a deploy run, exported as a Chrome trace.
+
+``PhaseResult`` used to carry only status + detail, so there was no
+way to tell whether a slow spin-up spent its time in ssh round-trips,
+rsync, remote bash or local rendering. While a :func:`session` is
+active, the deploy records **spans** at three levels:
+
+* **pipeline** — the top-level steps of :func:`pipeline.run_pipeline`
+  (tofu pre-flight + outputs, wait-for-ssh, the two s3-restore halves,
+  pre-bootstrap, run-all).
+* **phase** — every orchestrator phase, recorded by the phase
+  scheduler in the thread that ran it, so parallel phases show up as
+  parallel tracks.
+* **transport** / **render** / **parse** — every ``ssh`` / ``rsync``
+  subprocess (recorded at the same choke point as the ControlMaster
+  call timings, :func:`_remote.record_call`) plus the render → remote
+  → parse steps of the remote-script modules.
+
+At the end of the run the session writes a Chrome trace-event JSON
+file (``{"traceEvents": [...]}``). It loads as-is in Perfetto
+(ui.perfetto.dev) and ``chrome://tracing``. The spin-up workflow sets
+``NEXUS_TRACE_FILE`` and uploads the file as a build artifact, so
+deploy latency can be compared across runs.
+
+Without an active session every hook is a single ``None`` check: no
+clock reads, no allocation. Recording is thread-safe because phases
+run on a thread pool.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Span:
+    """One finished span. ``start`` / ``end`` are ``time.monotonic()`` values."""
+
+    name: str
+    cat: str
+    start: float
+    end: float
+    thread_id: int
+    thread_name: str
+    args: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def duration_s(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class Tracer:
+    """Collects :class:`Span` records for one run."""
+
+    origin: float = field(default_factory=time.monotonic)
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    spans: list[Span] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, name: str, cat: str, start: float, end: float, args: dict[str, str]) -> None:
+        thread = threading.current_thread()
+        span = Span(name, cat, start, end, threading.get_ident(), thread.name, args)
+        with self._lock:
+            self.spans.append(span)
+
+    def to_chrome_trace(self) -> dict[str, object]:
+        """Trace-event JSON: one complete (``X``) event per span.
+
+        Thread ids are renumbered 1..n in order of first appearance
+        (the main thread is normally 1) and named via ``thread_name``
+        metadata events.
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: (s.start, -s.end))
+        tids: dict[int, int] = {}
+        events: list[dict[str, object]] = [
+            {"ph": "M", "name": "process_name", "pid": 1, "args": {"name": "nexus-deploy"}},
+        ]
+        for span in spans:
+            if span.thread_id not in tids:
+                tids[span.thread_id] = len(tids) + 1
+                events.append(
+                    {
+                        "ph": "M",
+                        "name": "thread_name",
+                        "pid": 1,
+                        "tid": tids[span.thread_id],
+                        "args": {"name": span.thread_name},
+                    }
+                )
+            events.append(
+                {
+                    "ph": "X",
+                    "name": span.name,
+                    "cat": span.cat,
+                    "pid": 1,
+                    "tid": tids[span.thread_id],
+                    "ts": round((span.start - self.origin) * 1_000_000),
+                    "dur": round(span.duration_s * 1_000_000),
+                    "args": span.args,
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at": self.started_at.isoformat(timespec="seconds")},
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()) + "\n", encoding="utf-8")
+
+
+# The active tracer. Module-global rather than a ContextVar on purpose:
+# phase-scheduler worker threads must record into the same tracer, and
+# a ContextVar set on the main thread isn't visible from a pool thread.
+_ACTIVE: Tracer | None = None
+
+
+def active() -> Tracer | None:
+    """The tracer of the running :func:`session`, if any."""
+    return _ACTIVE
+
+
+def record(name: str, cat: str, started: float, **args: str) -> None:
+    """Record a span from ``started`` (``time.monotonic()``) to now.
+
+    For call sites that already time themselves. No-op without an
+    active session.
+    """
+    tracer = _ACTIVE
+    if tracer is not None:
+        tracer.add(name, cat, started, time.monotonic(), args)
+
+
+@contextlib.contextmanager
+def span(name: str, cat: str = "pipeline", **args: str) -> Iterator[None]:
+    """Record the enclosed block as a span (also when it raises)."""
+    tracer = _ACTIVE
+    if tracer is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        tracer.add(name, cat, started, time.monotonic(), args)
+
+
+@contextlib.contextmanager
+def session(path: Path | None) -> Iterator[Tracer | None]:
+    """Activate a tracer for the block and write it to ``path`` on exit.
+
+    ``path=None`` disables tracing (yields None). The trace is written
+    even when the block raises — a failed deploy is the one we most
+    want to look at. A write failure is only a warning: the trace is
+    diagnostic, never a reason to fail a deploy.
+    """
+    global _ACTIVE
+    if path is None:
+        yield None
+        return
+    tracer = Tracer()
+    previous, _ACTIVE = _ACTIVE, tracer
+    try:
+        yield tracer
+    finally:
+        _ACTIVE = previous
+        try:
+            tracer.write(path)
+        except OSError as exc:
+            sys.stderr.write(f"  ⚠ trace: could not write {path} ({type(exc).__name__})\n")
+        else:
+            sys.stderr.write(f"  → trace: {len(tracer.spans)} span(s) written to {path}\n")
+
+
+def path_from_env() -> Path | None:
+    """``NEXUS_TRACE_FILE`` as a path; None (tracing off) when unset/empty."""
+    raw = os.environ.get("NEXUS_TRACE_FILE", "").strip()
+    return Path(raw) if raw else None
+
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "active",
+    "path_from_env",
+    "record",
+    "session",
+    "span",
+]
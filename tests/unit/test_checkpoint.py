@@ -0,0 +1,104 @@
+"""Tests for nexus_deploy.checkpoint."""
+
+from __future__ import annotations
+
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+from nexus_deploy.checkpoint import CheckpointJournal, inputs_hash, journal_path
+
+
+def test_inputs_hash_is_separator_safe() -> None:
+    assert inputs_hash("ab", "c") != inputs_hash("a", "bc")
+    assert inputs_hash("a", "b") == inputs_hash("a", "b")
+
+
+def test_record_persists_and_load_roundtrips(tmp_path: Path) -> None:
+    path = tmp_path / "journal.json"
+    journal = CheckpointJournal(path)
+    journal.record(
+        "gitea_configure",
+        inputs="h1",
+        outputs={"gitea_token": "tok", "restart_services": ["jupyter"]},
+        name="gitea-configure",
+        detail="ok",
+    )
+    loaded = CheckpointJournal.load(path)
+    assert loaded is not None
+    assert loaded.run_id == journal.run_id
+    entry = loaded.lookup("gitea_configure", "h1")
+    assert entry is not None
+    assert entry.outputs == {"gitea_token": "tok", "restart_services": ["jupyter"]}
+    assert entry.name == "gitea-configure"
+
+
+def test_journal_is_private(tmp_path: Path) -> None:
+    path = tmp_path / "journal.json"
+    CheckpointJournal(path).save()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_lookup_misses_on_changed_inputs(tmp_path: Path) -> None:
+    journal = CheckpointJournal(tmp_path / "j.json")
+    journal.record("seed", inputs="old", outputs={}, name="seed", detail="")
+    assert journal.lookup("seed", "new") is None
+    assert journal.lookup("other", "old") is None
+
+
+def test_load_missing_returns_none(tmp_path: Path) -> None:
+    assert CheckpointJournal.load(tmp_path / "absent.json") is None
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "not json",
+        json.dumps({"version": 999, "run_id": "x", "phases": {}}),
+        json.dumps({"version": 1, "run_id": "x", "phases": {"seed": {"bogus": 1}}}),
+    ],
+)
+def test_load_ignores_unusable_journal(
+    tmp_path: Path, body: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "j.json"
+    path.write_text(body)
+    assert CheckpointJournal.load(path) is None
+    assert "checkpoint: ignoring" in capsys.readouterr().err
+
+
+def test_discard_tolerates_missing_file(tmp_path: Path) -> None:
+    journal = CheckpointJournal(tmp_path / "j.json")
+    journal.save()
+    journal.discard()
+    journal.discard()
+    assert not journal.path.exists()
+
+
+def test_journal_path_is_outside_the_checkout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path / "runner"))
+    root = tmp_path / "checkout"
+    path = journal_path(root)
+    assert path.parent == tmp_path / "state" / "nexus-deploy"
+    assert root not in path.parents
+    assert journal_path(tmp_path / "other") != path
+    assert journal_path(root) == path
+
+
+def test_journal_path_falls_back_to_runner_temp(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("XDG_STATE_HOME", raising=False)
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path / "runner"))
+    assert journal_path(tmp_path).parent == tmp_path / "runner" / "nexus-deploy"
+
+
+def test_save_creates_a_private_state_dir(tmp_path: Path) -> None:
+    path = tmp_path / "state" / "nexus-deploy" / "j.json"
+    CheckpointJournal(path).save()
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
@@ -0,0 +1,99 @@
+"""Import budget per subcommand of ``python -m nexus_deploy``.
+
+``__main__`` imports each subcommand's dependencies inside its handler
+(see ``_COMMANDS``). These tests run real invocations under
+``python -X importtime`` and pin, per subcommand, which heavy modules
+must NOT be loaded — deterministic, unlike wall-clock thresholds, and
+exactly what catches a stray module-level import.
+
+Every invocation is side-effect free: ``--version``, or a usage error
+that exits 2 after the handler's imports but before any I/O.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+_LINE = re.compile(r"^import time:\s+\d+ \|\s+\d+ \| \s*(\S+)$")
+
+_HEAVY = frozenset(
+    {
+        "requests",
+        "pydantic",
+        "nexus_deploy.config",
+        "nexus_deploy.orchestrator",
+        "nexus_deploy.pipeline",
+        "nexus_deploy.gitea",
+        "nexus_deploy.kestra",
+        "nexus_deploy.infisical",
+    }
+)
+
+
+def _importtime(*args: str) -> tuple[int, set[str]]:
+    """Run the CLI; return (rc, names of every module it imported)."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("NEXUS_")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "nexus_deploy", *args],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        env=env,
+        timeout=60,
+        check=False,
+    )
+    modules = {
+        match.group(1) for match in map(_LINE.match, proc.stderr.splitlines()) if match is not None
+    }
+    return proc.returncode, modules
+
+
+@pytest.mark.parametrize(
+    ("args", "rc", "allowed"),
+    [
+        (("--version",), 0, frozenset()),
+        (("hello",), 0, frozenset()),
+        (
+            ("config", "dump-shell", "--bogus"),
+            2,
+            frozenset({"pydantic", "nexus_deploy.config"}),
+        ),
+        (("stack-sync",), 2, frozenset()),
+        (("select-capacity",), 2, frozenset()),
+        (("run-pipeline", "--bogus"), 2, _HEAVY),
+    ],
+    ids=lambda v: " ".join(v) if isinstance(v, tuple) else None,
+)
+def test_subcommand_import_budget(args: tuple[str, ...], rc: int, allowed: frozenset[str]) -> None:
+    returncode, modules = _importtime(*args)
+    assert returncode == rc
+    assert "nexus_deploy" in modules
+    assert sorted((_HEAVY - allowed) & modules) == []
+
+
+def test_importing_main_loads_no_heavy_module() -> None:
+    """Plain ``import nexus_deploy.__main__`` — no handler runs at all."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, nexus_deploy.__main__; print('\\n'.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    assert sorted(_HEAVY & set(proc.stdout.splitlines())) == []
+
+
+def test_run_pipeline_does_load_the_deploy_stack() -> None:
+    # Guards the budget test above: if the handler stopped importing
+    # its dependencies, the "forbidden" checks would pass vacuously.
+    _, modules = _importtime("run-pipeline", "--bogus")
+    assert {"requests", "nexus_deploy.pipeline", "nexus_deploy.orchestrator"} <= modules
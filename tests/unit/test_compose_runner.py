@@ -10,16 +10,21 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 from nexus_deploy.compose_runner import (
     ComposeUpResult,
+    ServiceBuild,
+    StackTiming,
     expand_targets,
+    load_stack_weights,
     parse_result,
     render_remote_script,
     run_compose_up,
+    stack_builds,
 )
 
 # ---------------------------------------------------------------------------
@@ -117,54 +122,119 @@ def test_round_2_firewall_override_check_present() -> None:
 
 
 def test_round_3_parallel_deploy_via_background_jobs() -> None:
-    """R3 — leaf compose-up runs in background; PIDs collected for `wait`."""
+    """R3 — compose-up runs in background; exit codes come back per job."""
     script = _render_default(leaves=["jupyter", "marimo"])
     # Background-jobs marker
-    assert "&\n" in script
+    assert ") &\n" in script
     # PID collection
-    assert "PIDS+=($!)" in script
-    # Wait loop
-    assert 'wait "$pid"' in script
+    assert "PIDS[$i]=$!" in script
+    # Completion report + reap
+    assert 'echo "$i $rc" >&3' in script
+    assert "read -r i rc <&3" in script
+    assert 'wait "${PIDS[$i]}"' in script
 
 
-def test_round_4_docker_ps_verification_via_bash_exec() -> None:
+def test_render_weights_and_budget() -> None:
+    script = _render_default(leaves=["kestra", "marimo"], weights={"kestra": 3}, max_weight=5)
+    assert "MAX_WEIGHT=5" in script
+    assert "declare -A WEIGHTS=([kestra]=3 [marimo]=1)" in script
+    with pytest.raises(ValueError, match="max_weight"):
+        _render_default(max_weight=0)
+
+
+def _ps_docker(tmp_path: Path, ps_output: str) -> dict[str, str]:
+    """``compose up`` succeeds; ``docker ps -a`` prints ``ps_output``.
+
+    ``ps_output`` uses the snapshot's ``Names<TAB>State<TAB>Status``
+    format; every ``ps`` call is logged so tests can count snapshots.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (tmp_path / "ps.txt").write_text(ps_output)
+    docker = bin_dir / "docker"
+    docker.write_text(
+        "#!/usr/bin/env bash\n"
+        'if [ "$1" = ps ]; then\n'
+        f"  echo ps >> {tmp_path / 'ps.log'}\n"
+        f"  cat {tmp_path / 'ps.txt'}\n"
+        "fi\n"
+    )
+    docker.chmod(0o755)
+    return {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"}
+
+
+def _run_stacks(
+    tmp_path: Path, names: list[str], env: dict[str, str], **kwargs: Any
+) -> ComposeUpResult:
+    stacks = tmp_path / "stacks"
+    for name in names:
+        (stacks / name).mkdir(parents=True, exist_ok=True)
+        (stacks / name / "docker-compose.yml").write_text("services: {}\n")
+    script = render_remote_script(
+        parents=[],
+        leaves=names,
+        stacks_dir=str(stacks),
+        global_env=str(tmp_path / "global.env"),
+        **kwargs,
+    )
+    completed = subprocess.run(
+        ["bash", "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    result = parse_result(completed.stdout)
+    assert result is not None
+    return result
+
+
+@pytest.mark.parametrize(
+    ("ps_names", "name", "expected"),
+    [
+        (["foo", "bar", "baz"], "foo", True),
+        (["foo-bar", "foo-baz"], "foo", False),  # substring → must NOT match
+        ([], "foo", False),
+        (["foo"], "FOO", False),  # case-sensitive
+        # Regex-metachar safety: `foo.bar` must not match `fooXbar`
+        # the way a `^foo.bar$` pattern would.
+        (["fooXbar"], "foo.bar", False),
+        (["foo.bar"], "foo.bar", True),
+    ],
+)
+def test_round_4_docker_ps_verification_via_bash_exec(
+    tmp_path: Path, ps_names: list[str], name: str, expected: bool
+) -> None:
     """R4 — `docker ps` verification logic, executed via bash.
 
     Modul-2.0 lesson: dispatch logic that LOOKS right but behaves
-    wrong (e.g. grep matching substrings instead of exact names) is
-    a real risk. We extract the verification snippet and run it
-    against six scenarios.
-
-    Round-3 finding: switched from `grep -q "^name$"` (regex anchors)
-    to `grep -qFx -- "name"` (fixed-string + line-exact + arg-end
-    sentinel) so that container names containing regex metacharacters
-    (`.`, `[`, `*`) can't false-match. The two new cases at the bottom
-    pin this — they would have failed under the old regex form.
+    wrong (e.g. matching substrings instead of exact names) is a real
+    risk. The snapshot is looked up by exact container name, so these
+    six scenarios (originally pinned against `grep -qFx`) run through
+    the whole rendered script.
     """
-    cases = [
-        # (docker_ps_output, target_name, expected_match)
-        ("foo\nbar\nbaz\n", "foo", True),
-        ("foo-bar\nfoo-baz\n", "foo", False),  # substring → must NOT match
-        ("\n", "foo", False),
-        ("foo\n", "FOO", False),  # case-sensitive
-        # Regex-metachar safety (round-3 fix). Under the old
-        # `^name$` regex, `foo.bar` as a pattern would match `fooXbar`
-        # because `.` is "any char". Fixed-string `grep -F` rejects.
-        ("fooXbar\n", "foo.bar", False),
-        # Exact-match still works with fixed-string + metachar in name
-        ("foo.bar\n", "foo.bar", True),
-    ]
-    for ps_output, name, expected in cases:
-        snippet = f"""
-set -euo pipefail
-printf '%s' {shlex_quote(ps_output)} | grep -qFx -- {shlex_quote(name)} && echo match || echo nomatch
-"""
-        out = subprocess.run(
-            ["bash", "-c", snippet], capture_output=True, text=True, check=False
-        ).stdout.strip()
-        assert (out == "match") is expected, (
-            f"ps={ps_output!r} name={name!r} expected={expected} got={out!r}"
-        )
+    ps_output = "".join(f"{n}\trunning\tUp 3 seconds\n" for n in ps_names)
+    result = _run_stacks(tmp_path, [name], _ps_docker(tmp_path, ps_output))
+    assert (result.started == 1) is expected
+
+
+def test_verification_reports_health_and_rejects_exited(tmp_path: Path) -> None:
+    ps_output = (
+        "a\trunning\tUp 9 seconds (healthy)\n"
+        "b\trunning\tUp 9 seconds (unhealthy)\n"
+        "c\trunning\tUp 2 seconds (health: starting)\n"
+        "d\texited\tExited (1) 3 seconds ago\n"
+        "e\trunning\tUp 9 seconds\n"
+    )
+    env = _ps_docker(tmp_path, ps_output)
+    result = _run_stacks(tmp_path, ["a", "b", "c", "d", "e"], env, max_weight=5)
+    assert (result.started, result.failed) == (4, 1)
+    assert {t.service: (t.status, t.health) for t in result.stacks} == {
+        "a": ("started", "healthy"),
+        "b": ("started", "unhealthy"),
+        "c": ("started", "starting"),
+        "d": ("failed", "none"),
+        "e": ("started", "none"),
+    }
+    assert (result.healthy, result.unhealthy) == (1, 1)
+    # One snapshot per reap pass, never one per stack and probe.
+    assert (tmp_path / "ps.log").read_text().count("ps") <= 5
 
 
 def shlex_quote(s: str) -> str:
@@ -265,6 +335,299 @@ def test_compose_up_result_is_success() -> None:
     assert ComposeUpResult(started=5, failed=2).is_success is False
 
 
+def test_parse_result_collects_stack_timings() -> None:
+    out = (
+        "STACK kestra status=started wait_ms=0 up_ms=5200 health=healthy\n"
+        "  ✗ trino compose up failed (rc=1)\n"
+        "STACK trino status=failed wait_ms=5201 up_ms=800\n"
+        "RESULT started=1 failed=1"
+    )
+    result = parse_result(out)
+    assert result is not None
+    assert result.stacks == (
+        StackTiming("kestra", "started", 0, 5200, health="healthy"),
+        StackTiming("trino", "failed", 5201, 800),
+    )
+    assert result.stacks[1].latency_ms == 6001
+
+
+def test_load_stack_weights(tmp_path: Path) -> None:
+    services = tmp_path / "services.yaml"
+    services.write_text(
+        "services:\n"
+        "  jupyter: {image: x}\n"
+        "  kestra: {compose_weight: 3, support_images: {postgres: p}}\n"
+        "  openmetadata: {support_images: {a: a, b: b, c: c}}\n"
+        "  odd: {compose_weight: 0}\n"
+    )
+    assert load_stack_weights(services) == {
+        "jupyter": 1,
+        "kestra": 3,
+        "openmetadata": 4,
+        "odd": 1,
+    }
+    assert load_stack_weights(tmp_path / "missing.yaml") == {}
+
+
+def test_load_stack_weights_invalid_yaml_warns(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    services = tmp_path / "services.yaml"
+    services.write_text("services: [unclosed\n")
+    assert load_stack_weights(services) == {}
+    assert "compose weights: cannot read" in capsys.readouterr().err
+
+
+def test_repo_services_yaml_weights_heavy_stacks() -> None:
+    weights = load_stack_weights(Path(__file__).parents[2] / "services.yaml")
+    assert weights["kestra"] >= 3
+    assert weights["trino"] >= 3
+    assert weights["openmetadata"] >= 4
+    assert weights["jupyter"] == 1
+
+
+def test_parse_result_with_skipped() -> None:
+    out = "RESULT started=1 failed=0 skipped=3"
+    assert parse_result(out) == ComposeUpResult(started=1, failed=0, skipped=3)
+
+
+# ---------------------------------------------------------------------------
+# skip_unchanged — input-hash stamps, exec'd against a fake docker
+# ---------------------------------------------------------------------------
+
+
+def test_skip_unchanged_off_renders_no_stamp_logic() -> None:
+    script = _render_default()
+    assert "STAMPS_DIR" not in script
+    assert "skipped=" not in script
+
+
+def _fake_docker(tmp_path: Path) -> dict[str, str]:
+    """``docker compose up`` records the stack dir name; ``docker ps`` lists them."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    running = tmp_path / "running"
+    running.touch()
+    docker = bin_dir / "docker"
+    docker.write_text(
+        "#!/usr/bin/env bash\n"
+        f'if [ "$1" = ps ]; then sort -u {running} | sed "s/$/\\trunning\\tUp/"; exit 0; fi\n'
+        f'basename "$PWD" >> {running}\n'
+        f"echo up >> {tmp_path / 'ups'}\n"
+    )
+    docker.chmod(0o755)
+    return {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"}
+
+
+def test_skip_unchanged_skips_second_run_until_compose_changes(tmp_path: Path) -> None:
+    stacks = tmp_path / "stacks"
+    (stacks / "jupyter").mkdir(parents=True)
+    compose = stacks / "jupyter" / "docker-compose.yml"
+    compose.write_text("services: {jupyter: {image: x}}\n")
+    env = _fake_docker(tmp_path)
+    script = render_remote_script(
+        parents=[],
+        leaves=["jupyter"],
+        stacks_dir=str(stacks),
+        global_env=str(tmp_path / "global.env"),
+        skip_unchanged=True,
+        stamps_dir=str(tmp_path / "stamps"),
+    )
+
+    def run() -> tuple[int, int, int]:
+        completed = subprocess.run(
+            ["bash", "-c", script], capture_output=True, text=True, check=True, env=env
+        )
+        result = parse_result(completed.stdout)
+        assert result is not None
+        return result.started, result.failed, result.skipped
+
+    assert run() == (1, 0, 0)
+    assert run() == (0, 0, 1)
+    compose.write_text("services: {jupyter: {image: y}}\n")
+    assert run() == (1, 0, 0)
+    assert (tmp_path / "ups").read_text().count("up") == 2
+
+
+def _slow_docker(tmp_path: Path) -> dict[str, str]:
+    """``compose up`` sleeps while tracking how many run at once; ``d`` fails."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    state = tmp_path / "state"
+    state.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(
+        "#!/usr/bin/env bash\n"
+        f'if [ "$1" = ps ]; then cat {state}/up-* 2>/dev/null | sed "s/$/\\trunning\\tUp/"; exit 0; fi\n'
+        'n=$(basename "$PWD")\n'
+        f"touch {state}/running-$n\n"
+        f"ls {state} | grep -c '^running-' >> {tmp_path / 'concurrency'}\n"
+        "sleep 0.2\n"
+        f"rm {state}/running-$n\n"
+        '[ "$n" = d ] && exit 3\n'
+        f"echo $n > {state}/up-$n\n"
+    )
+    docker.chmod(0o755)
+    return {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"}
+
+
+def test_scheduler_never_exceeds_weight_budget(tmp_path: Path) -> None:
+    stacks = tmp_path / "stacks"
+    names = ["a", "b", "c", "d", "e", "f"]
+    for name in names:
+        (stacks / name).mkdir(parents=True)
+        (stacks / name / "docker-compose.yml").write_text("services: {}\n")
+    env = _slow_docker(tmp_path)
+    script = render_remote_script(
+        parents=[],
+        leaves=names,
+        stacks_dir=str(stacks),
+        global_env=str(tmp_path / "global.env"),
+        # "c" is heavier than the whole budget → must run alone.
+        weights={"a": 1, "b": 1, "c": 5, "d": 1, "e": 1, "f": 1},
+        max_weight=2,
+    )
+    completed = subprocess.run(
+        ["bash", "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    result = parse_result(completed.stdout)
+    assert result is not None
+    assert (result.started, result.failed) == (5, 1)
+    assert sorted(t.service for t in result.stacks) == names
+    assert {t.service for t in result.stacks if t.status == "failed"} == {"d"}
+    concurrency = [int(n) for n in (tmp_path / "concurrency").read_text().split()]
+    assert max(concurrency) == 2
+    timings = {t.service: t for t in result.stacks}
+    # "c" waited for a + b and everything after it waited for "c".
+    assert timings["c"].wait_ms >= timings["a"].up_ms
+    assert timings["d"].wait_ms >= timings["c"].wait_ms + timings["c"].up_ms
+
+
+# ---------------------------------------------------------------------------
+# Build-input hashing — skip `--build` when the image label matches
+# ---------------------------------------------------------------------------
+
+
+def _build_stack(root: Path, name: str, compose: str) -> Path:
+    stack = root / name
+    stack.mkdir(parents=True)
+    (stack / "docker-compose.yml").write_text(compose)
+    (stack / "Dockerfile").write_text("FROM python:3.13-slim\n")
+    return stack
+
+
+def test_stack_builds_hashes_context_and_shares_image_hash(tmp_path: Path) -> None:
+    dagster = _build_stack(
+        tmp_path,
+        "dagster",
+        "services:\n"
+        "  web: {build: ., image: '${IMAGE_DAGSTER:-nexus-dagster:1}'}\n"
+        "  daemon: {build: ., image: '${IMAGE_DAGSTER:-nexus-dagster:1}'}\n"
+        "  db: {image: postgres:16-alpine}\n",
+    )
+    _build_stack(
+        tmp_path, "soda", "services:\n  soda: {build: {context: ., dockerfile: Dockerfile}}\n"
+    )
+    _build_stack(tmp_path, "remote", "services:\n  x: {build: 'https://example.com/repo.git'}\n")
+    (tmp_path / "plain").mkdir()
+    (tmp_path / "plain" / "docker-compose.yml").write_text("services: {a: {image: a}}\n")
+
+    builds = stack_builds(tmp_path, ["dagster", "soda", "remote", "plain", "absent"])
+    assert sorted(builds) == ["dagster", "soda"]
+    (web,) = builds["dagster"]
+    assert web.image == "nexus-dagster:1"
+    assert web.services == ("web", "daemon")
+    assert builds["soda"][0].image == "soda-soda"
+
+    pinned = stack_builds(tmp_path, ["dagster"], {"dagster": "nexus-dagster:2"})["dagster"][0]
+    assert pinned.image == "nexus-dagster:2"
+    assert pinned.hash != web.hash
+
+    (dagster / "requirements.txt").write_text("dagster==1.12\n")
+    assert stack_builds(tmp_path, ["dagster"])["dagster"][0].hash != web.hash
+
+
+def test_render_without_builds_always_passes_build_flag() -> None:
+    script = _render_default()
+    assert "BUILD_CHECKS" not in script
+    assert "local files=() build=(--build)" in script
+    assert 'up -d "${build[@]}"' in script
+
+
+def _labelling_docker(tmp_path: Path) -> dict[str, str]:
+    """Fake docker whose builds store the label from the override file.
+
+    ``image inspect`` prints the stored label of the image (named
+    after its stack in these tests); ``compose`` logs its args.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    store = tmp_path / "labels"
+    store.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(
+        "#!/usr/bin/env bash\n"
+        f'if [ "$1" = ps ]; then ls {store} | sed "s/$/\\trunning\\tUp/"; exit 0; fi\n'
+        'if [ "$1 $2" = "image inspect" ]; then\n'
+        f'  cat {store}/"${{@: -1}}" 2>/dev/null || exit 1\n'
+        "  exit 0\n"
+        "fi\n"
+        'n=$(basename "$PWD")\n'
+        f'echo "$*" >> {tmp_path / "compose.log"}\n'
+        'prev=""\n'
+        'for a in "$@"; do\n'
+        '  if [ "$prev" = -f ] && [[ "$a" == /* ]]; then\n'
+        f'    grep -oE "[0-9a-f]{{64}}" "$a" | head -1 > {store}/"$n"\n'
+        "  fi\n"
+        "  prev=$a\n"
+        "done\n"
+        f'[ -f {store}/"$n" ] || touch {store}/"$n"\n'
+    )
+    docker.chmod(0o755)
+    return {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"}
+
+
+def test_build_skipped_while_image_label_matches(tmp_path: Path) -> None:
+    local = tmp_path / "local"
+    stack = _build_stack(local, "jupyter", "services:\n  jupyter: {build: ., image: jupyter}\n")
+    server = tmp_path / "server"
+    (server / "jupyter").mkdir(parents=True)
+    (server / "jupyter" / "docker-compose.yml").write_text("services: {}\n")
+    env = _labelling_docker(tmp_path)
+
+    def run() -> str:
+        script = render_remote_script(
+            parents=[],
+            leaves=["jupyter"],
+            stacks_dir=str(server),
+            global_env=str(tmp_path / "global.env"),
+            builds=stack_builds(local, ["jupyter"]),
+        )
+        completed = subprocess.run(
+            ["bash", "-c", script], capture_output=True, text=True, check=True, env=env
+        )
+        result = parse_result(completed.stdout)
+        assert result is not None
+        assert result.started == 1
+        return (tmp_path / "compose.log").read_text().splitlines()[-1]
+
+    first = run()
+    assert first.startswith("compose -f docker-compose.yml -f /")
+    assert first.endswith("up -d --build")
+    assert run() == "compose up -d"
+    (stack / "Dockerfile").write_text("FROM python:3.14-slim\n")
+    assert run().endswith("up -d --build")
+    assert run() == "compose up -d"
+
+
+def test_render_build_override_labels_every_service() -> None:
+    builds = {"dagster": (ServiceBuild("nexus-dagster:1", "a" * 64, ("web", "daemon")),)}
+    script = _render_default(leaves=["dagster"], builds=builds)
+    assert "[dagster]='nexus-dagster:1 " + "a" * 64 + "'" in script
+    assert '"web": {"build": {"labels": {"org.nexus-stack.build-hash": "' + "a" * 64 in script
+    assert '"daemon": {"build"' in script
+
+
 # ---------------------------------------------------------------------------
 # run_compose_up — orchestration
 # ---------------------------------------------------------------------------
@@ -433,10 +796,10 @@ def test_compose_up_cli_rc_mapping(
     """Verify the rc=0/1/2 contract via direct `_compose_up` call."""
     from nexus_deploy.__main__ import _compose_up
 
-    def fake_run(_enabled: list[str]) -> ComposeUpResult:
+    def fake_run(_enabled: list[str], **_kw: object) -> ComposeUpResult:
         return ComposeUpResult(started=started, failed=failed)
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_compose_up", fake_run)
+    monkeypatch.setattr("nexus_deploy.compose_runner.run_compose_up", fake_run)
     rc = _compose_up(["up", "--enabled", "jupyter,marimo"])
     assert rc == expected_rc
 
@@ -449,10 +812,10 @@ def test_compose_up_cli_rc2_on_unexpected_exception(
     in stderr; no str/repr that could leak attribute values."""
     from nexus_deploy.__main__ import _compose_up
 
-    def boom(_enabled: list[str]) -> ComposeUpResult:
+    def boom(_enabled: list[str], **_kw: object) -> ComposeUpResult:
         raise RuntimeError("secret-bearing-message-NEVER-print")
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_compose_up", boom)
+    monkeypatch.setattr("nexus_deploy.compose_runner.run_compose_up", boom)
     rc = _compose_up(["up", "--enabled", "jupyter"])
     assert rc == 2
     captured = capsys.readouterr()
@@ -467,10 +830,10 @@ def test_compose_up_cli_rc2_on_transport_failure(
     """ssh/rsync failure → rc=2. exc.cmd must NOT leak to stderr."""
     from nexus_deploy.__main__ import _compose_up
 
-    def boom(_enabled: list[str]) -> ComposeUpResult:
+    def boom(_enabled: list[str], **_kw: object) -> ComposeUpResult:
         raise subprocess.CalledProcessError(255, ["ssh", "with-secret-arg"])
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_compose_up", boom)
+    monkeypatch.setattr("nexus_deploy.compose_runner.run_compose_up", boom)
     rc = _compose_up(["up", "--enabled", "jupyter"])
     assert rc == 2
     captured = capsys.readouterr()
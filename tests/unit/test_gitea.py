@@ -21,6 +21,8 @@ import json
 import re
 import subprocess
 import sys
+import threading
+from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -45,6 +47,7 @@ from nexus_deploy.gitea import (
     _render_db_pw_sync_script,
     _sanitize_user_for_fork_name,
     _validate_path_segment,
+    _wait_mirror_sync,
     run_configure_gitea,
     run_mirror_setup,
     run_woodpecker_oauth_setup,
@@ -395,6 +398,61 @@ def test_with_token_rejects_empty_token() -> None:
         _client().with_token("")
 
 
+def test_with_token_shares_the_pooled_session() -> None:
+    base = _client()
+    assert base.with_token("tok")._session is base._session
+
+
+def test_context_manager_closes_the_pooled_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[bool] = []
+    with _client("tok") as client:
+        monkeypatch.setattr(client._session, "close", lambda: closed.append(True))
+    assert closed == [True]
+
+
+@responses.activate
+def test_woodpecker_oauth_closes_its_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[GiteaClient] = []
+    monkeypatch.setattr(GiteaClient, "close", lambda self: closed.append(self))
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/user/applications/oauth2",
+        status=500,
+    )
+    run_woodpecker_oauth_setup(
+        base_url=BASE_URL,
+        domain="example.com",
+        gitea_token="tok",
+        admin_username="admin",
+    )
+    assert len(closed) == 1
+
+
+@responses.activate
+def test_idempotent_call_retries_transient_5xx() -> None:
+    url = f"{BASE_URL}/api/v1/repos/a/b"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, status=200)
+    assert _client("tok").repo_exists("a", "b") is True
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_post_is_not_retried_on_5xx() -> None:
+    responses.add(responses.POST, f"{BASE_URL}/api/v1/user/repos", status=503)
+    result = _client("tok").create_repo("r")
+    assert result.status == "failed"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_wait_ready_probe_bypasses_adapter_retries() -> None:
+    responses.add(responses.GET, f"{BASE_URL}/api/healthz", status=503)
+    responses.add(responses.GET, f"{BASE_URL}/api/healthz", status=200)
+    assert _client().wait_ready(timeout_s=0.01, interval_s=0.05) is False
+    assert len(responses.calls) == 1
+
+
 @responses.activate
 def test_wait_ready_returns_true_on_200() -> None:
     responses.add(responses.GET, f"{BASE_URL}/api/healthz", status=200)
@@ -1329,7 +1387,7 @@ def test_round_8_cli_emits_eval_able_stdout(
     def fake_run(*_args: Any, **_kwargs: Any) -> GiteaResult:
         return fake_result
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_configure_gitea", fake_run)
+    monkeypatch.setattr("nexus_deploy.gitea.run_configure_gitea", fake_run)
     monkeypatch.setattr(
         "sys.stdin.read",
         lambda: json.dumps(
@@ -1352,7 +1410,7 @@ def test_round_8_cli_emits_eval_able_stdout(
     fake_pf_cm.__enter__ = MagicMock(return_value=12345)
     fake_pf_cm.__exit__ = MagicMock(return_value=None)
     fake_ssh.port_forward = MagicMock(return_value=fake_pf_cm)
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda host: fake_ssh)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda host: fake_ssh)
 
     from nexus_deploy.__main__ import _gitea_configure
 
@@ -1393,7 +1451,7 @@ def test_round_8_cli_omits_token_line_when_token_none(
         restart_services=("jupyter",),
     )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_configure_gitea", lambda *a, **k: fake_result)
+    monkeypatch.setattr("nexus_deploy.gitea.run_configure_gitea", lambda *a, **k: fake_result)
     monkeypatch.setattr("sys.stdin.read", lambda: '{"gitea_admin_password": "x"}')
     monkeypatch.setenv("ADMIN_EMAIL", "a@b.c")
     monkeypatch.setenv("REPO_NAME", "nexus-foo")
@@ -1407,7 +1465,7 @@ def test_round_8_cli_omits_token_line_when_token_none(
     fake_pf.__enter__ = MagicMock(return_value=12345)
     fake_pf.__exit__ = MagicMock(return_value=None)
     fake_ssh.port_forward = MagicMock(return_value=fake_pf)
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda host: fake_ssh)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda host: fake_ssh)
 
     from nexus_deploy.__main__ import _gitea_configure
 
@@ -2138,7 +2196,7 @@ def _setup_fake_ssh(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     fake_pf.__enter__ = MagicMock(return_value=12345)
     fake_pf.__exit__ = MagicMock(return_value=None)
     fake_ssh.port_forward = MagicMock(return_value=fake_pf)
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda host: fake_ssh)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda host: fake_ssh)
     return fake_ssh
 
 
@@ -2154,7 +2212,7 @@ def test_cli_woodpecker_oauth_emits_eval_able_stdout_on_success(
         name="Woodpecker CI", client_id="client-abc", client_secret="secret-xyz"
     )
     monkeypatch.setattr(
-        "nexus_deploy.__main__.run_woodpecker_oauth_setup",
+        "nexus_deploy.gitea.run_woodpecker_oauth_setup",
         lambda **kwargs: (fake_result, "", True),
     )
 
@@ -2175,7 +2233,7 @@ def test_cli_woodpecker_oauth_returns_rc_1_on_failure_with_diagnostic(
     _setup_fake_ssh(monkeypatch)
 
     monkeypatch.setattr(
-        "nexus_deploy.__main__.run_woodpecker_oauth_setup",
+        "nexus_deploy.gitea.run_woodpecker_oauth_setup",
         lambda **kwargs: (None, "list_oauth_apps: HTTP 503", False),
     )
 
@@ -2210,7 +2268,7 @@ def test_cli_woodpecker_oauth_returns_rc_2_on_rotation_half_complete(
     _setup_fake_ssh(monkeypatch)
 
     monkeypatch.setattr(
-        "nexus_deploy.__main__.run_woodpecker_oauth_setup",
+        "nexus_deploy.gitea.run_woodpecker_oauth_setup",
         lambda **kwargs: (None, "create_oauth_app: HTTP 503", True),  # rotation_started=True
     )
 
@@ -2254,7 +2312,7 @@ def test_cli_woodpecker_oauth_eval_handoff_safe_with_shell_meta(
         client_secret=adversarial_secret,
     )
     monkeypatch.setattr(
-        "nexus_deploy.__main__.run_woodpecker_oauth_setup",
+        "nexus_deploy.gitea.run_woodpecker_oauth_setup",
         lambda **kwargs: (fake_result, "", True),
     )
 
@@ -2316,7 +2374,7 @@ def test_cli_woodpecker_oauth_ssh_tunnel_failure_returns_rc_2(
         def port_forward(self, *_a: Any, **_k: Any) -> Any:
             raise SSHError("ssh tunnel boom")
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _BoomSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _BoomSSH)
 
     from nexus_deploy.__main__ import _gitea_woodpecker_oauth
 
@@ -2339,7 +2397,7 @@ def test_cli_woodpecker_oauth_unexpected_exception_returns_rc_2(
     def boom(**_kwargs: Any) -> Any:
         raise RuntimeError(secret_in_msg)
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_woodpecker_oauth_setup", boom)
+    monkeypatch.setattr("nexus_deploy.gitea.run_woodpecker_oauth_setup", boom)
 
     from nexus_deploy.__main__ import _gitea_woodpecker_oauth
 
@@ -3258,6 +3316,212 @@ def test_run_mirror_setup_user_token_failure_marks_fork_failed() -> None:
     assert len(fork_calls) == 0
 
 
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+_T1 = datetime(2026, 1, 1, 0, 0, 1, tzinfo=UTC)
+
+
+@responses.activate
+def test_get_mirror_updated_reads_stamp_and_server_clock() -> None:
+    url = f"{BASE_URL}/api/v1/repos/admin/m"
+    date = {"Date": "Thu, 01 Jan 2026 00:00:01 GMT"}
+    responses.add(responses.GET, url, json={"mirror_updated": "2026-01-01T00:00:00Z"}, headers=date)
+    responses.add(responses.GET, url, json={"name": "m"})
+    responses.add(responses.GET, url, status=500)
+    client = _client("tok")
+    assert client.get_mirror_updated("admin", "m") == (_T0, _T1)
+    assert client.get_mirror_updated("admin", "m")[0] is None
+    assert client.get_mirror_updated("admin", "m") == (None, None)
+
+
+def _sync_client(stamps: list[datetime | None], shas: list[str | None]) -> MagicMock:
+    client = MagicMock()
+    client.get_mirror_updated.side_effect = [(stamp, None) for stamp in stamps]
+    client.get_branch_head_sha.side_effect = shas
+    return client
+
+
+@pytest.mark.parametrize(
+    ("before_sha", "after_sha", "outcome"),
+    [("aaa", "bbb", "landed"), ("aaa", "aaa", "unchanged")],
+)
+def test_wait_mirror_sync_returns_when_stamp_reaches_baseline(
+    before_sha: str, after_sha: str, outcome: str
+) -> None:
+    client = _sync_client([_T0, _T1], [after_sha])
+    result = _wait_mirror_sync(
+        client,
+        "admin",
+        "m",
+        "main",
+        before_sha=before_sha,
+        baseline=_T1,
+        timeout_s=30.0,
+        max_interval_s=0.01,
+    )
+    assert result == (outcome, after_sha)
+    # HEAD is read once, after completion — no polling on the SHA.
+    assert client.get_branch_head_sha.call_count == 1
+
+
+def test_wait_mirror_sync_counts_a_fetch_within_the_baseline_second() -> None:
+    """One-second stamps: a fetch finishing in the trigger's second is done."""
+    client = _sync_client([_T1.replace(microsecond=400_000)], ["aaa"])
+    result = _wait_mirror_sync(
+        client,
+        "admin",
+        "m",
+        "main",
+        before_sha="aaa",
+        baseline=_T1,
+        timeout_s=30.0,
+        max_interval_s=0.01,
+    )
+    assert result == ("unchanged", "aaa")
+
+
+def test_wait_mirror_sync_falls_back_to_head_without_baseline() -> None:
+    client = _sync_client([], ["aaa", "bbb"])
+    result = _wait_mirror_sync(
+        client,
+        "admin",
+        "m",
+        "main",
+        before_sha="aaa",
+        baseline=None,
+        timeout_s=30.0,
+        max_interval_s=0.01,
+    )
+    assert result == ("landed", "bbb")
+    client.get_mirror_updated.assert_not_called()
+
+
+def test_wait_mirror_sync_times_out() -> None:
+    client = MagicMock()
+    client.get_mirror_updated.return_value = (_T0, None)
+    result = _wait_mirror_sync(
+        client,
+        "admin",
+        "m",
+        "main",
+        before_sha="aaa",
+        baseline=_T1,
+        timeout_s=0.05,
+        max_interval_s=0.01,
+    )
+    assert result == ("timeout", None)
+    client.get_branch_head_sha.assert_not_called()
+
+
+@responses.activate
+def test_run_mirror_setup_migrates_concurrently_in_list_order() -> None:
+    """Migrates overlap (all three wait on one barrier) and results keep
+    the GH_MIRROR_REPOS order with per-mirror timing."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def migrate(request: requests.PreparedRequest) -> tuple[int, dict[str, str], str]:
+        barrier.wait()
+        return 201, {}, json.dumps({"id": 10})
+
+    responses.add(responses.GET, f"{BASE_URL}/api/v1/users/admin", status=200, json={"id": 1})
+    for name in ("a", "b", "c"):
+        responses.add(
+            responses.GET, f"{BASE_URL}/api/v1/repos/admin/mirror-readonly-{name}", status=404
+        )
+    responses.add_callback(responses.POST, f"{BASE_URL}/api/v1/repos/migrate", callback=migrate)
+
+    result = run_mirror_setup(
+        base_url=BASE_URL,
+        admin_username="admin",
+        admin_password="admin-pw",
+        gitea_token="admin-tok",
+        gitea_user_username=None,
+        gh_mirror_repos=[f"https://github.com/o/{n}.git" for n in ("a", "b", "c")],
+        gh_mirror_token="ghp",
+        workspace_branch="main",
+        mirror_workers=3,
+    )
+    assert [m.name for m in result.mirrors] == [
+        "mirror-readonly-a",
+        "mirror-readonly-b",
+        "mirror-readonly-c",
+    ]
+    assert all(m.status == "created" for m in result.mirrors)
+    assert all(m.ms >= 0 for m in result.mirrors)
+    assert result.fork is None
+    assert result.is_success is True
+
+
+@responses.activate
+def test_run_mirror_setup_forks_first_successful_mirror_after_pool() -> None:
+    """First mirror fails its migrate → the fork lands on the second."""
+    responses.add(responses.GET, f"{BASE_URL}/api/v1/users/admin", status=200, json={"id": 1})
+    for name in ("bad", "good"):
+        responses.add(
+            responses.GET, f"{BASE_URL}/api/v1/repos/admin/mirror-readonly-{name}", status=404
+        )
+
+    def migrate(request: requests.PreparedRequest) -> tuple[int, dict[str, str], str]:
+        body = json.loads(request.body or "{}")
+        if body["repo_name"] == "mirror-readonly-bad":
+            return 500, {}, ""
+        return 201, {}, json.dumps({"id": 10})
+
+    responses.add_callback(responses.POST, f"{BASE_URL}/api/v1/repos/migrate", callback=migrate)
+    responses.add(
+        responses.PUT,
+        f"{BASE_URL}/api/v1/repos/admin/mirror-readonly-good/collaborators/stefan",
+        status=204,
+    )
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/api/v1/users/stefan/tokens",
+        status=201,
+        json={"sha1": "user-tok"},
+    )
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/api/v1/repos/admin/mirror-readonly-good/forks",
+        status=202,
+    )
+    responses.add(
+        responses.DELETE,
+        f"{BASE_URL}/api/v1/users/stefan/tokens/nexus-workspace-fork",
+        status=204,
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/repos/admin/mirror-readonly-good/branches/main",
+        status=404,
+    )
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/api/v1/repos/admin/mirror-readonly-good/mirror-sync",
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/api/v1/repos/stefan/good_stefan/merge-upstream",
+        status=200,
+    )
+
+    result = run_mirror_setup(
+        base_url=BASE_URL,
+        admin_username="admin",
+        admin_password="admin-pw",
+        gitea_token="admin-tok",
+        gitea_user_username="stefan",
+        gh_mirror_repos=["https://github.com/o/bad.git", "https://github.com/o/good.git"],
+        gh_mirror_token="ghp",
+        workspace_branch="main",
+        mirror_sync_poll_seconds=0.0,
+    )
+    assert [m.status for m in result.mirrors] == ["failed", "created"]
+    assert result.fork is not None
+    assert (result.fork.name, result.fork.status) == ("good_stefan", "created")
+    assert result.collaborator_added_count == 1
+    assert result.fork_synced is True
+
+
 # ---------------------------------------------------------------------------
 # CLI handler for `gitea mirror-setup`
 # ---------------------------------------------------------------------------
@@ -3362,7 +3626,7 @@ def test_cli_mirror_setup_emits_fork_name_and_owner_on_success(
         collaborator_added_count=1,
         fork_synced=True,
     )
-    monkeypatch.setattr("nexus_deploy.__main__.run_mirror_setup", lambda **kwargs: fake_result)
+    monkeypatch.setattr("nexus_deploy.gitea.run_mirror_setup", lambda **kwargs: fake_result)
 
     from nexus_deploy.__main__ import _gitea_mirror_setup
 
@@ -3396,7 +3660,7 @@ def test_cli_mirror_setup_omits_stdout_when_no_fork(
         collaborator_added_count=0,
         fork_synced=False,
     )
-    monkeypatch.setattr("nexus_deploy.__main__.run_mirror_setup", lambda **kwargs: fake_result)
+    monkeypatch.setattr("nexus_deploy.gitea.run_mirror_setup", lambda **kwargs: fake_result)
 
     from nexus_deploy.__main__ import _gitea_mirror_setup
 
@@ -3429,7 +3693,7 @@ def test_cli_mirror_setup_admin_uid_none_404_returns_rc_1(
         collaborator_added_count=0,
         fork_synced=False,
     )
-    monkeypatch.setattr("nexus_deploy.__main__.run_mirror_setup", lambda **kwargs: fake_result)
+    monkeypatch.setattr("nexus_deploy.gitea.run_mirror_setup", lambda **kwargs: fake_result)
 
     from nexus_deploy.__main__ import _gitea_mirror_setup
 
@@ -3465,7 +3729,7 @@ def test_cli_mirror_setup_admin_uid_lookup_failure_surfaces_diagnostic(
         collaborator_added_count=0,
         fork_synced=False,
     )
-    monkeypatch.setattr("nexus_deploy.__main__.run_mirror_setup", lambda **kwargs: fake_result)
+    monkeypatch.setattr("nexus_deploy.gitea.run_mirror_setup", lambda **kwargs: fake_result)
 
     from nexus_deploy.__main__ import _gitea_mirror_setup
 
@@ -3498,7 +3762,7 @@ def test_cli_mirror_setup_ssh_tunnel_failure_returns_rc_2(
         def port_forward(self, *_a: Any, **_k: Any) -> Any:
             raise SSHError("ssh tunnel boom")
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _BoomSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _BoomSSH)
 
     from nexus_deploy.__main__ import _gitea_mirror_setup
 
@@ -3613,7 +3877,7 @@ def test_cli_ssh_tunnel_failure_returns_rc_2(
         def port_forward(self, *_a: Any, **_k: Any) -> Any:
             raise SSHError("ssh tunnel boom")
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _BoomSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _BoomSSH)
 
     from nexus_deploy.__main__ import _gitea_configure
 
@@ -3640,14 +3904,14 @@ def test_cli_unexpected_exception_returns_rc_2(
     fake_pf.__enter__ = MagicMock(return_value=12345)
     fake_pf.__exit__ = MagicMock(return_value=None)
     fake_ssh.port_forward = MagicMock(return_value=fake_pf)
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda host: fake_ssh)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda host: fake_ssh)
 
     secret_in_message = "do-not-leak-secret-XYZZY"
 
     def boom(*_a: Any, **_k: Any) -> Any:
         raise RuntimeError(secret_in_message)
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_configure_gitea", boom)
+    monkeypatch.setattr("nexus_deploy.gitea.run_configure_gitea", boom)
 
     from nexus_deploy.__main__ import _gitea_configure
 
@@ -3675,12 +3939,12 @@ def test_cli_transport_failure_returns_rc_2(
     fake_pf.__enter__ = MagicMock(return_value=12345)
     fake_pf.__exit__ = MagicMock(return_value=None)
     fake_ssh.port_forward = MagicMock(return_value=fake_pf)
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda host: fake_ssh)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda host: fake_ssh)
 
     def boom(*_a: Any, **_k: Any) -> Any:
         raise subprocess.CalledProcessError(255, ["ssh", "secret-arg"])
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_configure_gitea", boom)
+    monkeypatch.setattr("nexus_deploy.gitea.run_configure_gitea", boom)
 
     from nexus_deploy.__main__ import _gitea_configure
 
@@ -0,0 +1,236 @@
+"""Tests for nexus_deploy.image_prepull.
+
+Pure image-resolution tests plus an exec'd-bash run of the rendered
+pull script against a fake ``docker`` on PATH.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from nexus_deploy.image_prepull import (
+    ImagePull,
+    PrePullResult,
+    collect_images,
+    interpolate,
+    parse_image_versions,
+    parse_result,
+    read_dotenv,
+    render_remote_script,
+    run_prepull,
+)
+
+# ---------------------------------------------------------------------------
+# Pure logic
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("${IMAGE_A:-a:1}", "a:2"),
+        ("${IMAGE_MISSING:-fallback:1}", "fallback:1"),
+        ("${EMPTY:-fallback:1}", "fallback:1"),
+        ("${EMPTY-fallback:1}", ""),
+        ("${IMAGE_MISSING}", ""),
+        ("${IMAGE_MISSING:?must be set}", ""),
+        ("$IMAGE_A", "a:2"),
+        ("registry/$${literal}", "registry/${literal}"),
+        ("plain:tag", "plain:tag"),
+    ],
+)
+def test_interpolate(value: str, expected: str) -> None:
+    assert interpolate(value, {"IMAGE_A": "a:2", "EMPTY": ""}) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('{"jupyter": "1.0"}', {"jupyter": "1.0"}),
+        (None, {}),
+        ("", {}),
+        ("{not json", {}),
+        ('["jupyter"]', {}),
+    ],
+)
+def test_parse_image_versions(raw: str | None, expected: dict[str, object]) -> None:
+    assert parse_image_versions(raw) == expected
+
+
+def test_read_dotenv(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nA=1\nexport B='two words'\nnot-a-pair\nC=\"3\"\n")
+    assert read_dotenv(env_file) == {"A": "1", "B": "two words", "C": "3"}
+    assert read_dotenv(tmp_path / "missing") == {}
+
+
+def _stack(root: Path, name: str, compose: str, env: str = "") -> None:
+    (root / name).mkdir(parents=True)
+    (root / name / "docker-compose.yml").write_text(compose)
+    if env:
+        (root / name / ".env").write_text(env)
+
+
+def test_collect_images_resolves_dedupes_and_skips_builds(tmp_path: Path) -> None:
+    _stack(
+        tmp_path,
+        "kestra",
+        "services:\n"
+        "  kestra: {image: '${IMAGE_KESTRA:-kestra/kestra:old}'}\n"
+        "  db: {image: 'postgres:16-alpine'}\n",
+    )
+    _stack(
+        tmp_path,
+        "redpanda",
+        "services:\n  broker: {image: '${REDPANDA_IMAGE:-redpanda:default}'}\n",
+        env="REDPANDA_IMAGE=redpanda:from-env\n",
+    )
+    _stack(
+        tmp_path,
+        "spark",
+        "services:\n"
+        "  master: {build: ., image: nexus-spark:local}\n"
+        "  db: {image: 'postgres:16-alpine'}\n",
+    )
+    _stack(tmp_path, "broken", "services: [unclosed\n")
+
+    images = collect_images(
+        tmp_path,
+        ["kestra", "redpanda", "spark", "broken", "absent"],
+        {"kestra": "kestra/kestra:v1.0"},
+    )
+    assert images == [
+        "kestra/kestra:v1.0",
+        "postgres:16-alpine",
+        "redpanda:from-env",
+    ]
+
+
+def test_collect_images_global_pin_beats_stack_env(tmp_path: Path) -> None:
+    _stack(
+        tmp_path,
+        "wikijs",
+        "services:\n  app: {image: '${IMAGE_WIKIJS:-wiki:default}'}\n",
+        env="IMAGE_WIKIJS=wiki:stack\n",
+    )
+    assert collect_images(tmp_path, ["wikijs"], {"wikijs": "wiki:pinned"}) == ["wiki:pinned"]
+
+
+def test_parse_result() -> None:
+    out = (
+        "PULL postgres:16-alpine status=present ms=0 bytes=0\n"
+        "  ⚠ docker pull bad:1 failed\n"
+        "PULL bad:1 status=failed ms=120 bytes=0\n"
+        "PULL kestra/kestra:v1.0 status=pulled ms=9000 bytes=734003200\n"
+        "RESULT pulled=1 present=1 failed=1\n"
+    )
+    result = parse_result(out)
+    assert result is not None
+    assert (result.pulled, result.present, result.failed) == (1, 1, 1)
+    assert result.images[2] == ImagePull("kestra/kestra:v1.0", "pulled", 9000, 734003200)
+    assert parse_result("garbage") is None
+
+
+def test_render_rejects_zero_workers() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        render_remote_script(["a"], workers=0)
+
+
+# ---------------------------------------------------------------------------
+# exec'd bash against a fake docker
+# ---------------------------------------------------------------------------
+
+
+def _fake_docker(tmp_path: Path) -> dict[str, str]:
+    """``image inspect`` succeeds for pulled images; ``pull`` of ``bad:*`` fails."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    store = tmp_path / "store"
+    store.mkdir()
+    (store / "present_1").write_text("")
+    docker = bin_dir / "docker"
+    docker.write_text(
+        "#!/usr/bin/env bash\n"
+        'key=$(printf %s "${@: -1}" | tr -c "A-Za-z0-9\\n" _)\n'
+        'if [ "$1 $2" = "image inspect" ]; then\n'
+        f'  [ -f {store}/"$key" ] || exit 1\n'
+        '  [ "$3" = --format ] && echo 1048576\n'
+        "  exit 0\n"
+        "fi\n"
+        'if [ "$1" = pull ]; then\n'
+        f"  echo pull >> {tmp_path / 'pulls'}\n"
+        '  case "${@: -1}" in bad:*) exit 1 ;; esac\n'
+        f'  touch {store}/"$key"\n'
+        "fi\n"
+    )
+    docker.chmod(0o755)
+    return {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"}
+
+
+def test_pull_script_pulls_missing_skips_present(tmp_path: Path) -> None:
+    env = _fake_docker(tmp_path)
+    script = render_remote_script(["present:1", "new:1", "new:2", "bad:1"], workers=2)
+    completed = subprocess.run(
+        ["bash", "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    result = parse_result(completed.stdout)
+    assert result is not None
+    assert (result.pulled, result.present, result.failed) == (2, 1, 1)
+    statuses = {p.image: (p.status, p.bytes) for p in result.images}
+    assert statuses == {
+        "present:1": ("present", 0),
+        "new:1": ("pulled", 1048576),
+        "new:2": ("pulled", 1048576),
+        "bad:1": ("failed", 0),
+    }
+    assert (tmp_path / "pulls").read_text().count("pull") == 3
+    assert "docker pull bad:1 failed" in completed.stderr
+
+
+def test_pull_script_with_no_images(tmp_path: Path) -> None:
+    completed = subprocess.run(
+        ["bash", "-c", render_remote_script([])],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_fake_docker(tmp_path),
+    )
+    assert parse_result(completed.stdout) == PrePullResult(pulled=0, present=0, failed=0)
+
+
+# ---------------------------------------------------------------------------
+# run_prepull
+# ---------------------------------------------------------------------------
+
+
+def _runner(stdout: str) -> Callable[[str], subprocess.CompletedProcess[str]]:
+    def run(_script: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args=["ssh"], returncode=0, stdout=stdout, stderr="")
+
+    return run
+
+
+def test_run_prepull_reports_slowest_first(capsys: pytest.CaptureFixture[str]) -> None:
+    out = (
+        "PULL small:1 status=pulled ms=1000 bytes=2048\n"
+        "PULL big:1 status=pulled ms=42000 bytes=1610612736\n"
+        "PULL cached:1 status=present ms=0 bytes=0\n"
+        "RESULT pulled=2 present=1 failed=0\n"
+    )
+    result = run_prepull(["small:1", "big:1", "cached:1"], script_runner=_runner(out))
+    assert result.is_success
+    err = capsys.readouterr().err
+    assert err.index("big:1 in 42.0s (1.50 GB)") < err.index("small:1 in 1.0s (2.0 KB)")
+    assert "cached:1" not in err
+    assert "PULL " not in err
+    assert "RESULT" not in err
+
+
+def test_run_prepull_without_result_counts_all_failed() -> None:
+    result = run_prepull(["a", "b"], script_runner=_runner("bash: oops\n"))
+    assert result == PrePullResult(pulled=0, present=0, failed=2)
@@ -572,6 +572,102 @@ def test_bootstrap_runs_ssh_loop_with_token(tmp_path: Path) -> None:
     assert "/opt/docker-server/.infisical-token" in cmd
 
 
+# ---------------------------------------------------------------------------
+# bootstrap(stream=True) — framed ndjson on the script's stdin
+# ---------------------------------------------------------------------------
+
+
+def test_encode_stream_frames() -> None:
+    client = InfisicalClient("p", "dev", "tok")
+    folders = [FolderSpec("a", {"X": "multi\nline"}), FolderSpec("b", {"Y": "2"})]
+    lines = client.encode_stream(folders).splitlines()
+    assert lines[0] == "BEGIN 2"
+    assert lines[-1] == "END"
+    assert [line[:2] for line in lines[1:-1]] == ["F ", "F ", "S ", "S "]
+    assert json.loads(lines[1][2:]) == folders[0].folder_payload("p", "dev")
+    # Embedded newline stays escaped inside its frame.
+    assert json.loads(lines[3][2:]) == folders[0].secrets_payload("p", "dev")
+
+
+_FAKE_INFISICAL_CURL = """#!/usr/bin/env bash
+body=$(cat)
+for a in "$@"; do case "$a" in http*) url="$a" ;; esac; done
+printf '%s %s\\n' "$url" "$body" >> "$CURL_LOG"
+case "$body" in
+    *FAILME*) printf '{"error":"nope"}' ;;
+    *)        printf '{}' ;;
+esac
+"""
+
+
+def _exec_stream_loop(tmp_path: Path, stdin: str) -> tuple[str, list[str]]:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "curl").write_text(_FAKE_INFISICAL_CURL, encoding="utf-8")
+    (bin_dir / "curl").chmod(0o755)
+    log = tmp_path / "curl.log"
+    log.touch()
+    completed = subprocess.run(
+        ["bash", "-s"],
+        input=stdin.replace("/opt/docker-server/.infisical-token", "/nonexistent"),
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PATH": f"{bin_dir}:{os.environ.get('PATH', '')}", "CURL_LOG": str(log)},
+    )
+    return completed.stdout, log.read_text(encoding="utf-8").splitlines()
+
+
+def test_stream_loop_posts_folders_then_patches_via_bash_exec(tmp_path: Path) -> None:
+    client = InfisicalClient("p", "dev", "tok")
+    folders = [FolderSpec("a", {"X": "1"}), FolderSpec("b", {"Y": "FAILME"})]
+    out, calls = _exec_stream_loop(
+        tmp_path, client._build_remote_stream_loop() + client.encode_stream(folders)
+    )
+    assert out.strip().splitlines()[-1] == "1:1"
+    urls = [call.split(" ", 1)[0] for call in calls]
+    assert urls == [
+        "http://localhost:8070/api/v2/folders",
+        "http://localhost:8070/api/v2/folders",
+        "http://localhost:8070/api/v4/secrets/batch",
+        "http://localhost:8070/api/v4/secrets/batch",
+    ]
+    assert json.loads(calls[2].split(" ", 1)[1]) == folders[0].secrets_payload("p", "dev")
+
+
+def test_stream_loop_counts_truncated_stream_as_failures(tmp_path: Path) -> None:
+    client = InfisicalClient("p", "dev", "tok")
+    folders = [FolderSpec("a", {"X": "1"}), FolderSpec("b", {"Y": "2"})]
+    document = client.encode_stream(folders).splitlines()
+    # Stream cut after the first PATCH frame: no second S, no END.
+    cut = "\n".join(document[:4]) + "\n"
+    out, _calls = _exec_stream_loop(tmp_path, client._build_remote_stream_loop() + cut)
+    assert out.strip().splitlines()[-1] == "1:1"
+
+
+def test_bootstrap_stream_skips_push_dir_and_rsync(tmp_path: Path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_ssh(script: str) -> subprocess.CompletedProcess[str]:
+        captured["script"] = script
+        return subprocess.CompletedProcess(args=["ssh"], returncode=0, stdout="1:0", stderr="")
+
+    def no_rsync(_local: Path, _remote: str) -> subprocess.CompletedProcess[str]:
+        raise AssertionError("stream mode must not rsync")
+
+    push_dir = tmp_path / "push"
+    client = InfisicalClient("p", "dev", "real-token", push_dir=push_dir)
+    result = client.bootstrap(
+        [FolderSpec("k", {"X": "v"})], ssh_runner=fake_ssh, rsync_runner=no_rsync, stream=True
+    )
+    assert result == BootstrapResult(folders_built=1, pushed=1, failed=0)
+    assert not push_dir.exists()
+    script, _, document = captured["script"].partition("main; exit $?\n")
+    assert "real-token" in script
+    assert "infisical-push" not in script
+    assert document.splitlines()[0] == "BEGIN 1"
+
+
 # ---------------------------------------------------------------------------
 # CLI: `nexus-deploy infisical bootstrap`
 # ---------------------------------------------------------------------------
@@ -706,7 +802,7 @@ def test_cli_infisical_bootstrap_unexpected_exception_returns_2(
     def boom(*_args: Any, **_kwargs: Any) -> Any:
         raise KeyError(secret_payload)
 
-    monkeypatch.setattr("nexus_deploy.__main__.compute_folders", boom)
+    monkeypatch.setattr("nexus_deploy.infisical.compute_folders", boom)
     monkeypatch.setattr(sys, "argv", ["nexus-deploy", "infisical", "bootstrap"])
     monkeypatch.setattr(sys, "stdin", _StubStdin("{}"))
     monkeypatch.setenv("PROJECT_ID", "p")
@@ -1014,8 +1110,8 @@ def test_cli_infisical_provision_admin_returns_1_when_creds_dropped(
 
     monkeypatch.setenv("ADMIN_EMAIL", "ops@example.com")
     monkeypatch.setenv("INFISICAL_PASS", "pw")
-    monkeypatch.setattr(main_mod, "SSHClient", _FakeSSH)
-    monkeypatch.setattr(main_mod, "provision_admin", _fake_provision)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _FakeSSH)
+    monkeypatch.setattr("nexus_deploy.infisical.provision_admin", _fake_provision)
 
     rc = main_mod._infisical_provision_admin([])
     assert rc == 1, "loaded-existing without credentials must be soft-fail"
@@ -1065,8 +1161,8 @@ def test_cli_infisical_provision_admin_returns_0_with_full_creds(
 
     monkeypatch.setenv("ADMIN_EMAIL", "ops@example.com")
     monkeypatch.setenv("INFISICAL_PASS", "pw")
-    monkeypatch.setattr(main_mod, "SSHClient", _FakeSSH)
-    monkeypatch.setattr(main_mod, "provision_admin", _fake_provision)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _FakeSSH)
+    monkeypatch.setattr("nexus_deploy.infisical.provision_admin", _fake_provision)
 
     rc = main_mod._infisical_provision_admin([])
     assert rc == 0
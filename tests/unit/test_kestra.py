@@ -423,6 +423,67 @@ def test_wait_for_execution_handles_kestra_error_then_recovers() -> None:
     assert _client().wait_for_execution("exec-1", timeout_s=5.0, interval_s=0.01) == "SUCCESS"
 
 
+def _sse(*states: str) -> str:
+    return "".join(f"data: {json.dumps({'state': {'current': s}})}\n\n" for s in states)
+
+
+@responses.activate
+def test_follow_execution_yields_transitions_until_terminal() -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/executions/exec-1/follow",
+        status=200,
+        body=": keep-alive\n\n" + _sse("CREATED", "RUNNING", "RUNNING", "SUCCESS", "RUNNING"),
+        content_type="text/event-stream",
+    )
+    states = list(_client().follow_execution("exec-1", timeout_s=5.0))
+    # Duplicate RUNNING collapsed; nothing after the terminal state.
+    assert states == ["CREATED", "RUNNING", "SUCCESS"]
+
+
+@responses.activate
+def test_follow_execution_non_200_raises() -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/executions/exec-1/follow",
+        status=404,
+    )
+    with pytest.raises(KestraError, match="follow_execution HTTP 404"):
+        list(_client().follow_execution("exec-1"))
+
+
+@responses.activate
+def test_wait_for_execution_returns_from_stream_without_polling() -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/executions/exec-1/follow",
+        status=200,
+        body=_sse("RUNNING", "FAILED"),
+        content_type="text/event-stream",
+    )
+    assert _client().wait_for_execution("exec-1", timeout_s=5.0, interval_s=0.01) == "FAILED"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_wait_for_execution_polls_after_stream_closes_early() -> None:
+    """Stream closes before a terminal state → polling finishes the wait."""
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/executions/exec-1/follow",
+        status=200,
+        body=_sse("RUNNING"),
+        content_type="text/event-stream",
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/executions/exec-1",
+        status=200,
+        json={"state": {"current": "SUCCESS"}},
+    )
+    assert _client().wait_for_execution("exec-1", timeout_s=5.0, interval_s=0.01) == "SUCCESS"
+
+
 # ---------------------------------------------------------------------------
 # render_system_flow_yaml + render_system_flows
 # ---------------------------------------------------------------------------
@@ -679,6 +740,71 @@ def test_register_all_system_flows_returns_one_result_per_flow() -> None:
     assert all(r.status == "created" for r in results)
 
 
+_BULK_URL = f"{BASE_URL}/api/v1/flows/bulk"
+
+
+@responses.activate
+def test_register_all_system_flows_uses_one_bulk_request() -> None:
+    responses.add(
+        responses.POST,
+        _BULK_URL,
+        status=200,
+        json=[
+            {"namespace": "system", "id": "git-sync", "revision": 1},
+            {"namespace": "system", "id": "flow-sync", "revision": 4},
+            {"namespace": "system", "id": "flow-export", "revision": 2},
+        ],
+    )
+    flows = render_system_flows(repo_owner="o", repo_name="r", branch="b", admin_username="a")
+    results = register_all_system_flows(_client(), flows)
+
+    assert [(r.name, r.status) for r in results] == [
+        ("system.git-sync", "created"),
+        ("system.flow-sync", "updated"),
+        ("system.flow-export", "updated"),
+    ]
+    assert len(responses.calls) == 1
+    req = responses.calls[0].request
+    # delete=false: the default would drop every other system.* flow.
+    assert "namespace=system" in (req.url or "")
+    assert "delete=false" in (req.url or "")
+    body = req.body.decode() if isinstance(req.body, bytes) else str(req.body)
+    assert body.count("\n---\n") == 2
+    assert "id: flow-export" in body
+
+
+@responses.activate
+def test_register_all_system_flows_falls_back_per_flow_without_bulk() -> None:
+    """Older Kestra: bulk endpoint 404 → POST per flow as before."""
+    responses.add(responses.POST, _BULK_URL, status=404)
+    for _ in range(3):
+        responses.add(responses.POST, f"{BASE_URL}/api/v1/flows", status=201)
+    flows = render_system_flows(repo_owner="o", repo_name="r", branch="b", admin_username="a")
+    results = register_all_system_flows(_client(), flows)
+    assert all(r.status == "created" and r.detail == "POST 201" for r in results)
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_register_all_system_flows_registers_flows_missing_from_bulk_reply() -> None:
+    responses.add(
+        responses.POST,
+        _BULK_URL,
+        status=200,
+        json=[
+            {"namespace": "system", "id": "git-sync", "revision": 1},
+            {"namespace": "system", "id": "flow-sync", "revision": 1},
+        ],
+    )
+    responses.add(responses.POST, f"{BASE_URL}/api/v1/flows", status=422)
+    responses.add(responses.PUT, f"{BASE_URL}/api/v1/flows/system/flow-export", status=200)
+    flows = render_system_flows(repo_owner="o", repo_name="r", branch="b", admin_username="a")
+    results = register_all_system_flows(_client(), flows)
+    assert results[2] == RegisterResult(
+        name="system.flow-export", status="updated", detail="POST 422 → PUT 200"
+    )
+
+
 @responses.activate
 def test_trigger_flow_sync_onboarding_returns_terminal_state() -> None:
     responses.add(
@@ -1383,7 +1509,7 @@ def test_cli_kestra_ssh_tunnel_failure_returns_2(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             raise SSHError("ssh tunnel to local port 8085 did not come up within 10.0s")
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _BoomSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _BoomSSH)
     rc = _kestra_register_system_flows([])
     assert rc == 2
     err = capsys.readouterr().err
@@ -1405,7 +1531,7 @@ def test_cli_kestra_unexpected_exception_returns_2(
     def boom(*_args: Any, **_kwargs: Any) -> None:
         raise RuntimeError("secret-do-not-print")
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", boom)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", boom)
     # Make SSHClient + port_forward succeed so we reach the run call
     from contextlib import contextmanager
 
@@ -1423,7 +1549,7 @@ def test_cli_kestra_unexpected_exception_returns_2(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             yield 8085
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _OkSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _OkSSH)
     rc = _kestra_register_system_flows([])
     assert rc == 2
     err = capsys.readouterr().err
@@ -1450,7 +1576,7 @@ def test_cli_kestra_happy_path_returns_zero(
             execution_state="SUCCESS",
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", fake_run)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", fake_run)
 
     from contextlib import contextmanager
 
@@ -1468,7 +1594,7 @@ def test_cli_kestra_happy_path_returns_zero(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             yield 8085
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _OkSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _OkSSH)
     rc = _kestra_register_system_flows([])
     assert rc == 0
     captured = capsys.readouterr()
@@ -1496,7 +1622,7 @@ def test_cli_kestra_partial_failure_returns_one(
             execution_state=None,
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", fake_run)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", fake_run)
 
     from contextlib import contextmanager
 
@@ -1514,7 +1640,7 @@ def test_cli_kestra_partial_failure_returns_one(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             yield 8085
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _OkSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _OkSSH)
     rc = _kestra_register_system_flows([])
     assert rc == 1
     captured = capsys.readouterr()
@@ -1541,7 +1667,7 @@ def test_cli_kestra_emits_actionable_warning_per_execution_state(
             execution_state="TRIGGER_FAILED",
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", fake_run)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", fake_run)
 
     from contextlib import contextmanager
 
@@ -1559,7 +1685,7 @@ def test_cli_kestra_emits_actionable_warning_per_execution_state(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             yield 8085
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _OkSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _OkSSH)
     rc = _kestra_register_system_flows([])
     assert rc == 1
     err = capsys.readouterr().err
@@ -1589,7 +1715,7 @@ def test_cli_kestra_emits_seed_flow_missing_hint(
             execution_state="SEED_FLOW_MISSING",
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", fake_run)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", fake_run)
 
     from contextlib import contextmanager
 
@@ -1607,7 +1733,7 @@ def test_cli_kestra_emits_seed_flow_missing_hint(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             yield 8085
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _OkSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _OkSSH)
     rc = _kestra_register_system_flows([])
     assert rc == 1
     err = capsys.readouterr().err
@@ -1635,7 +1761,7 @@ def test_cli_kestra_emits_verify_skipped_warning(
             verify_skipped_reason="flow_exists HTTP 503",
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", fake_run)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", fake_run)
 
     from contextlib import contextmanager
 
@@ -1653,7 +1779,7 @@ def test_cli_kestra_emits_verify_skipped_warning(
         def port_forward(self, *_args: Any, **_kwargs: Any) -> Any:
             yield 8085
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _OkSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _OkSSH)
     rc = _kestra_register_system_flows([])
     # SUCCESS is preserved → rc=0 (transient verify failure isn't a deploy failure)
     assert rc == 0
@@ -1700,8 +1826,8 @@ def test_cli_kestra_uses_dynamically_allocated_local_port(monkeypatch: pytest.Mo
             execution_state="SUCCESS",
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _CapturingSSH)
-    monkeypatch.setattr("nexus_deploy.__main__.run_register_system_flows", fake_run)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _CapturingSSH)
+    monkeypatch.setattr("nexus_deploy.kestra.run_register_system_flows", fake_run)
 
     _kestra_register_system_flows([])
     assert len(captured_local_port) == 1
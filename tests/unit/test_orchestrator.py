@@ -14,7 +14,9 @@ not new logic. Focus on:
 
 from __future__ import annotations
 
+import json
 import subprocess
+import time
 from pathlib import Path
 from typing import Any, Literal, cast
 from unittest.mock import MagicMock, patch
@@ -1368,6 +1370,263 @@ def test_run_all_resets_results_between_runs(
     assert len(r2.phases) == 14
 
 
+_RUN_ALL_PHASES = (
+    "_phase_infisical_bootstrap",
+    "_phase_services_configure",
+    "_phase_gitea_configure",
+    "_phase_compose_restart",
+    "_phase_kestra_secret_sync",
+    "_phase_kestra_register",
+    "_phase_seed",
+    "_phase_woodpecker_oauth",
+    "_phase_woodpecker_apply",
+    "_phase_mirror_setup",
+    "_phase_mirror_seed_rerun",
+    "_phase_mirror_finalize",
+    "_phase_secret_sync_jupyter",
+    "_phase_secret_sync_marimo",
+    "_phase_secret_sync_code_server",
+)
+
+
+def _record_phases(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+    names: tuple[str, ...],
+) -> dict[str, tuple[float, float]]:
+    """Stub ``names`` with phases that sleep briefly and record their
+    (start, end) window."""
+    windows: dict[str, tuple[float, float]] = {}
+
+    def make(name: str) -> Any:
+        def phase(*_a: Any) -> PhaseResult:
+            start = time.monotonic()
+            time.sleep(0.01)
+            windows[name] = (start, time.monotonic())
+            return PhaseResult(name=name, status="ok")
+
+        return phase
+
+    for name in names:
+        monkeypatch.setattr(orchestrator, name, make(name))
+    return windows
+
+
+def test_run_all_parallel_respects_declared_dependencies(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", MagicMock())
+    windows = _record_phases(orchestrator, monkeypatch, _RUN_ALL_PHASES)
+    orchestrator.max_parallel_phases = 4
+    result = orchestrator.run_all()
+
+    # Results stay in declared order regardless of completion order.
+    assert [p.name for p in result.phases] == list(_RUN_ALL_PHASES)
+
+    def before(a: str, b: str) -> bool:
+        return windows[f"_phase_{a}"][1] <= windows[f"_phase_{b}"][0]
+
+    assert before("gitea_configure", "compose_restart")
+    assert before("kestra_secret_sync", "kestra_register")
+    assert before("woodpecker_oauth", "woodpecker_apply")
+    assert before("mirror_setup", "mirror_seed_rerun")
+    assert before("mirror_seed_rerun", "mirror_finalize")
+    assert before("compose_restart", "secret_sync_jupyter")
+    assert before("infisical_bootstrap", "secret_sync_marimo")
+    assert result.critical_path
+    assert result.critical_path[-1][0] in {p.name for p in result.phases}
+
+
+def test_run_all_stamps_phase_timestamps_and_traces_phases(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from nexus_deploy import tracing
+
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", MagicMock())
+    windows = _record_phases(orchestrator, monkeypatch, _RUN_ALL_PHASES)
+    orchestrator.max_parallel_phases = 4
+    trace = tmp_path / "trace.json"
+    with tracing.session(trace):
+        result = orchestrator.run_all()
+
+    for phase in result.phases:
+        start, end = windows[phase.name]
+        assert phase.started <= start <= end <= phase.finished
+        assert phase.duration_s >= 0.01
+    events = json.loads(trace.read_text())["traceEvents"]
+    traced = {e["name"] for e in events if e.get("cat") == "phase"}
+    assert traced == set(_RUN_ALL_PHASES)
+
+
+def test_run_all_parallel_stops_scheduling_after_failure(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", MagicMock())
+    _record_phases(orchestrator, monkeypatch, _RUN_ALL_PHASES)
+    monkeypatch.setattr(
+        orchestrator,
+        "_phase_gitea_configure",
+        lambda _ssh: PhaseResult(name="gitea-configure", status="failed"),
+    )
+    orchestrator.max_parallel_phases = 4
+    result = orchestrator.run_all()
+    names = [p.name for p in result.phases]
+    assert "gitea-configure" in names
+    # Everything gated on gitea's token never started.
+    for gated in ("_phase_compose_restart", "_phase_seed", "_phase_woodpecker_apply"):
+        assert gated not in names
+    assert result.has_hard_failure
+
+
+class _StampingSSH:
+    """Minimal SSHClient stand-in for checkpoint tests: remembers the
+    run-id stamp ``_open_checkpoint`` writes and serves it back."""
+
+    def __init__(self) -> None:
+        self.stamp = ""
+
+    def __enter__(self) -> _StampingSSH:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        pass
+
+    def run(self, cmd: str, **_kw: Any) -> subprocess.CompletedProcess[str]:
+        if cmd.startswith("cat "):
+            return subprocess.CompletedProcess(cmd, 0, stdout=self.stamp + "\n")
+        self.stamp = cmd.split("echo ", 1)[1].split(" ", 1)[0]
+        return subprocess.CompletedProcess(cmd, 0, stdout="")
+
+
+def _checkpoint_phases(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+    calls: list[str],
+    *,
+    failing: str | None = None,
+) -> None:
+    """Stub every run_all phase; gitea-configure + mirror-setup write state."""
+
+    def make(name: str) -> Any:
+        def phase(_ssh: Any) -> PhaseResult:
+            calls.append(name)
+            if name == failing:
+                return PhaseResult(name=name, status="failed")
+            if name == "_phase_gitea_configure":
+                orchestrator.state.gitea_token = "tok-1"
+                orchestrator.state.restart_services = ("jupyter",)
+            return PhaseResult(name=name, status="ok")
+
+        phase.__name__ = name
+        return phase
+
+    for name in _RUN_ALL_PHASES:
+        monkeypatch.setattr(orchestrator, name, make(name))
+
+
+def test_run_all_resume_skips_recorded_phases(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    ssh = _StampingSSH()
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", lambda *_a, **_kw: ssh)
+    orchestrator.checkpoint_path = tmp_path / "journal.json"
+
+    calls: list[str] = []
+    _checkpoint_phases(orchestrator, monkeypatch, calls, failing="_phase_mirror_finalize")
+    first = orchestrator.run_all()
+    assert first.has_hard_failure
+    assert orchestrator.checkpoint_path.exists()
+
+    # Fresh process: state is gone, the journal + server stamp remain.
+    orchestrator.state = OrchestratorState()
+    orchestrator.resume = True
+    calls.clear()
+    _checkpoint_phases(orchestrator, monkeypatch, calls)
+    second = orchestrator.run_all()
+
+    # Only the phase that failed (and those after it) ran again.
+    assert calls == [
+        "_phase_mirror_finalize",
+        "_phase_secret_sync_jupyter",
+        "_phase_secret_sync_marimo",
+        "_phase_secret_sync_code_server",
+    ]
+    by_name = {p.name: p for p in second.phases}
+    assert by_name["_phase_gitea_configure"].status == "skipped"
+    assert "resumed" in by_name["_phase_gitea_configure"].detail
+    # Skipped phases hand their recorded outputs downstream.
+    assert orchestrator.state.gitea_token == "tok-1"
+    assert orchestrator.state.restart_services == ("jupyter",)
+    # A run without a failed phase retires the journal.
+    assert not second.has_hard_failure
+    assert not orchestrator.checkpoint_path.exists()
+
+
+def test_run_all_resume_ignores_journal_from_other_server(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    ssh = _StampingSSH()
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", lambda *_a, **_kw: ssh)
+    orchestrator.checkpoint_path = tmp_path / "journal.json"
+    calls: list[str] = []
+    _checkpoint_phases(orchestrator, monkeypatch, calls, failing="_phase_mirror_finalize")
+    orchestrator.run_all()
+
+    ssh.stamp = ""  # rebuilt server: no stamp
+    orchestrator.resume = True
+    calls.clear()
+    _checkpoint_phases(orchestrator, monkeypatch, calls)
+    orchestrator.run_all()
+    assert calls == list(_RUN_ALL_PHASES)
+
+
+def test_run_all_resume_reruns_on_changed_inputs(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    ssh = _StampingSSH()
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", lambda *_a, **_kw: ssh)
+    orchestrator.checkpoint_path = tmp_path / "journal.json"
+    calls: list[str] = []
+    _checkpoint_phases(orchestrator, monkeypatch, calls, failing="_phase_mirror_finalize")
+    orchestrator.run_all()
+
+    orchestrator.enabled_services = [*orchestrator.enabled_services, "prefect"]
+    orchestrator.resume = True
+    calls.clear()
+    _checkpoint_phases(orchestrator, monkeypatch, calls)
+    orchestrator.run_all()
+    assert calls == list(_RUN_ALL_PHASES)
+
+
+def test_run_pre_bootstrap_parallel_keeps_sync_after_local_writes(
+    orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus_deploy.orchestrator.SSHClient", MagicMock())
+    names = (
+        "_phase_workspace_coords",
+        "_phase_service_env",
+        "_phase_firewall_configure",
+        "_phase_stack_sync",
+        "_phase_firewall_sync",
+        "_phase_global_env",
+        "_phase_image_prepull",
+        "_phase_compose_up",
+        "_phase_infisical_provision",
+    )
+    windows = _record_phases(orchestrator, monkeypatch, names)
+    orchestrator.max_parallel_phases = 3
+    result = orchestrator.run_pre_bootstrap()
+    assert [p.name for p in result.phases] == list(names)
+    sync_start = windows["_phase_stack_sync"][0]
+    assert windows["_phase_service_env"][1] <= sync_start
+    assert windows["_phase_firewall_configure"][1] <= sync_start
+    up_start = windows["_phase_compose_up"][0]
+    assert windows["_phase_firewall_sync"][1] <= up_start
+    assert windows["_phase_global_env"][1] <= up_start
+    assert windows["_phase_image_prepull"][1] <= up_start
+    assert windows["_phase_service_env"][1] <= windows["_phase_image_prepull"][0]
+
+
 # ---------------------------------------------------------------------------
 # Exception coverage — catch-all + module-specific exception types
 # ---------------------------------------------------------------------------
@@ -1743,6 +2002,28 @@ def test_phase_stack_sync_happy_path(
     assert "cleanup_removed=3" in result.detail
 
 
+@pytest.mark.parametrize("mode", ["bulk", "manifest"])
+def test_phase_stack_sync_forwards_sync_mode(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Any,
+    mode: str,
+) -> None:
+    from nexus_deploy.stack_sync import CleanupResult, StackSyncResult
+
+    seen: dict[str, Any] = {}
+
+    def fake(*_a: Any, **kw: Any) -> StackSyncResult:
+        seen.update(kw)
+        return StackSyncResult(rsync=(), cleanup=CleanupResult(stopped=0, removed=0, failed=0))
+
+    monkeypatch.setattr("nexus_deploy.orchestrator._stack_sync.run_stack_sync", fake)
+    orchestrator.project_root = tmp_path
+    orchestrator.stack_sync_mode = mode  # type: ignore[assignment]
+    orchestrator._phase_stack_sync()
+    assert seen["sync_mode"] == mode
+
+
 def test_phase_stack_sync_failed_when_cleanup_unparseable(
     orchestrator: Orchestrator,
     monkeypatch: pytest.MonkeyPatch,
@@ -1876,6 +2157,124 @@ def test_phase_compose_up_partial_on_failures(
     assert "failed=2" in result.detail
 
 
+def test_phase_compose_up_reports_unhealthy_stacks(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from nexus_deploy.compose_runner import ComposeUpResult, StackTiming
+
+    stacks = (
+        StackTiming("kestra", "started", 0, 900, health="unhealthy"),
+        StackTiming("trino", "started", 0, 800, health="healthy"),
+    )
+    monkeypatch.setattr(
+        "nexus_deploy.orchestrator._compose_runner.run_compose_up",
+        lambda *_a, **_kw: ComposeUpResult(started=2, failed=0, stacks=stacks),
+    )
+    result = orchestrator._phase_compose_up()
+    assert result.status == "ok"
+    assert result.detail == "started=2 unhealthy=1"
+
+
+def test_phase_compose_up_forwards_skip_unchanged_and_reports_count(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from nexus_deploy.compose_runner import ComposeUpResult
+
+    seen: dict[str, Any] = {}
+
+    def fake(*_a: Any, **kw: Any) -> ComposeUpResult:
+        seen.update(kw)
+        return ComposeUpResult(started=2, failed=0, skipped=8)
+
+    monkeypatch.setattr("nexus_deploy.orchestrator._compose_runner.run_compose_up", fake)
+    orchestrator.skip_unchanged = True
+    result = orchestrator._phase_compose_up()
+    assert seen["skip_unchanged"] is True
+    assert result.status == "ok"
+    assert result.detail.endswith("unchanged=8")
+
+
+def test_phase_compose_up_forwards_weights_from_services_yaml(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    from nexus_deploy.compose_runner import ComposeUpResult
+
+    seen: dict[str, Any] = {}
+
+    def fake(*_a: Any, **kw: Any) -> ComposeUpResult:
+        seen.update(kw)
+        return ComposeUpResult(started=1, failed=0)
+
+    (tmp_path / "services.yaml").write_text("services:\n  kestra: {compose_weight: 3}\n")
+    monkeypatch.setattr("nexus_deploy.orchestrator._compose_runner.run_compose_up", fake)
+    orchestrator.project_root = tmp_path
+    orchestrator.compose_max_weight = 4
+    orchestrator._phase_compose_up()
+    assert seen["weights"] == {"kestra": 3}
+    assert seen["max_weight"] == 4
+    assert seen["local_stacks_dir"] == tmp_path / "stacks"
+
+
+def test_phase_image_prepull_pulls_enabled_stack_images(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    from nexus_deploy.image_prepull import PrePullResult
+
+    stack = tmp_path / "stacks" / "jupyter"
+    stack.mkdir(parents=True)
+    (stack / "docker-compose.yml").write_text(
+        "services:\n  app: {image: '${IMAGE_JUPYTER:-jupyter:old}'}\n"
+    )
+    seen: dict[str, Any] = {}
+
+    def fake(images: list[str], **kw: Any) -> PrePullResult:
+        seen.update(kw, images=images)
+        return PrePullResult(pulled=1, present=0, failed=0)
+
+    monkeypatch.setattr("nexus_deploy.orchestrator._image_prepull.run_prepull", fake)
+    orchestrator.project_root = tmp_path
+    orchestrator.enabled_services = ["jupyter"]
+    orchestrator.image_versions_json = '{"jupyter": "jupyter:new"}'
+    result = orchestrator._phase_image_prepull()
+    assert seen["images"] == ["jupyter:new"]
+    assert seen["workers"] == orchestrator.image_pull_workers
+    assert (result.status, result.detail) == ("ok", "pulled=1 present=0 failed=0")
+
+
+def test_phase_image_prepull_skipped_without_images(
+    orchestrator: Orchestrator, tmp_path: Path
+) -> None:
+    orchestrator.project_root = tmp_path
+    result = orchestrator._phase_image_prepull()
+    assert result.status == "skipped"
+
+
+def test_phase_image_prepull_transport_failure_is_not_fatal(
+    orchestrator: Orchestrator,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    stack = tmp_path / "stacks" / "jupyter"
+    stack.mkdir(parents=True)
+    (stack / "docker-compose.yml").write_text("services:\n  app: {image: jupyter}\n")
+
+    def boom(*_a: Any, **_kw: Any) -> Any:
+        raise subprocess.TimeoutExpired(["ssh"], 30)
+
+    monkeypatch.setattr("nexus_deploy.orchestrator._image_prepull.run_prepull", boom)
+    orchestrator.project_root = tmp_path
+    orchestrator.enabled_services = ["jupyter"]
+    result = orchestrator._phase_image_prepull()
+    assert result.status == "partial"
+    assert "TimeoutExpired" in result.detail
+
+
 def test_phase_infisical_provision_happy_path(
     orchestrator: Orchestrator,
     monkeypatch: pytest.MonkeyPatch,
@@ -1958,6 +2357,7 @@ def test_run_pre_bootstrap_runs_phases_in_order(
     monkeypatch.setattr(Orchestrator, "_phase_stack_sync", _make_phase("stack-sync"))
     monkeypatch.setattr(Orchestrator, "_phase_firewall_sync", _make_phase("firewall-sync"))
     monkeypatch.setattr(Orchestrator, "_phase_global_env", _make_phase("global-env"))
+    monkeypatch.setattr(Orchestrator, "_phase_image_prepull", _make_phase("image-prepull"))
     monkeypatch.setattr(Orchestrator, "_phase_compose_up", _make_phase("compose-up"))
     monkeypatch.setattr(
         Orchestrator,
@@ -1975,6 +2375,7 @@ def test_run_pre_bootstrap_runs_phases_in_order(
         "stack-sync",
         "firewall-sync",
         "global-env",
+        "image-prepull",
         "compose-up",
         "infisical-provision",
     ]
@@ -2027,7 +2428,7 @@ def test_run_pre_bootstrap_partial_continues_to_downstream(
     orchestrator: Orchestrator,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Partial-success phase doesn't abort — all 8 phases still run."""
+    """Partial-success phase doesn't abort — all 9 phases still run."""
     invocation_order: list[str] = []
 
     def _make_phase(name: str, status: Literal["ok", "partial"]) -> Any:
@@ -2053,6 +2454,7 @@ def test_run_pre_bootstrap_partial_continues_to_downstream(
     )
     monkeypatch.setattr(Orchestrator, "_phase_firewall_sync", _make_phase("firewall-sync", "ok"))
     monkeypatch.setattr(Orchestrator, "_phase_global_env", _make_phase("global-env", "ok"))
+    monkeypatch.setattr(Orchestrator, "_phase_image_prepull", _make_phase("image-prepull", "ok"))
     monkeypatch.setattr(Orchestrator, "_phase_compose_up", _make_phase("compose-up", "ok"))
     monkeypatch.setattr(
         Orchestrator,
@@ -2060,7 +2462,7 @@ def test_run_pre_bootstrap_partial_continues_to_downstream(
         _make_phase("infisical-provision", "ok"),
     )
     result = orchestrator.run_pre_bootstrap()
-    assert len(invocation_order) == 8
+    assert len(invocation_order) == 9
     assert result.has_partial
     assert not result.has_hard_failure
 
@@ -2100,6 +2502,7 @@ def test_run_pre_bootstrap_resets_stale_credentials(
     monkeypatch.setattr(Orchestrator, "_phase_stack_sync", _ok_phase)
     monkeypatch.setattr(Orchestrator, "_phase_firewall_sync", _ok_phase)
     monkeypatch.setattr(Orchestrator, "_phase_global_env", _ok_phase)
+    monkeypatch.setattr(Orchestrator, "_phase_image_prepull", _ok_phase)
     monkeypatch.setattr(Orchestrator, "_phase_compose_up", _ok_phase)
     monkeypatch.setattr(Orchestrator, "_phase_infisical_provision", _partial_no_creds)
 
@@ -0,0 +1,169 @@
+"""Tests for nexus_deploy.phase_scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from nexus_deploy.phase_scheduler import PhaseSpec, dependencies, run_phases
+
+
+@dataclass(frozen=True)
+class _Result:
+    name: str
+    status: str = "ok"
+
+
+def _spec(
+    name: str,
+    *,
+    reads: set[str] | None = None,
+    writes: set[str] | None = None,
+    status: str = "ok",
+    log: list[str] | None = None,
+    before: threading.Event | None = None,
+    after: threading.Event | None = None,
+) -> PhaseSpec[_Result]:
+    def run() -> _Result:
+        if before is not None:
+            assert before.wait(5), f"{name} waited for a phase that never ran"
+        if log is not None:
+            log.append(name)
+        if after is not None:
+            after.set()
+        return _Result(name, status)
+
+    return PhaseSpec(run, frozenset(reads or ()), frozenset(writes or ()))
+
+
+# ---------------------------------------------------------------------------
+# dependencies
+# ---------------------------------------------------------------------------
+
+
+def test_dependencies_read_after_write() -> None:
+    specs = [_spec("a", writes={"x"}), _spec("b", reads={"x"}), _spec("c")]
+    assert dependencies(specs) == [(), (0,), ()]
+
+
+def test_dependencies_write_after_read_and_write_after_write() -> None:
+    specs = [
+        _spec("a", reads={"x"}),
+        _spec("b", writes={"x"}),
+        _spec("c", writes={"x"}),
+    ]
+    assert dependencies(specs) == [(), (0,), (0, 1)]
+
+
+def test_dependencies_shared_reads_do_not_conflict() -> None:
+    specs = [_spec("a", reads={"x"}), _spec("b", reads={"x"})]
+    assert dependencies(specs) == [(), ()]
+
+
+# ---------------------------------------------------------------------------
+# run_phases
+# ---------------------------------------------------------------------------
+
+
+def test_sequential_runs_in_declared_order_and_stops_on_failure() -> None:
+    log: list[str] = []
+    specs = [
+        _spec("a", log=log),
+        _spec("b", status="failed", log=log),
+        _spec("c", log=log),
+    ]
+    report = run_phases(specs)
+    assert log == ["a", "b"]
+    assert [r.name for r in report.results] == ["a", "b"]
+
+
+def test_sequential_propagates_exceptions() -> None:
+    def boom() -> _Result:
+        raise RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        run_phases([PhaseSpec(boom)])
+
+
+def test_rejects_zero_workers() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        run_phases([_spec("a")], max_workers=0)
+
+
+def test_independent_phases_overlap() -> None:
+    """b can only finish once c has started — impossible serially."""
+    c_started = threading.Event()
+    specs = [
+        _spec("a"),
+        _spec("b", before=c_started),
+        _spec("c", after=c_started),
+    ]
+    report = run_phases(specs, max_workers=3)
+    assert [r.name for r in report.results] == ["a", "b", "c"]
+
+
+def test_dependent_phase_waits_for_its_writer() -> None:
+    log: list[str] = []
+    specs = [
+        _spec("writer", writes={"state.token"}, log=log),
+        _spec("reader", reads={"state.token"}, log=log),
+    ]
+    original = specs[0].run
+
+    def slow_writer() -> _Result:
+        time.sleep(0.05)
+        return original()
+
+    specs[0] = PhaseSpec(slow_writer, specs[0].reads, specs[0].writes)
+    run_phases(specs, max_workers=2)
+    assert log == ["writer", "reader"]
+
+
+def test_failure_stops_new_phases_but_finishes_in_flight() -> None:
+    log: list[str] = []
+    failed = threading.Event()
+    specs = [
+        _spec("fails", status="failed", writes={"x"}, log=log, after=failed),
+        _spec("sibling", log=log, before=failed),
+        _spec("downstream", reads={"x"}, log=log),
+    ]
+    report = run_phases(specs, max_workers=2)
+    assert sorted(log) == ["fails", "sibling"]
+    assert [r.name for r in report.results] == ["fails", "sibling"]
+
+
+def test_exception_in_worker_propagates() -> None:
+    def boom() -> _Result:
+        raise RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        run_phases([PhaseSpec(boom), _spec("other")], max_workers=2)
+
+
+def test_critical_path_follows_longest_dependency_chain() -> None:
+    def sleeper(name: str, seconds: float) -> PhaseSpec[_Result]:
+        def run() -> _Result:
+            time.sleep(seconds)
+            return _Result(name)
+
+        return PhaseSpec(run)
+
+    specs = [
+        PhaseSpec(sleeper("a", 0.01).run, writes=frozenset({"x"})),
+        PhaseSpec(sleeper("slow", 0.1).run, reads=frozenset({"x"})),
+        PhaseSpec(sleeper("fast", 0.01).run, reads=frozenset({"x"})),
+        PhaseSpec(sleeper("alone", 0.02).run),
+    ]
+    report = run_phases(specs, max_workers=4)
+    assert [r.result.name for r in report.critical_path] == ["a", "slow"]
+    assert report.critical_path_s >= 0.11
+
+
+def test_critical_path_empty_when_nothing_ran() -> None:
+    specs: list[PhaseSpec[_Result]] = []
+    report = run_phases(specs)
+    assert report.runs == ()
+    assert report.critical_path == ()
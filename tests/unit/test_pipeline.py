@@ -714,6 +714,53 @@ def test_cli_run_pipeline_unknown_arg_returns_2(capsys: pytest.CaptureFixture[st
     assert "unknown args" in capsys.readouterr().err
 
 
+def test_cli_run_pipeline_forwards_resume_flag(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from nexus_deploy.__main__ import _run_pipeline
+
+    seen: list[PipelineOptions] = []
+
+    def _capture(**kw: Any) -> Any:
+        seen.append(kw["options"])
+        raise PipelineError("stop here")
+
+    monkeypatch.setattr("nexus_deploy.pipeline.run_pipeline", _capture)
+    assert _run_pipeline(["--resume"]) == 2
+    assert seen[0].resume is True
+    assert _run_pipeline([]) == 2
+    assert seen[1].resume is False
+
+
+@pytest.mark.parametrize(
+    ("raw", "mode", "warned"),
+    [(None, "bulk", False), ("manifest", "manifest", False), ("rsync", "bulk", True)],
+)
+def test_cli_run_pipeline_reads_stack_sync_mode_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    raw: str | None,
+    mode: str,
+    warned: bool,
+) -> None:
+    from nexus_deploy.__main__ import _run_pipeline
+
+    seen: list[PipelineOptions] = []
+
+    def _capture(**kw: Any) -> Any:
+        seen.append(kw["options"])
+        raise PipelineError("stop here")
+
+    monkeypatch.setattr("nexus_deploy.pipeline.run_pipeline", _capture)
+    if raw is None:
+        monkeypatch.delenv("NEXUS_STACK_SYNC_MODE", raising=False)
+    else:
+        monkeypatch.setenv("NEXUS_STACK_SYNC_MODE", raw)
+    assert _run_pipeline([]) == 2
+    assert seen[0].stack_sync_mode == mode
+    assert ("NEXUS_STACK_SYNC_MODE" in capsys.readouterr().err) is warned
+
+
 def test_cli_run_pipeline_returns_2_on_pipeline_error(
     monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -723,7 +770,7 @@ def test_cli_run_pipeline_returns_2_on_pipeline_error(
     def _raise(*_a: Any, **_kw: Any) -> Any:
         raise PipelineError("synthetic boom")
 
-    monkeypatch.setattr("nexus_deploy.__main__._pipeline.run_pipeline", _raise)
+    monkeypatch.setattr("nexus_deploy.pipeline.run_pipeline", _raise)
     rc = _run_pipeline([])
     assert rc == 2
     assert "synthetic boom" in capsys.readouterr().err
@@ -737,7 +784,7 @@ def test_cli_run_pipeline_returns_2_on_unexpected_error(
     def _raise(*_a: Any, **_kw: Any) -> Any:
         raise RuntimeError("synthetic")
 
-    monkeypatch.setattr("nexus_deploy.__main__._pipeline.run_pipeline", _raise)
+    monkeypatch.setattr("nexus_deploy.pipeline.run_pipeline", _raise)
     rc = _run_pipeline([])
     assert rc == 2
     assert "unexpected error (RuntimeError)" in capsys.readouterr().err
@@ -758,7 +805,7 @@ def test_cli_run_pipeline_returns_0_on_clean_run(
             state=OrchestratorState(),
         ),
     )
-    monkeypatch.setattr("nexus_deploy.__main__._pipeline.run_pipeline", lambda **_: fake)
+    monkeypatch.setattr("nexus_deploy.pipeline.run_pipeline", lambda **_: fake)
     rc = _run_pipeline([])
     assert rc == 0
     out = capsys.readouterr().out
@@ -788,7 +835,7 @@ def test_cli_run_pipeline_returns_0_on_partial_with_stderr_warning(
             state=OrchestratorState(),
         ),
     )
-    monkeypatch.setattr("nexus_deploy.__main__._pipeline.run_pipeline", lambda **_: fake)
+    monkeypatch.setattr("nexus_deploy.pipeline.run_pipeline", lambda **_: fake)
     rc = _run_pipeline([])
     assert rc == 0  # NOT 1 — see docstring above.
     err = capsys.readouterr().err
@@ -113,6 +113,66 @@ def test_rsync_to_remote_delete_flag(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "--delete" in captured["args"]
 
 
+def test_rsync_dirs_to_remote_feeds_names_as_files_from(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["args"] = args[0]
+        captured.update(kwargs)
+        return subprocess.CompletedProcess(args=args[0], returncode=23, stdout="", stderr="")
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    completed = _remote.rsync_dirs_to_remote(Path("/stacks"), "nexus:/dst/", ["a", "b"])
+    cmd = captured["args"]
+    # -r must be explicit: --files-from switches off -a's implied recursion.
+    assert cmd[:4] == ["rsync", "-ar", "--itemize-changes", "--files-from=-"]
+    assert cmd[-2:] == ["/stacks/", "nexus:/dst/"]
+    assert captured["input"] == "a\nb\n"
+    # Non-zero exit is returned, not raised — the caller attributes it.
+    assert captured["check"] is False
+    assert completed.returncode == 23
+
+
+def _local_bash_popen(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run ssh_stream_in's remote command with a local bash instead of ssh."""
+    real_popen = subprocess.Popen
+
+    def fake_popen(args: list[str], **kwargs: Any) -> subprocess.Popen[bytes]:
+        assert args[0] == "ssh"
+        return real_popen(["bash", "-c", args[-1]], **kwargs)
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.Popen", fake_popen)
+
+
+def test_ssh_stream_in_feeds_stdin_and_returns_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    _local_bash_popen(monkeypatch)
+    payload = b"x" * (1 << 20)  # bigger than a pipe buffer
+
+    def feed(sink: Any) -> None:
+        sink.write(payload)
+
+    completed = _remote.ssh_stream_in("wc -c; echo done >&2", feed)
+
+    assert completed.stdout.split() == [str(len(payload)), "done"]
+
+
+def test_ssh_stream_in_raises_with_output_on_early_exit(monkeypatch: pytest.MonkeyPatch) -> None:
+    _local_bash_popen(monkeypatch)
+
+    def feed(sink: Any) -> None:
+        for _ in range(64):
+            sink.write(b"y" * 65536)
+
+    # The remote exits without reading: the writer's BrokenPipeError
+    # must surface as the remote's exit status, not as a pipe error.
+    with pytest.raises(subprocess.CalledProcessError) as info:
+        _remote.ssh_stream_in("echo refusing; exit 3", feed)
+    assert info.value.returncode == 3
+    assert "refusing" in info.value.output
+
+
 def test_ssh_run_merge_stderr_false_keeps_streams_separate(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -185,3 +245,158 @@ def test_rsync_to_remote_no_delete_by_default(monkeypatch: pytest.MonkeyPatch) -
     monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
     _remote.rsync_to_remote(Path("/src"), "nexus:/dst/")
     assert "--delete" not in captured["args"]
+
+
+# -- ControlMaster multiplexing -------------------------------------------
+
+
+@pytest.fixture
+def fake_master(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _remote.ControlMaster:
+    """Register a ControlMaster for ``nexus`` without spawning ssh."""
+    master = _remote.ControlMaster(
+        host="nexus",
+        control_path=tmp_path / "cm",
+        handshake_s=2.5,
+    )
+    monkeypatch.setitem(_remote._MASTERS, "nexus", master)
+    return master
+
+
+def test_ssh_options_empty_without_master() -> None:
+    assert _remote.ssh_options("nexus") == []
+    assert _remote.rsync_shell_args("nexus:/dst/") == []
+
+
+def test_ssh_run_routes_through_registered_master(
+    monkeypatch: pytest.MonkeyPatch, fake_master: _remote.ControlMaster
+) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["argv"] = args[0]
+        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    _remote.ssh_run_script("echo hi")
+    assert captured["argv"] == [
+        "ssh",
+        "-o",
+        f"ControlPath={fake_master.control_path}",
+        "-o",
+        "ControlMaster=no",
+        "nexus",
+        "bash",
+        "-s",
+    ]
+    # Timing is attributed to the master for the exit summary.
+    assert [kind for kind, _ in fake_master.call_timings] == ["ssh"]
+
+
+def test_ssh_run_other_host_ignores_master(
+    monkeypatch: pytest.MonkeyPatch, fake_master: _remote.ControlMaster
+) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["argv"] = args[0]
+        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    _remote.ssh_run("uptime", host="dev-host")
+    assert captured["argv"] == ["ssh", "dev-host", "uptime"]
+    assert fake_master.call_timings == []
+
+
+def test_rsync_to_remote_uses_master_shell(
+    monkeypatch: pytest.MonkeyPatch, fake_master: _remote.ControlMaster
+) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["argv"] = args[0]
+        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    _remote.rsync_to_remote(Path("/src"), "nexus:/dst/")
+    argv = captured["argv"]
+    rsh = argv[argv.index("-e") + 1]
+    assert rsh.startswith("ssh -o ")
+    assert f"ControlPath={fake_master.control_path}" in rsh
+    assert argv[-1] == "nexus:/dst/"
+    assert [kind for kind, _ in fake_master.call_timings] == ["rsync"]
+
+
+def test_open_control_master_registers_on_success(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(argv: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["argv"] = argv
+        captured["kwargs"] = kwargs
+        # ssh -M -f creates the socket before backgrounding.
+        control_path = Path(argv[argv.index("-o") + 1].removeprefix("ControlPath="))
+        control_path.touch()
+        return subprocess.CompletedProcess(args=argv, returncode=0)
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    monkeypatch.setattr(_remote, "_MASTERS", {})
+    master = _remote.open_control_master("nexus")
+    assert master is not None
+    assert _remote.control_master("nexus") is master
+    assert captured["argv"][:4] == ["ssh", "-M", "-N", "-f"]
+    assert "ControlPersist=yes" in captured["argv"]
+    assert captured["argv"][-1] == "nexus"
+    # Pipes must NOT be captured — the backgrounded master would hold
+    # them open and block subprocess.run forever.
+    assert captured["kwargs"]["stdout"] == subprocess.DEVNULL
+    assert captured["kwargs"]["stderr"] == subprocess.DEVNULL
+    assert "master up after" in capsys.readouterr().err
+
+    # A second open for the same host joins instead of starting another.
+    assert _remote.open_control_master("nexus") is None
+
+    closed = _remote.close_control_master("nexus")
+    assert closed is master
+    assert captured["argv"][-3:] == ["-O", "exit", "nexus"]
+    assert _remote.control_master("nexus") is None
+    assert not master.control_path.parent.exists()
+    assert "1 handshake" in capsys.readouterr().err
+
+
+def test_open_control_master_falls_back_on_failure(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def fake_run(argv: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args=argv, returncode=255)
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    monkeypatch.setattr(_remote, "_MASTERS", {})
+    assert _remote.open_control_master("nexus") is None
+    assert _remote.ssh_options("nexus") == []
+    assert "rc=255" in capsys.readouterr().err
+
+
+def test_open_control_master_survives_missing_ssh_binary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_run(*_args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        raise FileNotFoundError("ssh")
+
+    monkeypatch.setattr("nexus_deploy._remote.subprocess.run", fake_run)
+    monkeypatch.setattr(_remote, "_MASTERS", {})
+    assert _remote.open_control_master("nexus") is None
+
+
+def test_control_master_summary_reports_saving() -> None:
+    master = _remote.ControlMaster(
+        host="nexus",
+        control_path=Path("/tmp/x/cm"),  # noqa: S108
+        handshake_s=2.0,
+        call_timings=[("ssh", 0.5), ("ssh", 0.25), ("rsync", 1.0)],
+    )
+    summary = master.summary()
+    assert "3 multiplexed call(s)" in summary
+    assert "ssh=2x/0.8s" in summary
+    assert "rsync=1x/1.0s" in summary
+    assert "~6.0s" in summary
@@ -1024,7 +1024,7 @@ def test_cli_secret_sync_unexpected_exception_returns_2(
     def boom(*_a: Any, **_kw: Any) -> Any:
         raise KeyError(secret)
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_sync_for_stack", boom)
+    monkeypatch.setattr("nexus_deploy.secret_sync.run_sync_for_stack", boom)
     monkeypatch.setattr(sys, "argv", ["nexus-deploy", "secret-sync", "--stack", "jupyter"])
     monkeypatch.setenv("PROJECT_ID", "p")
     monkeypatch.setenv("INFISICAL_TOKEN", "t")
@@ -12,6 +12,7 @@ import json
 import os
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -22,12 +23,18 @@ from hypothesis import strategies as st
 from nexus_deploy.seeder import (
     SeedFile,
     SeedResult,
+    _git_blob_sha,
     _is_safe_repo_path,
     _url_encode_path,
+    diff_against_tree,
     encode_payloads,
+    iter_stream_frames,
     list_seed_files,
     parse_result,
+    parse_tree_listing,
     render_remote_loop,
+    render_remote_stream_loop,
+    render_remote_tree_fetch,
     run_seed_for_repo,
 )
 
@@ -446,6 +453,349 @@ def test_round_8_token_never_leaks_on_runtime_failure(
     assert secret_token not in captured.err
 
 
+# ---------------------------------------------------------------------------
+# Stream mode — lazy walk, length-prefixed frames, stdin-fed loop, ChangeFiles chunks
+# ---------------------------------------------------------------------------
+
+
+def _seed_file(name: str, content_b64: str = "aGVsbG8=") -> SeedFile:
+    return SeedFile(
+        repo_path=f"nexus_seeds/{name}",
+        url_path=f"nexus_seeds/{name}",
+        content_b64=content_b64,
+        commit_message=f"chore(seed): add {name}",
+    )
+
+
+def _parse_frames(data: bytes) -> list[dict[str, Any]]:
+    """Decode ``<nbytes>\\n<body>`` frames; every header must match its body."""
+    frames: list[dict[str, Any]] = []
+    while data:
+        header, _, data = data.partition(b"\n")
+        body, data = data[: int(header)], data[int(header) :]
+        assert len(body) == int(header)
+        frames.append(json.loads(body))
+    return frames
+
+
+def _frames(files: list[SeedFile], **caps: int) -> list[dict[str, Any]]:
+    return _parse_frames(b"".join(iter_stream_frames(files, **caps)))
+
+
+def test_iter_stream_frames_chunks_by_file_count() -> None:
+    files = [_seed_file(f"f{i}.txt") for i in range(5)]
+    paths = [[e["path"] for e in frame["files"]] for frame in _frames(files, max_files=2)]
+    assert paths == [
+        ["nexus_seeds/f0.txt", "nexus_seeds/f1.txt"],
+        ["nexus_seeds/f2.txt", "nexus_seeds/f3.txt"],
+        ["nexus_seeds/f4.txt"],
+    ]
+
+
+def test_iter_stream_frames_chunks_by_bytes_and_keeps_oversized_file() -> None:
+    files = [_seed_file("a.txt", "A" * 6), _seed_file("big.txt", "B" * 20), _seed_file("c.txt")]
+    sizes = [len(frame["files"]) for frame in _frames(files, max_bytes=10)]
+    assert sizes == [1, 1, 1]
+
+
+def test_iter_stream_frames_json_shape() -> None:
+    [frame] = _frames([_seed_file("x.txt")])
+    assert frame["message"].startswith("chore(seed): add 1 file(s)")
+    assert frame["files"] == [
+        {
+            "operation": "create",
+            "path": "nexus_seeds/x.txt",
+            "content": "aGVsbG8=",
+            "url_path": "nexus_seeds/x.txt",
+            "message": "chore(seed): add x.txt",
+        }
+    ]
+
+
+def test_stream_loop_keeps_hardening_rounds() -> None:
+    """R1-R3 hold for the stream script too."""
+    script = render_remote_stream_loop(
+        token="super-secret", repo_owner="admin", repo_name="ws", batch=True
+    )
+    first_executable = next(
+        line for line in script.splitlines() if line and not line.startswith("#")
+    )
+    assert first_executable == "set -euo pipefail"
+    token_lines = [line for line in script.splitlines() if "$TOKEN" in line]
+    assert len(token_lines) == 1
+    assert "printf" in token_lines[0]
+    assert all(
+        "super-secret" not in line for line in script.splitlines() if not line.startswith("TOKEN=")
+    )
+    trap_line = next(line for line in script.splitlines() if line.startswith("trap"))
+    assert 'rm -f "$CFG"' in trap_line
+
+
+_FAKE_CURL = """#!/usr/bin/env bash
+body=$(cat)
+for a in "$@"; do case "$a" in http*) url="$a" ;; esac; done
+printf '%s %s\\n' "$url" "$body" >> "$CURL_LOG"
+case "$url" in
+    */contents) printf '%s' "$BATCH_CODE" ;;
+    *exists*)   printf '422' ;;
+    *)          printf '201' ;;
+esac
+"""
+
+
+def _exec_stream_loop(
+    tmp_path: Path, files: list[SeedFile], *, batch: bool, batch_code: str = "201"
+) -> tuple[str, str]:
+    """Script + frames on one `bash -s` stdin against a fake curl; (stdout, curl log)."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "curl").write_text(_FAKE_CURL, encoding="utf-8")
+    (bin_dir / "curl").chmod(0o755)
+    log = tmp_path / "curl.log"
+    log.touch()
+    script = render_remote_stream_loop(token="t", repo_owner="admin", repo_name="ws", batch=batch)
+    stdin = script.encode() + b"".join(iter_stream_frames(files, max_files=2 if batch else 1))
+    env = {
+        **os.environ,
+        "PATH": f"{bin_dir}:{os.environ['PATH']}",
+        "CURL_LOG": str(log),
+        "BATCH_CODE": batch_code,
+    }
+    out = subprocess.run(
+        ["bash", "-s"], input=stdin, capture_output=True, check=True, env=env
+    ).stdout.decode()
+    return out, log.read_text(encoding="utf-8")
+
+
+_NEEDS_JQ = pytest.mark.skipif(
+    subprocess.run(["bash", "-c", "command -v jq"], capture_output=True).returncode != 0,
+    reason="jq not installed",
+)
+
+
+@_NEEDS_JQ
+@pytest.mark.parametrize(("batch", "posts"), [(True, 2), (False, 3)])
+def test_stream_loop_reads_frames_after_script_via_bash_exec(
+    tmp_path: Path, batch: bool, posts: int
+) -> None:
+    """Script + frames on one `bash -s` stdin, as ssh_stream_in sends them."""
+    files = [_seed_file(f"f{i}.txt") for i in range(3)]
+    out, log = _exec_stream_loop(tmp_path, files, batch=batch)
+    assert parse_result(out) == SeedResult(created=3, skipped=0, failed=0)
+    assert len(log.splitlines()) == posts
+
+
+@_NEEDS_JQ
+def test_stream_batch_sends_only_changefiles_fields(tmp_path: Path) -> None:
+    files = [_seed_file(f"f{i}.txt") for i in range(3)]
+    _out, log = _exec_stream_loop(tmp_path, files, batch=True)
+    calls = log.splitlines()
+    assert all(call.split(" ", 1)[0].endswith("/repos/admin/ws/contents") for call in calls)
+    sent = json.loads(calls[0].split(" ", 1)[1])
+    assert set(sent) == {"message", "files"}
+    assert set(sent["files"][0]) == {"operation", "path", "content"}
+
+
+@_NEEDS_JQ
+def test_stream_loop_stops_on_truncated_frame(tmp_path: Path) -> None:
+    files = [_seed_file(f"f{i}.txt") for i in range(3)]
+    stdin = b"".join(iter_stream_frames(files, max_files=2))
+    cut = stdin[: stdin.rindex(b"\n", 0, len(stdin) - 1) + 5]
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "curl").write_text(_FAKE_CURL, encoding="utf-8")
+    (bin_dir / "curl").chmod(0o755)
+    script = render_remote_stream_loop(token="t", repo_owner="admin", repo_name="ws", batch=True)
+    env = {
+        **os.environ,
+        "PATH": f"{bin_dir}:{os.environ['PATH']}",
+        "CURL_LOG": str(tmp_path / "curl.log"),
+        "BATCH_CODE": "201",
+    }
+    proc = subprocess.run(
+        ["bash", "-s"], input=script.encode() + cut, capture_output=True, check=True, env=env
+    )
+    assert parse_result(proc.stdout.decode()) == SeedResult(created=2, skipped=0, failed=0)
+    assert "truncated in chunk 2" in proc.stderr.decode()
+
+
+@_NEEDS_JQ
+def test_stream_loop_keeps_frames_aligned_around_a_large_file(tmp_path: Path) -> None:
+    """A multi-MB frame is copied whole and the frame after it still parses."""
+    seed_root = _big_seed_root(tmp_path)
+    (seed_root / "z.txt").write_bytes(b"last\n")
+    files = list_seed_files(seed_root, lazy=True)
+    out, log = _exec_stream_loop(tmp_path, files, batch=False)
+    assert parse_result(out) == SeedResult(created=3, skipped=0, failed=0)
+    sent = {
+        url.rsplit("/", 1)[1]: base64.b64decode(json.loads(body)["content"])
+        for url, body in (call.split(" ", 1) for call in log.splitlines())
+    }
+    assert sent["big.bin"] == (seed_root / "data" / "big.bin").read_bytes()
+    assert sent["z.txt"] == b"last\n"
+
+
+@_NEEDS_JQ
+def test_stream_batch_422_falls_back_to_per_file_attribution(tmp_path: Path) -> None:
+    files = [_seed_file("exists.txt"), _seed_file("new.txt")]
+    out, log = _exec_stream_loop(tmp_path, files, batch=True, batch_code="422")
+    assert parse_result(out) == SeedResult(created=1, skipped=1, failed=0)
+    urls = [call.split(" ", 1)[0] for call in log.splitlines()]
+    assert urls[1:] == [
+        "http://localhost:3200/api/v1/repos/admin/ws/contents/nexus_seeds/exists.txt",
+        "http://localhost:3200/api/v1/repos/admin/ws/contents/nexus_seeds/new.txt",
+    ]
+
+
+@_NEEDS_JQ
+def test_stream_batch_other_error_fails_whole_chunk(tmp_path: Path) -> None:
+    files = [_seed_file(f"f{i}.txt") for i in range(3)]
+    out, _log = _exec_stream_loop(tmp_path, files, batch=True, batch_code="500")
+    assert parse_result(out) == SeedResult(created=0, skipped=0, failed=3)
+
+
+def _big_seed_root(tmp_path: Path) -> Path:
+    seed_root = tmp_path / "seeds"
+    (seed_root / "data").mkdir(parents=True)
+    (seed_root / "a.txt").write_bytes(b"hello\n")
+    # Larger than one read buffer and not a multiple of 3.
+    (seed_root / "data" / "big.bin").write_bytes(os.urandom(2 * 1024 * 1024 + 1))
+    return seed_root
+
+
+def test_list_seed_files_lazy_defers_content(tmp_path: Path) -> None:
+    seed_root = _big_seed_root(tmp_path)
+    eager = list_seed_files(seed_root)
+    lazy = list_seed_files(seed_root, lazy=True)
+    assert [f.repo_path for f in lazy] == [f.repo_path for f in eager]
+    assert [f.blob_sha for f in lazy] == [f.blob_sha for f in eager]
+    assert all(f.content_b64 == "" and f.local_path is not None for f in lazy)
+    assert lazy[1].size == 2 * 1024 * 1024 + 1
+
+
+def test_iter_stream_frames_lazy_match_eager(tmp_path: Path) -> None:
+    """Lazily read + encoded frames decode to the same chunks as eager ones."""
+    seed_root = _big_seed_root(tmp_path)
+    lazy = _frames(list_seed_files(seed_root, lazy=True), max_files=1)
+    assert lazy == _frames(list_seed_files(seed_root), max_files=1)
+    assert (
+        base64.b64decode(lazy[1]["files"][0]["content"])
+        == (seed_root / "data" / "big.bin").read_bytes()
+    )
+
+
+def test_iter_stream_frames_rejects_lazy_file_that_changed_size(tmp_path: Path) -> None:
+    seed_root = tmp_path / "seeds"
+    seed_root.mkdir()
+    (seed_root / "a.txt").write_bytes(b"hello\n")
+    [lazy] = list_seed_files(seed_root, lazy=True)
+    (seed_root / "a.txt").write_bytes(b"hello, grown\n")
+    with pytest.raises(OSError, match="changed size"):
+        b"".join(iter_stream_frames([lazy]))
+
+
+def test_stream_loop_has_no_push_dir_and_ends_in_main() -> None:
+    script = render_remote_stream_loop(
+        token="super-secret", repo_owner="a", repo_name="b", batch=True
+    )
+    assert "PUSH_DIR" not in script
+    assert script.rstrip().endswith("main; exit $?")
+    token_lines = [line for line in script.splitlines() if "$TOKEN" in line]
+    assert len(token_lines) == 1
+    assert "printf" in token_lines[0]
+
+
+# ---------------------------------------------------------------------------
+# Tree-diff pre-pass — blob hashing, listing parse, diff
+# ---------------------------------------------------------------------------
+
+
+def test_git_blob_sha_matches_git_hash_object(tmp_path: Path) -> None:
+    # Well-known: `printf 'hello\n' | git hash-object --stdin`.
+    assert _git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+    assert _git_blob_sha(b"") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+
+def test_list_seed_files_sets_blob_sha(tmp_path: Path) -> None:
+    seed_root = tmp_path / "seeds"
+    seed_root.mkdir()
+    (seed_root / "a.txt").write_bytes(b"hello\n")
+    [f] = list_seed_files(seed_root)
+    assert f.blob_sha == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_parse_tree_listing_statuses() -> None:
+    sha = "a" * 40
+    out = f"BLOB {sha} nexus_seeds/a.txt\nBLOB {sha} notes/with space.md\nTREE ok\n"
+    assert parse_tree_listing(out) == {"nexus_seeds/a.txt": sha, "notes/with space.md": sha}
+    assert parse_tree_listing("TREE empty\n") == {}
+    assert parse_tree_listing("TREE unavailable\n") is None
+    # Script died between pages → no closing status → not trusted.
+    assert parse_tree_listing(f"BLOB {sha} nexus_seeds/a.txt\n") is None
+
+
+def test_diff_against_tree_splits_missing_unchanged_diverged() -> None:
+    same = SeedFile("nexus_seeds/same.txt", "nexus_seeds/same.txt", "", "m", blob_sha="1" * 40)
+    edited = SeedFile("nexus_seeds/edit.txt", "nexus_seeds/edit.txt", "", "m", blob_sha="2" * 40)
+    new = SeedFile("nexus_seeds/new.txt", "nexus_seeds/new.txt", "", "m", blob_sha="3" * 40)
+    tree = {"nexus_seeds/same.txt": "1" * 40, "nexus_seeds/edit.txt": "f" * 40}
+    missing, unchanged, diverged = diff_against_tree([same, edited, new], tree)
+    assert missing == [new]
+    assert unchanged == [same]
+    assert diverged == [edited]
+
+
+_FAKE_TREE_CURL = """#!/usr/bin/env bash
+for a in "$@"; do case "$a" in http*) url="$a" ;; esac; done
+echo "$url" >> "$CURL_LOG"
+case "$url" in
+    */repos/admin/ws) echo '{"default_branch":"main"}' ;;
+    *page=1)
+        echo '{"truncated":true,"tree":[{"type":"blob","path":"a.txt","sha":"'"$SHA_A"'"},'\\
+'{"type":"tree","path":"dir","sha":"'"$SHA_A"'"}]}'
+        printf '%s' "$TREE_CODE" ;;
+    *page=2)
+        echo '{"truncated":false,"tree":[{"type":"blob","path":"dir/b.txt","sha":"'"$SHA_B"'"}]}'
+        printf '200' ;;
+esac
+"""
+
+
+@pytest.mark.skipif(
+    subprocess.run(["bash", "-c", "command -v jq"], capture_output=True).returncode != 0,
+    reason="jq not installed",
+)
+@pytest.mark.parametrize(("tree_code", "expected"), [("200", "ok"), ("404", "empty")])
+def test_tree_fetch_pages_until_not_truncated_via_bash_exec(
+    tmp_path: Path, tree_code: str, expected: str
+) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "curl").write_text(_FAKE_TREE_CURL, encoding="utf-8")
+    (bin_dir / "curl").chmod(0o755)
+    env = {
+        **os.environ,
+        "PATH": f"{bin_dir}:{os.environ['PATH']}",
+        "CURL_LOG": str(tmp_path / "curl.log"),
+        "TREE_CODE": tree_code,
+        "SHA_A": "a" * 40,
+        "SHA_B": "b" * 40,
+    }
+    script = render_remote_tree_fetch(token="t", repo_owner="admin", repo_name="ws")
+    out = subprocess.run(
+        ["bash", "-c", script], capture_output=True, text=True, check=True, env=env
+    ).stdout
+    assert out.splitlines()[-1] == f"TREE {expected}"
+    if expected == "ok":
+        assert parse_tree_listing(out) == {"a.txt": "a" * 40, "dir/b.txt": "b" * 40}
+        assert "git/trees/main?recursive=true" in (tmp_path / "curl.log").read_text()
+    else:
+        assert parse_tree_listing(out) == {}
+
+
+# ---------------------------------------------------------------------------
+# parse_result
+# ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
 # parse_result
 # ---------------------------------------------------------------------------
@@ -681,6 +1031,183 @@ def test_run_seed_writes_payloads_to_push_dir(tmp_path: Path) -> None:
     assert all(f.name.startswith("seed-") and f.name.endswith(".json") for f in files)
 
 
+def test_run_seed_batch_needs_stream() -> None:
+    with pytest.raises(ValueError, match="stream=True"):
+        run_seed_for_repo(
+            repo_owner="admin", repo_name="ws", root=FIXTURE_ROOT, token="t", batch=True
+        )
+
+
+def _tree_listing_for(files: list[SeedFile], *, edit: str = "") -> str:
+    lines = [f"BLOB {'f' * 40 if f.repo_path == edit else f.blob_sha} {f.repo_path}" for f in files]
+    return "\n".join([*lines, "TREE ok"])
+
+
+def _capture_stream(
+    stdout: str, fed: bytearray, cmds: list[str] | None = None
+) -> Callable[[str, Any], subprocess.CompletedProcess[str]]:
+    """Stream runner that records what would go down ssh stdin."""
+
+    def stream_runner(cmd: str, feed: Any) -> subprocess.CompletedProcess[str]:
+        if cmds is not None:
+            cmds.append(cmd)
+
+        class _Pipe:
+            def write(self, data: bytes) -> int:
+                fed.extend(data)
+                return len(data)
+
+        feed(_Pipe())
+        return subprocess.CompletedProcess(args=["ssh"], returncode=0, stdout=stdout, stderr="")
+
+    return stream_runner
+
+
+def _split_fed(fed: bytearray) -> tuple[str, list[dict[str, Any]]]:
+    """(script, decoded frames) of a captured stream."""
+    script, _, frames = bytes(fed).partition(b"main; exit $?\n")
+    return script.decode(), _parse_frames(frames)
+
+
+def test_run_seed_tree_diff_skips_everything_present() -> None:
+    """Every seed already in the tree → no write stream at all."""
+    listing = _tree_listing_for(list_seed_files(FIXTURE_ROOT))
+    scripts: list[str] = []
+
+    def runner(script: str) -> subprocess.CompletedProcess[str]:
+        scripts.append(script)
+        return subprocess.CompletedProcess(args=["ssh"], returncode=0, stdout=listing, stderr="")
+
+    def no_stream(_cmd: str, _feed: Any) -> subprocess.CompletedProcess[str]:
+        raise AssertionError("nothing to push")
+
+    result = run_seed_for_repo(
+        repo_owner="admin",
+        repo_name="ws",
+        root=FIXTURE_ROOT,
+        token="t",
+        script_runner=runner,
+        stream_runner=no_stream,
+        batch=True,
+        tree_diff=True,
+        stream=True,
+    )
+    assert result == SeedResult(created=0, skipped=4, failed=0)
+    assert len(scripts) == 1
+
+
+def test_run_seed_tree_diff_uploads_only_missing_and_warns_on_edits(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    files = list_seed_files(FIXTURE_ROOT)
+    # files[0] missing from the repo, files[1] edited by the student.
+    listing = _tree_listing_for(files[1:], edit=files[1].repo_path)
+    fed = bytearray()
+
+    result = run_seed_for_repo(
+        repo_owner="admin",
+        repo_name="ws",
+        root=FIXTURE_ROOT,
+        token="t",
+        script_runner=_ok_script_runner(listing),
+        stream_runner=_capture_stream("RESULT created=1 skipped=0 failed=0", fed),
+        batch=True,
+        tree_diff=True,
+        stream=True,
+    )
+    assert result == SeedResult(created=1, skipped=3, failed=0)
+    script, [chunk] = _split_fed(fed)
+    assert "post_chunk" in script.rsplit("main()", 1)[1]
+    assert [e["path"] for e in chunk["files"]] == [files[0].repo_path]
+    err = capsys.readouterr().err
+    assert f"Seed {files[1].repo_path} differs" in err
+    assert "would overwrite a student edit" in err
+    assert "BLOB " not in err
+
+
+def test_run_seed_batch_without_listing_posts_per_file() -> None:
+    """No tree listing → every file may exist, so no doomed ChangeFiles chunk."""
+    fed = bytearray()
+    result = run_seed_for_repo(
+        repo_owner="admin",
+        repo_name="ws",
+        root=FIXTURE_ROOT,
+        token="t",
+        script_runner=_ok_script_runner("TREE unavailable"),
+        stream_runner=_capture_stream("RESULT created=0 skipped=4 failed=0", fed),
+        batch=True,
+        tree_diff=True,
+        stream=True,
+    )
+    assert result == SeedResult(created=0, skipped=4, failed=0)
+    script, frames = _split_fed(fed)
+    assert "post_chunk" not in script.rsplit("main()", 1)[1]
+    assert [len(frame["files"]) for frame in frames] == [1, 1, 1, 1]
+
+
+def test_run_seed_tree_diff_unavailable_uploads_everything(tmp_path: Path) -> None:
+    outputs = iter(["TREE unavailable", "RESULT created=4 skipped=0 failed=0"])
+
+    def runner(_script: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(
+            args=["ssh"], returncode=0, stdout=next(outputs), stderr=""
+        )
+
+    push_dir = tmp_path / "push"
+    result = run_seed_for_repo(
+        repo_owner="admin",
+        repo_name="ws",
+        root=FIXTURE_ROOT,
+        token="t",
+        push_dir=push_dir,
+        script_runner=runner,
+        rsync_runner=_noop_rsync,
+        tree_diff=True,
+    )
+    assert result == SeedResult(created=4, skipped=0, failed=0)
+    assert len(list(push_dir.glob("seed-*.json"))) == 4
+
+
+def test_run_seed_stream_counts_files_missing_from_result_as_failed() -> None:
+    """A stream cut short reports fewer files than were sent — the rest failed."""
+    result = run_seed_for_repo(
+        repo_owner="admin",
+        repo_name="ws",
+        root=FIXTURE_ROOT,
+        token="t",
+        stream_runner=_capture_stream("RESULT created=1 skipped=0 failed=0", bytearray()),
+        stream=True,
+    )
+    assert result == SeedResult(created=1, skipped=0, failed=3)
+
+
+def test_run_seed_stream_mode_skips_push_dir_and_rsync(tmp_path: Path) -> None:
+    fed = bytearray()
+    cmds: list[str] = []
+
+    def no_rsync(_src: Path, _dst: str) -> subprocess.CompletedProcess[str]:
+        raise AssertionError("stream mode must not rsync")
+
+    push_dir = tmp_path / "push"
+    result = run_seed_for_repo(
+        repo_owner="admin",
+        repo_name="ws",
+        root=FIXTURE_ROOT,
+        token="tok-in-stdin",
+        push_dir=push_dir,
+        rsync_runner=no_rsync,
+        stream_runner=_capture_stream("RESULT created=4 skipped=0 failed=0", fed, cmds),
+        stream=True,
+    )
+    assert result == SeedResult(created=4, skipped=0, failed=0)
+    assert not push_dir.exists()
+    # Token travels in the stdin script, never in the ssh argv.
+    assert cmds == ["bash -s"]
+    script, frames = _split_fed(fed)
+    assert "tok-in-stdin" in script
+    assert len(frames) == 4
+
+
 # ---------------------------------------------------------------------------
 # CLI integration
 # ---------------------------------------------------------------------------
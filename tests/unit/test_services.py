@@ -2,7 +2,9 @@
 
 Eight round-tagged invariant tests (one per hardening round) plus
 per-spec snapshots, exec'd-bash regression tests for the JSON
-build + idempotent-skip dispatch, and CLI integration covering rc=0/1/2.
+build + idempotent-skip dispatch, REST hooks driven against
+``responses`` through a fake ``SSHClient.port_forward``, and CLI
+integration covering rc=0/1/2.
 """
 
 from __future__ import annotations
@@ -11,18 +13,25 @@ import base64
 import json
 import os
 import re
-import shlex
 import subprocess
 import sys
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import pytest
+import requests
+import responses
 
 from nexus_deploy.config import NexusConfig
 from nexus_deploy.infisical import BootstrapEnv
 from nexus_deploy.services import (
+    _HOOK_REGISTRY,
+    _HTTP_HOOK_REGISTRY,
+    HookClient,
     HookResult,
     SetupResult,
     _filestash_has_external,
@@ -32,29 +41,26 @@ from nexus_deploy.services import (
     _filestash_primary_backend,
     _filestash_s3_connections,
     _filestash_s3_params,
+    _http_hook_stamp,
     _parse_filestash_pull_output,
     _render_filestash_pull_script,
     _render_filestash_push_script,
+    _render_hook_stamps_fetch,
+    _render_wait_healthy,
+    _wait_ready,
     configure_filestash,
     parse_results,
-    render_dify_hook,
     render_garage_hook,
-    render_lakefs_hook,
-    render_metabase_hook,
-    render_n8n_hook,
-    render_openmetadata_hook,
     render_pg_ducklake_hook,
-    render_portainer_hook,
     render_redpanda_hook,
     render_remote_script,
     render_sftpgo_hook,
     render_superset_hook,
     render_uptime_kuma_hook,
-    render_wikijs_hook,
-    render_windmill_hook,
     run_admin_setups,
     supported_hooks,
 )
+from nexus_deploy.ssh import SSHClient, SSHError
 
 
 def _make_config(**overrides: Any) -> NexusConfig:
@@ -105,8 +111,7 @@ def _make_env(admin_email: str = "ops@example.com") -> BootstrapEnv:
 
 
 def test_supported_hooks_contains_all_specs() -> None:
-    """5 REST hooks + 2 docker-exec hooks + Filestash (python) +
-    6 additional admin-setups."""
+    """8 REST hooks + 6 bash hooks + Filestash (python)."""
     assert set(supported_hooks()) == {
         # REST first-init
         "portainer",
@@ -114,17 +119,17 @@ def test_supported_hooks_contains_all_specs() -> None:
         "metabase",
         "lakefs",
         "openmetadata",
+        "wikijs",
+        "dify",
+        "windmill",
         # docker-exec CLI
         "redpanda",
         "superset",
         # python-side mutation
         "filestash",
-        # additional admin-setups
+        # additional bash admin-setups
         "uptime-kuma",
         "garage",
-        "wikijs",
-        "dify",
-        "windmill",
         "sftpgo",
         # pg-ducklake bootstrap-SQL re-apply
         "pg-ducklake",
@@ -132,124 +137,504 @@ def test_supported_hooks_contains_all_specs() -> None:
 
 
 # ---------------------------------------------------------------------------
-# Per-hook renderers — basic shape + skip-on-missing-credential
+# REST hooks — Python engine over SSH tunnels
 # ---------------------------------------------------------------------------
 
+BASE = "http://svc.test"
 
-def test_render_portainer_hook_basic() -> None:
-    script = render_portainer_hook(_make_config(), _make_env())
-    assert "portainer_hook()" in script
-    assert "/api/users/admin/init" in script
-    assert "RESULT hook=portainer status=" in script
 
+def _client() -> HookClient:
+    return HookClient(BASE, requests.Session())
 
-def test_render_portainer_hook_skips_when_password_empty() -> None:
-    """Missing admin password → skipped-not-ready, not failed."""
-    config = _make_config(portainer_admin_password="")
-    script = render_portainer_hook(config, _make_env())
-    assert script.strip() == 'echo "RESULT hook=portainer status=skipped-not-ready"'
 
+def _sent(index: int) -> Any:
+    return json.loads(responses.calls[index].request.body)  # type: ignore[arg-type]
 
-def test_render_n8n_hook_uses_admin_email_from_env() -> None:
-    """n8n needs admin_email — comes from BootstrapEnv, not NexusConfig."""
-    script = render_n8n_hook(_make_config(), _make_env(admin_email="alice@example.com"))
-    assert "alice@example.com" in script
 
+class _FakeSSH:
+    """``port_forward`` yields the REMOTE port, so each hook's base URL is
+    ``http://localhost:<service port>`` and ``responses`` can route it."""
 
-def test_render_n8n_hook_skips_when_email_empty() -> None:
-    """Missing admin_email → skipped (uniform with missing password)."""
-    script = render_n8n_hook(_make_config(), _make_env(admin_email=""))
-    assert script.strip() == 'echo "RESULT hook=n8n status=skipped-not-ready"'
+    def __init__(self, *, broken: frozenset[int] = frozenset()) -> None:
+        self.broken = broken
+        self.forwards: list[int] = []
 
+    @contextmanager
+    def port_forward(self, local_port: int, remote_host: str, remote_port: int) -> Iterator[int]:
+        assert remote_host == "localhost"
+        assert local_port > 0
+        self.forwards.append(remote_port)
+        if remote_port in self.broken:
+            raise SSHError("tunnel did not come up")
+        yield remote_port
 
-def test_render_metabase_hook_skips_when_password_empty() -> None:
-    script = render_metabase_hook(_make_config(metabase_admin_password=""), _make_env())
-    assert script.strip() == 'echo "RESULT hook=metabase status=skipped-not-ready"'
 
-
-def test_render_lakefs_hook_skips_when_keys_empty() -> None:
-    script = render_lakefs_hook(
-        _make_config(lakefs_admin_access_key="", lakefs_admin_secret_key=""),
+def _run_rest(
+    enabled: list[str],
+    ssh: _FakeSSH,
+    *,
+    config: NexusConfig | None = None,
+    runner: Any = None,
+    skip_unchanged: bool = False,
+) -> SetupResult:
+    return run_admin_setups(
+        config or _make_config(),
         _make_env(),
+        enabled,
+        script_runner=runner or _ok_runner(""),
+        ssh=cast("SSHClient", ssh),
+        skip_unchanged=skip_unchanged,
     )
-    assert script.strip() == 'echo "RESULT hook=lakefs status=skipped-not-ready"'
 
 
-def test_render_lakefs_hook_pins_host_port_8000() -> None:
-    """R-port: LakeFS compose maps 8000:8000. Hook MUST hit
-    localhost:8000 from the SSH host. Pinned to catch port-mapping
-    drift if the compose file changes (and to defend against a
-    repeat of the cross-hook search-replace bug from PR #529 R1
-    that incorrectly pushed LakeFS to 8200 alongside Windmill)."""
-    script = render_lakefs_hook(_make_config(), _make_env())
-    assert "localhost:8000" in script
-    assert "localhost:8200" not in script
+@pytest.mark.parametrize(
+    ("name", "field"),
+    [
+        ("portainer", "portainer_admin_password"),
+        ("n8n", "n8n_admin_password"),
+        ("metabase", "metabase_admin_password"),
+        ("lakefs", "lakefs_admin_secret_key"),
+        ("openmetadata", "openmetadata_admin_password"),
+        ("wikijs", "wikijs_admin_password"),
+        ("dify", "dify_admin_password"),
+        ("windmill", "windmill_superadmin_secret"),
+    ],
+)
+def test_rest_hook_without_credentials_skips_without_tunnel(name: str, field: str) -> None:
+    """Missing credential → skipped-not-ready, not failed, and no tunnel opened."""
+    ssh = _FakeSSH()
+    result = _run_rest([name], ssh, config=_make_config(**{field: ""}))
+    assert result.hooks == (HookResult(name=name, status="skipped-not-ready"),)
+    assert ssh.forwards == []
+
+
+def test_rest_hook_inputs_need_admin_email() -> None:
+    env = _make_env(admin_email="")
+    for name in ("n8n", "metabase", "openmetadata", "dify", "windmill"):
+        assert _HTTP_HOOK_REGISTRY[name].inputs(_make_config(), env) is None, name
+
+
+def test_rest_hooks_pin_host_ports() -> None:
+    """Each tunnel targets the service's host port from its compose file.
+    LakeFS is pinned explicitly: PR #529 R1 once pushed it to 8200
+    alongside Windmill in a cross-hook search-replace."""
+    assert {name: hook.port for name, hook in _HTTP_HOOK_REGISTRY.items()} == {
+        "portainer": 9090,
+        "n8n": 5678,
+        "metabase": 3000,
+        "lakefs": 8000,
+        "openmetadata": 8585,
+        "wikijs": 3005,
+        "dify": 8501,
+        "windmill": 8200,
+    }
+
+
+@responses.activate
+def test_rest_hooks_run_concurrently_one_tunnel_each(capsys: pytest.CaptureFixture[str]) -> None:
+    """portainer's first-init only answers once n8n's owner-setup has
+    started, which can't happen when hooks run one after another.
+    Logs still come out in ``enabled`` order."""
+    n8n_started = threading.Event()
 
+    def portainer_init(_request: Any) -> tuple[int, dict[str, str], str]:
+        if n8n_started.wait(timeout=5):
+            return 200, {}, '{"Id": 1}'
+        return 500, {}, "timeout"
 
-def test_render_openmetadata_hook_skips_when_password_empty() -> None:
-    script = render_openmetadata_hook(_make_config(openmetadata_admin_password=""), _make_env())
-    assert script.strip() == 'echo "RESULT hook=openmetadata status=skipped-not-ready"'
+    def n8n_setup(_request: Any) -> tuple[int, dict[str, str], str]:
+        n8n_started.set()
+        return 200, {}, '{"data": {"id": "u1"}}'
 
+    responses.add(responses.GET, "http://localhost:9090/api/system/status", status=200)
+    responses.add_callback(
+        responses.POST, "http://localhost:9090/api/users/admin/init", callback=portainer_init
+    )
+    responses.add(responses.GET, "http://localhost:5678/healthz", status=200)
+    responses.add(responses.GET, "http://localhost:5678/rest/settings", json={})
+    responses.add_callback(
+        responses.POST, "http://localhost:5678/rest/owner/setup", callback=n8n_setup
+    )
+    ssh = _FakeSSH(broken=frozenset({3000}))
 
-def test_render_metabase_hook_uses_admin_email() -> None:
-    script = render_metabase_hook(_make_config(), _make_env())
-    assert "ops@example.com" in script
-    assert "/api/setup" in script
+    result = _run_rest(["portainer", "metabase", "n8n"], ssh)
 
+    assert result.hooks == (
+        HookResult(name="portainer", status="configured"),
+        HookResult(name="metabase", status="failed"),
+        HookResult(name="n8n", status="configured"),
+    )
+    assert sorted(ssh.forwards) == [3000, 5678, 9090]
+    assert "metabase: ssh tunnel to port 3000 failed" in capsys.readouterr().err
 
-def test_render_lakefs_hook_picks_hetzner_when_both_bucket_and_server_set() -> None:
-    """Storage namespace selection requires BOTH
-    `hetzner_s3_bucket_lakefs` AND `hetzner_s3_server` to be set
-    to land in the s3:// namespace.
 
-    Test fixture intentionally uses a non-URL-shaped server value
-    (``hetzner-s3-fake-host``) to avoid CodeQL's "Incomplete URL
-    substring sanitization" false-positive — the rule fires on
-    ``"foo.com" in some_url`` patterns intended for security
-    decisions, but this assertion just checks rendered-bash content.
-    """
-    script = render_lakefs_hook(
-        _make_config(
-            hetzner_s3_bucket_lakefs="b1",
-            hetzner_s3_server="hetzner-s3-fake-host",
-        ),
-        _make_env(),
+@responses.activate
+def test_rest_hook_not_ready_reports_skipped(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setitem(
+        _HTTP_HOOK_REGISTRY, "portainer", replace(_HTTP_HOOK_REGISTRY["portainer"], timeout_s=0)
     )
-    assert "b1" in script
-    assert "hetzner-s3-fake-host" in script
-    # The if-condition tests both vars
-    assert '[ -n "$HETZNER_BUCKET" ] && [ -n "$HETZNER_SERVER" ]' in script
+    responses.add(responses.GET, "http://localhost:9090/api/system/status", status=503)
+    result = _run_rest(["portainer"], _FakeSSH())
+    assert result.hooks == (HookResult(name="portainer", status="skipped-not-ready"),)
+    assert "portainer not ready after 0s — skipping setup" in capsys.readouterr().err
+    # Setup never ran.
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_wait_ready_backs_off_with_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Probes start 250ms apart and double (half to full delay) up to the cap."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("nexus_deploy.services.time.sleep", sleeps.append)
+    for status in (503, 503, 503, 503, 200):
+        responses.add(responses.GET, f"{BASE}/api/version", status=status)
+    hook = _HTTP_HOOK_REGISTRY["windmill"]
+    assert _wait_ready(_client(), replace(hook, max_backoff_s=1.0))
+    assert len(sleeps) == 4
+    for slept, delay in zip(sleeps, (0.25, 0.5, 1.0, 1.0), strict=True):
+        assert delay / 2 <= slept <= delay
+
+
+def test_rest_hook_ready_predicates() -> None:
+    def resp(status: int, body: str = "") -> requests.Response:
+        r = requests.Response()
+        r.status_code = status
+        r._content = body.encode()
+        return r
+
+    dify = _HTTP_HOOK_REGISTRY["dify"].ready
+    assert all(dify(resp(status)) for status in (200, 302, 307))
+    assert not dify(resp(502))
+    om = _HTTP_HOOK_REGISTRY["openmetadata"].ready
+    assert om(resp(200, '{"version": "1.5"}'))
+    assert not om(resp(200, "starting"))
 
 
-def test_render_lakefs_hook_falls_back_to_local_when_no_hetzner() -> None:
-    script = render_lakefs_hook(
-        _make_config(hetzner_s3_bucket_lakefs="", hetzner_s3_server=""), _make_env()
+@pytest.mark.parametrize(
+    ("body", "status"),
+    [
+        ('{"Id": 1, "Username": "admin"}', "configured"),
+        ('{"message": "Administrator already initialized"}', "already-configured"),
+        ("", "failed"),
+    ],
+)
+@responses.activate
+def test_portainer_setup_dispatch(body: str, status: str) -> None:
+    responses.add(responses.POST, f"{BASE}/api/users/admin/init", body=body)
+    inputs = _HTTP_HOOK_REGISTRY["portainer"].inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert _HTTP_HOOK_REGISTRY["portainer"].setup(_client(), inputs) == status
+    assert _sent(0) == {"Username": "admin", "Password": "p-pass"}
+
+
+@responses.activate
+def test_n8n_setup_already_configured_via_settings() -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE}/rest/settings",
+        json={"data": {"userManagement": {"showSetupOnFirstLoad": False}}},
     )
-    assert "local://data/lakefs/" in script
-    assert "local-storage" in script
+    inputs = {"email": "ops@example.com", "password": "n-pass"}
+    assert _HTTP_HOOK_REGISTRY["n8n"].setup(_client(), inputs) == "already-configured"
+    assert len(responses.calls) == 1
 
 
-def test_render_lakefs_hook_falls_back_when_only_bucket_set_no_server() -> None:
-    """Round-7 finding: bucket alone is NOT enough — endpoint is also
-    required. Without the server, lakefs has no way to read/write S3.
-    Both inputs are required; we enforce that here."""
-    config = _make_config(hetzner_s3_bucket_lakefs="b1", hetzner_s3_server="")
-    script = render_lakefs_hook(config, _make_env())
-    # Both fields are present in the rendered script (their values
-    # get baked in), but at runtime the AND-check will land in the
-    # local:// branch because HETZNER_SERVER is empty. We pin the
-    # AND-check structure here.
-    assert '[ -n "$HETZNER_BUCKET" ] && [ -n "$HETZNER_SERVER" ]' in script
+@responses.activate
+def test_n8n_setup_posts_owner_when_settings_unreadable() -> None:
+    responses.add(responses.GET, f"{BASE}/rest/settings", body="<html>")
+    responses.add(responses.POST, f"{BASE}/rest/owner/setup", json={"data": {"id": "1"}})
+    inputs = {"email": "alice@example.com", "password": "n-pass"}
+    assert _HTTP_HOOK_REGISTRY["n8n"].setup(_client(), inputs) == "configured"
+    assert _sent(1)["email"] == "alice@example.com"
+
+
+@responses.activate
+def test_metabase_setup_token_absent_means_already_configured() -> None:
+    responses.add(responses.GET, f"{BASE}/api/session/properties", json={"setup-token": None})
+    inputs = {"email": "ops@example.com", "password": "m-pass"}
+    assert _HTTP_HOOK_REGISTRY["metabase"].setup(_client(), inputs) == "already-configured"
+
+
+@responses.activate
+def test_metabase_setup_body_carries_token_and_password_verbatim() -> None:
+    """Shell-meta characters in the password reach the API untouched."""
+    nasty_password = 'evil"$(date)`whoami`'
+    responses.add(responses.GET, f"{BASE}/api/session/properties", json={"setup-token": "tok123"})
+    responses.add(responses.POST, f"{BASE}/api/setup", json={"id": "s1"})
+    hook = _HTTP_HOOK_REGISTRY["metabase"]
+    inputs = hook.inputs(_make_config(metabase_admin_password=nasty_password), _make_env())
+    assert inputs is not None
+    assert hook.setup(_client(), inputs) == "configured"
+    body = _sent(1)
+    assert body["token"] == "tok123"
+    assert body["user"]["password"] == nasty_password
+    assert body["user"]["email"] == "ops@example.com"
 
 
-def test_render_openmetadata_hook_3_step_flow() -> None:
-    """Login (default-pwd) → changePassword → verify-login."""
-    script = render_openmetadata_hook(_make_config(), _make_env())
-    # All three POST endpoints appear
-    assert script.count("/api/v1/users/login") == 2  # login + verify
-    assert "/api/v1/users/changePassword" in script
-    # System-version probe (custom wait, not _render_wait_healthy)
-    assert "/api/v1/system/version" in script
+@pytest.mark.parametrize(
+    ("bucket", "server", "namespace", "repo"),
+    [
+        ("b1", "hetzner-s3-fake-host", "s3://b1/lakefs/", "hetzner-object-storage"),
+        ("", "", "local://data/lakefs/", "local-storage"),
+        # Round-7 finding: bucket alone is NOT enough — LakeFS also needs
+        # the endpoint to read/write S3.
+        ("b1", "", "local://data/lakefs/", "local-storage"),
+    ],
+)
+def test_lakefs_storage_namespace_needs_bucket_and_server(
+    bucket: str, server: str, namespace: str, repo: str
+) -> None:
+    config = _make_config(hetzner_s3_bucket_lakefs=bucket, hetzner_s3_server=server)
+    inputs = _HTTP_HOOK_REGISTRY["lakefs"].inputs(config, _make_env())
+    assert inputs is not None
+    assert (inputs["storage_namespace"], inputs["repo_name"]) == (namespace, repo)
+
+
+@pytest.mark.parametrize(
+    ("config_body", "repo_body", "status", "calls"),
+    [
+        ('{"setup_complete":false}', '{"id": "local-storage"}', "configured", 3),
+        (
+            '{"setup_complete":true}',
+            '{"message": "repository already exists"}',
+            "already-configured",
+            2,
+        ),
+        ('{"setup_complete":false}', '{"message": "repository already exists"}', "configured", 3),
+        ('{"setup_complete":true}', "", "failed", 2),
+    ],
+)
+@responses.activate
+def test_lakefs_setup_dispatch(config_body: str, repo_body: str, status: str, calls: int) -> None:
+    responses.add(responses.GET, f"{BASE}/api/v1/config", body=config_body)
+    responses.add(responses.POST, f"{BASE}/api/v1/setup_lakefs", json={"access_key_id": "x"})
+    responses.add(responses.POST, f"{BASE}/api/v1/repositories", body=repo_body)
+    hook = _HTTP_HOOK_REGISTRY["lakefs"]
+    inputs = hook.inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert hook.setup(_client(), inputs) == status
+    assert len(responses.calls) == calls
+    repo_call = responses.calls[-1].request
+    expected = base64.b64encode(b"FAKE-LAKEFS-ACCESS-KEY-1234:secret-lakefs-key").decode()
+    assert repo_call.headers["Authorization"] == f"Basic {expected}"
+
+
+@responses.activate
+def test_lakefs_setup_failure_stops_before_repo() -> None:
+    responses.add(responses.GET, f"{BASE}/api/v1/config", body="")
+    responses.add(responses.POST, f"{BASE}/api/v1/setup_lakefs", status=500, body="boom")
+    inputs = _HTTP_HOOK_REGISTRY["lakefs"].inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert _HTTP_HOOK_REGISTRY["lakefs"].setup(_client(), inputs) == "failed"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_openmetadata_setup_login_change_verify() -> None:
+    """Login (default-pwd) → changePassword (Bearer) → verify-login."""
+    login = f"{BASE}/api/v1/users/login"
+    responses.add(responses.POST, login, json={"accessToken": "tok-default"})
+    responses.add(responses.PUT, f"{BASE}/api/v1/users/changePassword", status=200)
+    responses.add(responses.POST, login, json={"accessToken": "tok-new"})
+    hook = _HTTP_HOOK_REGISTRY["openmetadata"]
+    inputs = hook.inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert hook.setup(_client(), inputs) == "configured"
+    assert _sent(0) == {
+        "email": "admin@example.com",
+        "password": base64.b64encode(b"admin").decode(),
+    }
+    change = responses.calls[1].request
+    assert change.headers["Authorization"] == "Bearer tok-default"
+    assert _sent(1)["newPassword"] == "om-pass-Complex1!"
+    assert _sent(2)["password"] == base64.b64encode(b"om-pass-Complex1!").decode()
+
+
+@pytest.mark.parametrize(
+    ("body", "status"),
+    [('{"message": "Invalid username or password"}', "already-configured"), ("", "failed")],
+)
+@responses.activate
+def test_openmetadata_setup_default_login_rejected(body: str, status: str) -> None:
+    responses.add(responses.POST, f"{BASE}/api/v1/users/login", status=401, body=body)
+    inputs = {"login": "admin@example.com", "password": "pw"}
+    assert _HTTP_HOOK_REGISTRY["openmetadata"].setup(_client(), inputs) == status
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("body", "status"),
+    [
+        ('{"data":{"setup":{"responseResult":{"succeeded":true}}}}', "configured"),
+        (
+            '{"data":{"setup":{"responseResult":{"message":"Already set up"}}}}',
+            "already-configured",
+        ),
+        ("", "failed"),
+    ],
+)
+@responses.activate
+def test_wikijs_setup_dispatch(body: str, status: str) -> None:
+    responses.add(responses.POST, f"{BASE}/graphql", body=body)
+    hook = _HTTP_HOOK_REGISTRY["wikijs"]
+    inputs = hook.inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert hook.setup(_client(), inputs) == status
+    variables = _sent(0)["variables"]["input"]
+    assert variables["adminPassword"] == variables["adminPasswordConfirm"] == "wiki-pass"
+
+
+def test_wikijs_inputs_prefer_gitea_user_email_over_admin_email() -> None:
+    env = BootstrapEnv(
+        domain="example.com", admin_email="admin@example.com", gitea_user_email="user@example.com"
+    )
+    inputs = _HTTP_HOOK_REGISTRY["wikijs"].inputs(_make_config(), env)
+    assert inputs is not None
+    assert inputs["email"] == "user@example.com"
+    assert _HTTP_HOOK_REGISTRY["wikijs"].inputs(_make_config(), BootstrapEnv()) is None
+
+
+@responses.activate
+def test_dify_setup_already_finished() -> None:
+    responses.add(responses.GET, f"{BASE}/console/api/setup", json={"step": "finished"})
+    inputs = {"email": "ops@example.com", "password": "dify-pass"}
+    assert _HTTP_HOOK_REGISTRY["dify"].setup(_client(), inputs) == "already-configured"
+
+
+@responses.activate
+def test_dify_setup_reuses_init_session_cookie() -> None:
+    """The init call's session cookie rides along on the setup call —
+    the keep-alive session replaces the bash cookie-jar tmpfile."""
+    responses.add(responses.GET, f"{BASE}/console/api/setup", json={"step": "not_started"})
+    responses.add(
+        responses.POST,
+        f"{BASE}/console/api/init",
+        json={"result": "success"},
+        headers={"Set-Cookie": "session=abc; Path=/"},
+    )
+    responses.add(responses.POST, f"{BASE}/console/api/setup", json={"result": "success"})
+    inputs = {"email": "ops@example.com", "password": "dify-pass"}
+    assert _HTTP_HOOK_REGISTRY["dify"].setup(_client(), inputs) == "configured"
+    assert responses.calls[2].request.headers["Cookie"] == "session=abc"
+    assert _sent(2) == {"email": "ops@example.com", "name": "Admin", "password": "dify-pass"}
+
+
+@responses.activate
+def test_dify_setup_init_rejected_warns_and_fails() -> None:
+    responses.add(responses.GET, f"{BASE}/console/api/setup", json={})
+    responses.add(responses.POST, f"{BASE}/console/api/init", json={"result": "fail"})
+    client = _client()
+    assert _HTTP_HOOK_REGISTRY["dify"].setup(client, {"email": "e", "password": "p"}) == "failed"
+    assert client.log == ["  ⚠ Dify init validation failed — configure manually at /install"]
+
+
+def _windmill_responses(
+    base: str = BASE, workspace: str = '"nexus"', rotation_status: int = 200
+) -> None:
+    responses.add(responses.POST, f"{base}/api/users/create", body="")
+    responses.add(responses.POST, f"{base}/api/workspaces/create", body=workspace)
+    responses.add(responses.POST, f"{base}/api/users/setpassword", status=rotation_status)
+
+
+@pytest.mark.parametrize(
+    ("workspace", "status"),
+    [
+        ('"nexus"', "configured"),
+        ("workspace already exists", "already-configured"),
+        ("", "failed"),
+    ],
+)
+@responses.activate
+def test_windmill_setup_workspace_dispatch(workspace: str, status: str) -> None:
+    _windmill_responses(workspace=workspace)
+    hook = _HTTP_HOOK_REGISTRY["windmill"]
+    inputs = hook.inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert hook.setup(_client(), inputs) == status
+    # Every call authenticates with the superadmin secret.
+    assert {c.request.headers["Authorization"] for c in responses.calls} == {"Bearer wm-secret"}
+    assert _sent(0)["super_admin"] is True
+    # Default admin rotated to a fresh random password, never the secret.
+    assert _sent(-1)["password"] not in ("wm-secret", "wm-admin-pass")
+
+
+@responses.activate
+def test_windmill_setup_rotation_failure_fails_hook() -> None:
+    """Security-critical: a failed default-admin rotation fails the hook
+    even when the workspace was created."""
+    _windmill_responses(rotation_status=401)
+    client = _client()
+    inputs = _HTTP_HOOK_REGISTRY["windmill"].inputs(_make_config(), _make_env())
+    assert inputs is not None
+    assert _HTTP_HOOK_REGISTRY["windmill"].setup(client, inputs) == "failed"
+    assert "rotation returned HTTP 401" in client.log[0]
+
+
+@responses.activate
+def test_windmill_setup_creates_regular_user_only_when_email_differs() -> None:
+    _windmill_responses()
+    env = BootstrapEnv(admin_email="ops@example.com", gitea_user_email="dev@example.com")
+    inputs = _HTTP_HOOK_REGISTRY["windmill"].inputs(_make_config(), env)
+    assert inputs is not None
+    assert _HTTP_HOOK_REGISTRY["windmill"].setup(_client(), inputs) == "configured"
+    created = [
+        _sent(i) for i, c in enumerate(responses.calls) if str(c.request.url).endswith("/create")
+    ]
+    assert [(b.get("email"), b.get("super_admin")) for b in created[:2]] == [
+        ("ops@example.com", True),
+        ("dev@example.com", False),
+    ]
+
+
+@responses.activate
+def test_rest_hooks_skip_unchanged_via_stamps() -> None:
+    """R9 for REST hooks: a matching admin-setup stamp skips the hook
+    without a tunnel; windmill always runs; fresh stamps are stored."""
+    config = _make_config()
+    env = _make_env()
+    portainer_inputs = _HTTP_HOOK_REGISTRY["portainer"].inputs(config, env)
+    assert portainer_inputs is not None
+    unchanged = _http_hook_stamp(portainer_inputs, "c" * 64)
+    scripts: list[str] = []
+
+    def runner(script: str) -> subprocess.CompletedProcess[str]:
+        scripts.append(script)
+        out = f"HOOKSTAMP portainer {unchanged} {'c' * 64}\nHOOKSTAMP n8n - -\n"
+        return subprocess.CompletedProcess(args=["ssh"], returncode=0, stdout=out, stderr="")
+
+    responses.add(responses.GET, "http://localhost:5678/healthz", status=200)
+    responses.add(responses.GET, "http://localhost:5678/rest/settings", json={})
+    responses.add(responses.POST, "http://localhost:5678/rest/owner/setup", json={"id": "1"})
+    responses.add(responses.GET, "http://localhost:8200/api/version", status=200)
+    _windmill_responses("http://localhost:8200")
+    ssh = _FakeSSH()
+
+    result = _run_rest(
+        ["portainer", "n8n", "windmill"], ssh, config=config, runner=runner, skip_unchanged=True
+    )
+
+    assert [h.status for h in result.hooks] == ["skipped-unchanged", "configured", "configured"]
+    assert sorted(ssh.forwards) == [5678, 8200]
+    fetch, store = scripts
+    assert "windmill" not in fetch
+    n8n_inputs = _HTTP_HOOK_REGISTRY["n8n"].inputs(config, env)
+    assert n8n_inputs is not None
+    assert f"echo {_http_hook_stamp(n8n_inputs, '')} > " in store
+    assert "/admin-setup/n8n" in store
+    assert "/admin-setup/windmill" not in store
+    # R4: credentials never travel in a remote script.
+    for script in scripts:
+        assert "n-pass" not in script
+        assert "p-pass" not in script
+
+
+def test_hook_stamps_fetch_script_reports_dash_for_missing() -> None:
+    """The fetch script runs against an empty stamps dir without failing."""
+    script = _render_hook_stamps_fetch(["portainer"])
+    proc = subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True)
+    assert proc.stdout == "HOOKSTAMP portainer - -\n"
 
 
 # ---------------------------------------------------------------------------
@@ -444,7 +829,7 @@ def test_render_superset_hook_email_via_dash_e_not_argv() -> None:
 
 
 # ---------------------------------------------------------------------------
-# Uptime Kuma, Garage, Wiki.js, Dify, Windmill, SFTPGo
+# Uptime Kuma, Garage, SFTPGo
 # ---------------------------------------------------------------------------
 
 
@@ -508,223 +893,6 @@ def test_render_garage_hook_validates_node_id_as_64_hex() -> None:
     assert "[0-9a-fA-F]{64}" in script
 
 
-def test_render_wikijs_hook_basic() -> None:
-    script = render_wikijs_hook(_make_config(), _make_env())
-    assert "wikijs_hook()" in script
-    assert "/graphql" in script
-    assert "mutation ($input: SetupInput!)" in script
-    assert "siteUrl: env.NEXUS_U" in script
-
-
-def test_render_wikijs_hook_skips_when_password_empty() -> None:
-    config = _make_config(wikijs_admin_password="")
-    script = render_wikijs_hook(config, _make_env())
-    assert "wikijs_hook()" not in script
-    assert "RESULT hook=wikijs status=skipped-not-ready" in script
-
-
-def test_render_wikijs_hook_skips_when_email_empty() -> None:
-    """Email comes from gitea_user_email or admin_email — both empty → skip."""
-    env = BootstrapEnv(domain="example.com")  # no admin_email, no gitea_user_email
-    script = render_wikijs_hook(_make_config(), env)
-    assert "RESULT hook=wikijs status=skipped-not-ready" in script
-
-
-def test_render_wikijs_hook_prefers_gitea_user_email_over_admin_email() -> None:
-    """When both are set, gitea_user_email wins (single-address user
-    identity). Use disjoint email values so the check is unambiguous —
-    shlex.quote('admin@example.com') returns the bare string (no
-    shell-special chars), so the previous assertion
-    'NEXUS_E=...admin@example.com... not in script' would have passed
-    even if the hook had buggily used admin_email (it would have been
-    embedded as NEXUS_E=admin@example.com without quotes). Using a
-    distinctive admin-only token here avoids that false-positive."""
-    env = BootstrapEnv(
-        domain="example.com",
-        admin_email="admin-should-not-appear@example.org",
-        gitea_user_email="user@example.com",
-    )
-    script = render_wikijs_hook(_make_config(), env)
-    assert "user@example.com" in script
-    # The admin email's distinctive prefix MUST NOT appear anywhere
-    # in the rendered script — pins both the gitea-user-wins choice
-    # AND defends against shlex.quote rendering ambiguities.
-    assert "admin-should-not-appear" not in script
-
-
-def test_render_wikijs_hook_password_via_env_var_not_argv() -> None:
-    """R-secret: GraphQL body builds via NEXUS_P=… jq -n env, not --arg."""
-    script = render_wikijs_hook(_make_config(), _make_env())
-    assert "NEXUS_P=" in script
-    # No --arg pass-through (would land password in jq's argv)
-    assert "--arg pass" not in script
-
-
-def test_render_dify_hook_basic() -> None:
-    script = render_dify_hook(_make_config(), _make_env())
-    assert "dify_hook()" in script
-    assert "/console/api/init" in script
-    assert "/console/api/setup" in script
-    # Cookie jar tmpfile
-    assert "DIFY_COOKIES=$(mktemp)" in script
-    assert 'chmod 600 "$DIFY_COOKIES"' in script
-
-
-def test_render_dify_hook_skips_when_password_empty() -> None:
-    config = _make_config(dify_admin_password="")
-    script = render_dify_hook(config, _make_env())
-    assert "RESULT hook=dify status=skipped-not-ready" in script
-    assert "dify_hook()" not in script
-
-
-def test_render_dify_hook_already_configured_via_setup_check() -> None:
-    """R-idempotent: pre-check `/setup` → already-configured if step finished."""
-    script = render_dify_hook(_make_config(), _make_env())
-    assert '"step":"finished"' in script
-    assert "RESULT hook=dify status=already-configured" in script
-
-
-def test_render_dify_hook_handles_307_redirect_in_readiness() -> None:
-    """Dify's redirect-to-/install pattern (HTTP 307) counts as ready."""
-    script = render_dify_hook(_make_config(), _make_env())
-    assert "200|302|307)" in script
-
-
-def test_render_dify_hook_password_via_env_var_not_argv() -> None:
-    script = render_dify_hook(_make_config(), _make_env())
-    # Init body and setup body both use NEXUS_P= env-var
-    assert "NEXUS_P=" in script
-    assert "--arg password" not in script
-
-
-def test_render_dify_hook_cookie_trap_on_return() -> None:
-    """R-tmpfile-cleanup: cookie jar removed on function-scoped RETURN
-    trap, AND the trap is explicitly cleared via 'trap - RETURN'
-    before EVERY function-return path (success AND init-failure
-    early-exit) so it doesn't leak across hooks. Same pattern as
-    LakeFS / OpenMetadata. The orchestrator runs all hooks in one
-    shell with 'set -u'; a leaked RETURN trap referencing
-    DIFY_COOKIES would trip set -u on a later hook."""
-    script = render_dify_hook(_make_config(), _make_env())
-    assert "trap 'rm -f \"$DIFY_COOKIES\"' RETURN" in script
-    # Cleanup + trap-reset must appear at least TWICE: once on the
-    # success path (after the setup POST) and once on the init-
-    # failure early-exit path. R7 caught the missing one on the
-    # init-failure path.
-    assert script.count('rm -f "$DIFY_COOKIES"') >= 2
-    assert script.count("trap - RETURN") >= 2
-
-
-def test_render_windmill_hook_basic() -> None:
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "windmill_hook()" in script
-    # All 4 legacy steps present
-    assert "/api/users/create" in script
-    assert "/api/workspaces/create" in script
-    assert "/api/users/setpassword" in script
-    # Workspace name must be "nexus" for stability across migration
-    assert 'id: "nexus"' in script
-
-
-def test_render_windmill_hook_pins_host_port_8200() -> None:
-    """R-port: Windmill compose maps 8200:8000. Hook MUST hit
-    localhost:8200 from the SSH host, not the in-container port 8000.
-    Pinned to catch port-mapping drift if the compose file changes."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "localhost:8200" in script
-    assert "localhost:8000" not in script
-
-
-def test_render_windmill_hook_skips_when_any_required_field_empty() -> None:
-    """Skip when any of secret/admin_password/admin_email is empty —
-    the legacy gate required all 3."""
-    for kw in (
-        {"windmill_superadmin_secret": ""},
-        {"windmill_admin_password": ""},
-    ):
-        config = _make_config(**kw)
-        script = render_windmill_hook(config, _make_env())
-        assert "RESULT hook=windmill status=skipped-not-ready" in script
-        assert "windmill_hook()" not in script
-    # admin_email empty
-    env = BootstrapEnv(domain="example.com")
-    script = render_windmill_hook(_make_config(), env)
-    assert "RESULT hook=windmill status=skipped-not-ready" in script
-
-
-def test_render_windmill_hook_creates_admin_user() -> None:
-    """Step 1: legacy creates super_admin=true user for ADMIN_EMAIL."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "super_admin: true" in script
-    # Email goes via env-var to jq, not --arg
-    assert "NEXUS_E=" in script
-
-
-def test_render_windmill_hook_creates_regular_user_when_gitea_user_email_differs() -> None:
-    """Step 2: legacy conditionally creates super_admin=false user
-    for GITEA_USER_EMAIL when it differs from ADMIN_EMAIL."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "super_admin: false" in script
-    assert "GITEA_UE=" in script
-    # Conditional gate
-    assert '[ -n "$GITEA_UE" ]' in script
-
-
-def test_render_windmill_hook_secures_default_admin_account() -> None:
-    """R-security (Step 4): MUST rotate admin@windmill.dev password
-    away from the long-lived WINDMILL_SUPERADMIN_SECRET. Without
-    this, anyone with the secret could log in as the default admin.
-
-    Plus: rotation HTTP status must be CHECKED, not silenced. A
-    failed rotation (wrong secret, API error) must surface as
-    'failed' with a stderr warning, not silently report 'configured'
-    while the default admin stays usable."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "openssl rand -base64 32" in script
-    assert "/api/users/setpassword" in script
-    # Status capture (NOT silenced)
-    assert "DEFPW_STATUS=" in script
-    assert "200|204)" in script  # success branch
-    # Failure path: warns AND aborts to 'failed'
-    assert "default-admin password rotation returned HTTP" in script
-    assert "may still be usable with the superadmin secret" in script
-
-
-def test_render_windmill_hook_bearer_via_curl_config_not_argv() -> None:
-    """R-secret-transport: WINDMILL_SUPERADMIN_SECRET reaches curl
-    via mode-600 --config tmpfile (RETURN trap), NOT via -H argv.
-    Plus: the RETURN trap is explicitly cleared before function-
-    return so it doesn't leak across hooks (orchestrator runs all
-    hooks in one shell with set -u)."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "WM_CFG=$(mktemp)" in script
-    assert 'chmod 600 "$WM_CFG"' in script
-    assert "trap 'rm -f \"$WM_CFG\"' RETURN" in script
-    # Explicit cleanup + trap reset before exit
-    assert 'rm -f "$WM_CFG"' in script
-    assert "trap - RETURN" in script
-    # No -H "Authorization: Bearer" argv
-    assert '-H "Authorization' not in script
-    assert "-H 'Authorization" not in script
-
-
-def test_render_windmill_hook_secret_via_env_var_not_argv() -> None:
-    """jq calls receive secrets via NEXUS_E / NEXUS_P / NEXUS_RP env vars."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "NEXUS_P=" in script
-    assert "--arg password" not in script
-    assert "--arg email" not in script
-
-
-def test_render_windmill_hook_workspace_response_dispatch() -> None:
-    """Workspace-create body \"nexus\" / 'created' → configured;
-    'already exists' → already-configured; else → failed."""
-    script = render_windmill_hook(_make_config(), _make_env())
-    assert "RESULT hook=windmill status=configured" in script
-    assert "RESULT hook=windmill status=already-configured" in script
-    assert "RESULT hook=windmill status=failed" in script
-
-
 def test_render_sftpgo_hook_basic() -> None:
     script = render_sftpgo_hook(_make_config(), _make_env())
     assert "sftpgo_hook()" in script
@@ -849,11 +1017,11 @@ def test_render_pg_ducklake_hook_uses_wall_clock_bound_for_readiness() -> None:
 @pytest.mark.parametrize(
     "renderer",
     [
-        render_portainer_hook,
-        render_n8n_hook,
-        render_metabase_hook,
-        render_lakefs_hook,
-        render_openmetadata_hook,
+        render_redpanda_hook,
+        render_superset_hook,
+        render_garage_hook,
+        render_sftpgo_hook,
+        render_pg_ducklake_hook,
     ],
 )
 def test_round_8_per_hook_emits_exactly_one_result_line(renderer: Any) -> None:
@@ -877,7 +1045,7 @@ def test_round_1_set_minus_u_at_top_no_set_e() -> None:
     ``|| true`` and explicit branches to control flow.
     """
     script = render_remote_script(
-        config=_make_config(), env=_make_env(), enabled_hooks=["portainer"]
+        config=_make_config(), env=_make_env(), enabled_hooks=["redpanda"]
     )
     assert script.startswith("set -u")
     # No `set -e` in the orchestrator (R6 corollary)
@@ -891,50 +1059,30 @@ def test_round_2_per_spec_healthcheck_timeouts() -> None:
     unify them and break Metabase (Java app, 120s), OpenMetadata
     (180s, slow boot), or Superset (300s = 5min, db upgrade + init).
     """
-    timeouts = {
-        # 2.2b — REST hooks
+    rest_timeouts = {
         "portainer": 5,
         "n8n": 60,
         "metabase": 120,
         "lakefs": 60,
         "openmetadata": 180,
-        # 2.2c — docker-exec hooks
-        "redpanda": 60,
-        "superset": 300,
-    }
-    renderers = {
-        "portainer": render_portainer_hook,
-        "n8n": render_n8n_hook,
-        "metabase": render_metabase_hook,
-        "lakefs": render_lakefs_hook,
-        "openmetadata": render_openmetadata_hook,
-        "redpanda": render_redpanda_hook,
-        "superset": render_superset_hook,
+        "wikijs": 90,
+        "dify": 120,
+        "windmill": 120,
     }
-    for hook_name, expected_timeout in timeouts.items():
-        script = renderers[hook_name](_make_config(), _make_env())
-        # Look for the human-readable warning that names the timeout.
-        # Superset's warning uses '5min' instead of '300s' for readability.
-        if hook_name == "superset":
-            assert "after 5min" in script, "Expected '5min' in superset script"
-        else:
-            assert f"after {expected_timeout}s" in script, (
-                f"Expected '{expected_timeout}s' in {hook_name} script"
-            )
+    assert {n: h.timeout_s for n, h in _HTTP_HOOK_REGISTRY.items()} == rest_timeouts
+    # docker-exec hooks name the timeout in their not-ready warning.
+    # Superset's warning uses '5min' instead of '300s' for readability.
+    assert "after 60s" in render_redpanda_hook(_make_config(), _make_env())
+    assert "after 5min" in render_superset_hook(_make_config(), _make_env())
 
 
 @pytest.mark.parametrize(
     ("renderer", "canary_field", "canary_value"),
     [
         # Each hook is tested with a unique canary substituted for the
-        # credential field that's most likely to land in argv.
-        # 2.2b — REST hooks
-        (render_portainer_hook, "portainer_admin_password", "PORTAINER-CANARY-X1Y2"),
-        (render_n8n_hook, "n8n_admin_password", "N8N-CANARY-X1Y2"),
-        (render_metabase_hook, "metabase_admin_password", "METABASE-CANARY-X1Y2"),
-        (render_lakefs_hook, "lakefs_admin_secret_key", "LAKEFS-SECRET-CANARY-X1Y2"),
-        (render_openmetadata_hook, "openmetadata_admin_password", "OM-CANARY-X1Y2"),
-        # 2.2c — docker-exec hooks. Same R4 invariant via stdin pipe.
+        # credential field that's most likely to land in argv. REST
+        # hooks render no bash at all (see
+        # test_rest_hooks_skip_unchanged_via_stamps).
         (render_redpanda_hook, "redpanda_admin_password", "RP-CANARY-X1Y2"),
         (render_superset_hook, "superset_admin_password", "SU-CANARY-X1Y2"),
     ],
@@ -982,100 +1130,18 @@ def test_no_credential_leaks_into_subprocess_argv_per_hook(
                     )
 
 
-def test_round_4_setup_body_via_env_no_argv_leak() -> None:
-    """R4 — admin password is injected to jq via env var (NOT --arg
-    positional argv) and fed to curl via stdin (--data-binary @-),
-    never via argv.
-
-    Critical: a future bug that put the password into curl's OR
-    jq's argv would leak it via `ps` on the remote host. We assert
-    that:
-      1. The password value appears in the rendered script (it's
-         the value of an env-var assignment — that's expected and
-         bash-safe; bash builtins / env-var-to-cmd assignments don't
-         fork).
-      2. The password value does NOT appear AFTER a forking-command
-         token (curl, jq) on any line — meaning it's never in argv.
-
-    The detailed cross-hook version of this check lives in
-    ``test_no_credential_leaks_into_subprocess_argv_per_hook``;
-    this test pins the Metabase-specific shape.
-    """
-    canary = "UNIQUE-METABASE-PWD-LEAK-CANARY"
-    config = _make_config(metabase_admin_password=canary)
-    script = render_metabase_hook(config, _make_env())
-    assert canary in script, "Canary must appear (as env-var value)"
-    # Canary must NOT appear AFTER curl/jq on any line (= not in argv)
-    for line in script.splitlines():
-        for cmd_token in ("curl ", "jq "):
-            idx_cmd = line.find(cmd_token)
-            idx_canary = line.find(canary)
-            if idx_cmd >= 0 and idx_canary > idx_cmd:
-                raise AssertionError(f"Password leaked into {cmd_token.strip()} argv: {line!r}")
-    # And the rendered script uses --data-binary @- for the POST body
-    assert "--data-binary @-" in script
-
-
-def test_round_4_setup_body_built_correctly_against_rendered_script() -> None:
-    """R4 exec — drive the ACTUAL rendered jq pipeline against a known
-    config and assert the resulting JSON parses + has expected
-    fields, even with shell-meta characters in the password.
-
-    Earlier this test built a hand-coded jq snippet that was decoupled
-    from the renderer — it could pass even if the real renderer drifted.
-    Now we extract the BODY=$(...) line from the rendered script,
-    execute it via bash -c, and parse the captured JSON. This pins
-    the renderer's actual jq form against shell-meta-character
-    payloads.
-    """
-    nasty_password = 'evil"$(date)`whoami`'
-    config = _make_config(metabase_admin_password=nasty_password)
-    full_script = render_metabase_hook(config, _make_env())
-    # Extract the BODY=$(...) jq-build block from the rendered script.
-    # It's a multi-line continuation: BODY=$(NEXUS_TOKEN=... NEXUS_E=...
-    # NEXUS_P=... jq -n '{...}')
-    lines = full_script.splitlines()
-    body_start = next(i for i, line in enumerate(lines) if line.strip().startswith("BODY=$(NEXUS_"))
-    body_end = body_start
-    while not lines[body_end].rstrip().endswith(")"):
-        body_end += 1
-    body_lines = lines[body_start : body_end + 1]
-    # The rendered version uses an implicit SETUP_TOKEN runtime-shell var
-    # (captured from /api/session/properties); inject it explicitly.
-    snippet = (
-        "set -euo pipefail\nSETUP_TOKEN=tok123\n"
-        + "\n".join(body_lines)
-        + '\nprintf "%s" "$BODY"\n'
-    )
-    out = subprocess.run(["bash", "-c", snippet], capture_output=True, text=True, check=True).stdout
-    parsed = json.loads(out)
-    assert parsed["user"]["password"] == nasty_password
-    assert parsed["token"] == "tok123"
-    assert parsed["user"]["email"] == "ops@example.com"
-
-
 def test_round_5_idempotent_skip_via_substring_match() -> None:
-    """R5 — idempotent-skip detection per hook.
+    """R5 — idempotent-skip detection per docker-exec hook.
 
     Each hook has a distinct "already configured" signal. Pin them
-    so refactors don't accidentally drop the check.
+    so refactors don't accidentally drop the check. REST hooks pin
+    theirs behaviourally (``test_*_setup_dispatch`` above).
     """
-    portainer = render_portainer_hook(_make_config(), _make_env())
-    assert "already initialized" in portainer  # Portainer's API response substring
+    garage = render_garage_hook(_make_config(), _make_env())
+    assert "No nodes currently have" in garage  # layout empty → not configured yet
 
-    n8n = render_n8n_hook(_make_config(), _make_env())
-    assert "showSetupOnFirstLoad" in n8n  # n8n's settings probe
-
-    metabase = render_metabase_hook(_make_config(), _make_env())
-    assert "setup-token" in metabase  # Metabase: token absent → already configured
-
-    lakefs = render_lakefs_hook(_make_config(), _make_env())
-    assert '"setup_complete":true' in lakefs
-
-    om = render_openmetadata_hook(_make_config(), _make_env())
-    # OpenMetadata: default login fails with invalid → already configured
-    assert "invalid" in om
-    assert "unauthorized" in om
+    superset = render_superset_hook(_make_config(), _make_env())
+    assert "reset-password" in superset  # user exists → reset instead of create
 
 
 def test_round_6_hook_failure_does_not_abort_orchestrator() -> None:
@@ -1087,7 +1153,7 @@ def test_round_6_hook_failure_does_not_abort_orchestrator() -> None:
     script = render_remote_script(
         config=_make_config(),
         env=_make_env(),
-        enabled_hooks=["portainer", "n8n", "metabase"],
+        enabled_hooks=["redpanda", "superset", "garage"],
     )
     # Orchestrator preamble: set -u only
     assert script.startswith("set -u")
@@ -1113,7 +1179,7 @@ def test_round_7_hook_execution_order_matches_enabled_arg() -> None:
         config=_make_config(),
         env=_make_env(),
         # Pass in reverse-registry order to verify caller-order wins
-        enabled_hooks=["openmetadata", "portainer", "lakefs"],
+        enabled_hooks=["sftpgo", "redpanda", "garage"],
     )
     # The order in which hook functions are called must follow the
     # `enabled_hooks` argument order (caller's responsibility to sort
@@ -1124,7 +1190,142 @@ def test_round_7_hook_execution_order_matches_enabled_arg() -> None:
         m = re.match(r"^([a-z_]+)_hook$", line.strip())
         if m:
             order.append(m.group(1))
-    assert order == ["openmetadata", "portainer", "lakefs"]
+    assert order == ["sftpgo", "redpanda", "garage"]
+
+
+def test_hooks_run_in_parallel_and_replay_logs_in_caller_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each hook runs in its own background subshell; output is buffered
+    per hook and replayed in ``enabled_hooks`` order.
+
+    redpanda's fake hook only succeeds if garage (listed after it)
+    starts while redpanda is still waiting, which can't happen when
+    hooks run one after another.
+    """
+    marker = tmp_path / "garage-started"
+
+    def redpanda(_config: NexusConfig, _env: BootstrapEnv) -> str:
+        return (
+            'echo "  → redpanda waiting"\n'
+            f"for _ in $(seq 1 100); do [ -f {marker} ] && break; sleep 0.05; done\n"
+            'echo "  ⚠ redpanda warning" >&2\n'
+            f"if [ -f {marker} ]; then s=configured; else s=failed; fi\n"
+            'echo "RESULT hook=redpanda status=$s"\n'
+        )
+
+    def garage(_config: NexusConfig, _env: BootstrapEnv) -> str:
+        return (
+            f"touch {marker}\n"
+            'echo "  ⚠ garage warning" >&2\n'
+            'echo "RESULT hook=garage status=configured"\n'
+        )
+
+    monkeypatch.setitem(_HOOK_REGISTRY, "redpanda", redpanda)
+    monkeypatch.setitem(_HOOK_REGISTRY, "garage", garage)
+    script = render_remote_script(
+        config=_make_config(),
+        env=_make_env(),
+        enabled_hooks=["redpanda", "garage", "not-a-hook"],
+    )
+    proc = subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True)
+    assert proc.stdout.splitlines() == [
+        "  → redpanda waiting",
+        "RESULT hook=redpanda status=configured",
+        "RESULT hook=garage status=configured",
+        "RESULT hook=not-a-hook status=skipped-not-ready",
+    ]
+    assert proc.stderr.splitlines() == ["  ⚠ redpanda warning", "  ⚠ garage warning"]
+
+
+def test_wait_healthy_backs_off_from_subsecond_probes(tmp_path: Path) -> None:
+    """Readiness probes start 250ms apart and double (with jitter) up to
+    ``interval_seconds`` — a service that comes up after three failed
+    probes is seen in well under the 6s that fixed 2s sleeps took."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls"
+    curl = bin_dir / "curl"
+    curl.write_text(
+        "#!/usr/bin/env bash\n"
+        f"echo x >> {calls}\n"
+        f'if [ "$(wc -l < {calls})" -ge 4 ]; then echo 200; else echo 503; fi\n'
+    )
+    curl.chmod(0o755)
+    wait = _render_wait_healthy(
+        name="svc", url="http://localhost:1/health", timeout_seconds=20, interval_seconds=2
+    )
+    assert not re.search(r"^\s*sleep \d+$", wait, re.MULTILINE)
+    snippet = f'set -u\nsvc_hook() {{\n{wait}\necho "READY=$READY after $SECONDS s"\n}}\nsvc_hook\n'
+    proc = subprocess.run(
+        ["bash", "-c", snippet],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"},
+    )
+    assert proc.stdout.startswith("READY=true")
+    assert calls.read_text().count("x") == 4
+    # 125-250 + 250-500 + 500-1000 ms of backoff.
+    assert int(proc.stdout.split()[2]) <= 3
+
+
+def test_round_9_skip_unchanged_wraps_bash_hooks() -> None:
+    """R9 — stamped bash hooks are gated on their input hash."""
+    plain = render_remote_script(
+        config=_make_config(), env=_make_env(), enabled_hooks=["garage", "superset"]
+    )
+    script = render_remote_script(
+        config=_make_config(),
+        env=_make_env(),
+        enabled_hooks=["garage", "superset"],
+        skip_unchanged=True,
+    )
+    assert "HOOK_WANT" not in plain
+    assert script.count("HOOK_WANT=") == 2
+    assert "status=skipped-unchanged" in script
+    assert "/admin-setup/garage" in script
+
+
+@pytest.mark.parametrize(("exit_code", "stamped"), [(0, True), (3, False)])
+def test_round_9_stamp_wrapper_runs_body_verbatim_via_bash_exec(
+    tmp_path: Path, exit_code: int, stamped: bool
+) -> None:
+    """Heredocs, bare ``)`` case arms and ``exit`` work inside the wrapper."""
+    from nexus_deploy import stamps
+    from nexus_deploy.services import _wrap_with_stamp
+
+    body = f"""cat <<'EOF'
+heredoc (with parens
+EOF
+case x in
+    x) echo "RESULT hook=garage status=configured" ;;
+esac
+exit {exit_code}
+"""
+    script = _wrap_with_stamp("garage", body).replace(stamps.REMOTE_STAMPS_DIR, str(tmp_path))
+    proc = subprocess.run(
+        ["bash", "-c", f"set -u\n{script}\necho after"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout.splitlines() == [
+        "heredoc (with parens",
+        "RESULT hook=garage status=configured",
+        "after",
+    ]
+    assert (tmp_path / "admin-setup" / "garage").exists() is stamped
+
+
+def test_parse_results_counts_skipped_unchanged() -> None:
+    result = SetupResult(
+        hooks=parse_results(
+            "RESULT hook=portainer status=skipped-unchanged\nRESULT hook=n8n status=configured\n"
+        )
+    )
+    assert result.skipped_unchanged == 1
+    assert result.configured == 1
 
 
 # ---------------------------------------------------------------------------
@@ -1158,13 +1359,13 @@ def test_render_remote_script_drops_unsafe_hook_names(
     script = render_remote_script(
         config=_make_config(),
         env=_make_env(),
-        enabled_hooks=["portainer", unsafe_name],
+        enabled_hooks=["redpanda", unsafe_name],
     )
     # Unsafe name must NOT reach the rendered bash
     if unsafe_name:  # empty string isn't a substring of anything useful
         assert unsafe_name not in script
-    # Portainer (the safe entry) still rendered
-    assert "portainer_hook" in script
+    # RedPanda (the safe entry) still rendered
+    assert "redpanda_hook" in script
     # Stderr warning emitted
     captured = capsys.readouterr()
     assert "Dropped hook with unsafe name" in captured.err
@@ -1175,11 +1376,11 @@ def test_render_remote_script_unknown_hook_emits_skip() -> None:
     script = render_remote_script(
         config=_make_config(),
         env=_make_env(),
-        enabled_hooks=["portainer", "filestash"],  # filestash → 2.2c
+        enabled_hooks=["redpanda", "filestash"],  # filestash → python family
     )
     assert "RESULT hook=filestash status=skipped-not-ready" in script
-    # Portainer still runs
-    assert "portainer_hook" in script
+    # RedPanda still runs
+    assert "redpanda_hook" in script
 
 
 def test_render_remote_script_empty_list_yields_minimal_orchestrator() -> None:
@@ -1271,7 +1472,7 @@ def test_run_admin_setups_filters_unknown_services() -> None:
         return subprocess.CompletedProcess(
             args=["ssh"],
             returncode=0,
-            stdout="RESULT hook=portainer status=configured",
+            stdout="RESULT hook=redpanda status=configured",
             stderr="",
         )
 
@@ -1280,13 +1481,13 @@ def test_run_admin_setups_filters_unknown_services() -> None:
         _make_env(),
         # gitea + jupyter are not in any admin-setup registry
         # (gitea uses its own dedicated module; jupyter has no admin hook)
-        ["portainer", "gitea", "jupyter"],
+        ["redpanda", "gitea", "jupyter"],
         script_runner=capture,
     )
     # gitea + jupyter (not in any registry) must NOT reach the script
     assert "gitea_hook" not in captured["script"]
     assert "jupyter_hook" not in captured["script"]
-    assert "portainer_hook" in captured["script"]
+    assert "redpanda_hook" in captured["script"]
 
 
 def test_run_admin_setups_all_unknown_returns_empty_result() -> None:
@@ -1311,16 +1512,16 @@ def test_run_admin_setups_all_unknown_returns_empty_result() -> None:
 def test_run_admin_setups_missing_result_line_counts_as_failed() -> None:
     """A hook that did NOT emit a RESULT line counts as failed
     (server-side ssh hung up mid-script, etc.)."""
-    out = "RESULT hook=portainer status=configured\n"  # n8n missing
+    out = "RESULT hook=redpanda status=configured\n"  # superset missing
     result = run_admin_setups(
         _make_config(),
         _make_env(),
-        ["portainer", "n8n"],
+        ["redpanda", "superset"],
         script_runner=_ok_runner(out),
     )
     by_name = {h.name: h.status for h in result.hooks}
-    assert by_name["portainer"] == "configured"
-    assert by_name["n8n"] == "failed"
+    assert by_name["redpanda"] == "configured"
+    assert by_name["superset"] == "failed"
 
 
 def test_run_admin_setups_forwards_remote_warnings_to_local_stderr(
@@ -1328,14 +1529,14 @@ def test_run_admin_setups_forwards_remote_warnings_to_local_stderr(
 ) -> None:
     """Modul-1.2 Round-4 lesson: ⚠ warnings reach local stderr."""
     out = (
-        "  ⚠ metabase not ready after 120s — skipping setup\n"
-        "RESULT hook=metabase status=skipped-not-ready\n"
+        "  ⚠ garage not ready after 30s — skipping setup\n"
+        "RESULT hook=garage status=skipped-not-ready\n"
     )
-    run_admin_setups(_make_config(), _make_env(), ["metabase"], script_runner=_ok_runner(out))
+    run_admin_setups(_make_config(), _make_env(), ["garage"], script_runner=_ok_runner(out))
     captured = capsys.readouterr()
-    assert "metabase not ready after 120s" in captured.err
+    assert "garage not ready after 30s" in captured.err
     # RESULT line is wire-format, must NOT pollute stderr
-    assert "RESULT hook=metabase" not in captured.err
+    assert "RESULT hook=garage" not in captured.err
 
 
 # ---------------------------------------------------------------------------
@@ -1436,7 +1637,7 @@ def test_services_configure_cli_rc_mapping(
     def fake_run(_config: Any, _env: Any, _enabled: list[str]) -> SetupResult:
         return SetupResult(hooks=hooks)
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_admin_setups", fake_run)
+    monkeypatch.setattr("nexus_deploy.services.run_admin_setups", fake_run)
     monkeypatch.setattr("sys.stdin.read", lambda: "{}")
     rc = _services_configure(["configure", "--enabled", "portainer"])
     assert rc == expected_rc
@@ -1451,7 +1652,7 @@ def test_services_configure_cli_rc2_on_unexpected_exception(
     def boom(_c: Any, _e: Any, _en: list[str]) -> SetupResult:
         raise RuntimeError("secret-bearing-message-NEVER-print")
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_admin_setups", boom)
+    monkeypatch.setattr("nexus_deploy.services.run_admin_setups", boom)
     monkeypatch.setattr("sys.stdin.read", lambda: "{}")
     rc = _services_configure(["configure", "--enabled", "portainer"])
     assert rc == 2
@@ -1469,7 +1670,7 @@ def test_services_configure_cli_rc2_on_transport_failure(
     def boom(_c: Any, _e: Any, _en: list[str]) -> SetupResult:
         raise subprocess.CalledProcessError(255, ["ssh", "with-secret-arg"])
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_admin_setups", boom)
+    monkeypatch.setattr("nexus_deploy.services.run_admin_setups", boom)
     monkeypatch.setattr("sys.stdin.read", lambda: "{}")
     rc = _services_configure(["configure", "--enabled", "portainer"])
     assert rc == 2
@@ -1870,6 +2071,17 @@ def test_configure_filestash_happy_path_writes_configured() -> None:
     assert result == HookResult(name="filestash", status="configured")
 
 
+def test_configure_filestash_skip_unchanged_does_not_push() -> None:
+    """Pulled config already matches → no push stage (runner has one reply)."""
+    settled = _filestash_mutate_config(
+        {"general": {"host": "https://files.example.com"}}, config=_config_with_r2()
+    )
+    pull_b64 = base64.b64encode(json.dumps(settled).encode()).decode()
+    runner = _runner_returning([f"RESULT_PULL_OK {pull_b64}\n"])
+    result = configure_filestash(_config_with_r2(), script_runner=runner, skip_unchanged=True)
+    assert result == HookResult(name="filestash", status="skipped-unchanged")
+
+
 def test_configure_filestash_skipped_not_ready_short_circuits() -> None:
     """When stage 1 reports not-ready we don't even render stage 2."""
     runner_call_count = {"n": 0}
@@ -2009,57 +2221,64 @@ def test_run_admin_setups_dispatches_bash_and_python_hooks_together() -> None:
     pull_b64 = base64.b64encode(json.dumps(initial).encode()).decode()
     runner = _runner_returning(
         [
-            "RESULT hook=portainer status=configured\n",
+            "RESULT hook=redpanda status=configured\n",
             f"RESULT_PULL_OK {pull_b64}\n",
             "RESULT hook=filestash status=configured\n",
         ]
     )
     result = run_admin_setups(
-        _make_config(), _make_env(), ["portainer", "filestash"], script_runner=runner
+        _make_config(), _make_env(), ["redpanda", "filestash"], script_runner=runner
     )
     names = {h.name for h in result.hooks}
-    assert names == {"portainer", "filestash"}
+    assert names == {"redpanda", "filestash"}
     assert result.is_success
 
 
+def test_run_admin_setups_returns_results_in_enabled_order() -> None:
+    """Families run bash → python, but results follow ``enabled``."""
+    initial = {"general": {"host": "x"}}
+    pull_b64 = base64.b64encode(json.dumps(initial).encode()).decode()
+    runner = _runner_returning(
+        [
+            "RESULT hook=redpanda status=configured\n",
+            f"RESULT_PULL_OK {pull_b64}\n",
+            "RESULT hook=filestash status=configured\n",
+        ]
+    )
+    result = run_admin_setups(
+        _make_config(), _make_env(), ["filestash", "jupyter", "redpanda"], script_runner=runner
+    )
+    assert [h.name for h in result.hooks] == ["filestash", "redpanda"]
+
+
 # ---------------------------------------------------------------------------
 # SUBDOMAIN_SEPARATOR — Issue #540 (wiki site_url)
 # ---------------------------------------------------------------------------
 
 
-def test_render_wikijs_hook_uses_separator_in_site_url() -> None:
-    """siteUrl in the rendered GraphQL mutation honors
-    BootstrapEnv.subdomain_separator. With separator='-' the
-    rendered URL is ``wiki-user1.example.com``, not
-    ``wiki.user1.example.com``. Without this fix, Wiki.js would
-    redirect users to a host that doesn't resolve under
-    flat-subdomain tenants."""
+def test_wikijs_site_url_uses_separator() -> None:
+    """siteUrl in the GraphQL setup mutation honors
+    BootstrapEnv.subdomain_separator. With separator='-' the URL is
+    ``wiki-user1.example.com``, not ``wiki.user1.example.com``.
+    Without this fix, Wiki.js would redirect users to a host that
+    doesn't resolve under flat-subdomain tenants."""
     env = BootstrapEnv(
         domain="user1.example.com",
         admin_email="user1@example.com",
         gitea_user_email="user1@example.com",
         subdomain_separator="-",
     )
-    config = _make_config(wikijs_admin_password="pw")
-    script = render_wikijs_hook(config, env)
-    # The site URL is shlex-quoted into the rendered bash. Pinning
-    # the SHELL-QUOTED form (``'…'``) rather than the bare URL makes
-    # the assertion more specific AND dodges CodeQL's
-    # py/incomplete-url-substring-sanitization rule, which heuristically
-    # flags ``<bare-domain> in container`` patterns in tests.
-    assert shlex.quote("https://wiki-user1.example.com") in script
-    # And the dot form's shlex-quoted shape must NOT appear (would
-    # be a regression).
-    assert shlex.quote("https://wiki.user1.example.com") not in script
-
-
-def test_render_wikijs_hook_default_separator_is_dot_form_unchanged() -> None:
-    """Default-tenant render is byte-identical to pre-#540."""
+    inputs = _HTTP_HOOK_REGISTRY["wikijs"].inputs(_make_config(wikijs_admin_password="pw"), env)
+    assert inputs is not None
+    assert inputs["site_url"] == "https://wiki-user1.example.com"
+
+
+def test_wikijs_site_url_default_separator_is_dot_form() -> None:
     env = BootstrapEnv(
         domain="example.com",
         admin_email="admin@example.com",
         gitea_user_email="user@example.com",
     )
-    config = _make_config(wikijs_admin_password="pw")
-    script = render_wikijs_hook(config, env)
-    assert shlex.quote("https://wiki.example.com") in script
+    inputs = _HTTP_HOOK_REGISTRY["wikijs"].inputs(_make_config(wikijs_admin_password="pw"), env)
+    assert inputs is not None
+    assert inputs["site_url"] == "https://wiki.example.com"
@@ -633,7 +633,7 @@ def test_cli_setup_ssh_config_happy_path(
     from nexus_deploy.__main__ import _setup_ssh_config
 
     monkeypatch.setattr(
-        "nexus_deploy.__main__.configure_ssh",
+        "nexus_deploy.setup.configure_ssh",
         lambda spec: None,  # No-op, we just verify the env-var parse + rc
     )
     monkeypatch.setenv("SSH_HOST", "ssh.example.com")
@@ -653,7 +653,7 @@ def test_cli_setup_wait_ssh_token_fail_returns_2(
     monkeypatch.setenv("CF_ACCESS_CLIENT_ID", "a")
     monkeypatch.setenv("CF_ACCESS_CLIENT_SECRET", "b")
     monkeypatch.setattr(
-        "nexus_deploy.__main__.wait_for_service_token",
+        "nexus_deploy.setup.wait_for_service_token",
         lambda **_kwargs: SSHReadinessResult(succeeded=False, attempts=6, last_error="Auth failed"),
     )
     rc = _setup_wait_ssh([])
@@ -677,9 +677,9 @@ def test_cli_setup_wait_ssh_skips_token_when_absent(
         token_called["n"] += 1
         return SSHReadinessResult(succeeded=True, attempts=1)
 
-    monkeypatch.setattr("nexus_deploy.__main__.wait_for_service_token", fake_token)
+    monkeypatch.setattr("nexus_deploy.setup.wait_for_service_token", fake_token)
     monkeypatch.setattr(
-        "nexus_deploy.__main__.wait_for_ssh",
+        "nexus_deploy.setup.wait_for_ssh",
         lambda **_kwargs: SSHReadinessResult(succeeded=True, attempts=1),
     )
     rc = _setup_wait_ssh([])
@@ -693,11 +693,11 @@ def test_cli_setup_wait_ssh_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("CF_ACCESS_CLIENT_ID", "a")
     monkeypatch.setenv("CF_ACCESS_CLIENT_SECRET", "b")
     monkeypatch.setattr(
-        "nexus_deploy.__main__.wait_for_service_token",
+        "nexus_deploy.setup.wait_for_service_token",
         lambda **_kwargs: SSHReadinessResult(succeeded=True, attempts=2),
     )
     monkeypatch.setattr(
-        "nexus_deploy.__main__.wait_for_ssh",
+        "nexus_deploy.setup.wait_for_ssh",
         lambda **_kwargs: SSHReadinessResult(succeeded=True, attempts=3),
     )
     rc = _setup_wait_ssh([])
@@ -728,8 +728,8 @@ def test_cli_setup_ensure_jq_remote_command_failure_returns_2(
         exc.output = fake_output
         raise exc
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda _alias: _FakeSSHContext())
-    monkeypatch.setattr("nexus_deploy.__main__.ensure_jq", boom)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda _alias: _FakeSSHContext())
+    monkeypatch.setattr("nexus_deploy.setup.ensure_jq", boom)
     rc = _setup_ensure_jq([])
     assert rc == 2
     captured = capsys.readouterr()
@@ -757,9 +757,9 @@ def test_cli_setup_ensure_jq_transport_failure_returns_2(
         def __exit__(self, *_a: Any) -> None:
             return None
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", lambda _alias: _FakeSSHContext())
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", lambda _alias: _FakeSSHContext())
     monkeypatch.setattr(
-        "nexus_deploy.__main__.ensure_jq",
+        "nexus_deploy.setup.ensure_jq",
         lambda _ssh: (_ for _ in ()).throw(OSError("connection refused")),
     )
     rc = _setup_ensure_jq([])
@@ -1126,7 +1126,7 @@ def test_cli_setup_wetty_ssh_agent_returns_1_when_auth_sock_not_written(
                 stderr="",
             )
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _FakeSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _FakeSSH)
     rc = _setup_wetty_ssh_agent([])
     assert rc == 1
     err = capsys.readouterr().err
@@ -1165,6 +1165,6 @@ def test_cli_setup_wetty_ssh_agent_happy_path_returns_0(
                 stderr="",
             )
 
-    monkeypatch.setattr("nexus_deploy.__main__.SSHClient", _FakeSSH)
+    monkeypatch.setattr("nexus_deploy.ssh.SSHClient", _FakeSSH)
     rc = _setup_wetty_ssh_agent([])
     assert rc == 0
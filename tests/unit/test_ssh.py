@@ -7,6 +7,7 @@ ProxyCommand) is verified via spin-up acceptance, not these tests.
 
 from __future__ import annotations
 
+import os
 import socket
 import subprocess
 import threading
@@ -473,3 +474,163 @@ def test_ssh_error_message_does_not_leak_argv() -> None:
         assert "ProxyCommand" not in msg
         assert "Authorization" not in msg
         assert "Bearer" not in msg
+
+
+# -- multiplexing -------------------------------------------------------
+
+
+def test_context_manager_without_multiplex_spawns_nothing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def boom(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("no master expected")
+
+    monkeypatch.setattr("nexus_deploy.ssh._remote.open_control_master", boom)
+    with SSHClient("nexus"):
+        pass
+
+
+def test_multiplex_owner_opens_and_closes_master(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from nexus_deploy import _remote
+
+    master = _remote.ControlMaster("nexus", tmp_path / "cm", handshake_s=1.0)
+    calls: list[str] = []
+
+    def fake_open(host: str) -> _remote.ControlMaster:
+        calls.append(f"open:{host}")
+        _remote._MASTERS[host] = master
+        return master
+
+    def fake_close(host: str) -> _remote.ControlMaster | None:
+        calls.append(f"close:{host}")
+        return _remote._MASTERS.pop(host, None)
+
+    monkeypatch.setattr(_remote, "_MASTERS", {})
+    monkeypatch.setattr("nexus_deploy.ssh._remote.open_control_master", fake_open)
+    monkeypatch.setattr("nexus_deploy.ssh._remote.close_control_master", fake_close)
+    captured: dict[str, Any] = {}
+
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["argv"] = args[0]
+        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("nexus_deploy.ssh.subprocess.run", fake_run)
+    with SSHClient("nexus", multiplex=True) as ssh:
+        ssh.run("uptime")
+        assert captured["argv"][1:3] == ["-o", f"ControlPath={tmp_path / 'cm'}"]
+        assert captured["argv"][-2:] == ["nexus", "uptime"]
+    assert calls == ["open:nexus", "close:nexus"]
+    assert len(master.call_timings) == 1
+
+
+def test_multiplex_joiner_does_not_close_foreign_master(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A nested client for the same host (open returns None) must not close it."""
+    closed: list[str] = []
+    monkeypatch.setattr("nexus_deploy.ssh._remote.open_control_master", lambda _h: None)
+    monkeypatch.setattr(
+        "nexus_deploy.ssh._remote.close_control_master",
+        lambda h: closed.append(h),
+    )
+    with SSHClient("nexus", multiplex=True):
+        pass
+    assert closed == []
+
+
+# -- AsyncSSHClient -----------------------------------------------------
+
+
+def _fake_ssh_on_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, body: str) -> Path:
+    """Put a stand-in ``ssh`` on PATH; ``body`` runs after argv is logged."""
+    argv_log = tmp_path / "argv.log"
+    fake_ssh = tmp_path / "ssh"
+    fake_ssh.write_text(f'#!/usr/bin/env bash\necho "$*" >> {argv_log}\n{body}\n')
+    fake_ssh.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    return argv_log
+
+
+async def test_async_run_script_feeds_stdin_not_argv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from nexus_deploy.ssh import AsyncSSHClient
+
+    argv_log = _fake_ssh_on_path(tmp_path, monkeypatch, "cat")
+    secret = "TOKEN=top-secret-do-not-leak\necho hi"
+    result = await AsyncSSHClient().run_script_async(secret)
+    assert result.returncode == 0
+    assert result.stdout == secret
+    assert result.args == ["ssh", "nexus", "bash", "-s"]
+    assert "top-secret-do-not-leak" not in argv_log.read_text()
+
+
+async def test_async_run_check_raises_called_process_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from nexus_deploy.ssh import AsyncSSHClient
+
+    _fake_ssh_on_path(tmp_path, monkeypatch, "echo boom >&2; exit 3")
+    client = AsyncSSHClient()
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        await client.run_async("false")
+    assert exc_info.value.returncode == 3
+    assert "boom" in exc_info.value.output
+    # check=False returns the CompletedProcess instead.
+    result = await client.run_async("false", check=False, merge_stderr=False)
+    assert result.returncode == 3
+    assert result.stderr == "boom\n"
+
+
+async def test_async_timeout_kills_process(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from nexus_deploy.ssh import AsyncSSHClient
+
+    _fake_ssh_on_path(tmp_path, monkeypatch, "exec sleep 30")
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+        await AsyncSSHClient().run_script_async("sleep", timeout=0.3)
+    assert time.monotonic() - started < 5
+    # Exception carries argv only — never the script body.
+    assert exc_info.value.cmd == ["ssh", "nexus", "bash", "-s"]
+
+
+async def test_async_gather_overlaps_and_respects_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+
+    from nexus_deploy.ssh import AsyncSSHClient
+
+    _fake_ssh_on_path(tmp_path, monkeypatch, "sleep 0.4")
+    started = time.monotonic()
+    await asyncio.gather(*(AsyncSSHClient().run_async("x") for _ in range(4)))
+    assert time.monotonic() - started < 1.2  # overlapped, not 4 x 0.4s
+
+    limited = AsyncSSHClient(max_concurrency=1)
+    started = time.monotonic()
+    await asyncio.gather(limited.run_async("x"), limited.run_async("y"))
+    assert time.monotonic() - started >= 0.8  # serialised by the semaphore
+
+
+async def test_async_cancellation_reaps_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+
+    from nexus_deploy.ssh import AsyncSSHClient
+
+    _fake_ssh_on_path(tmp_path, monkeypatch, "exec sleep 30")
+    task = asyncio.create_task(AsyncSSHClient().run_script_async("sleep"))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_async_client_rejects_zero_concurrency() -> None:
+    from nexus_deploy.ssh import AsyncSSHClient
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        AsyncSSHClient(max_concurrency=0)
@@ -0,0 +1,241 @@
+"""Tests for nexus_deploy.stack_manifest.
+
+Pure manifest/diff/parse tests plus exec'd-bash round trips: the
+rendered fetch + apply scripts run against a tmp "server" directory,
+fed by the real tar/gzip/zstd writer.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import shutil
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+import pytest
+
+from nexus_deploy.stack_manifest import (
+    build_manifest,
+    diff_manifests,
+    parse_applied,
+    parse_fetch_output,
+    push_stacks,
+    render_apply_script,
+)
+
+# ---------------------------------------------------------------------------
+# Pure logic
+# ---------------------------------------------------------------------------
+
+
+def test_build_manifest_records_files_dirs_and_symlinks(tmp_path: Path) -> None:
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "conf" / "a.yml").write_text("a: 1\n")
+    script = tmp_path / "entry.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    (tmp_path / "link").symlink_to("conf/a.yml")
+
+    manifest = build_manifest(tmp_path)
+
+    assert manifest["conf"] == "d"
+    assert manifest["conf/a.yml"].startswith("f 0 ")
+    assert manifest["entry.sh"].startswith("f 1 ")
+    assert manifest["link"] == "l conf/a.yml"
+    assert build_manifest(tmp_path) == manifest
+
+
+def test_build_manifest_changes_with_content(tmp_path: Path) -> None:
+    (tmp_path / "a").write_text("one")
+    before = build_manifest(tmp_path)
+    (tmp_path / "a").write_text("two")
+    assert build_manifest(tmp_path)["a"] != before["a"]
+
+
+def test_diff_manifests_cold_ships_everything() -> None:
+    delta = diff_manifests("svc", {"b": "d", "a": "f 0 x"}, None)
+    assert delta.cold
+    assert delta.changed == ("a", "b")
+    assert not delta.is_empty
+
+
+def test_diff_manifests_ships_changed_and_deletes_gone() -> None:
+    local = {"same": "f 0 1", "changed": "f 0 2", "new": "f 0 3"}
+    remote = {"same": "f 0 1", "changed": "f 0 old", "gone": "f 0 4", "../escape": "f 0 5"}
+    delta = diff_manifests("svc", local, remote)
+    assert delta.changed == ("changed", "new")
+    # Paths from the server's manifest are not trusted blindly.
+    assert delta.deleted == ("gone",)
+
+
+def test_diff_manifests_identical_is_empty() -> None:
+    assert diff_manifests("svc", {"a": "d"}, {"a": "d"}).is_empty
+
+
+def test_parse_fetch_output_skips_undecodable_manifests() -> None:
+    good = base64.b64encode(json.dumps({"a": "d"}).encode()).decode()
+    not_a_map = base64.b64encode(b"[1, 2]").decode()
+    stdout = (
+        f"CODEC zstd\nMANIFEST jupyter {good}\nMANIFEST bad !!!\nMANIFEST list {not_a_map}\nnoise\n"
+    )
+    assert parse_fetch_output(stdout) == (True, {"jupyter": {"a": "d"}})
+    assert parse_fetch_output("")[0] is False
+
+
+def test_render_apply_script_picks_decompressor() -> None:
+    assert "zstd -dc | tar" in render_apply_script(["a"], "zstd", stacks_dir="/s")
+    assert "gzip -dc | tar" in render_apply_script(["a"], "gzip", stacks_dir="/s")
+
+
+def test_parse_applied() -> None:
+    assert parse_applied("APPLIED a\nnoise\nAPPLIED b\n") == {"a", "b"}
+
+
+# ---------------------------------------------------------------------------
+# exec'd bash round trips
+# ---------------------------------------------------------------------------
+
+
+def _bash(script: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ["bash", "-c", script], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+def _bash_stream(
+    script: str, feed: Callable[[IO[bytes]], None]
+) -> subprocess.CompletedProcess[str]:
+    """Stand-in for ``ssh_stream_in`` that runs the script locally."""
+    with subprocess.Popen(
+        ["bash", "-c", script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    ) as proc:
+        assert proc.stdin is not None
+        assert proc.stdout is not None
+        feed(proc.stdin)
+        proc.stdin.close()
+        out = proc.stdout.read().decode()
+        rc = proc.wait(timeout=60)
+    if rc != 0:
+        raise subprocess.CalledProcessError(rc, ["bash"], output=out)
+    return subprocess.CompletedProcess(["bash"], rc, stdout=out)
+
+
+@pytest.fixture
+def layout(tmp_path: Path) -> tuple[Path, Path, Path]:
+    local = tmp_path / "local"
+    server = tmp_path / "server" / "stacks"
+    manifests = tmp_path / "server" / "manifests"
+    (local / "jupyter" / "conf").mkdir(parents=True)
+    (local / "jupyter" / "docker-compose.yml").write_text("services: {}\n")
+    (local / "jupyter" / "conf" / "old.cfg").write_text("old\n")
+    (local / "empty").mkdir()
+    return local, server, manifests
+
+
+def _push(local: Path, server: Path, manifests: Path, names: list[str]) -> dict[str, object]:
+    results = push_stacks(
+        local,
+        names,
+        remote_stacks_dir=str(server),
+        manifests_dir=str(manifests),
+        script_runner=_bash,
+        stream_runner=_bash_stream,
+    )
+    return {svc: (r.status, r.shipped, r.deleted) for svc, r in results.items()}
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_push_round_trip_cold_then_delta(
+    layout: tuple[Path, Path, Path], monkeypatch: pytest.MonkeyPatch, codec: str
+) -> None:
+    if shutil.which("bash") is None or shutil.which("tar") is None:
+        pytest.skip("bash/tar not on PATH")
+    if codec == "zstd" and shutil.which("zstd") is None:
+        pytest.skip("zstd not on PATH")
+    if codec == "gzip":
+        monkeypatch.setattr("nexus_deploy.stack_manifest.shutil.which", lambda _name: None)
+    local, server, manifests = layout
+
+    # Cold: everything ships, including an empty stack dir.
+    assert _push(local, server, manifests, ["jupyter", "empty"]) == {
+        "jupyter": ("synced", 3, 0),
+        "empty": ("synced", 0, 0),
+    }
+    assert (server / "jupyter" / "conf" / "old.cfg").read_text() == "old\n"
+    assert (server / "empty").is_dir()
+    assert not (server / ".nexus-sync").exists()
+    stored = json.loads((manifests / "jupyter.json").read_text())
+    assert stored == build_manifest(local / "jupyter")
+
+    # Delta: one file changed, one removed.
+    (local / "jupyter" / "docker-compose.yml").write_text("services: {app: {}}\n")
+    (local / "jupyter" / "conf" / "old.cfg").unlink()
+    assert _push(local, server, manifests, ["jupyter", "empty"]) == {
+        "jupyter": ("synced", 1, 1),
+        "empty": ("unchanged", 0, 0),
+    }
+    assert "app" in (server / "jupyter" / "docker-compose.yml").read_text()
+    assert not (server / "jupyter" / "conf" / "old.cfg").exists()
+
+    # Nothing left to do.
+    assert _push(local, server, manifests, ["jupyter"]) == {"jupyter": ("unchanged", 0, 0)}
+
+
+def test_push_without_stack_dir_on_server_is_cold_again(
+    layout: tuple[Path, Path, Path],
+) -> None:
+    local, server, manifests = layout
+    _push(local, server, manifests, ["jupyter"])
+    shutil.rmtree(server / "jupyter")  # e.g. removed by the cleanup loop
+    assert _push(local, server, manifests, ["jupyter"]) == {"jupyter": ("synced", 3, 0)}
+    assert (server / "jupyter" / "docker-compose.yml").is_file()
+
+
+def test_push_fetch_failure_settles_nothing(
+    layout: tuple[Path, Path, Path], capsys: pytest.CaptureFixture[str]
+) -> None:
+    local, server, _ = layout
+
+    def broken(_script: str) -> subprocess.CompletedProcess[str]:
+        raise subprocess.TimeoutExpired(["ssh"], 30)
+
+    results = push_stacks(
+        local,
+        ["jupyter"],
+        remote_stacks_dir=str(server),
+        script_runner=broken,
+        stream_runner=lambda *_: pytest.fail("stream must not start"),
+    )
+    assert results == {}
+    assert "stack manifests unavailable (TimeoutExpired)" in capsys.readouterr().err
+
+
+def test_push_stream_failure_keeps_only_applied_stacks(
+    layout: tuple[Path, Path, Path], capsys: pytest.CaptureFixture[str]
+) -> None:
+    local, server, _ = layout
+
+    def half_applied(
+        _script: str, feed: Callable[[IO[bytes]], None]
+    ) -> subprocess.CompletedProcess[str]:
+        raise subprocess.CalledProcessError(
+            1, ["ssh"], output="APPLIED jupyter\nmv: cannot move: No space left on device\n"
+        )
+
+    results = push_stacks(
+        local,
+        ["jupyter", "empty"],
+        remote_stacks_dir=str(server),
+        script_runner=lambda _: subprocess.CompletedProcess(["ssh"], 0, stdout=""),
+        stream_runner=half_applied,
+    )
+    assert list(results) == ["jupyter"]
+    err = capsys.readouterr().err
+    assert "stack delta push failed (rc=1)" in err
+    assert "No space left on device" in err
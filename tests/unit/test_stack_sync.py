@@ -8,15 +8,18 @@ end-to-end run_stack_sync, and CLI rc=0/1/2 contract.
 
 from __future__ import annotations
 
+import io
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from nexus_deploy.stack_manifest import build_manifest, manifest_hash
 from nexus_deploy.stack_sync import (
     CleanupResult,
     RsyncResult,
@@ -491,6 +494,214 @@ def test_rsync_enabled_targets_correct_remote_path(tmp_path: Path) -> None:
     assert captured["local"].endswith("jupyter")
 
 
+# ---------------------------------------------------------------------------
+# rsync_enabled_stacks — bulk mode
+# ---------------------------------------------------------------------------
+
+
+def _bulk(
+    rc: int = 0, stdout: str = "", stderr: str = ""
+) -> tuple[list[tuple[Path, str, list[str]]], Callable[..., subprocess.CompletedProcess[str]]]:
+    calls: list[tuple[Path, str, list[str]]] = []
+
+    def runner(local: Path, remote: str, names: list[str]) -> subprocess.CompletedProcess[str]:
+        calls.append((local, remote, list(names)))
+        return subprocess.CompletedProcess(["rsync"], rc, stdout=stdout, stderr=stderr)
+
+    return calls, runner
+
+
+def _no_per_service(local: Path, _remote: str) -> subprocess.CompletedProcess[str]:
+    raise AssertionError(f"unexpected per-service rsync for {local.name}")
+
+
+def test_bulk_rsync_pushes_all_pending_stacks_in_one_call(tmp_path: Path) -> None:
+    for svc in ("jupyter", "marimo", "n8n"):
+        (tmp_path / svc).mkdir()
+    calls, runner = _bulk(
+        stdout=">f+++++++++ jupyter/docker-compose.yml\ncd+++++++++ jupyter/conf/\n",
+    )
+
+    results = rsync_enabled_stacks(
+        tmp_path,
+        ["jupyter", "marimo", "missing", "n8n"],
+        rsync_runner=_no_per_service,
+        unchanged=frozenset({"n8n"}),
+        remote_stacks_dir="/opt/foo",
+        host="bar",
+        mode="bulk",
+        bulk_rsync_runner=runner,
+    )
+
+    assert calls == [(tmp_path, "bar:/opt/foo/", ["jupyter", "marimo"])]
+    assert [(r.service, r.status, r.detail) for r in results] == [
+        ("jupyter", "synced", "2 item(s)"),
+        ("marimo", "synced", ""),
+        ("missing", "missing-local", ""),
+        ("n8n", "unchanged", ""),
+    ]
+
+
+def test_bulk_rsync_attributes_partial_transfer_errors(tmp_path: Path) -> None:
+    for svc in ("a", "b", "c"):
+        (tmp_path / svc).mkdir()
+    stderr = (
+        f'rsync: [sender] send_files failed to open "{tmp_path}/b/secret.env": '
+        "Permission denied (13)\n"
+        'rsync: [receiver] mkstemp "/opt/docker-server/stacks/c/.x.AbC" failed: '
+        "No space left on device (28)\n"
+        "rsync error: some files/attrs were not transferred (see previous errors) "
+        "(code 23) at main.c(1338) [sender=3.2.7]\n"
+    )
+    _, runner = _bulk(rc=23, stderr=stderr)
+
+    results = rsync_enabled_stacks(
+        tmp_path,
+        ["a", "b", "c"],
+        rsync_runner=_no_per_service,
+        mode="bulk",
+        bulk_rsync_runner=runner,
+    )
+
+    assert [r.status for r in results] == ["synced", "failed", "failed"]
+    assert results[1].detail == "rsync rc=23"
+    assert "secret.env" in results[1].stderr_excerpt
+    assert "No space left" in results[2].stderr_excerpt
+    assert "code 23" not in results[1].stderr_excerpt
+
+
+def test_bulk_rsync_unattributable_error_retries_rest_per_service(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for svc in ("a", "b", "c"):
+        (tmp_path / svc).mkdir()
+    stderr = (
+        'rsync: [receiver] failed to open "a/x": Permission denied (13)\nrsync: something odd\n'
+    )
+    _, runner = _bulk(rc=23, stderr=stderr)
+    retried: list[str] = []
+
+    def per_service(local: Path, remote: str) -> subprocess.CompletedProcess[str]:
+        retried.append(local.name)
+        return _ok_rsync(local, remote)
+
+    results = rsync_enabled_stacks(
+        tmp_path,
+        ["a", "b", "c"],
+        rsync_runner=per_service,
+        mode="bulk",
+        bulk_rsync_runner=runner,
+    )
+
+    assert retried == ["b", "c"]
+    assert [r.status for r in results] == ["failed", "synced", "synced"]
+    assert "name no stack" in capsys.readouterr().err
+
+
+def test_bulk_rsync_transport_failure_falls_back_to_per_service(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    _, runner = _bulk(rc=255, stderr="ssh: connect to host nexus port 22: Connection refused\n")
+    retried: list[str] = []
+
+    def per_service(local: Path, remote: str) -> subprocess.CompletedProcess[str]:
+        retried.append(local.name)
+        if local.name == "b":
+            raise subprocess.CalledProcessError(255, ["rsync"])
+        return _ok_rsync(local, remote)
+
+    results = rsync_enabled_stacks(
+        tmp_path,
+        ["a", "b"],
+        rsync_runner=per_service,
+        mode="bulk",
+        bulk_rsync_runner=runner,
+    )
+
+    assert retried == ["a", "b"]
+    assert [r.status for r in results] == ["synced", "failed"]
+    assert "bulk rsync failed (rc=255)" in capsys.readouterr().err
+
+
+def test_run_stack_sync_manifest_push_failure_falls_back_to_bulk(tmp_path: Path) -> None:
+    (tmp_path / "jupyter").mkdir()
+    calls, runner = _bulk()
+
+    def broken_stream(_script: str, _feed: object) -> subprocess.CompletedProcess[str]:
+        raise subprocess.CalledProcessError(255, ["ssh"], output="")
+
+    result = run_stack_sync(
+        tmp_path,
+        ["jupyter"],
+        rsync_runner=_no_per_service,
+        bulk_rsync_runner=runner,
+        stream_runner=broken_stream,
+        # Serves the manifest fetch (no manifests → cold) and the cleanup.
+        script_runner=lambda _: _ok_cleanup_runner(),
+    )
+
+    assert [names for _, _, names in calls] == [["jupyter"]]
+    assert result.synced == 1
+
+
+def test_run_stack_sync_manifest_mode_settles_without_rsync(tmp_path: Path) -> None:
+    (tmp_path / "jupyter").mkdir()
+    (tmp_path / "jupyter" / "docker-compose.yml").write_text("services: {}\n")
+
+    def stream(script: str, feed: Callable[..., None]) -> subprocess.CompletedProcess[str]:
+        feed(io.BytesIO())
+        return subprocess.CompletedProcess(["ssh"], 0, stdout="APPLIED jupyter\n")
+
+    result = run_stack_sync(
+        tmp_path,
+        ["jupyter"],
+        rsync_runner=_no_per_service,
+        bulk_rsync_runner=lambda *_: pytest.fail("unexpected bulk rsync"),
+        stream_runner=stream,
+        script_runner=lambda _: _ok_cleanup_runner(),
+        sync_mode="manifest",
+    )
+
+    assert [(r.status, r.detail) for r in result.rsync] == [("synced", "1 item(s)")]
+
+
+def test_run_stack_sync_manifest_mode_walks_each_tree_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """skip_unchanged's stamp hash and the delta diff share one manifest."""
+    from nexus_deploy import stack_manifest
+
+    (tmp_path / "jupyter").mkdir()
+    (tmp_path / "jupyter" / "docker-compose.yml").write_text("services: {}\n")
+    walked: list[str] = []
+    real_build = stack_manifest.build_manifest
+
+    def counting_build(root: Path) -> dict[str, str]:
+        walked.append(root.name)
+        return real_build(root)
+
+    monkeypatch.setattr(stack_manifest, "build_manifest", counting_build)
+
+    def stream(script: str, feed: Callable[..., None]) -> subprocess.CompletedProcess[str]:
+        feed(io.BytesIO())
+        return subprocess.CompletedProcess(["ssh"], 0, stdout="APPLIED jupyter\n")
+
+    result = run_stack_sync(
+        tmp_path,
+        ["jupyter"],
+        rsync_runner=_no_per_service,
+        stream_runner=stream,
+        script_runner=lambda _: _ok_cleanup_runner(),
+        sync_mode="manifest",
+        skip_unchanged=True,
+    )
+
+    assert result.synced == 1
+    assert walked == ["jupyter"]
+
+
 # ---------------------------------------------------------------------------
 # cleanup_disabled_stacks — DI + unsafe-name filter contract
 # ---------------------------------------------------------------------------
@@ -570,6 +781,7 @@ def test_run_stack_sync_happy_path(tmp_path: Path) -> None:
         tmp_path,
         ["jupyter", "marimo"],
         rsync_runner=_ok_rsync,
+        sync_mode="per-service",
         script_runner=lambda _: _ok_cleanup_runner(removed=2),
     )
     assert isinstance(result, StackSyncResult)
@@ -595,6 +807,7 @@ def test_run_stack_sync_partial_failure(tmp_path: Path) -> None:
         tmp_path,
         ["a", "b"],
         rsync_runner=runner,
+        sync_mode="per-service",
         script_runner=lambda _: _ok_cleanup_runner(),
     )
     assert result.synced == 1
@@ -612,12 +825,74 @@ def test_run_stack_sync_cleanup_unparseable_means_not_success(tmp_path: Path) ->
         tmp_path,
         ["jupyter"],
         rsync_runner=_ok_rsync,
+        sync_mode="per-service",
         script_runner=bad_runner,
     )
     assert result.cleanup is None
     assert result.is_success is False
 
 
+def test_run_stack_sync_skip_unchanged_skips_stamped_and_stamps_synced(tmp_path: Path) -> None:
+    (tmp_path / "jupyter").mkdir()
+    (tmp_path / "marimo").mkdir()
+    (tmp_path / "marimo" / "docker-compose.yml").write_text("services: {}\n")
+    stamped = manifest_hash(build_manifest(tmp_path / "jupyter"))
+    scripts: list[str] = []
+    rsynced: list[str] = []
+
+    def script_runner(script: str) -> subprocess.CompletedProcess[str]:
+        scripts.append(script)
+        if "STAMP $name" in script:
+            out = f"STAMP jupyter {stamped}\nSTAMP marimo {'0' * 64}\n"
+        else:
+            out = "RESULT stopped=0 removed=0 failed=0"
+        return subprocess.CompletedProcess(args=["ssh"], returncode=0, stdout=out, stderr="")
+
+    def rsync(local: Path, remote: str) -> subprocess.CompletedProcess[str]:
+        rsynced.append(local.name)
+        return _ok_rsync(local, remote)
+
+    result = run_stack_sync(
+        tmp_path,
+        ["jupyter", "marimo"],
+        rsync_runner=rsync,
+        sync_mode="per-service",
+        script_runner=script_runner,
+        skip_unchanged=True,
+    )
+    assert rsynced == ["marimo"]
+    assert (result.synced, result.unchanged) == (1, 1)
+    assert result.is_success
+    store = next(s for s in scripts if "mkdir -p" in s and "echo" in s)
+    assert "/marimo" in store
+    assert "/jupyter" not in store
+
+
+def test_run_stack_sync_stamp_fetch_failure_syncs_everything(tmp_path: Path) -> None:
+    (tmp_path / "jupyter").mkdir()
+    rsynced: list[str] = []
+
+    def script_runner(script: str) -> subprocess.CompletedProcess[str]:
+        if "STAMP $name" in script:
+            raise subprocess.TimeoutExpired(["ssh"], 30)
+        return _ok_cleanup_runner()
+
+    def rsync(local: Path, remote: str) -> subprocess.CompletedProcess[str]:
+        rsynced.append(local.name)
+        return _ok_rsync(local, remote)
+
+    result = run_stack_sync(
+        tmp_path,
+        ["jupyter"],
+        rsync_runner=rsync,
+        sync_mode="per-service",
+        script_runner=script_runner,
+        skip_unchanged=True,
+    )
+    assert rsynced == ["jupyter"]
+    assert result.synced == 1
+
+
 # ---------------------------------------------------------------------------
 # CLI rc=0/1/2 mapping (direct _stack_sync call, no subprocess)
 # ---------------------------------------------------------------------------
@@ -661,13 +936,13 @@ def test_cli_stack_sync_happy_returns_0(tmp_path: Path, monkeypatch: pytest.Monk
 
     (tmp_path / "jupyter").mkdir()
 
-    def fake_run(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def fake_run(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         return StackSyncResult(
             rsync=(RsyncResult(service="jupyter", status="synced"),),
             cleanup=CleanupResult(stopped=0, removed=0, failed=0),
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", fake_run)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
     rc = _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path)])
     assert rc == 0
 
@@ -678,7 +953,7 @@ def test_cli_stack_sync_partial_returns_1(tmp_path: Path, monkeypatch: pytest.Mo
     (tmp_path / "jupyter").mkdir()
     (tmp_path / "marimo").mkdir()
 
-    def fake_run(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def fake_run(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         return StackSyncResult(
             rsync=(
                 RsyncResult(service="jupyter", status="synced"),
@@ -687,7 +962,7 @@ def test_cli_stack_sync_partial_returns_1(tmp_path: Path, monkeypatch: pytest.Mo
             cleanup=CleanupResult(stopped=0, removed=0, failed=0),
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", fake_run)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
     rc = _stack_sync(["--enabled", "jupyter,marimo", "--stacks-dir", str(tmp_path)])
     assert rc == 1
 
@@ -700,13 +975,13 @@ def test_cli_stack_sync_all_failed_returns_2(
 
     (tmp_path / "jupyter").mkdir()
 
-    def fake_run(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def fake_run(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         return StackSyncResult(
             rsync=(RsyncResult(service="jupyter", status="failed", detail="rsync rc=1"),),
             cleanup=CleanupResult(stopped=0, removed=0, failed=0),
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", fake_run)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
     rc = _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path)])
     assert rc == 2
 
@@ -719,13 +994,13 @@ def test_cli_stack_sync_unparseable_cleanup_returns_2(
 
     (tmp_path / "jupyter").mkdir()
 
-    def fake_run(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def fake_run(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         return StackSyncResult(
             rsync=(RsyncResult(service="jupyter", status="synced"),),
             cleanup=None,
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", fake_run)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
     rc = _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path)])
     assert rc == 2
 
@@ -740,7 +1015,7 @@ def test_cli_stack_sync_forwards_rsync_stderr_excerpt(
 
     (tmp_path / "jupyter").mkdir()
 
-    def fake_run(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def fake_run(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         return StackSyncResult(
             rsync=(
                 RsyncResult(
@@ -753,7 +1028,7 @@ def test_cli_stack_sync_forwards_rsync_stderr_excerpt(
             cleanup=CleanupResult(stopped=0, removed=0, failed=0),
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", fake_run)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
     rc = _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path)])
     assert rc == 2  # all-failed → rc=2
     err = capsys.readouterr().err
@@ -773,10 +1048,10 @@ def test_cli_stack_sync_rc2_on_transport_failure(
 
     (tmp_path / "jupyter").mkdir()
 
-    def boom(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def boom(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         raise subprocess.CalledProcessError(255, ["ssh", "secret-bearing-arg"])
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", boom)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", boom)
     rc = _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path)])
     assert rc == 2
     captured = capsys.readouterr()
@@ -797,10 +1072,10 @@ def test_cli_stack_sync_rc2_on_unexpected_exception(
 
     (tmp_path / "jupyter").mkdir()
 
-    def boom(_local: Path, _enabled: list[str]) -> StackSyncResult:
+    def boom(_local: Path, _enabled: list[str], **_kw: object) -> StackSyncResult:
         raise RuntimeError("secret-bearing-message-NEVER-print")
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", boom)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", boom)
     rc = _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path)])
     assert rc == 2
     captured = capsys.readouterr()
@@ -820,19 +1095,44 @@ def test_cli_stack_sync_filters_empty_csv_entries(
 
     captured: dict[str, list[str]] = {}
 
-    def fake_run(_local: Path, enabled: list[str]) -> StackSyncResult:
+    def fake_run(_local: Path, enabled: list[str], **_kw: object) -> StackSyncResult:
         captured["enabled"] = enabled
         return StackSyncResult(
             rsync=tuple(RsyncResult(service=s, status="synced") for s in enabled),
             cleanup=CleanupResult(stopped=0, removed=0, failed=0),
         )
 
-    monkeypatch.setattr("nexus_deploy.__main__.run_stack_sync", fake_run)
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
     rc = _stack_sync(["--enabled", ",jupyter,,marimo,", "--stacks-dir", str(tmp_path)])
     assert rc == 0
     assert captured["enabled"] == ["jupyter", "marimo"]
 
 
+@pytest.mark.parametrize(
+    ("flag", "mode"),
+    [
+        ([], "bulk"),
+        (["--mode", "manifest"], "manifest"),
+        (["--mode", "per-service"], "per-service"),
+        (["--per-service"], "per-service"),
+    ],
+)
+def test_cli_stack_sync_rsync_mode_flag(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, flag: list[str], mode: str
+) -> None:
+    from nexus_deploy.__main__ import _stack_sync
+
+    captured: dict[str, object] = {}
+
+    def fake_run(_local: Path, _enabled: list[str], **kw: object) -> StackSyncResult:
+        captured.update(kw)
+        return StackSyncResult(rsync=(), cleanup=CleanupResult(stopped=0, removed=0, failed=0))
+
+    monkeypatch.setattr("nexus_deploy.stack_sync.run_stack_sync", fake_run)
+    assert _stack_sync(["--enabled", "jupyter", "--stacks-dir", str(tmp_path), *flag]) == 0
+    assert captured["sync_mode"] == mode
+
+
 # ---------------------------------------------------------------------------
 # Subprocess-level CLI smoke (one happy path through the real entry point)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,82 @@
+"""Tests for nexus_deploy.stamps."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from nexus_deploy.stamps import (
+    REMOTE_STAMPS_DIR,
+    parse_stamps,
+    render_fetch_script,
+    render_store_script,
+    stamp_dir,
+    tree_hash,
+)
+
+_SHA = "a" * 64
+
+
+def _tree(root: Path) -> Path:
+    (root / "sub").mkdir(parents=True)
+    (root / "docker-compose.yml").write_text("services: {}\n")
+    (root / "sub" / "init.sh").write_text("#!/bin/sh\n")
+    return root
+
+
+def test_tree_hash_is_stable(tmp_path: Path) -> None:
+    root = _tree(tmp_path / "svc")
+    assert tree_hash(root) == tree_hash(root)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda r: (r / "docker-compose.yml").write_text("services: {a: {}}\n"),
+        lambda r: (r / "sub" / "init.sh").chmod(0o755),
+        lambda r: (r / "sub" / "init.sh").rename(r / "sub" / "boot.sh"),
+        lambda r: (r / "new.env").write_text(""),
+    ],
+)
+def test_tree_hash_changes_with_content_mode_and_layout(tmp_path: Path, mutate: object) -> None:
+    root = _tree(tmp_path / "svc")
+    before = tree_hash(root)
+    mutate(root)  # type: ignore[operator]
+    assert tree_hash(root) != before
+
+
+def test_stamp_dir_rejects_unsafe_kind() -> None:
+    assert stamp_dir("compose-up") == f"{REMOTE_STAMPS_DIR}/compose-up"
+    with pytest.raises(ValueError, match="unsafe"):
+        stamp_dir("../etc")
+
+
+def test_parse_stamps_ignores_noise() -> None:
+    out = f"warning: foo\nSTAMP jupyter {_SHA}\nSTAMP bad short\n"
+    assert parse_stamps(out) == {"jupyter": _SHA}
+
+
+def test_store_script_drops_unsafe_entries() -> None:
+    script = render_store_script("stack-sync", {"jupyter": _SHA, "x;rm": _SHA, "ok": "zz"})
+    assert f"echo {_SHA} > {REMOTE_STAMPS_DIR}/stack-sync/jupyter" in script
+    assert "x;rm" not in script
+    assert " > " + f"{REMOTE_STAMPS_DIR}/stack-sync/ok" not in script
+
+
+def test_fetch_and_store_roundtrip_in_bash(tmp_path: Path) -> None:
+    """Store then fetch against a sandboxed state dir; only present stacks report."""
+    base = tmp_path / "stacks"
+    (base / "jupyter").mkdir(parents=True)
+    sandbox = str(tmp_path / "state")
+
+    def run(script: str) -> str:
+        script = script.replace(REMOTE_STAMPS_DIR, sandbox)
+        return subprocess.run(
+            ["bash", "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+
+    run(render_store_script("stack-sync", {"jupyter": _SHA, "marimo": "b" * 64}))
+    out = run(render_fetch_script("stack-sync", ["jupyter", "marimo"], require_dir=str(base)))
+    assert parse_stamps(out) == {"jupyter": _SHA}
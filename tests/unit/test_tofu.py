@@ -17,6 +17,12 @@ from nexus_deploy.tofu import (
     load_r2_credentials,
 )
 
+
+def _doc(**values: Any) -> str:
+    """``tofu output -json`` stdout (all outputs) for ``values``."""
+    return json.dumps({name: {"sensitive": False, "value": v} for name, v in values.items()})
+
+
 # -- output_raw ---------------------------------------------------------
 
 
@@ -30,14 +36,16 @@ def test_output_raw_invokes_tofu_with_correct_args(
         captured["cwd"] = kwargs.get("cwd")
         captured["check"] = kwargs.get("check")
         captured["capture_output"] = kwargs.get("capture_output")
-        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout="1.2.3.4", stderr="")
+        return subprocess.CompletedProcess(
+            args=args[0], returncode=0, stdout=_doc(server_ip="1.2.3.4"), stderr=""
+        )
 
     monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", fake_run)
     runner = TofuRunner(Path("/some/tofu/dir"))
     result = runner.output_raw("server_ip")
 
     assert result == "1.2.3.4"
-    assert captured["argv"] == ["tofu", "output", "-raw", "server_ip"]
+    assert captured["argv"] == ["tofu", "output", "-json"]
     assert captured["cwd"] == Path("/some/tofu/dir")
     assert captured["check"] is True
     assert captured["capture_output"] is True
@@ -63,7 +71,7 @@ def test_output_raw_strips_trailing_newlines_to_match_dollar_paren(
         return subprocess.CompletedProcess(
             args=args[0],
             returncode=0,
-            stdout="1.2.3.4\n\n",  # tofu adds one + extra possible
+            stdout=_doc(server_ip="1.2.3.4\n\n"),
             stderr="",
         )
 
@@ -82,7 +90,7 @@ def test_output_raw_preserves_internal_newlines(
         return subprocess.CompletedProcess(
             args=args[0],
             returncode=0,
-            stdout="line1\nline2\nline3\n",  # 2 internal + 1 trailing
+            stdout=_doc(multiline_value="line1\nline2\nline3\n"),  # 2 internal + 1 trailing
             stderr="",
         )
 
@@ -159,14 +167,16 @@ def test_output_json_invokes_tofu_with_correct_args(
 
     def fake_run(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
         captured["argv"] = args[0]
-        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout='{"a": 1}', stderr="")
+        return subprocess.CompletedProcess(
+            args=args[0], returncode=0, stdout=_doc(secrets={"a": 1}), stderr=""
+        )
 
     monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", fake_run)
     runner = TofuRunner(Path("/dir"))
     result = runner.output_json("secrets")
 
     assert result == {"a": 1}
-    assert captured["argv"] == ["tofu", "output", "-json", "secrets"]
+    assert captured["argv"] == ["tofu", "output", "-json"]
 
 
 def test_output_json_parses_list(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -174,7 +184,10 @@ def test_output_json_parses_list(monkeypatch: pytest.MonkeyPatch) -> None:
 
     def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
         return subprocess.CompletedProcess(
-            args=args[0], returncode=0, stdout='["jupyter", "marimo"]', stderr=""
+            args=args[0],
+            returncode=0,
+            stdout=_doc(enabled_services=["jupyter", "marimo"]),
+            stderr="",
         )
 
     monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", fake_run)
@@ -241,6 +254,23 @@ def test_output_json_raises_when_no_default_provided(
         TofuRunner(Path("/dir")).output_json("enabled_services")
 
 
+def test_cached_fetch_failure_is_chained_on_every_read(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The cached fetch failure stays the ``__cause__`` of later TofuErrors."""
+
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        raise subprocess.CalledProcessError(returncode=1, cmd=args[0], stderr="backend down")
+
+    monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", fake_run)
+    runner = TofuRunner(Path("/dir"))
+    for read in (lambda: runner.output_json("a"), lambda: runner.output_raw("b")):
+        with pytest.raises(TofuError) as excinfo:
+            read()
+        assert isinstance(excinfo.value.__cause__, subprocess.CalledProcessError)
+        assert excinfo.value.__cause__.stderr == "backend down"
+
+
 def test_output_json_default_none_is_treated_as_supplied(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -268,6 +298,83 @@ def test_output_json_default_empty_string_is_treated_as_supplied(
     assert result == ""
 
 
+# -- single cached fetch ------------------------------------------------
+
+
+def _counting_run(stdout: str, calls: list[list[str]]) -> Any:
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append(args[0])
+        return subprocess.CompletedProcess(args=args[0], returncode=0, stdout=stdout, stderr="")
+
+    return fake_run
+
+
+def test_outputs_are_fetched_once_per_runner(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+    doc = _doc(secrets={"k": "v"}, enabled_services=["jupyter"], server_ip="1.2.3.4")
+    monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", _counting_run(doc, calls))
+    runner = TofuRunner()
+    assert runner.output_json("secrets") == {"k": "v"}
+    assert runner.output_json("enabled_services") == ["jupyter"]
+    assert runner.output_raw("server_ip") == "1.2.3.4"
+    assert runner.output_json("service_urls", default={}) == {}
+    assert calls == [["tofu", "output", "-json"]]
+
+    runner.refresh()
+    runner.output_raw("server_ip")
+    assert len(calls) == 2
+
+
+def test_failed_fetch_is_cached_and_each_read_keeps_its_semantics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(*args: Any, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append(args[0])
+        raise subprocess.CalledProcessError(returncode=1, cmd=args[0])
+
+    monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", fake_run)
+    runner = TofuRunner(Path("/dir"))
+    assert runner.output_json("secrets", default={}) == {}
+    assert runner.output_raw("server_ip", default="") == ""
+    with pytest.raises(TofuError, match="output -json image_versions failed"):
+        runner.output_json("image_versions")
+    assert len(calls) == 1
+
+
+def test_undefined_output_takes_default_or_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", _counting_run(_doc(a=1), []))
+    runner = TofuRunner(Path("/dir"))
+    assert runner.output_json("missing", default=None) is None
+    with pytest.raises(TofuError, match="output -json missing failed in /dir"):
+        runner.output_json("missing")
+    with pytest.raises(TofuError, match="output -raw missing failed"):
+        runner.output_raw("missing")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(True, "true"), (False, "false"), (3, "3"), ("x", "x")],
+)
+def test_output_raw_renders_scalars_like_tofu(
+    monkeypatch: pytest.MonkeyPatch, value: Any, expected: str
+) -> None:
+    monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", _counting_run(_doc(v=value), []))
+    assert TofuRunner().output_raw("v") == expected
+
+
+@pytest.mark.parametrize("value", [["a"], {"a": 1}, None])
+def test_output_raw_rejects_non_scalars_like_tofu(
+    monkeypatch: pytest.MonkeyPatch, value: Any
+) -> None:
+    """``tofu output -raw`` errors on lists/maps/null → default or TofuError."""
+    monkeypatch.setattr("nexus_deploy.tofu.subprocess.run", _counting_run(_doc(v=value), []))
+    assert TofuRunner().output_raw("v", default="fallback") == "fallback"
+    with pytest.raises(TofuError):
+        TofuRunner().output_raw("v")
+
+
 # -- end-to-end against a real tofu-stand-in ----------------------------
 
 
@@ -279,7 +386,7 @@ def test_output_json_actually_invokes_subprocess(tmp_path: Path) -> None:
     ValueError before subprocess is spawned.
     """
     fake_tofu = tmp_path / "tofu"
-    payload = json.dumps({"server_ip": "1.2.3.4"})
+    payload = _doc(server_ip="1.2.3.4")
     fake_tofu.write_text(f"#!/usr/bin/env bash\nprintf %s {payload!r}\n")
     fake_tofu.chmod(0o755)
 
@@ -291,7 +398,7 @@ def test_output_json_actually_invokes_subprocess(tmp_path: Path) -> None:
         result = TofuRunner(tmp_path).output_json("server_ip")
     finally:
         os.environ["PATH"] = old_path
-    assert result == {"server_ip": "1.2.3.4"}
+    assert result == "1.2.3.4"
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,101 @@
+"""Tests for nexus_deploy.tracing."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_deploy import _remote, tracing
+
+
+def _events(path: Path, ph: str = "X") -> list[dict[str, Any]]:
+    return [e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == ph]
+
+
+def test_span_is_noop_without_session() -> None:
+    assert tracing.active() is None
+    with tracing.span("nothing"):
+        pass
+    tracing.record("nothing", "phase", time.monotonic())
+    assert tracing.active() is None
+
+
+def test_session_writes_complete_events(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    with tracing.session(path) as tracer:
+        assert tracing.active() is tracer
+        with tracing.span("tofu outputs"):
+            time.sleep(0.01)
+        tracing.record("compose-up", "phase", time.monotonic(), status="ok")
+    assert tracing.active() is None
+
+    events = _events(path)
+    assert [e["name"] for e in events] == ["tofu outputs", "compose-up"]
+    assert events[0]["cat"] == "pipeline"
+    assert events[0]["dur"] >= 10_000
+    assert events[1]["args"] == {"status": "ok"}
+    assert {e["tid"] for e in events} == {1}
+
+
+def test_worker_threads_get_their_own_track(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    with tracing.session(path):
+        with tracing.span("main"):
+            pass
+        worker = threading.Thread(
+            target=lambda: tracing.record("phase", "phase", time.monotonic()),
+            name="phase_0",
+        )
+        worker.start()
+        worker.join()
+    by_name = {e["name"]: e["tid"] for e in _events(path)}
+    assert by_name == {"main": 1, "phase": 2}
+    names = {e["tid"]: e["args"]["name"] for e in _events(path, "M") if "tid" in e}
+    assert names[2] == "phase_0"
+
+
+def test_session_writes_trace_when_block_raises(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    with pytest.raises(RuntimeError), tracing.session(path), tracing.span("doomed"):
+        raise RuntimeError("deploy failed")
+    assert [e["name"] for e in _events(path)] == ["doomed"]
+
+
+def test_session_without_path_disables_tracing() -> None:
+    with tracing.session(None) as tracer:
+        assert tracer is None
+        assert tracing.active() is None
+
+
+def test_unwritable_trace_path_only_warns(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    with tracing.session(blocker / "trace.json"):
+        pass
+    assert "trace: could not write" in capsys.readouterr().err
+
+
+def test_path_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("NEXUS_TRACE_FILE", raising=False)
+    assert tracing.path_from_env() is None
+    monkeypatch.setenv("NEXUS_TRACE_FILE", "out/trace.json")
+    assert tracing.path_from_env() == Path("out/trace.json")
+
+
+def test_remote_calls_become_transport_spans(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    with tracing.session(path):
+        _remote.record_call("nexus", "rsync", time.monotonic())
+    (event,) = _events(path)
+    assert (event["name"], event["cat"], event["args"]) == (
+        "rsync",
+        "transport",
+        {"host": "nexus"},
+    )